@@ -10,8 +10,6 @@ import sys
 
 import numpy
 
-import tensorflow
-
 import config.general_settings as cfg
 
 from src.menu import menu
@@ -30,6 +28,5 @@ if __name__ == '__main__':
     os.environ['PYTHONHASHSEED'] = str(cfg.SEED)
     random.seed(cfg.SEED)
     numpy.random.seed(cfg.SEED)
-    tensorflow.random.set_seed(cfg.SEED)
 
     menu.execute(sys.argv[1:])
@@ -8,9 +8,67 @@ FORECAST_HORIZON = 3
 NB_EPOCHS = 250
 EARLY_STOPPING_PATIENCE = 10
 ERROR_METRIC = "mae"
+# "Recursive" forecasts one day per window, and each following day from the days forecasted before it (one model call
+# per day of the horizon). "Direct" forecasts every day of the horizon from a single window, in one model call
+FORECASTING_MODE = "Recursive"
 ALGORITHM = [
     "Long Short Term Memory",
     "Gated Recurrent Unit",
     "Convolutional Neural Network"
 ]
 VERBOSE = True
+# How the predictions run the deployed forecaster: "numpy" (its exported weights, without importing TensorFlow),
+# "tflite" (its TFLite conversion, see TFLITE_QUANTIZATION) or "keras". The Keras model is loaded if the files
+# of the chosen backend were not deployed
+INFERENCE_BACKEND = "numpy"
+# Whether the deployed forecaster is also converted to TFLite, and how: None (not converted), "float32",
+# "float16" or "dynamic_range" (int8 weights). The TFLite model runs TFLITE_BATCH_SIZE windows per call
+TFLITE_QUANTIZATION = None
+TFLITE_BATCH_SIZE = 32
+# Whether to save the plot of the training history of each forecaster to /output/figures
+PLOT_HISTORY = True
+
+# Windows per optimizer step. Larger batches take far fewer steps per epoch, but may need a larger learning rate
+BATCH_SIZE = 1
+LEARNING_RATE = 0.001
+# How the learning rate grows with the batch size: None (LEARNING_RATE), "linear" or "sqrt"
+LEARNING_RATE_SCALING = None
+# Whether to feed the windows through a tf.data pipeline, batched once and then cached and prefetched
+DATASET_PIPELINE = False
+DATASET_CACHE = True
+DATASET_PREFETCH = True
+
+# Training settings compared by "./run.sh benchmark-training", each one differing from the settings above,
+# trained for BENCHMARK_EPOCHS epochs with the first forecasting algorithm and BENCHMARK_SCALING_METHOD
+BENCHMARK_EPOCHS = 20
+BENCHMARK_SCALING_METHOD = "Min Max Scaler"
+BENCHMARK_SETTINGS = [
+    {"batch_size": 1, "dataset_pipeline": False},
+    {"batch_size": 1, "dataset_pipeline": True},
+    {"batch_size": 32, "dataset_pipeline": True},
+    {"batch_size": 32, "dataset_pipeline": True, "learning_rate_scaling": "sqrt"},
+    {"batch_size": 128, "dataset_pipeline": True, "learning_rate_scaling": "sqrt"},
+]
+
+# Inference backends compared by "./run.sh benchmark-inference" against the Keras model of the deployed forecaster,
+# on BENCHMARK_INFERENCE_WINDOWS random windows (seeded), each backend running BENCHMARK_INFERENCE_REPEATS times
+BENCHMARK_INFERENCE_WINDOWS = 256
+BENCHMARK_INFERENCE_REPEATS = 10
+BENCHMARK_INFERENCE_QUANTIZATIONS = ["float32", "dynamic_range"]
+
+# How many combinations of scaler and forecaster are trained at the same time, each one in its own process
+# (1 trains them one by one, in the pipeline process)
+SELECTION_WORKERS = 4
+# TensorFlow threads of each process: for running an operation (0 splits the cores between the processes)
+# and for running operations at the same time
+SELECTION_INTRA_OP_THREADS = 0
+SELECTION_INTER_OP_THREADS = 1
+# Each combination is seeded with SELECTION_SEED plus its position, so it trains the same on any worker
+SELECTION_SEED = 42
+
+# The settings above that only change how the pipeline runs, not its results. Changing them does not re-run the steps
+EXECUTION_SETTINGS = [
+    "SELECTION_WORKERS",
+    "SELECTION_INTRA_OP_THREADS",
+    "SELECTION_INTER_OP_THREADS",
+]
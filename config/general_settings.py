@@ -8,6 +8,31 @@ HOTSPOT_FILE_NAME = "DIAS-FOCOS-CALOR_1999-2019_Subregiao-NHECOLANDIA.xlsx"
 CLIMATIC_DATA_FILE_NAME = "Climatic_Data_1999_a_2019_SubRegiao-NHECOLANDIA.xlsx"
 PREDICTION_DATA_FILE_NAME = "prediction_data.xlsx"
 
+# Compression for the DataFrames stored in execution objects: "zstd", "lz4", "snappy" or None
+EXECUTION_OBJECTS_COMPRESSION = "zstd"
+
+# How many pipeline steps may run at the same time, when they do not depend on each other (1 runs them one by one)
+PIPELINE_WORKERS = 4
+
+# How many processes may calculate the statistical risk rates of a long history, split by the days with heavy
+# precipitation (1 calculates them in the pipeline process). Starting a process costs about as much as calculating
+# hundreds of thousands of days, so each one calculates at least RISK_RATE_MIN_DAYS_PER_WORKER days
+RISK_RATE_WORKERS = 4
+RISK_RATE_MIN_DAYS_PER_WORKER = 250000
+
+# Whether to measure each step (and each combination trained by the selection steps) into /output/profiles.
+# Memory allocations are traced too, which slows down the execution
+PROFILE_PIPELINE = False
+
+# The settings above that only change how the pipeline runs, not its results. Changing them does not re-run the steps
+EXECUTION_SETTINGS = [
+    "EXECUTION_OBJECTS_COMPRESSION",
+    "PIPELINE_WORKERS",
+    "RISK_RATE_WORKERS",
+    "RISK_RATE_MIN_DAYS_PER_WORKER",
+    "PROFILE_PIPELINE",
+]
+
 """
 RECOMMENDATION: DO NOT EDIT THE VARIABLES BELOW THIS COMMENT
 """
@@ -18,6 +43,8 @@ OUTPUT_EXECUTION_OBJECTS_DIR = "{output_dir}execution_objects/".format(output_di
 OUTPUT_DEPLOYED_MODEL_DIR = "{output_dir}deployed_model/".format(output_dir=OUTPUT_DIR)
 OUTPUT_PREDICTIONS_DIR = "{output_dir}predictions/".format(output_dir=OUTPUT_DIR)
 OUTPUT_FIGURES_DIR = "{output_dir}figures/".format(output_dir=OUTPUT_DIR)
+OUTPUT_PROFILES_DIR = "{output_dir}profiles/".format(output_dir=OUTPUT_DIR)
+OUTPUT_WINDOW_CACHE_DIR = "{output_dir}window_cache/".format(output_dir=OUTPUT_DIR)
 TEST_DIR = "{project_dir}test/".format(project_dir=PROJECT_DIR)
 DATA_DIR = "{project_dir}datasets/".format(project_dir=PROJECT_DIR)
 ASSETS_DIR = "{project_dir}assets/".format(project_dir=PROJECT_DIR)
@@ -26,9 +53,12 @@ PREDICTION_DIR = "{data_dir}prediction/".format(data_dir=DATA_DIR)
 
 SCALER_FILE_NAME = "scaler.pkl"
 FORECASTER_SUB_DIR = "forecaster_assets"
+FORECASTER_WEIGHTS_FILE_NAME = "forecaster_weights.npz"
+FORECASTER_TFLITE_FILE_NAME = "forecaster.tflite"
 SAMPLER_FILE_NAME = "sampler.pkl"
 CLASSIFIER_FILE_NAME = "classifier.pkl"
 DEFINITIONS_DICT_FILE_NAME = "definitions_dict.pkl"
+RISK_RATE_STATES_FILE_NAME = "risk_rate_states.pkl"
 
 LOG_FILE = "{output_dir}app.log".format(output_dir=OUTPUT_DIR)
 LOG_FORMAT = "%(asctime)s %(levelname)s %(threadName)s %(name)s %(message)s"
@@ -37,6 +67,7 @@ SEED = 0
 
 SCALING_METHOD_KEY = 'scaling_method'
 FORECASTING_ALGORITHM_KEY = 'forecasting_algorithm'
+FORECASTING_MODE_KEY = 'forecasting_mode'
 SAMPLING_METHOD_KEY = 'sampling_method'
 CLASSIFICATION_ALGORITHM_KEY = 'classification_algorithm'
 THRESHOLDS_KEY = 'thresholds'
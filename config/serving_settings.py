@@ -0,0 +1,16 @@
+"""
+Config: Serving Settings File
+-----------------------------------
+"""
+
+# Address of the prediction service started by "./run.sh serve"
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8080
+
+# Requests arriving within SERVE_BATCH_WAIT seconds of each other are forecasted and classified together,
+# up to SERVE_MAX_BATCH_SIZE requests per batch
+SERVE_BATCH_WAIT = 0.005
+SERVE_MAX_BATCH_SIZE = 64
+
+# How often (in seconds) the deployed model files are checked, so that a new deployment is loaded without a restart
+SERVE_RELOAD_INTERVAL = 5.0
@@ -11,6 +11,7 @@ run_directories_check()
   mkdir -p output/
   mkdir -p output/execution_objects/
   mkdir -p output/figures/
+  mkdir -p output/profiles/
   mkdir -p output/deployed_model/
   mkdir -p output/predictions/
   mkdir -p datasets/
@@ -38,6 +39,31 @@ run_predict()
   TF_CPP_MIN_LOG_LEVEL=3 python3 -W ignore PantanalFireDetection.py predict
 }
 
+run_serve()
+{
+  TF_CPP_MIN_LOG_LEVEL=3 python3 -W ignore PantanalFireDetection.py serve
+}
+
+run_benchmark_training()
+{
+  TF_CPP_MIN_LOG_LEVEL=3 python3 -W ignore PantanalFireDetection.py benchmark-training
+}
+
+run_benchmark_inference()
+{
+  TF_CPP_MIN_LOG_LEVEL=3 python3 -W ignore PantanalFireDetection.py benchmark-inference
+}
+
+run_benchmark_imports()
+{
+  python3 -W ignore PantanalFireDetection.py benchmark-imports
+}
+
+run_plan()
+{
+  TF_CPP_MIN_LOG_LEVEL=3 python3 -W ignore PantanalFireDetection.py $1 --plan
+}
+
 if [ "$1" == "build" ]; then
   echo ">>>>>>>>>>>> [1/3] Running directories check"
   run_directories_check
@@ -55,6 +81,36 @@ elif [ "$1" == "predict" ]; then
   run_directories_check
   echo ">>>>>>>>>>>> [2/2] Making predictions"
   run_predict
+elif [ "$1" == "serve" ]; then
+  echo ">>>>>>>>>>>> [1/2] Running directories check"
+  run_directories_check
+  echo ">>>>>>>>>>>> [2/2] Serving the predictions"
+  run_serve
+elif [ "$1" == "plan-fit" ]; then
+  echo ">>>>>>>>>>>> [1/2] Running directories check"
+  run_directories_check
+  echo ">>>>>>>>>>>> [2/2] Planning the fit"
+  run_plan fit
+elif [ "$1" == "plan-predict" ]; then
+  echo ">>>>>>>>>>>> [1/2] Running directories check"
+  run_directories_check
+  echo ">>>>>>>>>>>> [2/2] Planning the predictions"
+  run_plan predict
+elif [ "$1" == "benchmark-training" ]; then
+  echo ">>>>>>>>>>>> [1/2] Running directories check"
+  run_directories_check
+  echo ">>>>>>>>>>>> [2/2] Benchmarking the training settings"
+  run_benchmark_training
+elif [ "$1" == "benchmark-inference" ]; then
+  echo ">>>>>>>>>>>> [1/2] Running directories check"
+  run_directories_check
+  echo ">>>>>>>>>>>> [2/2] Benchmarking the inference backends"
+  run_benchmark_inference
+elif [ "$1" == "benchmark-imports" ]; then
+  echo ">>>>>>>>>>>> [1/2] Running directories check"
+  run_directories_check
+  echo ">>>>>>>>>>>> [2/2] Benchmarking the imports"
+  run_benchmark_imports
 elif [ "$1" == "all" ]; then
   echo ">>>>>>>>>>>> [1/5] Running directories check"
   run_directories_check
@@ -68,5 +124,5 @@ elif [ "$1" == "all" ]; then
   run_predict
 else
   echo ">>>>>>>>>>>> Option \"$1\" not found. Please try again with one of the following options:"
-  echo "- build - fit - predict - all"
+  echo "- build - fit - predict - serve - plan-fit - plan-predict - benchmark-training - benchmark-inference - benchmark-imports - all"
 fi
\ No newline at end of file
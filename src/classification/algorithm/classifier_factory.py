@@ -1,18 +1,22 @@
 """Module which represents a factory for ClassificationAlgorithmEnums"""
-from src.classification.algorithm.catboost_classifier import CatBoostClassifier
 from src.classification.algorithm.classifier import Classifier
-from src.classification.algorithm.dtree_classifier import DecisionTreeClassifier
-from src.classification.algorithm.knn_classifier import KNNClassifier
-from src.classification.algorithm.lightgbm_classifier import LightGBMClassifier
-from src.classification.algorithm.logistic_regression_classifier import LogisticRegressionClassifier
-from src.classification.algorithm.mlp_classifier import MLPClassifier
-from src.classification.algorithm.nb_classifier import NaiveBayesClassifier
-from src.classification.algorithm.rforest_classifier import RandomForestClassifier
-from src.classification.algorithm.svm_classifier import SVMClassifier
-from src.classification.algorithm.xgboost_classifier import XGBoostClassifier
 from src.enum.classification_algorithms_enum import ClassificationAlgorithmEnum
 from src.exception.not_implemented_exception import NotImplementedException
 
+# The modules of the classifiers, imported when they are chosen. They are code dependencies of the factory nonetheless
+LAZY_MODULE_NAMES = [
+    "src.classification.algorithm.mlp_classifier",
+    "src.classification.algorithm.knn_classifier",
+    "src.classification.algorithm.svm_classifier",
+    "src.classification.algorithm.nb_classifier",
+    "src.classification.algorithm.dtree_classifier",
+    "src.classification.algorithm.rforest_classifier",
+    "src.classification.algorithm.xgboost_classifier",
+    "src.classification.algorithm.logistic_regression_classifier",
+    "src.classification.algorithm.lightgbm_classifier",
+    "src.classification.algorithm.catboost_classifier",
+]
+
 
 def get(clf_algorithm: ClassificationAlgorithmEnum) -> Classifier:
     """
@@ -25,23 +29,74 @@ def get(clf_algorithm: ClassificationAlgorithmEnum) -> Classifier:
     if not isinstance(clf_algorithm, ClassificationAlgorithmEnum):
         raise TypeError("Parameter algorithm must be of type ClassificationAlgorithmEnum")
     if clf_algorithm == ClassificationAlgorithmEnum.MLP:
-        return MLPClassifier()
+        return __mlp()
     if clf_algorithm == ClassificationAlgorithmEnum.KNN:
-        return KNNClassifier()
+        return __knn()
     if clf_algorithm == ClassificationAlgorithmEnum.SVM:
-        return SVMClassifier()
+        return __svm()
     if clf_algorithm == ClassificationAlgorithmEnum.NB:
-        return NaiveBayesClassifier()
+        return __nb()
     if clf_algorithm == ClassificationAlgorithmEnum.DTREE:
-        return DecisionTreeClassifier()
+        return __dtree()
     if clf_algorithm == ClassificationAlgorithmEnum.RFOREST:
-        return RandomForestClassifier()
+        return __rforest()
     if clf_algorithm == ClassificationAlgorithmEnum.XGBOOST:
-        return XGBoostClassifier()
+        return __xgboost()
     if clf_algorithm == ClassificationAlgorithmEnum.LR:
-        return LogisticRegressionClassifier()
+        return __lr()
     if clf_algorithm == ClassificationAlgorithmEnum.LIGHTGBM:
-        return LightGBMClassifier()
+        return __lightgbm()
     if clf_algorithm == ClassificationAlgorithmEnum.CATBOOST:
-        return CatBoostClassifier()
+        return __catboost()
     raise NotImplementedException("No Classifier implemented for classification algorithm {}".format(clf_algorithm.value))
+
+
+# Each classifier is imported when it is chosen, so that XGBoost, LightGBM and CatBoost are only imported by their own classifiers
+def __mlp() -> Classifier:
+    from src.classification.algorithm.mlp_classifier import MLPClassifier
+    return MLPClassifier()
+
+
+def __knn() -> Classifier:
+    from src.classification.algorithm.knn_classifier import KNNClassifier
+    return KNNClassifier()
+
+
+def __svm() -> Classifier:
+    from src.classification.algorithm.svm_classifier import SVMClassifier
+    return SVMClassifier()
+
+
+def __nb() -> Classifier:
+    from src.classification.algorithm.nb_classifier import NaiveBayesClassifier
+    return NaiveBayesClassifier()
+
+
+def __dtree() -> Classifier:
+    from src.classification.algorithm.dtree_classifier import DecisionTreeClassifier
+    return DecisionTreeClassifier()
+
+
+def __rforest() -> Classifier:
+    from src.classification.algorithm.rforest_classifier import RandomForestClassifier
+    return RandomForestClassifier()
+
+
+def __xgboost() -> Classifier:
+    from src.classification.algorithm.xgboost_classifier import XGBoostClassifier
+    return XGBoostClassifier()
+
+
+def __lr() -> Classifier:
+    from src.classification.algorithm.logistic_regression_classifier import LogisticRegressionClassifier
+    return LogisticRegressionClassifier()
+
+
+def __lightgbm() -> Classifier:
+    from src.classification.algorithm.lightgbm_classifier import LightGBMClassifier
+    return LightGBMClassifier()
+
+
+def __catboost() -> Classifier:
+    from src.classification.algorithm.catboost_classifier import CatBoostClassifier
+    return CatBoostClassifier()
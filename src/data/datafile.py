@@ -46,9 +46,7 @@ class Datafile:
 
     def __extract_full_file_path(self) -> None:
         """Extract full file path from file name and data source"""
-        self.full_file_path = "{data_dir}{data_source_name}/{file_name}".format(data_dir=cfg.DATA_DIR,
-                                                                                data_source_name=self.data_source.value,
-                                                                                file_name=self.file_name)
+        self.full_file_path = get_full_file_path(self.data_source, self.file_name)
 
     def __extract_file_extension(self) -> None:
         """Extract file extension from file name, so that the correct file reader is set"""
@@ -64,3 +62,15 @@ class Datafile:
         """Extract data from file"""
         file_reader = file_reader_factory.get(self.file_extension)
         self.data = file_reader.read_data(self.full_file_path)
+
+
+def get_full_file_path(data_source: DataSourceEnum, file_name: str) -> str:
+    """
+    Get the full file path from file name and data source, without reading the file
+    :param data_source: The source of the data
+    :param file_name: The name of the file that contains the data
+    :return: the full file path
+    """
+    return "{data_dir}{data_source_name}/{file_name}".format(data_dir=cfg.DATA_DIR,
+                                                             data_source_name=data_source.value,
+                                                             file_name=file_name)
@@ -0,0 +1,10 @@
+"""Module which contains the ForecastingModeEnum enum class"""
+
+from src.enum.enum_class import EnumClass
+
+
+class ForecastingModeEnum(EnumClass):
+    """Enum for the ways a forecaster reaches the days of the forecast horizon"""
+
+    RECURSIVE = "Recursive"
+    DIRECT = "Direct"
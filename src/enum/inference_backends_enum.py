@@ -0,0 +1,11 @@
+"""Module which contains the InferenceBackendEnum enum class"""
+
+from src.enum.enum_class import EnumClass
+
+
+class InferenceBackendEnum(EnumClass):
+    """Enum for the ways the predictions run the deployed forecaster"""
+
+    NUMPY = "numpy"
+    TFLITE = "tflite"
+    KERAS = "keras"
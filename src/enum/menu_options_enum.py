@@ -8,3 +8,7 @@ class MenuOptionEnum(EnumClass):
 
     FIT = "fit"
     PREDICT = "predict"
+    SERVE = "serve"
+    BENCHMARK_TRAINING = "benchmark-training"
+    BENCHMARK_INFERENCE = "benchmark-inference"
+    BENCHMARK_IMPORTS = "benchmark-imports"
@@ -21,7 +21,8 @@ class RiskRateIndexEnum(EnumClass):
     def prob_threshold(self) -> float:
         """
         Getter for prob_threshold
-        :return: The threshold of the probability (0 to 1) so which it belongs to the index
+        :return: The default threshold of the probability (0 to 1) so which it belongs to the index.
+        The thresholds selected for a model are held by a ThresholdSet
         """
         return self._prob_threshold_
 
@@ -33,13 +34,6 @@ class RiskRateIndexEnum(EnumClass):
         """
         return self._factor_value_
 
-    def set_prob_threshold(self, threshold: float) -> None:
-        """
-        Setter for prob_threshold
-        :param threshold: The new threshold that wants to be set to the index
-        """
-        self._prob_threshold_ = threshold
-
     # (Name, Default Threshold, Factor)
     NULO = ("Nulo", 0.05, 0)
     PEQUENO = ("Pequeno", 0.25, 1)
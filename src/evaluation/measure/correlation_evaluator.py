@@ -3,6 +3,10 @@ Module which contains the CorrelationEvaluator class
 It contains the required methods to calculate the evaluation measure
 based on the correlations between hotspot identified and risk rate index
 """
+from typing import List, Tuple
+
+import numpy as np
+
 import pandas as pd
 
 import config.dataset_settings as dscfg
@@ -38,32 +42,34 @@ class CorrelationEvaluator(Evaluator):
             measure_names.append(measure_name)
         output[dscfg.EVALUATION_METRIC_COLUMN_NAME] = measure_names
 
-        for column_name in column_names:
-            correlation = []
-            count = []
+        counts, hotspot_counts = self.__count_risk_rates(dataset, column_names)
+        for i, column_name in enumerate(column_names):
             prefix = column_name[0:(len(column_name) - len(index_suffix) - 1)]
-            for risk_rate in RiskRateIndexEnum:
-                curr_correlation = self.__calculate_correlation_rate(dataset, column_name, risk_rate.value)
-                curr_count = dataset[dataset[column_name] == risk_rate.value].shape[0]
-                correlation.append(curr_correlation)
-                count.append(curr_count)
-            output[prefix] = correlation
-            output[prefix + dscfg.COMMON_SEPARATOR + dscfg.COUNT_SUFFIX] = count
+            output[prefix] = [hotspot_count / count if count > 0 else 0
+                              for count, hotspot_count in zip(counts[i], hotspot_counts[i])]
+            output[prefix + dscfg.COMMON_SEPARATOR + dscfg.COUNT_SUFFIX] = counts[i]
         return output
 
-    def __calculate_correlation_rate(self,
-                                     data: pd.DataFrame,
-                                     column_name: str, rate: str) -> float:
+    def __count_risk_rates(self, dataset: pd.DataFrame, column_names: List[str]) -> Tuple[List[List[int]], List[List[int]]]:
         """
-        Calculates correlation rate
-        :param data: the data for which the measures will be calculated
-        :param column_name: the column to be considered for calculation
-        :return: correlation rate for column in data
+        Counts the rows of each risk rate, and the rows of each risk rate with hotspots identified, for every column at once.
+        Each (column, risk rate) pair gets a bin, so that a single bincount counts all of them
+        :param dataset: the dataset for which the measures will be calculated
+        :param column_names: the risk rate index columns
+        :return: the counts and the hotspot counts, one list per column with one value per risk rate
         """
-        rate_data = pdutils.select_rows_by_value(data, column_name, rate)
-        if rate_data.empty:
-            return 0
-        rate_data_true = pdutils.select_rows_by_value(rate_data,
-                                                      dscfg.HOTSPOT_IDENTIFIED_COLUMN_NAME,
-                                                      1)
-        return rate_data_true.shape[0] / rate_data.shape[0]
+        if not column_names:
+            return [], []
+        risk_rates = [risk_rate.value for risk_rate in RiskRateIndexEnum]
+        n_bins = len(column_names) * len(risk_rates)
+
+        # Codes are -1 for the values which are not a risk rate
+        codes = np.stack([pd.Categorical(dataset[column_name], categories=risk_rates).codes for column_name in column_names])
+        bins = codes + (np.arange(len(column_names)) * len(risk_rates))[:, np.newaxis]
+        valid = codes >= 0
+        counts = np.bincount(bins[valid], minlength=n_bins)
+
+        hotspots = (dataset[dscfg.HOTSPOT_IDENTIFIED_COLUMN_NAME] == 1).to_numpy()
+        hotspot_counts = np.bincount(bins[valid & hotspots], minlength=n_bins)
+        shape = (len(column_names), len(risk_rates))
+        return counts.reshape(shape).tolist(), hotspot_counts.reshape(shape).tolist()
@@ -0,0 +1,6 @@
+"""Module which contains the PlanInterruptionException class"""
+
+
+class PlanInterruptionException(Exception):
+    """Exception for when a step would re-run in plan mode, so the following steps cannot be planned from its output"""
+    pass
@@ -10,9 +10,6 @@ import numpy as np
 
 import pandas as pd
 
-from tensorflow.keras import Sequential
-from tensorflow.keras.layers import Conv1D, Dense, Flatten, LSTM, MaxPooling1D, TimeDistributed
-
 import config.forecast_settings as fccfg
 
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
@@ -27,6 +24,7 @@ class CNNForecaster(Forecaster):
 
     algorithm = ForecastingAlgorithmEnum.CNN
     forecaster = None
+    history_file_name = "cnn_forecaster_history.png"
 
     def build_architecture(self, dataset: pd.DataFrame) -> Tuple[np.array, np.array, Any]:
         """
@@ -34,6 +32,9 @@ class CNNForecaster(Forecaster):
         :param dataset: The dataset for training the forecaster
         :return: a list containing the assets X and y from dataset, and the forecaster base architecture
         """
+        from tensorflow.keras import Sequential
+        from tensorflow.keras.layers import Conv1D, Flatten, LSTM, MaxPooling1D, TimeDistributed
+
         super(CNNForecaster, self).build_architecture(dataset)
         architecture = Sequential(name='cnn-lstm')
 
@@ -53,22 +54,6 @@ class CNNForecaster(Forecaster):
             name='lstm_2',
             input_shape=(fccfg.OBSERVATION_WINDOW, n_features),
             units=100))
-        architecture.add(Dense(
-            name='dense',
-            units=n_features,
-            activation='sigmoid'))
+        self.add_output_layers(architecture, n_features)
 
         return X, y, architecture
-
-    def learn(self, dataset: pd.DataFrame) -> Any:
-        """
-        Trains the CNN+LSTM forecasting model
-        :param dataset: The dataset for training the forecaster
-        :return: The history from forecaster
-        """
-        history = super(CNNForecaster, self).learn(dataset)
-
-        self.plot_history(history, "cnn_forecaster_history.png")
-        # self.plot_model("cnn_forecaster_model.png")
-
-        return history
@@ -1,23 +1,27 @@
 """
 Module which contains the Forecaster class
 It contains the required methods to train a forecasting model and extract forecasted data
+TensorFlow (and matplotlib) are imported by the methods that build, train and plot the model, so that
+a deployed forecaster run by a NumpyModel does not import them
 """
-from typing import Any, List, Tuple
-
-import matplotlib.pyplot as plt
+import math
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 import pandas as pd
 
-from tensorflow.keras.callbacks import EarlyStopping
-from tensorflow.keras.utils import plot_model
-
 import config.data_preparation_settings as dpcfg
 import config.forecast_settings as fccfg
 import config.general_settings as cfg
 
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
+from src.forecasting.training_settings import TrainingSettings
+
+# The batch size of evaluate, as in the evaluate of Keras
+EVALUATION_BATCH_SIZE = 32
 
 
 class Forecaster:
@@ -25,6 +29,15 @@ class Forecaster:
 
     algorithm: ForecastingAlgorithmEnum
     forecaster: Any
+    history_file_name: str
+    mode: ForecastingModeEnum
+
+    def __init__(self, mode: Optional[ForecastingModeEnum] = None):
+        """
+        Class constructor
+        :param mode: How the days of the forecast horizon are forecasted, FORECASTING_MODE by default
+        """
+        self.mode = mode if mode is not None else ForecastingModeEnum(fccfg.FORECASTING_MODE)
 
     def build_architecture(self, dataset: pd.DataFrame) -> Tuple[np.array, np.array, Any]:
         """
@@ -35,31 +48,73 @@ class Forecaster:
         if self.__class__ == Forecaster:
             raise Exception("Class Forecaster must not be called directly")
 
-    def learn(self, dataset: pd.DataFrame) -> Any:
+    def learn(self, dataset: Union[pd.DataFrame, np.ndarray], training_settings: Optional[TrainingSettings] = None) -> Any:
         """
         Trains the forecasting model
         :param dataset: The dataset for training the forecaster
+        :param training_settings: How the forecaster is trained, the forecast settings by default
         :return: The history from forecaster
         """
         if self.__class__ == Forecaster:
             raise Exception("Class Forecaster must not be called directly")
+        if training_settings is None:
+            training_settings = TrainingSettings.from_config()
+
+        from tensorflow.keras.callbacks import EarlyStopping
 
         X, y, self.forecaster = self.build_architecture(dataset)
-        self.forecaster.compile(loss=fccfg.ERROR_METRIC, optimizer='adam', metrics=['mse', 'mae'])
+        self.__compile(training_settings.get_learning_rate())
 
         callback = EarlyStopping(monitor='val_loss', patience=fccfg.EARLY_STOPPING_PATIENCE)
 
-        history = self.forecaster.fit(X, y,
-                                      epochs=fccfg.NB_EPOCHS,
-                                      callbacks=[callback],
-                                      verbose=fccfg.VERBOSE,
-                                      validation_split=1 - dpcfg.TRAIN_SIZE,
-                                      batch_size=1,
-                                      shuffle=False)
+        if training_settings.dataset_pipeline:
+            train_dataset, validation_dataset = self.__create_datasets(np.asarray(dataset), len(X), training_settings)
+            history = self.forecaster.fit(train_dataset,
+                                          epochs=training_settings.epochs,
+                                          callbacks=[callback],
+                                          verbose=training_settings.verbose,
+                                          validation_data=validation_dataset)
+        else:
+            # Keras materializes the whole windows before fitting
+            history = self.forecaster.fit(X, y,
+                                          epochs=training_settings.epochs,
+                                          callbacks=[callback],
+                                          verbose=training_settings.verbose,
+                                          validation_split=1 - dpcfg.TRAIN_SIZE,
+                                          batch_size=training_settings.batch_size,
+                                          shuffle=False)
+
+        if training_settings.plot_history:
+            self.plot_history(history, self.history_file_name)
 
         return history
 
-    def evaluate(self, dataset: pd.DataFrame) -> List[float]:
+    def save_weights(self, file_path: str) -> None:
+        """
+        Saves the weights of the trained forecasting model
+        :param file_path: The file path of the weights
+        """
+        if self.__class__ == Forecaster:
+            raise Exception("Class Forecaster must not be called directly")
+        if self.forecaster is None:
+            raise Exception("You must train the forecaster before calling save_weights method")
+
+        self.forecaster.save_weights(file_path)
+
+    def restore(self, dataset: Union[pd.DataFrame, np.ndarray], file_path: str) -> None:
+        """
+        Restores a trained forecasting model from its weights, without training it again
+        :param dataset: The dataset the forecaster was trained with
+        :param file_path: The file path of the weights
+        """
+        if self.__class__ == Forecaster:
+            raise Exception("Class Forecaster must not be called directly")
+
+        _, _, self.forecaster = self.build_architecture(dataset)
+        self.__compile(TrainingSettings.from_config().get_learning_rate())
+        self.forecaster.load_weights(file_path)
+
+    def evaluate(self, dataset: Union[pd.DataFrame, np.ndarray]) -> List[float]:
         """
         Gets score for model in a test set
         :param dataset: The dataset for testing the model
@@ -70,10 +125,9 @@ class Forecaster:
         if self.forecaster is None:
             raise Exception("You must train the forecaster before calling evaluate method")
 
-        assets = self.get_assets(dataset)
-        X = assets[0]
-        y = assets[1]
-        scores = self.forecaster.evaluate(X, y)
+        sequence = np.asarray(dataset, dtype=np.float32)
+        n_windows = self.get_assets(dataset)[0].shape[0]
+        scores = self.forecaster.evaluate(self.__create_dataset(sequence, 0, n_windows, EVALUATION_BATCH_SIZE))
         if not isinstance(scores, list):
             scores = [scores]
         return scores
@@ -97,16 +151,53 @@ class Forecaster:
         forecasted = pd.DataFrame(self.forecaster.predict(dataset))
         return forecasted
 
-    def get_assets(self, dataset: pd.DataFrame) -> Tuple[np.array, np.array, int]:
+    def forecast_windows(self, windows: np.array) -> np.array:
+        """
+        Extracts the forecasted data for many observation windows at once, after training the model
+        :param windows: The observation windows, with shape (n_windows, OBSERVATION_WINDOW, n_features)
+        :return: The forecasted values, one row per window. In direct mode, each row has the values of
+        every day of the horizon, with shape (n_windows, FORECAST_HORIZON, n_features)
         """
-        Extracts the assets given the dataset, for the forecaster
+        if self.__class__ == Forecaster:
+            raise Exception("Class Forecaster must not be called directly")
+
+        if self.forecaster is None:
+            raise Exception("You must train the forecaster before calling forecast method")
+
+        return np.asarray(self.forecaster.predict(windows, verbose=0))
+
+    def get_assets(self, dataset: Union[pd.DataFrame, np.ndarray]) -> Tuple[np.array, np.array, int]:
+        """
+        Extracts the assets given the dataset, for the forecaster. The input and target are read-only views
+        of the dataset, so the windows are not copied until they are used
         :param dataset: The dataset from which the assets will be extracted
         :return: The input (x) and target (y), as well as the number of features
         """
         X, y = self.__split_sequence(np.asarray(dataset))
-        n_rows = X.shape[0]
-        X, n_features = self.__reshape_dataset(X, n_rows)
-        return X, y, n_features
+        return X, y, X.shape[2]
+
+    def add_output_layers(self, architecture: Any, n_features: int) -> None:
+        """
+        Adds the output layers of the forecaster to its architecture: the values of the next day,
+        or in direct mode, the values of every day of the forecast horizon
+        :param architecture: The forecaster base architecture
+        :param n_features: The number of features
+        """
+        from tensorflow.keras.layers import Dense, Reshape
+
+        if self.mode == ForecastingModeEnum.DIRECT:
+            architecture.add(Dense(
+                name='dense',
+                units=fccfg.FORECAST_HORIZON * n_features,
+                activation='sigmoid'))
+            architecture.add(Reshape(
+                name='horizon',
+                target_shape=(fccfg.FORECAST_HORIZON, n_features)))
+        else:
+            architecture.add(Dense(
+                name='dense',
+                units=n_features,
+                activation='sigmoid'))
 
     def plot_history(self, history: Any, file_name: str) -> None:
         """
@@ -114,6 +205,8 @@ class Forecaster:
         :param history: the history
         :param file_name: the file name, without path
         """
+        import matplotlib.pyplot as plt
+
         plt.plot(history.history['loss'])
         plt.plot(history.history['val_loss'])
         plt.title('model train vs validation loss')
@@ -128,7 +221,9 @@ class Forecaster:
         Plots the model and saves
         :param file_name: the file name, without path
         """
-        plot_model(
+        import tensorflow as tf
+
+        tf.keras.utils.plot_model(
             self.forecaster,
             to_file=cfg.OUTPUT_FIGURES_DIR + file_name,
             show_shapes=True,
@@ -141,23 +236,83 @@ class Forecaster:
             show_layer_activations=True
         )
 
+    def __compile(self, learning_rate: float) -> None:
+        """
+        Compiles the forecasting model
+        :param learning_rate: The learning rate of the optimizer
+        """
+        from tensorflow.keras.optimizers import Adam
+
+        self.forecaster.compile(loss=fccfg.ERROR_METRIC, optimizer=Adam(learning_rate=learning_rate), metrics=['mse', 'mae'])
+
+    def __create_datasets(self, sequence: np.array, n_windows: int, training_settings: TrainingSettings) -> Tuple[Any, Any]:
+        """
+        Creates the tf.data pipelines of the training and validation windows. The last windows are
+        for validation, as in the validation_split of fit
+        :param sequence: The sequence that will be used by the forecaster
+        :param n_windows: The number of windows in the sequence
+        :param training_settings: How the forecaster is trained
+        :return: The training and validation datasets
+        """
+        split_at = int(math.ceil(n_windows * (1.0 - (1 - dpcfg.TRAIN_SIZE))))
+        sequence = np.asarray(sequence, dtype=np.float32)
+        return (self.__create_dataset(sequence, 0, split_at, training_settings.batch_size, training_settings),
+                self.__create_dataset(sequence, split_at, n_windows, training_settings.batch_size, training_settings))
+
+    def __create_dataset(self, sequence: np.array, first_window: int, last_window: int, batch_size: int,
+                         training_settings: Optional[TrainingSettings] = None) -> Any:
+        """
+        Creates the tf.data pipeline of windows, in order. Only the sequence is held by the pipeline,
+        and the windows of each batch are gathered from it when the batch is needed
+        :param sequence: The sequence that will be used by the forecaster
+        :param first_window: The position of the first window
+        :param last_window: The position after the last window
+        :param batch_size: The windows per batch
+        :param training_settings: How the forecaster is trained, which tells whether the batches are cached and prefetched
+        :return: The dataset
+        """
+        import tensorflow as tf
+
+        sequence = tf.constant(sequence)
+        offsets = tf.range(fccfg.OBSERVATION_WINDOW, dtype=tf.int64)
+        target_offsets = tf.range(fccfg.OBSERVATION_WINDOW, fccfg.OBSERVATION_WINDOW + fccfg.FORECAST_HORIZON, dtype=tf.int64)
+
+        def gather_windows(starts: tf.Tensor) -> Tuple[tf.Tensor, tf.Tensor]:
+            if self.mode == ForecastingModeEnum.DIRECT:
+                return (tf.gather(sequence, starts[:, tf.newaxis] + offsets),
+                        tf.gather(sequence, starts[:, tf.newaxis] + target_offsets))
+            return (tf.gather(sequence, starts[:, tf.newaxis] + offsets),
+                    tf.gather(sequence, starts + fccfg.OBSERVATION_WINDOW))
+
+        dataset = tf.data.Dataset.range(first_window, last_window).batch(batch_size).map(gather_windows)
+        if training_settings is not None and training_settings.cache:
+            dataset = dataset.cache()
+        if training_settings is not None and training_settings.prefetch:
+            dataset = dataset.prefetch(tf.data.AUTOTUNE)
+        return dataset
+
     def __split_sequence(self, sequence: np.array) -> Tuple[np.array, np.array]:
         """
-        Extracts the input and target data for forecasting models
+        Extracts the input and target data for forecasting models, as strided views of the sequence.
+        In direct mode, the target of each window is made of the FORECAST_HORIZON rows after it
         :param sequence: The sequence that will be used by the forecaster
         :return: The input (x) and target (y) sequences for training
         """
-        n_col = len(sequence[0])
-        x, y = list(), list()
-        for i in range(len(sequence)):
-            end_ix = i + fccfg.OBSERVATION_WINDOW
-            if end_ix > len(sequence) - 1:
-                break
-            seq_x = sequence[i:end_ix, 0:n_col]
-            x.append(seq_x)
-            seq_y = sequence[end_ix, 0:n_col]
-            y.append(seq_y)
-        return np.array(x), np.array(y)
+        n_col = sequence.shape[1]
+        direct = self.mode == ForecastingModeEnum.DIRECT
+        n_targets = fccfg.FORECAST_HORIZON if direct else 1
+        n_windows = max(len(sequence) - fccfg.OBSERVATION_WINDOW - n_targets + 1, 0)
+        if n_windows == 0:
+            target_shape = (0, n_targets, n_col) if direct else (0, n_col)
+            return np.empty((0, fccfg.OBSERVATION_WINDOW, n_col), dtype=sequence.dtype), np.empty(target_shape, dtype=sequence.dtype)
+        # Each window is (OBSERVATION_WINDOW, n_col), and the last ones have no target
+        x = sliding_window_view(sequence, (fccfg.OBSERVATION_WINDOW, n_col))[:n_windows, 0]
+        if direct:
+            y = sliding_window_view(sequence, (n_targets, n_col))[fccfg.OBSERVATION_WINDOW:fccfg.OBSERVATION_WINDOW + n_windows, 0]
+        else:
+            y = sequence[fccfg.OBSERVATION_WINDOW:]
+            y.flags.writeable = False
+        return x, y
 
     def __reshape_dataset(self, dataset: np.array, first_dim: int) -> Tuple[np.array, int]:
         """
@@ -1,6 +1,8 @@
 """Module which represents a factory for Forecaster"""
+from typing import Optional
 
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
 from src.exception.not_implemented_exception import NotImplementedException
 from src.forecasting.algorithm.cnn_forecaster import CNNForecaster
 from src.forecasting.algorithm.forecaster import Forecaster
@@ -8,10 +10,11 @@ from src.forecasting.algorithm.gru_forecaster import GRUForecaster
 from src.forecasting.algorithm.lstm_forecaster import LSTMForecaster
 
 
-def get(forecast_algorithm: ForecastingAlgorithmEnum) -> Forecaster:
+def get(forecast_algorithm: ForecastingAlgorithmEnum, mode: Optional[ForecastingModeEnum] = None) -> Forecaster:
     """
     Factory method for ForecastAlgorithms
     :param forecast_algorithm: The enum for forecasting algorithm
+    :param mode: How the days of the forecast horizon are forecasted, FORECASTING_MODE by default
     :return: The forecaster object for that given enum
     """
     if not forecast_algorithm:
@@ -19,9 +22,9 @@ def get(forecast_algorithm: ForecastingAlgorithmEnum) -> Forecaster:
     if not isinstance(forecast_algorithm, ForecastingAlgorithmEnum):
         raise TypeError("Parameter forecast_algorithm must be of type ForecastingAlgorithmEnum")
     if forecast_algorithm == ForecastingAlgorithmEnum.LSTM:
-        return LSTMForecaster()
+        return LSTMForecaster(mode)
     if forecast_algorithm == ForecastingAlgorithmEnum.GRU:
-        return GRUForecaster()
+        return GRUForecaster(mode)
     if forecast_algorithm == ForecastingAlgorithmEnum.CNN:
-        return CNNForecaster()
+        return CNNForecaster(mode)
     raise NotImplementedException("No Forecaster implemented for forecasting algorithm {}".format(forecast_algorithm.value))
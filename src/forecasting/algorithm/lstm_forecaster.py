@@ -9,9 +9,6 @@ import numpy as np
 
 import pandas as pd
 
-from tensorflow.keras import Sequential
-from tensorflow.keras.layers import Dense, LSTM
-
 import config.forecast_settings as fccfg
 
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
@@ -26,6 +23,7 @@ class LSTMForecaster(Forecaster):
 
     algorithm = ForecastingAlgorithmEnum.LSTM
     forecaster = None
+    history_file_name = "lstm_forecaster_history.png"
 
     def build_architecture(self, dataset: pd.DataFrame) -> Tuple[np.array, np.array, Any]:
         """
@@ -33,6 +31,9 @@ class LSTMForecaster(Forecaster):
         :param dataset: The dataset for training the forecaster
         :return: a list containing the assets X and y from dataset, and the forecaster base architecture
         """
+        from tensorflow.keras import Sequential
+        from tensorflow.keras.layers import LSTM
+
         super(LSTMForecaster, self).build_architecture(dataset)
         architecture = Sequential(name='lstm')
 
@@ -46,22 +47,6 @@ class LSTMForecaster(Forecaster):
             name='lstm_2',
             input_shape=(fccfg.OBSERVATION_WINDOW, n_features),
             units=100))
-        architecture.add(Dense(
-            name='dense',
-            units=n_features,
-            activation='sigmoid'))
+        self.add_output_layers(architecture, n_features)
 
         return X, y, architecture
-
-    def learn(self, dataset: pd.DataFrame) -> Any:
-        """
-        Trains the LSTM forecasting model
-        :param dataset: The dataset for training the forecaster
-        :return: The history from forecaster
-        """
-        history = super(LSTMForecaster, self).learn(dataset)
-
-        self.plot_history(history, "lstm_forecaster_history.png")
-        # self.plot_model("lstm_forecaster_model.png")
-
-        return history
@@ -5,6 +5,8 @@ model (train + test)
 """
 from typing import List
 
+import numpy as np
+
 import pandas as pd
 
 import config.dataset_settings as dscfg
@@ -12,6 +14,7 @@ import config.forecast_settings as fccfg
 import config.general_settings as cfg
 
 import src.utils.pandas_utils as pdutils
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
 from src.forecasting.algorithm.forecaster import Forecaster
 
 
@@ -32,21 +35,27 @@ def create_forecasted_datasets(forecaster: Forecaster,
     dataset = pdutils.delete_columns(dataset, columns_ignore)
 
     predict_start_index = X_train.shape[0]
+    values = dataset.to_numpy(dtype=np.float64)
 
     forecasted_datasets = []
-    last_forecasted_dataset = pd.DataFrame()
-
-    # Generates X different forecasted datasets, with X being equal to
-    # FORECAST_HORIZON setting
-    for i in range(0, fccfg.FORECAST_HORIZON):
-        forecasted_dataset = __generate_forecasted_dataset(dataset,
-                                                           predict_start_index,
-                                                           X_test,
-                                                           forecaster,
-                                                           last_forecasted_dataset,
-                                                           i)
-        forecasted_datasets.append(forecasted_dataset)
-        last_forecasted_dataset = forecasted_dataset
+    last_forecasted_values = None
+
+    if forecaster.mode == ForecastingModeEnum.DIRECT:
+        # A single forecaster call for every day of the horizon
+        for forecasted_values in __generate_direct_forecasted_values(values, predict_start_index, X_test.shape[0], forecaster):
+            forecasted_datasets.append(pd.DataFrame(forecasted_values))
+    else:
+        # Generates X different forecasted datasets, with X being equal to
+        # FORECAST_HORIZON setting
+        for i in range(0, fccfg.FORECAST_HORIZON):
+            forecasted_values = __generate_forecasted_values(values,
+                                                             predict_start_index,
+                                                             X_test.shape[0],
+                                                             forecaster,
+                                                             last_forecasted_values,
+                                                             i)
+            forecasted_datasets.append(pd.DataFrame(forecasted_values))
+            last_forecasted_values = forecasted_values
 
     # Adds Date column and saves dataset
     for i, forecasted_dataset in enumerate(forecasted_datasets):
@@ -56,41 +65,87 @@ def create_forecasted_datasets(forecaster: Forecaster,
     return forecasted_datasets
 
 
-def __generate_forecasted_dataset(dataset: pd.DataFrame,
-                                  predict_start_index: int,
-                                  X_test: pd.DataFrame,
-                                  forecaster: Forecaster,
-                                  last_forecasted_dataset: pd.DataFrame,
-                                  days_in_future: int) -> pd.DataFrame:
+def __generate_forecasted_values(values: np.ndarray,
+                                 predict_start_index: int,
+                                 n_rows: int,
+                                 forecaster: Forecaster,
+                                 last_forecasted_values: np.ndarray,
+                                 days_in_future: int) -> np.ndarray:
     """
-    Calls different methods sequentially in order to generate the forecasted dataset
-    :param dataset: the full dataset (train + test)
+    Generates the forecasted values for one day in the future, with a single forecaster call
+    The first days_in_future rows are copied from the last forecasting results, so that every
+    forecasted dataset keeps the same number of rows as X_test
+    :param values: the full dataset (train + test), as a float array
     :param predict_start_index: the index from which the prediction should start
-    :param X_test: the ml X_test dataset, it is required to get the instances that will be forecasted (by selecting the dates)
+    :param n_rows: the number of rows to be forecasted (X_test size)
     :param forecaster: the forecaster object
-    :param last_forecasted_dataset: the dataset with the last forecasting results
+    :param last_forecasted_values: the values with the last forecasting results (None for the first day)
     :param days_in_future: number of days in the future that is to be forecasted
-    :return: the forecasted dataset
+    :return: the forecasted values
+    """
+    windows = __build_observation_windows(values, predict_start_index, n_rows, last_forecasted_values, days_in_future)
+    forecasted = forecaster.forecast_windows(windows)
+
+    forecasted_values = np.empty((n_rows, forecasted.shape[1]), dtype=forecasted.dtype)
+    if days_in_future > 0:
+        forecasted_values[:days_in_future] = last_forecasted_values[:days_in_future]
+    forecasted_values[days_in_future:] = forecasted
+    return forecasted_values
+
+
+def __generate_direct_forecasted_values(values: np.ndarray,
+                                        predict_start_index: int,
+                                        n_rows: int,
+                                        forecaster: Forecaster) -> List[np.ndarray]:
     """
-    forecasted_data = pd.DataFrame()
-    for i in range(0, days_in_future):
-        last_forecasted_row = pdutils.select_rows(last_forecasted_dataset, i)
-        forecasted_data = pdutils.join_dataframes_x_wise([forecasted_data, last_forecasted_row])
-
-    for i in range(predict_start_index + days_in_future, predict_start_index + X_test.shape[0]):
-        x_actual = pdutils.select_rows(dataset, range(i - fccfg.OBSERVATION_WINDOW, i - days_in_future))
-        if last_forecasted_dataset.empty:
-            x = x_actual
-        else:
-            index_start = i - predict_start_index - 1
-            selected_indexes = range(index_start, index_start + days_in_future)
-            x_last_forecasted = pdutils.select_rows(last_forecasted_dataset, selected_indexes)
-            x = pdutils.join_dataframes_x_wise([x_actual, x_last_forecasted], drop_column_names=True)
-
-        forecasted = forecaster.forecast(x)
-        forecasted_data = pd.concat([forecasted_data, forecasted])
-
-    return forecasted_data
+    Generates the forecasted values for every day in the future, with a single call of a direct forecaster
+    Day i of row r is forecasted from the window that ends i days before row r, the same actual rows
+    a recursive forecaster would use. As in recursive mode, the first i rows are copied from day i - 1
+    :param values: the full dataset (train + test), as a float array
+    :param predict_start_index: the index from which the prediction should start
+    :param n_rows: the number of rows to be forecasted (X_test size)
+    :param forecaster: the forecaster object, in direct mode
+    :return: the forecasted values of each day in the future
+    """
+    windows = __build_observation_windows(values, predict_start_index, n_rows, None, 0)
+    forecasted = forecaster.forecast_windows(windows)
+
+    forecasted_values = []
+    for days_in_future in range(0, fccfg.FORECAST_HORIZON):
+        day_values = np.empty((n_rows, forecasted.shape[2]), dtype=forecasted.dtype)
+        if days_in_future > 0:
+            day_values[:days_in_future] = forecasted_values[-1][:days_in_future]
+        day_values[days_in_future:] = forecasted[:max(n_rows - days_in_future, 0), days_in_future]
+        forecasted_values.append(day_values)
+    return forecasted_values
+
+
+def __build_observation_windows(values: np.ndarray,
+                                predict_start_index: int,
+                                n_rows: int,
+                                last_forecasted_values: np.ndarray,
+                                days_in_future: int) -> np.ndarray:
+    """
+    Builds every observation window for one day in the future as a single tensor
+    Each window is made of the last actual rows available followed by the rows forecasted the day before
+    :param values: the full dataset (train + test), as a float array
+    :param predict_start_index: the index from which the prediction should start
+    :param n_rows: the number of rows to be forecasted (X_test size)
+    :param last_forecasted_values: the values with the last forecasting results (None for the first day)
+    :param days_in_future: number of days in the future that is to be forecasted
+    :return: the windows, with shape (n_rows - days_in_future, OBSERVATION_WINDOW, n_features)
+    """
+    targets = np.arange(predict_start_index + days_in_future, predict_start_index + n_rows)
+
+    actual_offsets = np.arange(-fccfg.OBSERVATION_WINDOW, -days_in_future)
+    windows = values[targets[:, np.newaxis] + actual_offsets]
+    if last_forecasted_values is None:
+        return windows
+
+    forecasted_offsets = np.arange(0, days_in_future)
+    forecasted_indexes = (targets - predict_start_index - 1)[:, np.newaxis] + forecasted_offsets
+    forecasted_windows = last_forecasted_values[forecasted_indexes].astype(values.dtype)
+    return np.concatenate([windows, forecasted_windows], axis=1)
 
 
 def __fix_and_save_forecasted_dataset(forecasted_dataset: pd.DataFrame,
@@ -0,0 +1,224 @@
+"""
+Module that has the forward pass of the Keras layers used by the forecasters, written with NumPy,
+so that a deployed forecaster can be run without TensorFlow.
+Every layer takes the configuration and the weights of its Keras layer (get_config and get_weights),
+and computes in float32, as Keras does
+"""
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+LayerConfig = Dict[str, Any]
+
+
+def apply(class_name: str, config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Applies a layer to a batch
+    :param class_name: the class name of the Keras layer
+    :param config: the configuration of the Keras layer
+    :param weights: the weights of the Keras layer
+    :param X: the batch, with the samples in the first axis
+    :return: the output of the layer
+    """
+    if class_name == "TimeDistributed":
+        # The wrapped layer is applied to each time step, as if the time steps were samples
+        inner_layer = config["layer"]
+        output = apply(inner_layer["class_name"], inner_layer["config"], weights, X.reshape((-1,) + X.shape[2:]))
+        return output.reshape(X.shape[:2] + output.shape[1:])
+    if class_name not in __LAYERS:
+        raise ValueError("Layer {} is not supported".format(class_name))
+    return __LAYERS[class_name](config, weights, X)
+
+
+def lstm(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a LSTM layer (gates in the Keras order: input, forget, cell and output)
+    :param config: the configuration of the Keras layer
+    :param weights: the kernel, the recurrent kernel and the bias
+    :param X: the batch, with shape (n_samples, n_steps, n_features)
+    :return: the last hidden state, or every hidden state if return_sequences
+    """
+    __check_recurrent_config(config)
+    activation = get_activation(config["activation"])
+    recurrent_activation = get_activation(config["recurrent_activation"])
+    kernel, recurrent_kernel = weights[0], weights[1]
+    units = recurrent_kernel.shape[0]
+
+    # The input of every step is projected at once, and only the recurrent projection runs step by step
+    projected_X = X @ kernel
+    if config["use_bias"]:
+        projected_X += weights[2]
+    hidden_state = np.zeros((X.shape[0], units), dtype=np.float32)
+    cell_state = np.zeros((X.shape[0], units), dtype=np.float32)
+    hidden_states = []
+    for step in range(X.shape[1]):
+        gates = projected_X[:, step] + hidden_state @ recurrent_kernel
+        input_gate = recurrent_activation(gates[:, :units])
+        forget_gate = recurrent_activation(gates[:, units:2 * units])
+        cell_candidate = activation(gates[:, 2 * units:3 * units])
+        output_gate = recurrent_activation(gates[:, 3 * units:])
+        cell_state = forget_gate * cell_state + input_gate * cell_candidate
+        hidden_state = output_gate * activation(cell_state)
+        hidden_states.append(hidden_state)
+    return np.stack(hidden_states, axis=1) if config["return_sequences"] else hidden_state
+
+
+def gru(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a GRU layer (gates in the Keras order: update, reset and candidate)
+    :param config: the configuration of the Keras layer
+    :param weights: the kernel, the recurrent kernel and the bias (input and recurrent biases if reset_after)
+    :param X: the batch, with shape (n_samples, n_steps, n_features)
+    :return: the last hidden state, or every hidden state if return_sequences
+    """
+    __check_recurrent_config(config)
+    activation = get_activation(config["activation"])
+    recurrent_activation = get_activation(config["recurrent_activation"])
+    kernel, recurrent_kernel = weights[0], weights[1]
+    units = recurrent_kernel.shape[0]
+    reset_after = config.get("reset_after", False)
+
+    input_bias = recurrent_bias = None
+    if config["use_bias"]:
+        input_bias, recurrent_bias = (weights[2][0], weights[2][1]) if reset_after else (weights[2], None)
+    projected_X = X @ kernel
+    if input_bias is not None:
+        projected_X += input_bias
+    hidden_state = np.zeros((X.shape[0], units), dtype=np.float32)
+    hidden_states = []
+    for step in range(X.shape[1]):
+        projected_step = projected_X[:, step]
+        if reset_after:
+            # The reset gate is applied after the recurrent projection of the candidate
+            projected_hidden_state = hidden_state @ recurrent_kernel
+            if recurrent_bias is not None:
+                projected_hidden_state += recurrent_bias
+            update_gate = recurrent_activation(projected_step[:, :units] + projected_hidden_state[:, :units])
+            reset_gate = recurrent_activation(projected_step[:, units:2 * units] + projected_hidden_state[:, units:2 * units])
+            candidate = activation(projected_step[:, 2 * units:] + reset_gate * projected_hidden_state[:, 2 * units:])
+        else:
+            projected_hidden_state = hidden_state @ recurrent_kernel[:, :2 * units]
+            update_gate = recurrent_activation(projected_step[:, :units] + projected_hidden_state[:, :units])
+            reset_gate = recurrent_activation(projected_step[:, units:2 * units] + projected_hidden_state[:, units:])
+            candidate = activation(projected_step[:, 2 * units:] + (reset_gate * hidden_state) @ recurrent_kernel[:, 2 * units:])
+        hidden_state = update_gate * hidden_state + (1 - update_gate) * candidate
+        hidden_states.append(hidden_state)
+    return np.stack(hidden_states, axis=1) if config["return_sequences"] else hidden_state
+
+
+def dense(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a Dense layer, on the last axis
+    :param config: the configuration of the Keras layer
+    :param weights: the kernel and the bias
+    :param X: the batch
+    :return: the output of the layer
+    """
+    output = X @ weights[0]
+    if config["use_bias"]:
+        output += weights[1]
+    return get_activation(config["activation"])(output)
+
+
+def conv1d(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a Conv1D layer, with valid padding
+    :param config: the configuration of the Keras layer
+    :param weights: the kernel, with shape (kernel_size, n_features, filters), and the bias
+    :param X: the batch, with shape (n_samples, n_steps, n_features)
+    :return: the output of the layer, with shape (n_samples, n_output_steps, filters)
+    """
+    if config["padding"] != "valid" or tuple(config["dilation_rate"]) != (1,) or config.get("groups", 1) != 1:
+        raise ValueError("Layer Conv1D is only supported with valid padding, no dilation and a single group")
+    kernel = weights[0]
+    # Windows of kernel_size steps, with shape (n_samples, n_output_steps, n_features, kernel_size)
+    windows = sliding_window_view(X, kernel.shape[0], axis=1)[:, ::config["strides"][0]]
+    output = np.einsum("nsfk,kfo->nso", windows, kernel, optimize=True).astype(np.float32)
+    if config["use_bias"]:
+        output += weights[1]
+    return get_activation(config["activation"])(output)
+
+
+def max_pooling1d(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a MaxPooling1D layer, with valid padding
+    :param config: the configuration of the Keras layer
+    :param weights: no weights
+    :param X: the batch, with shape (n_samples, n_steps, n_features)
+    :return: the output of the layer
+    """
+    if config["padding"] != "valid" or config.get("data_format", "channels_last") != "channels_last":
+        raise ValueError("Layer MaxPooling1D is only supported with valid padding and channels last")
+    pool_size = config["pool_size"][0]
+    windows = sliding_window_view(X, pool_size, axis=1)[:, ::config["strides"][0]]
+    return windows.max(axis=-1)
+
+
+def flatten(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a Flatten layer
+    :param config: the configuration of the Keras layer
+    :param weights: no weights
+    :param X: the batch
+    :return: the batch, with one axis per sample
+    """
+    return X.reshape((X.shape[0], -1))
+
+
+def reshape(config: LayerConfig, weights: List[np.ndarray], X: np.ndarray) -> np.ndarray:
+    """
+    Forward pass of a Reshape layer
+    :param config: the configuration of the Keras layer
+    :param weights: no weights
+    :param X: the batch
+    :return: the batch, with each sample reshaped to target_shape
+    """
+    return X.reshape((X.shape[0],) + tuple(config["target_shape"]))
+
+
+def get_activation(name: str) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Get an activation function by its Keras name
+    :param name: the name
+    :return: the activation function
+    """
+    if name not in __ACTIVATIONS:
+        raise ValueError("Activation {} is not supported".format(name))
+    return __ACTIVATIONS[name]
+
+
+def __check_recurrent_config(config: LayerConfig) -> None:
+    """
+    Checks that a recurrent layer runs forwards, from a zero state, as supported
+    :param config: the configuration of the Keras layer
+    """
+    if config.get("go_backwards") or config.get("stateful") or config.get("return_state"):
+        raise ValueError("Layer {} is only supported forwards, not stateful and without returning its state".format(config["name"]))
+
+
+def __sigmoid(X: np.ndarray) -> np.ndarray:
+    """
+    Sigmoid activation
+    :param X: the values
+    :return: the activated values
+    """
+    return (1 / (1 + np.exp(-X))).astype(X.dtype, copy=False)
+
+
+__ACTIVATIONS = {
+    "linear": lambda X: X,
+    "relu": lambda X: np.maximum(X, 0),
+    "sigmoid": __sigmoid,
+    "tanh": np.tanh
+}
+
+__LAYERS = {
+    "LSTM": lstm,
+    "GRU": gru,
+    "Dense": dense,
+    "Conv1D": conv1d,
+    "MaxPooling1D": max_pooling1d,
+    "Flatten": flatten,
+    "Reshape": reshape
+}
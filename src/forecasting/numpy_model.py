@@ -0,0 +1,86 @@
+"""Module which contains the NumpyModel class"""
+import json
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.forecasting import numpy_layer_operations
+
+SPEC_KEY = "spec"
+WEIGHT_KEY_FORMAT = "layer_{}_weight_{}"
+
+
+class NumpyModel:
+    """
+    The NumpyModel entity
+    It holds the layers of a trained Keras Sequential model (class name, configuration and weights)
+    and runs its forward pass with NumPy, so that a deployed forecaster is loaded and run without TensorFlow.
+    It answers predict as the Keras model does, so it can take the place of the model in a forecaster
+    """
+
+    layers: List[Dict[str, Any]]
+
+    def __init__(self, layers: List[Dict[str, Any]]):
+        """
+        Class constructor
+        :param layers: the layers, each one with its class_name, config and weights
+        """
+        self.layers = layers
+
+    @classmethod
+    def from_keras(cls, model: Any) -> "NumpyModel":
+        """
+        Create the model from a trained Keras Sequential model
+        :param model: the Keras model
+        :return: the model
+        """
+        layers = []
+        for layer in model.layers:
+            config = layer.get_config()
+            if type(layer).__name__ == "TimeDistributed":
+                config["layer"] = {"class_name": type(layer.layer).__name__, "config": layer.layer.get_config()}
+            layers.append({
+                "class_name": type(layer).__name__,
+                "config": json.loads(json.dumps(config, default=str)),
+                "weights": [np.asarray(weights, dtype=np.float32) for weights in layer.get_weights()]
+            })
+        return cls(layers)
+
+    @classmethod
+    def load(cls, file_path: str) -> "NumpyModel":
+        """
+        Loads a model saved by save
+        :param file_path: the file path (.npz)
+        :return: the model
+        """
+        with np.load(file_path, allow_pickle=False) as arrays:
+            spec = json.loads(str(arrays[SPEC_KEY]))
+            return cls([{
+                "class_name": layer["class_name"],
+                "config": layer["config"],
+                "weights": [arrays[WEIGHT_KEY_FORMAT.format(position, weight_position)] for weight_position in range(layer["n_weights"])]
+            } for position, layer in enumerate(spec)])
+
+    def save(self, file_path: str) -> None:
+        """
+        Saves the model as plain arrays, with the layers described in JSON
+        :param file_path: the file path (.npz)
+        """
+        spec = [{"class_name": layer["class_name"], "config": layer["config"], "n_weights": len(layer["weights"])} for layer in self.layers]
+        arrays = {WEIGHT_KEY_FORMAT.format(position, weight_position): weights
+                  for position, layer in enumerate(self.layers)
+                  for weight_position, weights in enumerate(layer["weights"])}
+        with open(file_path, 'wb') as file:
+            np.savez(file, **{SPEC_KEY: np.array(json.dumps(spec))}, **arrays)
+
+    def predict(self, X: Any, verbose: Any = 0) -> np.ndarray:
+        """
+        Runs the forward pass of the model
+        :param X: the batch, with the samples in the first axis
+        :param verbose: ignored, as in the predict of Keras
+        :return: the output of the last layer
+        """
+        output = np.asarray(X, dtype=np.float32)
+        for layer in self.layers:
+            output = numpy_layer_operations.apply(layer["class_name"], layer["config"], layer["weights"], output)
+        return output
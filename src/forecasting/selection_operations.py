@@ -0,0 +1,116 @@
+"""
+Module that has all operations required to train the combinations of scalers and forecasters to be selected.
+Each scaler is fitted once, and its scaled sequences are stored in a window cache, shared by its forecasters.
+Each combination is an independent job, seeded by its position, which may run on a process pool.
+The jobs save the weights of their forecasters to files and return only their error metrics,
+so that only the weights of the best combination are loaded back
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import pandas as pd
+
+import config.forecast_settings as fccfg
+
+from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting.algorithm import forecaster_factory
+from src.forecasting.window_cache import WindowCache
+from src.scaling import scaler_factory
+from src.scaling.scaler import Scaler
+
+Combination = Tuple[ScalingMethodEnum, ForecastingAlgorithmEnum]
+
+
+def scale(scaling_method: ScalingMethodEnum,
+          X_train: pd.DataFrame,
+          X_validation: pd.DataFrame,
+          window_cache: WindowCache) -> Tuple[Scaler, pd.DataFrame, pd.DataFrame, str, str]:
+    """
+    Fits a scaler, scales the attributes and stores their sequences in the window cache
+    :param scaling_method: the scaling method
+    :param X_train: attributes for training
+    :param X_validation: attributes for validation
+    :param window_cache: the window cache
+    :return: the fitted scaler, the scaled attributes for training and validation and the file paths of their sequences
+    """
+    scaler = scaler_factory.get(scaling_method)
+    scaled_X_train = scaler.fit_scale(X_train)
+    scaled_X_validation = scaler.scale(X_validation)
+    return scaler, scaled_X_train, scaled_X_validation, window_cache.put(scaled_X_train), window_cache.put(scaled_X_validation)
+
+
+def train_combination(position: int,
+                      forecasting_algorithm: ForecastingAlgorithmEnum,
+                      train_file_path: str,
+                      validation_file_path: str,
+                      weights_file_path: str) -> List[float]:
+    """
+    Trains the forecaster of a combination on its scaled sequences, and saves its weights
+    :param position: the position of the combination, which seeds its training
+    :param forecasting_algorithm: the forecasting algorithm
+    :param train_file_path: the file path of the scaled sequence for training, in the window cache
+    :param validation_file_path: the file path of the scaled sequence for validation, in the window cache
+    :param weights_file_path: the file path where the weights of the forecaster are saved
+    :return: the error metric of the forecaster on the validation sequence
+    """
+    import tensorflow as tf
+    tf.keras.utils.set_random_seed(fccfg.SELECTION_SEED + position)
+
+    forecaster = forecaster_factory.get(forecasting_algorithm)
+    forecaster.learn(WindowCache.load(train_file_path))
+    error_metric = forecaster.evaluate(WindowCache.load(validation_file_path))
+    forecaster.save_weights(weights_file_path)
+    return error_metric
+
+
+def train_combinations(forecasting_algorithms: List[ForecastingAlgorithmEnum],
+                       train_file_paths: List[str],
+                       validation_file_paths: List[str],
+                       weights_file_paths: List[str],
+                       workers: int) -> List[List[float]]:
+    """
+    Trains the forecasters of the combinations on a process pool. The workers memory-map the scaled
+    sequences, so they are not sent to them
+    :param forecasting_algorithms: the forecasting algorithm of each combination
+    :param train_file_paths: the file path of the scaled sequence for training of each combination
+    :param validation_file_paths: the file path of the scaled sequence for validation of each combination
+    :param weights_file_paths: the file path where the weights of each forecaster are saved
+    :param workers: the number of processes
+    :return: the error metric of each combination, in order
+    """
+    workers = min(workers, len(forecasting_algorithms))
+    intra_op_threads = fccfg.SELECTION_INTRA_OP_THREADS or max(1, (os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=__initialize_worker,
+                             initargs=(intra_op_threads, fccfg.SELECTION_INTER_OP_THREADS)) as executor:
+        futures = [executor.submit(train_combination, position, *job)
+                   for position, job in enumerate(zip(forecasting_algorithms, train_file_paths, validation_file_paths, weights_file_paths))]
+        return [future.result() for future in futures]
+
+
+def get_best_position(error_metrics: List[List[float]]) -> int:
+    """
+    Get the position of the combination with the lowest error. Ties are won by the first one
+    :param error_metrics: the error metric of each combination
+    :return: the position
+    """
+    best_position = 0
+    for position, error_metric in enumerate(error_metrics):
+        if error_metric[0] < error_metrics[best_position][0]:
+            best_position = position
+    return best_position
+
+
+def __initialize_worker(intra_op_threads: int, inter_op_threads: int) -> None:
+    """
+    Limits the TensorFlow threads of a worker process, before it runs any operation
+    :param intra_op_threads: the threads for running an operation
+    :param inter_op_threads: the threads for running operations at the same time
+    """
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
@@ -0,0 +1,61 @@
+"""Module which contains the TFLiteModel class"""
+from typing import Any
+
+import numpy as np
+
+from src.forecasting import tflite_operations
+
+
+class TFLiteModel:
+    """
+    The TFLiteModel entity
+    It holds the TFLite conversion of a trained Keras forecaster model and runs it through the TFLite interpreter.
+    It answers predict as the Keras model does, so it can take the place of the model in a forecaster
+    """
+
+    model_content: bytes
+
+    def __init__(self, model_content: bytes):
+        """
+        Class constructor
+        :param model_content: the TFLite flatbuffer
+        """
+        self.model_content = model_content
+
+    @classmethod
+    def from_keras(cls, model: Any, quantization: str, batch_size: int) -> "TFLiteModel":
+        """
+        Create the model by converting a trained Keras model
+        :param model: the Keras model
+        :param quantization: "float32" (none), "float16" or "dynamic_range" (int8 weights)
+        :param batch_size: the fixed number of windows of each interpreter call
+        :return: the model
+        """
+        return cls(tflite_operations.convert(model, quantization, batch_size))
+
+    @classmethod
+    def load(cls, file_path: str) -> "TFLiteModel":
+        """
+        Loads a model saved by save
+        :param file_path: the file path (.tflite)
+        :return: the model
+        """
+        with open(file_path, 'rb') as file:
+            return cls(file.read())
+
+    def save(self, file_path: str) -> None:
+        """
+        Saves the model flatbuffer
+        :param file_path: the file path (.tflite)
+        """
+        with open(file_path, 'wb') as file:
+            file.write(self.model_content)
+
+    def predict(self, X: Any, verbose: Any = 0) -> np.ndarray:
+        """
+        Runs the model
+        :param X: the windows, with the samples in the first axis
+        :param verbose: ignored, as in the predict of Keras
+        :return: the output of the model, one row per window
+        """
+        return tflite_operations.predict(self, X)
@@ -0,0 +1,104 @@
+"""
+Module that has all operations required to convert a trained Keras forecaster to TFLite and to run it.
+The model is converted with a fixed batch input signature, so that its recurrent layers are lowered to
+TFLite builtin operations. Its interpreter is created once per model and reused by every prediction
+"""
+import threading
+import weakref
+from typing import Any, Optional
+
+import numpy as np
+
+FLOAT32_QUANTIZATION = "float32"
+FLOAT16_QUANTIZATION = "float16"
+DYNAMIC_RANGE_QUANTIZATION = "dynamic_range"
+QUANTIZATIONS = [FLOAT32_QUANTIZATION, FLOAT16_QUANTIZATION, DYNAMIC_RANGE_QUANTIZATION]
+
+# The interpreter of each TFLite model and its lock, since an interpreter must not be invoked by two threads at once
+__interpreters: Any = weakref.WeakKeyDictionary()
+__interpreters_lock = threading.Lock()
+
+
+def convert(model: Any, quantization: str, batch_size: int) -> bytes:
+    """
+    Converts a trained Keras model to a TFLite flatbuffer
+    :param model: the Keras model
+    :param quantization: "float32" (none), "float16" or "dynamic_range" (int8 weights)
+    :param batch_size: the fixed number of windows of each model call
+    :return: the flatbuffer
+    """
+    if quantization not in QUANTIZATIONS:
+        raise ValueError("Parameter quantization must be one of {}".format(", ".join(QUANTIZATIONS)))
+    if batch_size < 1:
+        raise ValueError("Parameter batch_size must be positive")
+    import tensorflow as tf
+
+    input_shape = (batch_size,) + tuple(model.input_shape[1:])
+    call = tf.function(lambda X: model(X, training=False), input_signature=[tf.TensorSpec(input_shape, tf.float32)])
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([call.get_concrete_function()], model)
+    if quantization != FLOAT32_QUANTIZATION:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if quantization == FLOAT16_QUANTIZATION:
+        converter.target_spec.supported_types = [tf.float16]
+    return converter.convert()
+
+
+def predict(tflite_model: Any, X: Any) -> np.ndarray:
+    """
+    Runs a TFLite model, one fixed batch at a time. The last batch is padded with zeros
+    :param tflite_model: the TFLite model
+    :param X: the windows, with the samples in the first axis
+    :return: the output of the model, one row per window
+    """
+    X = np.asarray(X, dtype=np.float32)
+    interpreter, lock = __get_interpreter(tflite_model)
+    input_details = interpreter.get_input_details()[0]
+    output_details = interpreter.get_output_details()[0]
+    batch_size = input_details["shape"][0]
+
+    outputs = []
+    with lock:
+        for start in range(0, X.shape[0], batch_size):
+            batch = X[start:start + batch_size]
+            n_windows = batch.shape[0]
+            if n_windows < batch_size:
+                batch = np.concatenate([batch, np.zeros((batch_size - n_windows,) + batch.shape[1:], dtype=np.float32)])
+            # The fused recurrent layers keep their states in variable tensors, which are zeroed for every batch
+            interpreter.reset_all_variables()
+            interpreter.set_tensor(input_details["index"], batch)
+            interpreter.invoke()
+            outputs.append(interpreter.get_tensor(output_details["index"])[:n_windows].copy())
+    if not outputs:
+        return np.empty((0,) + tuple(output_details["shape"][1:]), dtype=np.float32)
+    return np.concatenate(outputs)
+
+
+def __get_interpreter(tflite_model: Any) -> Any:
+    """
+    Get the interpreter of a TFLite model, creating it on the first call
+    :param tflite_model: the TFLite model
+    :return: the interpreter and its lock
+    """
+    with __interpreters_lock:
+        interpreter = __interpreters.get(tflite_model)
+        if interpreter is None:
+            interpreter = (__create_interpreter(tflite_model.model_content), threading.Lock())
+            __interpreters[tflite_model] = interpreter
+        return interpreter
+
+
+def __create_interpreter(model_content: bytes, num_threads: Optional[int] = None) -> Any:
+    """
+    Creates a TFLite interpreter, from the tflite_runtime package if it is installed, so that TensorFlow is not imported
+    :param model_content: the flatbuffer
+    :param num_threads: the threads of the interpreter, all the cores by default
+    :return: the interpreter, with its tensors allocated
+    """
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+    interpreter = Interpreter(model_content=model_content, num_threads=num_threads)
+    interpreter.allocate_tensors()
+    return interpreter
@@ -0,0 +1,98 @@
+"""Module which contains the TrainingSettings class"""
+import math
+from typing import Any, Optional
+
+import config.forecast_settings as fccfg
+
+LINEAR_LEARNING_RATE_SCALING = "linear"
+SQRT_LEARNING_RATE_SCALING = "sqrt"
+
+
+class TrainingSettings:
+    """
+    The TrainingSettings entity
+    It holds how a forecaster is trained: the batch size, whether the windows are fed through a tf.data pipeline
+    (cached and prefetched), how the learning rate grows with the batch size, the epochs, the verbosity
+    and whether the training history is plotted
+    """
+
+    batch_size: int
+    dataset_pipeline: bool
+    cache: bool
+    prefetch: bool
+    learning_rate_scaling: Optional[str]
+    epochs: int
+    verbose: Any
+    plot_history: bool
+
+    def __init__(self, batch_size: int,
+                 dataset_pipeline: bool,
+                 cache: bool,
+                 prefetch: bool,
+                 learning_rate_scaling: Optional[str],
+                 epochs: int,
+                 verbose: Any,
+                 plot_history: bool):
+        """
+        Class constructor
+        :param batch_size: the windows per optimizer step
+        :param dataset_pipeline: whether the windows are fed through a tf.data pipeline
+        :param cache: whether the tf.data pipeline caches the batches after the first epoch
+        :param prefetch: whether the tf.data pipeline prepares the next batches while training
+        :param learning_rate_scaling: how the learning rate grows with the batch size: None, "linear" or "sqrt"
+        :param epochs: the maximum number of epochs
+        :param verbose: the verbosity of the training
+        :param plot_history: whether the training history is plotted
+        """
+        if batch_size < 1:
+            raise ValueError("Parameter batch_size must be positive")
+        if learning_rate_scaling not in [None, LINEAR_LEARNING_RATE_SCALING, SQRT_LEARNING_RATE_SCALING]:
+            raise ValueError("Parameter learning_rate_scaling must be None, {} or {}".format(LINEAR_LEARNING_RATE_SCALING,
+                                                                                               SQRT_LEARNING_RATE_SCALING))
+        self.batch_size = batch_size
+        self.dataset_pipeline = dataset_pipeline
+        self.cache = cache
+        self.prefetch = prefetch
+        self.learning_rate_scaling = learning_rate_scaling
+        self.epochs = epochs
+        self.verbose = verbose
+        self.plot_history = plot_history
+
+    @classmethod
+    def from_config(cls, **overrides: Any) -> "TrainingSettings":
+        """
+        Create the training settings from the forecast settings
+        :param overrides: the settings that differ from the forecast settings, by parameter name
+        :return: the training settings
+        """
+        settings = {
+            "batch_size": fccfg.BATCH_SIZE,
+            "dataset_pipeline": fccfg.DATASET_PIPELINE,
+            "cache": fccfg.DATASET_CACHE,
+            "prefetch": fccfg.DATASET_PREFETCH,
+            "learning_rate_scaling": fccfg.LEARNING_RATE_SCALING,
+            "epochs": fccfg.NB_EPOCHS,
+            "verbose": fccfg.VERBOSE,
+            "plot_history": fccfg.PLOT_HISTORY
+        }
+        settings.update(overrides)
+        return cls(**settings)
+
+    def get_learning_rate(self) -> float:
+        """
+        Get the learning rate, which is LEARNING_RATE for a single window per step, scaled for larger batches
+        :return: the learning rate
+        """
+        if self.learning_rate_scaling == LINEAR_LEARNING_RATE_SCALING:
+            return fccfg.LEARNING_RATE * self.batch_size
+        if self.learning_rate_scaling == SQRT_LEARNING_RATE_SCALING:
+            return fccfg.LEARNING_RATE * math.sqrt(self.batch_size)
+        return fccfg.LEARNING_RATE
+
+    def describe(self) -> str:
+        """
+        Describe the settings
+        :return: the description
+        """
+        return "batch_size={}, dataset_pipeline={}, cache={}, prefetch={}, learning_rate_scaling={}".format(
+            self.batch_size, self.dataset_pipeline, self.cache, self.prefetch, self.learning_rate_scaling)
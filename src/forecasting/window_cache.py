@@ -0,0 +1,76 @@
+"""Module which contains the WindowCache class"""
+import os
+import threading
+from typing import List
+
+import numpy as np
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+import src.utils.pandas_utils as pdutils
+from src.utils import fingerprint_utils
+
+SEQUENCE_SUFFIX = ".npy"
+
+
+class WindowCache:
+    """
+    The WindowCache entity
+    It stores the scaled sequences the forecasters are trained on, as .npy files named after the fingerprint
+    of their content, so that every forecaster trained on the same scaling (in this process, in a worker
+    or in a later run) memory-maps one sequence instead of converting the DataFrame again.
+    The windows are strided views of the sequence (see Forecaster.get_assets), so they are never stored.
+    Only the sequences of the latest selection are kept (see clean)
+    """
+
+    cache_dir: str
+
+    def __init__(self, cache_dir: str):
+        """
+        Class constructor
+        :param cache_dir: the directory where the sequences are stored
+        """
+        self.cache_dir = cache_dir
+
+    def put(self, scaled_dataset: pd.DataFrame) -> str:
+        """
+        Stores the sequence of a scaled dataset, without the columns ignored for machine learning,
+        unless a sequence with the same content is already stored
+        :param scaled_dataset: the scaled dataset
+        :return: the file path of the sequence
+        """
+        sequence = np.ascontiguousarray(np.asarray(pdutils.delete_columns(scaled_dataset, dscfg.COLUMNS_IGNORE_FOR_ML)))
+        file_path = os.path.join(self.cache_dir, fingerprint_utils.get_fingerprint(sequence) + SEQUENCE_SUFFIX)
+        if os.path.exists(file_path):
+            return file_path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temporary_path = "{}.tmp{}-{}".format(file_path, os.getpid(), threading.get_ident())
+        with open(temporary_path, 'wb') as file:
+            np.save(file, sequence, allow_pickle=False)
+        # Readers never see a partial file, and a file written meanwhile by someone else has the same content
+        os.replace(temporary_path, file_path)
+        return file_path
+
+    def clean(self, file_paths: List[str]) -> None:
+        """
+        Removes every stored sequence but the given ones. No sequence must be stored meanwhile
+        :param file_paths: the file paths of the sequences to be kept, as returned when they were stored
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        kept_file_names = {os.path.basename(file_path) for file_path in file_paths}
+        for file_name in os.listdir(self.cache_dir):
+            if file_name not in kept_file_names:
+                os.remove(os.path.join(self.cache_dir, file_name))
+
+    @staticmethod
+    def load(file_path: str) -> np.ndarray:
+        """
+        Loads a stored sequence, as a read-only memory map
+        :param file_path: the file path of the sequence, as returned when it was stored
+        :return: the sequence, with shape (n_rows, n_features)
+        """
+        return np.load(file_path, mmap_mode='r', allow_pickle=False)
@@ -1,17 +1,42 @@
 """Module representing the program menu"""
+import config.general_settings as cfg
+
 from src.enum.menu_options_enum import MenuOptionEnum
 from src.pipeline import pipeline_executor
 
+PLAN_FLAG = "--plan"
+
 
 def execute(argv: str) -> None:
     """
     Executes the program according to the option chosen
-    :param argv: the user inputs
+    :param argv: the user inputs, the option optionally followed by the --plan flag
     """
     arg = argv[0]
+    plan = PLAN_FLAG in argv[1:]
     if arg == MenuOptionEnum.FIT.value:
-        pipeline_executor.execute_fit_pipeline()
+        __seed_tensorflow()
+        pipeline_executor.execute_fit_pipeline(plan=plan)
     elif arg == MenuOptionEnum.PREDICT.value:
-        pipeline_executor.execute_predict_pipeline()
+        pipeline_executor.execute_predict_pipeline(plan=plan)
+    elif arg == MenuOptionEnum.SERVE.value:
+        from src.serving import prediction_server
+        prediction_server.execute()
+    elif arg == MenuOptionEnum.BENCHMARK_TRAINING.value:
+        from src.profiling import training_benchmark
+        __seed_tensorflow()
+        training_benchmark.execute()
+    elif arg == MenuOptionEnum.BENCHMARK_INFERENCE.value:
+        from src.profiling import inference_benchmark
+        inference_benchmark.execute()
+    elif arg == MenuOptionEnum.BENCHMARK_IMPORTS.value:
+        from src.profiling import import_benchmark
+        import_benchmark.execute()
     else:
         raise Exception("Menu option {} not implemented".format(argv[0]))
+
+
+def __seed_tensorflow() -> None:
+    """Seeds TensorFlow, only for the options that train, since the predictions do not import it"""
+    import tensorflow as tf
+    tf.random.set_seed(cfg.SEED)
@@ -0,0 +1,80 @@
+"""
+Module which holds the context of the current pipeline execution
+It is shared by the pipeline and its steps, without having to pass it through every constructor
+"""
+from contextvars import ContextVar
+from typing import Optional
+
+from src.profiling.profiler import Profiler
+from src.storage.storage_statistics import StorageStatistics
+
+DEFAULT_PIPELINE_NAME = "no_pipeline"
+
+__plan_mode: ContextVar = ContextVar("plan_mode", default=False)
+__pipeline_name: ContextVar = ContextVar("pipeline_name", default=DEFAULT_PIPELINE_NAME)
+__storage_statistics: ContextVar = ContextVar("storage_statistics", default=None)
+__profiler: ContextVar = ContextVar("profiler", default=None)
+
+
+def is_plan_mode() -> bool:
+    """
+    Whether the pipeline is only planning, that is, reporting which steps would re-run without running them
+    :return: whether it is in plan mode or not
+    """
+    return __plan_mode.get()
+
+
+def set_plan_mode(plan_mode: bool) -> None:
+    """
+    Sets the plan mode for the current execution
+    :param plan_mode: whether it is in plan mode or not
+    """
+    __plan_mode.set(plan_mode)
+
+
+def get_pipeline_name() -> str:
+    """
+    The name of the pipeline being executed, which is part of each step identity
+    :return: the pipeline name
+    """
+    return __pipeline_name.get()
+
+
+def set_pipeline_name(pipeline_name: str) -> None:
+    """
+    Sets the name of the pipeline being executed
+    :param pipeline_name: the pipeline name
+    """
+    __pipeline_name.set(pipeline_name)
+
+
+def get_storage_statistics() -> Optional[StorageStatistics]:
+    """
+    The statistics of the execution objects stored and read by the pipeline being executed
+    :return: the statistics, or None outside a pipeline execution
+    """
+    return __storage_statistics.get()
+
+
+def set_storage_statistics(storage_statistics: Optional[StorageStatistics]) -> None:
+    """
+    Sets the statistics of the execution objects for the pipeline being executed
+    :param storage_statistics: the statistics
+    """
+    __storage_statistics.set(storage_statistics)
+
+
+def get_profiler() -> Optional[Profiler]:
+    """
+    The profiler of the pipeline being executed
+    :return: the profiler, or None if profiling is disabled
+    """
+    return __profiler.get()
+
+
+def set_profiler(profiler: Optional[Profiler]) -> None:
+    """
+    Sets the profiler for the pipeline being executed
+    :param profiler: the profiler, or None to disable profiling
+    """
+    __profiler.set(profiler)
@@ -7,6 +7,7 @@ from src.enum.classification_algorithms_enum import ClassificationAlgorithmEnum
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
 from src.enum.sampling_methods_enum import SamplingMethodEnum
 from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.pipeline import execution_context
 from src.pipeline.step import StepOutput
 from src.utils import validation_utils
 
@@ -77,7 +78,10 @@ class Pipeline:
     def save_elapsed_time(self, start: float, end: float) -> None:
         """
         Saves pipeline elapsed run time
+        Nothing is saved in plan mode, since the steps were not run
         """
+        if execution_context.is_plan_mode():
+            return
         with open(cfg.ASSETS_DIR + "elapsed_time.txt", 'w') as f:
             elapsed_time = end - start
             f.write("Pipeline elapsed run time: ")
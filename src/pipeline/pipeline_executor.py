@@ -1,15 +1,30 @@
 """Module which contains operations to execute pipeline"""
+import time
+from typing import Union
+
 import config.classification_settings as clfcfg
 import config.data_preparation_settings as dpcfg
 import config.forecast_settings as fccfg
+import config.general_settings as cfg
 
 from src.enum.pipelines_enum import PipelineEnum
-from src.pipeline import pipeline_factory
+from src.exception.plan_interruption_exception import PlanInterruptionException
+from src.pipeline import execution_context, pipeline_factory
 from src.pipeline.pipeline import FitPipelineParameters, PredictPipelineParameters
+from src.pipeline.step_cache import StepCache
+from src.profiling.profiler import Profiler
+from src.storage.storage_statistics import StorageStatistics
+from src.utils import profiling_utils
+from src.utils.logging_utils import print_and_log
+
+PIPELINE_PROFILE_CATEGORY = "pipeline"
 
 
-def execute_fit_pipeline() -> None:
-    """Run pipeline fit"""
+def execute_fit_pipeline(plan: bool = False) -> None:
+    """
+    Run pipeline fit
+    :param plan: whether to only report which steps would re-run and why, without running them
+    """
     pipeline_parameters = FitPipelineParameters(
         dpcfg.SCALING_METHOD,
         fccfg.ALGORITHM,
@@ -17,13 +32,62 @@ def execute_fit_pipeline() -> None:
         clfcfg.ALGORITHM
     )
 
-    pipeline = pipeline_factory.get(PipelineEnum.FIT)
-    pipeline.run(pipeline_parameters)
+    __run_pipeline(PipelineEnum.FIT, pipeline_parameters, plan)
 
 
-def execute_predict_pipeline() -> None:
-    """Run pipeline predict"""
+def execute_predict_pipeline(plan: bool = False) -> None:
+    """
+    Run pipeline predict
+    :param plan: whether to only report which steps would re-run and why, without running them
+    """
     pipeline_parameters = PredictPipelineParameters()
 
-    pipeline = pipeline_factory.get(PipelineEnum.PREDICT)
-    pipeline.run(pipeline_parameters)
+    __run_pipeline(PipelineEnum.PREDICT, pipeline_parameters, plan)
+
+
+def __run_pipeline(pipeline_enum: PipelineEnum,
+                   pipeline_parameters: Union[FitPipelineParameters, PredictPipelineParameters],
+                   plan: bool) -> None:
+    """
+    Run a pipeline, either for real or in plan mode
+    :param pipeline_enum: the enum for the pipeline
+    :param pipeline_parameters: the parameters for the pipeline
+    :param plan: whether to only report which steps would re-run and why, without running them
+    """
+    pipeline = pipeline_factory.get(pipeline_enum)
+    pipeline_name = pipeline_enum.value.lower().replace(" ", "_")
+    execution_context.set_plan_mode(plan)
+    execution_context.set_pipeline_name(pipeline_name)
+    storage_statistics = StorageStatistics()
+    execution_context.set_storage_statistics(storage_statistics)
+    profiler = Profiler() if cfg.PROFILE_PIPELINE and not plan else None
+    execution_context.set_profiler(profiler)
+    try:
+        if profiler is not None:
+            profiler.start()
+        with profiling_utils.profile(pipeline_name, PIPELINE_PROFILE_CATEGORY):
+            pipeline.run(pipeline_parameters)
+        if not plan:
+            StepCache.clean(cfg.OUTPUT_EXECUTION_OBJECTS_DIR, storage_statistics)
+            print_and_log("Execution objects: {}".format(storage_statistics.get_summary()))
+    except PlanInterruptionException as exception:
+        print_and_log(str(exception))
+    finally:
+        if profiler is not None:
+            profiler.stop()
+            __save_profile(profiler, pipeline_name)
+        execution_context.set_plan_mode(False)
+        execution_context.set_pipeline_name(execution_context.DEFAULT_PIPELINE_NAME)
+        execution_context.set_storage_statistics(None)
+        execution_context.set_profiler(None)
+
+
+def __save_profile(profiler: Profiler, pipeline_name: str) -> None:
+    """
+    Saves the profile of a pipeline execution, as a JSON report and a Chrome trace
+    :param profiler: the profiler of the execution
+    :param pipeline_name: the pipeline name
+    """
+    file_name_prefix = "{}{}_{}".format(cfg.OUTPUT_PROFILES_DIR, pipeline_name, time.strftime("%Y%m%d_%H%M%S"))
+    profiler.save(file_name_prefix + "_profile.json", file_name_prefix + "_trace.json")
+    print_and_log("Profile saved to {}_profile.json (Chrome trace: {}_trace.json)".format(file_name_prefix, file_name_prefix))
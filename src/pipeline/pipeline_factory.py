@@ -3,8 +3,6 @@
 from src.enum.pipelines_enum import PipelineEnum
 from src.exception.not_implemented_exception import NotImplementedException
 from src.pipeline.pipeline import Pipeline
-from src.pipeline.pipelines.fit_pipeline import FitPipeline
-from src.pipeline.pipelines.predict_pipeline import PredictPipeline
 
 
 def get(pipeline: PipelineEnum) -> Pipeline:
@@ -24,9 +22,12 @@ def get(pipeline: PipelineEnum) -> Pipeline:
     raise NotImplementedException("No Pipeline implemented for pipeline {}".format(pipeline.value))
 
 
-def __fit_pipeline() -> FitPipeline:
+def __fit_pipeline() -> Pipeline:
+    # Imported here, so that the predictions do not import the training steps (and TensorFlow)
+    from src.pipeline.pipelines.fit_pipeline import FitPipeline
     return FitPipeline()
 
 
-def __predict_pipeline() -> PredictPipeline:
+def __predict_pipeline() -> Pipeline:
+    from src.pipeline.pipelines.predict_pipeline import PredictPipeline
     return PredictPipeline()
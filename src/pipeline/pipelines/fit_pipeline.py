@@ -3,7 +3,9 @@ from typing import Any
 
 import config.general_settings as cfg
 
+from src.pipeline import execution_context
 from src.pipeline.pipeline import FitPipelineParameters, Pipeline
+from src.pipeline.step_graph import StepGraph
 from src.pipeline.steps.calculate_evaluation_measures_step import CalculateEvaluationMeasuresStep
 from src.pipeline.steps.calculate_predicted_risk_rates import CalculatePredictedRiskRatesStep
 from src.pipeline.steps.calculate_statistical_risk_rates_step import CalculateStatisticalRiskRatesStep
@@ -18,119 +20,147 @@ from src.pipeline.steps.select_sampler_classifier_step import SelectSamplerClass
 from src.pipeline.steps.select_scaler_forecaster_step import SelectScalerForecasterStep
 from src.pipeline.steps.select_thresholds_step import SelectThresholdsStep
 
+TRAIN_VS_VALIDATION_ROLE = "train_vs_validation"
+RETRAIN_VS_TEST_ROLE = "retrain_vs_test"
+
 
 class FitPipeline(Pipeline):
     """The FitPipeline entity"""
 
     def run(self, pipeline_parameters: FitPipelineParameters) -> Any:
         """
-        Run pipeline, according to the sequential steps defined
+        Run pipeline, according to the step graph defined
         :param pipeline_parameters: The parameters for each run of the pipeline
         :return: the evaluation metrics dataset, the scaler, the classifier and the forecaster
         """
         start = timer()
 
-        prepare_data_step = ReadPrepareTrainingDataStep()
+        graph = StepGraph()
+
+        prepare_data_step = graph.add(ReadPrepareTrainingDataStep)
 
-        create_assets_step = CreateTrainingAssetsStep(
-            prepare_data_step.step_output.dataset
+        create_assets_step = graph.add(
+            CreateTrainingAssetsStep,
+            prepare_data_step.output("dataset")
         )
 
-        select_scaler_forecaster_step = SelectScalerForecasterStep(
+        select_scaler_forecaster_step = graph.add(
+            SelectScalerForecasterStep,
             pipeline_parameters.scaling_methods,
             pipeline_parameters.forecasting_algorithms,
-            create_assets_step.step_output.X_train,
-            create_assets_step.step_output.X_validation
+            create_assets_step.output("X_train"),
+            create_assets_step.output("X_validation")
         )
 
-        select_sampler_classifier_step = SelectSamplerClassifierStep(
+        select_sampler_classifier_step = graph.add(
+            SelectSamplerClassifierStep,
             pipeline_parameters.sampling_methods,
             pipeline_parameters.classification_algorithms,
-            select_scaler_forecaster_step.step_output.scaled_X_train,
-            create_assets_step.step_output.y_train,
-            select_scaler_forecaster_step.step_output.scaled_X_validation,
-            create_assets_step.step_output.y_validation
+            select_scaler_forecaster_step.output("scaled_X_train"),
+            create_assets_step.output("y_train"),
+            select_scaler_forecaster_step.output("scaled_X_validation"),
+            create_assets_step.output("y_validation")
         )
 
         # First time, train vs validation
-        create_forecasted_datasets_step = CreateForecastedDatasetsStep(
-            select_scaler_forecaster_step.step_output.scaler,
-            select_scaler_forecaster_step.step_output.forecaster,
-            select_scaler_forecaster_step.step_output.scaled_X_train,
-            create_assets_step.step_output.X_validation
+        validation_create_forecasted_datasets_step = graph.add(
+            CreateForecastedDatasetsStep,
+            select_scaler_forecaster_step.output("scaler"),
+            select_scaler_forecaster_step.output("forecaster"),
+            select_scaler_forecaster_step.output("scaled_X_train"),
+            create_assets_step.output("X_validation"),
+            step_role=TRAIN_VS_VALIDATION_ROLE
         )
 
         # First time, train vs validation
-        predict_step = PredictStep(
-            select_sampler_classifier_step.step_output.classifier,
-            create_forecasted_datasets_step.step_output.scaled_X_test,
-            create_forecasted_datasets_step.step_output.forecasted_scaled_X_tests
+        validation_predict_step = graph.add(
+            PredictStep,
+            select_sampler_classifier_step.output("classifier"),
+            validation_create_forecasted_datasets_step.output("scaled_X_test"),
+            validation_create_forecasted_datasets_step.output("forecasted_scaled_X_tests"),
+            step_role=TRAIN_VS_VALIDATION_ROLE
         )
 
-        select_thresholds_step = SelectThresholdsStep(
-            prepare_data_step.step_output.dataset,
-            predict_step.step_output.predicted_dataset
+        select_thresholds_step = graph.add(
+            SelectThresholdsStep,
+            prepare_data_step.output("dataset"),
+            validation_predict_step.output("predicted_dataset")
         )
 
-        retrain_step = RetrainStep(
-            select_scaler_forecaster_step.step_output.scaler,
-            select_scaler_forecaster_step.step_output.forecaster,
-            select_sampler_classifier_step.step_output.sampler,
-            select_sampler_classifier_step.step_output.classifier,
-            create_assets_step.step_output.X_train_validation,
-            create_assets_step.step_output.y_train_validation
+        retrain_step = graph.add(
+            RetrainStep,
+            select_scaler_forecaster_step.output("scaler"),
+            select_scaler_forecaster_step.output("forecaster"),
+            select_sampler_classifier_step.output("sampler"),
+            select_sampler_classifier_step.output("classifier"),
+            create_assets_step.output("X_train_validation"),
+            create_assets_step.output("y_train_validation")
         )
 
         # Second time, train_validation vs test
-        create_forecasted_datasets_step = CreateForecastedDatasetsStep(
-            retrain_step.step_output.scaler,
-            retrain_step.step_output.forecaster,
-            retrain_step.step_output.scaled_X_train_validation,
-            create_assets_step.step_output.X_test
+        # It runs after the first time, since both write the forecasted datasets files
+        create_forecasted_datasets_step = graph.add(
+            CreateForecastedDatasetsStep,
+            retrain_step.output("scaler"),
+            retrain_step.output("forecaster"),
+            retrain_step.output("scaled_X_train_validation"),
+            create_assets_step.output("X_test"),
+            step_role=RETRAIN_VS_TEST_ROLE,
+            after=[validation_create_forecasted_datasets_step]
         )
 
         # Second time, train_validation vs test
-        predict_step = PredictStep(
-            retrain_step.step_output.classifier,
-            create_forecasted_datasets_step.step_output.scaled_X_test,
-            create_forecasted_datasets_step.step_output.forecasted_scaled_X_tests
+        predict_step = graph.add(
+            PredictStep,
+            retrain_step.output("classifier"),
+            create_forecasted_datasets_step.output("scaled_X_test"),
+            create_forecasted_datasets_step.output("forecasted_scaled_X_tests"),
+            step_role=RETRAIN_VS_TEST_ROLE
         )
 
-        calculate_predicted_risk_rates_step = CalculatePredictedRiskRatesStep(
-            prepare_data_step.step_output.dataset,
-            predict_step.step_output.predicted_dataset,
-            select_thresholds_step.step_output.thresholds
+        calculate_predicted_risk_rates_step = graph.add(
+            CalculatePredictedRiskRatesStep,
+            prepare_data_step.output("dataset"),
+            predict_step.output("predicted_dataset"),
+            select_thresholds_step.output("thresholds")
         )
 
-        calculate_statistical_risk_rates_step = CalculateStatisticalRiskRatesStep(
-            prepare_data_step.step_output.dataset,
-            create_assets_step.step_output.X_test,
-            create_forecasted_datasets_step.step_output.forecasted_X_tests
+        calculate_statistical_risk_rates_step = graph.add(
+            CalculateStatisticalRiskRatesStep,
+            prepare_data_step.output("dataset"),
+            create_assets_step.output("X_test"),
+            create_forecasted_datasets_step.output("forecasted_X_tests")
         )
 
-        create_output_dataset_step = CreateResultsOutputDatasetStep(
-            prepare_data_step.step_output.dataset,
-            predict_step.step_output.predicted_dataset,
-            calculate_predicted_risk_rates_step.step_output.predicted_risk_rates_dataset,
-            calculate_statistical_risk_rates_step.step_output.statistical_risk_rates_dataset
+        create_output_dataset_step = graph.add(
+            CreateResultsOutputDatasetStep,
+            prepare_data_step.output("dataset"),
+            predict_step.output("predicted_dataset"),
+            calculate_predicted_risk_rates_step.output("predicted_risk_rates_dataset"),
+            calculate_statistical_risk_rates_step.output("statistical_risk_rates_dataset")
         )
 
-        create_output_dataset_step.step_output.output_dataset.to_csv(cfg.DATA_GENERATED_DIR + "fit_output_dataset.csv")
-
-        calculate_evaluation_measures_step = CalculateEvaluationMeasuresStep(
-            create_output_dataset_step.step_output.output_dataset
+        calculate_evaluation_measures_step = graph.add(
+            CalculateEvaluationMeasuresStep,
+            create_output_dataset_step.output("output_dataset")
         )
 
-        DeployModelStep(
-            retrain_step.step_output.scaler,
-            retrain_step.step_output.forecaster,
-            retrain_step.step_output.sampler,
-            retrain_step.step_output.classifier,
-            select_thresholds_step.step_output.thresholds
+        graph.add(
+            DeployModelStep,
+            retrain_step.output("scaler"),
+            retrain_step.output("forecaster"),
+            retrain_step.output("sampler"),
+            retrain_step.output("classifier"),
+            select_thresholds_step.output("thresholds")
         )
 
+        graph.run(cfg.PIPELINE_WORKERS)
+
+        if not execution_context.is_plan_mode():
+            create_output_dataset_step.step.step_output.output_dataset.to_csv(cfg.DATA_GENERATED_DIR + "fit_output_dataset.csv")
+
         end = timer()
 
         self.save_elapsed_time(start, end)
 
-        return calculate_evaluation_measures_step
+        return calculate_evaluation_measures_step.step
@@ -5,14 +5,18 @@ import pandas as pd
 
 import config.general_settings as cfg
 
+from src.pipeline import execution_context
 from src.pipeline.pipeline import Pipeline, PredictPipelineParameters
+from src.pipeline.step_graph import StepGraph
 from src.pipeline.steps.calculate_predicted_risk_rates import CalculatePredictedRiskRatesStep
 from src.pipeline.steps.calculate_statistical_risk_rates_step import CalculateStatisticalRiskRatesStep
 from src.pipeline.steps.create_forecasted_datasets_step import CreateForecastedDatasetsStep
 from src.pipeline.steps.create_results_output_dataset_step import CreateResultsOutputDatasetStep
 from src.pipeline.steps.load_model_step import LoadModelStep
+from src.pipeline.steps.load_risk_rate_states_step import LoadRiskRateStatesStep
 from src.pipeline.steps.predict_step import PredictStep
 from src.pipeline.steps.read_prediction_data_step import ReadPredictionDataStep
+from src.pipeline.steps.save_risk_rate_states_step import SaveRiskRateStatesStep
 
 
 class PredictPipeline(Pipeline):
@@ -20,48 +24,66 @@ class PredictPipeline(Pipeline):
 
     def run(self, pipeline_parameters: PredictPipelineParameters) -> Any:
         """
-        Run pipeline, according to the sequential steps defined
+        Run pipeline, according to the step graph defined
         :param pipeline_parameters: The parameters for each run of the pipeline
         """
         start = timer()
 
-        read_data_step = ReadPredictionDataStep()
+        graph = StepGraph()
 
-        load_model_step = LoadModelStep()
+        read_data_step = graph.add(ReadPredictionDataStep)
 
-        create_forecasted_datasets_step = CreateForecastedDatasetsStep(
-            load_model_step.step_output.scaler,
-            load_model_step.step_output.forecaster,
+        load_model_step = graph.add(LoadModelStep)
+
+        load_risk_rate_states_step = graph.add(LoadRiskRateStatesStep)
+
+        create_forecasted_datasets_step = graph.add(
+            CreateForecastedDatasetsStep,
+            load_model_step.output("scaler"),
+            load_model_step.output("forecaster"),
             pd.DataFrame(),
-            read_data_step.step_output.dataset
+            read_data_step.output("dataset")
         )
 
-        predict_step = PredictStep(
-            load_model_step.step_output.classifier,
-            create_forecasted_datasets_step.step_output.scaled_X_test,
-            create_forecasted_datasets_step.step_output.forecasted_scaled_X_tests
+        predict_step = graph.add(
+            PredictStep,
+            load_model_step.output("classifier"),
+            create_forecasted_datasets_step.output("scaled_X_test"),
+            create_forecasted_datasets_step.output("forecasted_scaled_X_tests")
         )
 
-        calculate_predicted_risk_rates_step = CalculatePredictedRiskRatesStep(
-            read_data_step.step_output.dataset,
-            predict_step.step_output.predicted_dataset,
-            load_model_step.step_output.thresholds
+        calculate_predicted_risk_rates_step = graph.add(
+            CalculatePredictedRiskRatesStep,
+            read_data_step.output("dataset"),
+            predict_step.output("predicted_dataset"),
+            load_model_step.output("thresholds")
         )
 
-        calculate_statistical_risk_rates_step = CalculateStatisticalRiskRatesStep(
-            read_data_step.step_output.dataset,
-            read_data_step.step_output.dataset,
-            create_forecasted_datasets_step.step_output.forecasted_X_tests
+        calculate_statistical_risk_rates_step = graph.add(
+            CalculateStatisticalRiskRatesStep,
+            read_data_step.output("dataset"),
+            read_data_step.output("dataset"),
+            create_forecasted_datasets_step.output("forecasted_X_tests"),
+            load_risk_rate_states_step.output("risk_rate_states")
         )
 
-        create_output_dataset_step = CreateResultsOutputDatasetStep(
-            read_data_step.step_output.dataset,
-            predict_step.step_output.predicted_dataset,
-            calculate_predicted_risk_rates_step.step_output.predicted_risk_rates_dataset,
-            calculate_statistical_risk_rates_step.step_output.statistical_risk_rates_dataset
+        graph.add(
+            SaveRiskRateStatesStep,
+            calculate_statistical_risk_rates_step.output("risk_rate_states")
         )
 
-        create_output_dataset_step.step_output.output_dataset.to_csv(cfg.DATA_GENERATED_DIR + "predict_output_dataset.csv")
+        create_output_dataset_step = graph.add(
+            CreateResultsOutputDatasetStep,
+            read_data_step.output("dataset"),
+            predict_step.output("predicted_dataset"),
+            calculate_predicted_risk_rates_step.output("predicted_risk_rates_dataset"),
+            calculate_statistical_risk_rates_step.output("statistical_risk_rates_dataset")
+        )
+
+        graph.run(cfg.PIPELINE_WORKERS)
+
+        if not execution_context.is_plan_mode():
+            create_output_dataset_step.step.step_output.output_dataset.to_csv(cfg.DATA_GENERATED_DIR + "predict_output_dataset.csv")
 
         end = timer()
 
@@ -4,13 +4,17 @@ Both are abstract
 """
 
 import logging
-import pickle
-from typing import Any, List
+import re
+import threading
+from typing import Any, Callable, Dict, List
 
-import config.general_settings as cfg
+from src.exception.plan_interruption_exception import PlanInterruptionException
+from src.pipeline import execution_context
+from src.pipeline.step_cache import StepCache
+from src.utils import fingerprint_utils, profiling_utils
+from src.utils.logging_utils import print_and_log
 
-INPUT_SUFFIX = "_input"
-OUTPUT_SUFFIX = "_output"
+STEP_PROFILE_CATEGORY = "step"
 
 
 class Step:
@@ -19,28 +23,46 @@ class Step:
     step_description: str
     step_input: Any
     step_output: Any
+    step_cache: StepCache
+    step_cacheable = True
+    step_role = ""
 
     def prepare(self) -> None:
         """
         Prepare step to be executed.
         Needs to be called from each implemented step!
         """
-        if self.requires_re_run():
-            logging.info("Running step {}\n{}".format(
-                self.step_name,
-                self.step_description
-            ))
-            self.run()
-            self.__save_step_input_object()
-            self.__save_step_output_object()
-            self.step_output.updated = True
-        else:
-            logging.info("Skipping step {}".format(
-                self.step_name
-            ))
-            self.step_input = self.__load_step_input_object()
-            self.step_output = self.__load_step_output_object()
-            self.step_output.updated = False
+        with profiling_utils.profile(self.get_step_identity(), STEP_PROFILE_CATEGORY, step_name=self.step_name) as profile_span:
+            self.step_cache = StepCache(self)
+            re_run = self.requires_re_run()
+            if profile_span is not None:
+                profile_span.args["cache_hit"] = not re_run
+            if re_run:
+                if execution_context.is_plan_mode():
+                    print_and_log("[plan] Step {} would re-run: {}".format(self.get_step_identity(), self.__get_re_run_reason()))
+                    raise PlanInterruptionException("[plan] Steps after {} were not planned, since they depend on its output".format(self.get_step_identity()))
+                logging.info("Running step {} ({})\n{}".format(
+                    self.step_name,
+                    self.get_step_identity(),
+                    self.step_description
+                ))
+                # The step may change its input objects, so their remembered fingerprints are no longer valid
+                fingerprint_utils.forget_fingerprints(self.step_input)
+                self.run()
+                self.step_cache.save(self.step_input, self.step_output)
+                self.step_output.updated = True
+            else:
+                if execution_context.is_plan_mode():
+                    print_and_log("[plan] Step {} is up to date".format(self.get_step_identity()))
+                else:
+                    # So that the key used by this run is the one kept when the execution objects are cleaned
+                    self.step_cache.save_latest()
+                logging.info("Skipping step {} ({})".format(
+                    self.step_name,
+                    self.get_step_identity()
+                ))
+                self.step_output = self.step_cache.load_output()
+                self.step_output.updated = False
 
     def requires_re_run(self) -> bool:
         """
@@ -49,52 +71,39 @@ class Step:
         """
         if self.__class__ == Step:
             raise Exception("Class Step must not be called directly")
-        return True
+        return not self.step_cacheable or not self.step_cache.contains()
 
     def run(self) -> None:
         """Internal run for step"""
         if self.__class__ == Step:
             raise Exception("Class Step must not be called directly")
 
-    def __save_step_input_object(self) -> None:
-        """To save step_input object to file"""
-        with open(self.__get_step_input_file_name(), 'wb') as file:
-            pickle.dump(self.step_input, file)
-
-    def __save_step_output_object(self) -> None:
-        """To save step_output object to file"""
-        with open(self.__get_step_output_file_name(), 'wb') as file:
-            pickle.dump(self.step_output, file)
-
-    def __load_step_input_object(self) -> Any:
-        """
-        To load step_input object from file
-        :return: the loaded object
+    def get_step_identity(self) -> str:
         """
-        with open(self.__get_step_input_file_name(), 'rb') as file:
-            return pickle.load(file)
-
-    def __load_step_output_object(self) -> Any:
-        """
-        To load step_output object from file
-        :return: the loaded object
+        The identity of this step instance, made of the pipeline name, the step class and the step role.
+        The role tells apart instances of the same step class within a pipeline
+        :return: the step identity, as a relative path
         """
-        with open(self.__get_step_output_file_name(), 'rb') as file:
-            return pickle.load(file)
+        identity = [execution_context.get_pipeline_name(), re.sub(r"(?<!^)(?=[A-Z])", "_", type(self).__name__).lower()]
+        if self.step_role:
+            identity.append(self.step_role)
+        return "/".join(identity)
 
-    def __get_step_input_file_name(self) -> str:
+    def get_file_dependencies(self) -> List[str]:
         """
-        Return the step input file name
-        :return: the step input file name
+        The files read by the step, whose content is part of the step cache key
+        :return: the file paths
         """
-        return cfg.OUTPUT_EXECUTION_OBJECTS_DIR + self.step_name.lower().replace(" ", "_") + INPUT_SUFFIX
+        return []
 
-    def __get_step_output_file_name(self) -> str:
+    def __get_re_run_reason(self) -> str:
         """
-        Return the step output file name
-        :return: the step output file name
+        Explains why the step needs to be re-run
+        :return: the reason
         """
-        return cfg.OUTPUT_EXECUTION_OBJECTS_DIR + self.step_name.lower().replace(" ", "_") + OUTPUT_SUFFIX
+        if not self.step_cacheable:
+            return "step is never cached"
+        return self.step_cache.get_miss_reason()
 
 
 class StepInput:
@@ -106,3 +115,28 @@ class StepOutput:
     """The StepOutput entity"""
     outputs: List[Any]
     updated = True
+
+    def set_lazy_fields(self, field_loaders: Dict[str, Callable[[], Any]]) -> None:
+        """
+        Sets fields that are only loaded on their first access
+        :param field_loaders: the functions that load each field, by field name
+        """
+        self.__dict__["_lazy_field_loaders"] = dict(field_loaders)
+        self.__dict__["_lazy_field_lock"] = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Loads a lazy field on its first access. Only called for attributes that are not set yet.
+        Steps running concurrently may access the same field, so it is loaded only once
+        :param name: the attribute name
+        :return: the attribute value
+        """
+        field_loaders = self.__dict__.get("_lazy_field_loaders", {})
+        if name not in field_loaders:
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+        with self.__dict__["_lazy_field_lock"]:
+            if name in field_loaders:
+                # The loader is only removed once the field is set, so that it is never seen as missing
+                setattr(self, name, field_loaders[name]())
+                del field_loaders[name]
+        return self.__dict__[name]
@@ -0,0 +1,189 @@
+"""
+Module which contains the StepCache class
+It stores the step objects by a key made of everything that may change the step output
+"""
+import json
+import os
+import sys
+from typing import Any, Dict, Optional, Set
+
+import config.general_settings as cfg
+
+from src.pipeline import execution_context
+from src.storage.blob_store import BlobStore
+from src.storage.object_serializer import ObjectSerializer
+from src.storage.storage_statistics import StorageStatistics
+from src.utils import fingerprint_utils
+
+INPUT_SUFFIX = "_input.json"
+OUTPUT_SUFFIX = "_output.json"
+LATEST_KEY_FILE_NAME = "latest.json"
+BLOBS_SUB_DIR = "blobs/"
+
+CODE_COMPONENT = "code"
+SETTINGS_COMPONENT_PREFIX = "settings:"
+INPUT_COMPONENT_PREFIX = "input:"
+FILE_COMPONENT_PREFIX = "file:"
+
+
+class StepCache:
+    """
+    The StepCache entity
+    The key is a fingerprint of the step input, the settings and source code the step depends on
+    and the files it reads. A step whose key was already stored does not need to re-run.
+    Keys are stored per step identity, so that every step instance is cached on its own.
+    Their values are kept in a blob store shared by all steps, so that each one is written only once.
+    Only the latest key of each step identity is kept once a pipeline ends (see clean)
+    """
+
+    step_dir: str
+    key_components: Dict[str, str]
+    key: str
+    serializer: ObjectSerializer
+
+    def __init__(self, step: Any):
+        """
+        Class constructor
+        :param step: the step, with its step_input already set
+        """
+        self.step_dir = cfg.OUTPUT_EXECUTION_OBJECTS_DIR + step.get_step_identity() + "/"
+        self.key_components = self.__get_key_components(step)
+        self.key = fingerprint_utils.get_fingerprint_of_fingerprints(self.key_components)
+        self.serializer = ObjectSerializer(BlobStore(cfg.OUTPUT_EXECUTION_OBJECTS_DIR + BLOBS_SUB_DIR,
+                                                     cfg.EXECUTION_OBJECTS_COMPRESSION,
+                                                     execution_context.get_storage_statistics()))
+
+    def contains(self) -> bool:
+        """
+        Whether the step objects for this key were already stored
+        :return: whether they were stored or not
+        """
+        return self.serializer.contains(self.__get_file_name(INPUT_SUFFIX)) and self.serializer.contains(self.__get_file_name(OUTPUT_SUFFIX))
+
+    def get_miss_reason(self) -> str:
+        """
+        Explains why this key was not stored, by comparing it with the latest stored key
+        :return: the reason
+        """
+        latest_key_file_name = self.step_dir + LATEST_KEY_FILE_NAME
+        if not os.path.isfile(latest_key_file_name):
+            return "no cached result"
+        with open(latest_key_file_name, 'r') as file:
+            latest_key_components = json.load(file)["key_components"]
+
+        names = sorted(set(latest_key_components) | set(self.key_components))
+        changes = [self.__describe_component(name) for name in names
+                   if latest_key_components.get(name) != self.key_components.get(name)]
+        if not changes:
+            return "cached result is missing"
+        return ", ".join(changes) + " changed"
+
+    def save(self, step_input: Any, step_output: Any) -> None:
+        """
+        Stores the step objects for this key
+        :param step_input: the step input
+        :param step_output: the step output
+        """
+        os.makedirs(self.step_dir, exist_ok=True)
+        self.serializer.save(step_input, self.__get_file_name(INPUT_SUFFIX))
+        self.serializer.save(step_output, self.__get_file_name(OUTPUT_SUFFIX))
+        self.save_latest()
+
+    def save_latest(self) -> None:
+        """Stores this key as the latest one of the step identity, either because it was saved or used"""
+        with open(self.step_dir + LATEST_KEY_FILE_NAME, 'w') as file:
+            json.dump({"key": self.key, "key_components": self.key_components}, file, indent=4, sort_keys=True)
+
+    @staticmethod
+    def clean(root_dir: str, statistics: Optional[StorageStatistics] = None) -> None:
+        """
+        Removes the step objects of every key but the latest one of each step identity, and then the blobs
+        no remaining step object references, so that the execution objects do not grow with every change.
+        No step must run meanwhile
+        :param root_dir: the execution objects directory
+        :param statistics: the storage statistics to be updated with the removed blobs, if any
+        """
+        referenced_blob_ids = set()
+        for dir_path, dir_names, file_names in os.walk(root_dir):
+            if os.path.normpath(dir_path) == os.path.normpath(root_dir + BLOBS_SUB_DIR):
+                dir_names.clear()
+                continue
+            latest_key = None
+            if LATEST_KEY_FILE_NAME in file_names:
+                with open(os.path.join(dir_path, LATEST_KEY_FILE_NAME), 'r') as file:
+                    latest_key = json.load(file)["key"]
+            for file_name in file_names:
+                if not file_name.endswith((INPUT_SUFFIX, OUTPUT_SUFFIX)):
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                if latest_key is not None and not file_name.startswith(latest_key):
+                    os.remove(file_path)
+                    continue
+                with open(file_path, 'r') as file:
+                    StepCache.__collect_blob_ids(json.load(file), referenced_blob_ids)
+        BlobStore(root_dir + BLOBS_SUB_DIR, statistics=statistics).clean(referenced_blob_ids)
+
+    @staticmethod
+    def __collect_blob_ids(entry: Any, blob_ids: Set[str]) -> None:
+        """
+        Collects the blobs referenced by a manifest entry, recursively
+        :param entry: the manifest entry
+        :param blob_ids: the blob fingerprints collected so far
+        """
+        if isinstance(entry, dict):
+            if "blob" in entry:
+                blob_ids.add(entry["blob"])
+            for value in entry.values():
+                StepCache.__collect_blob_ids(value, blob_ids)
+        elif isinstance(entry, list):
+            for item in entry:
+                StepCache.__collect_blob_ids(item, blob_ids)
+
+    def load_output(self) -> Any:
+        """
+        Loads the step output stored for this key, lazily: each field is only read on its first access.
+        The step input is not loaded, since it has the same fingerprint as the current one
+        :return: the step output
+        """
+        output_class, field_loaders = self.serializer.load_lazily(self.__get_file_name(OUTPUT_SUFFIX))
+        step_output = output_class.__new__(output_class)
+        step_output.set_lazy_fields(field_loaders)
+        return step_output
+
+    def __get_key_components(self, step: Any) -> Dict[str, str]:
+        """
+        Gets the fingerprints that compose the key
+        :param step: the step
+        :return: the fingerprints, by component name
+        """
+        source_modules, settings_modules = fingerprint_utils.get_code_dependencies(sys.modules[type(step).__module__])
+
+        key_components = {CODE_COMPONENT: fingerprint_utils.get_code_fingerprint(source_modules)}
+        for settings_module in settings_modules:
+            key_components[SETTINGS_COMPONENT_PREFIX + settings_module.__name__] = fingerprint_utils.get_settings_fingerprint(settings_module)
+        for name, value in vars(step.step_input).items():
+            key_components[INPUT_COMPONENT_PREFIX + name] = fingerprint_utils.get_fingerprint(value)
+        for file_path in step.get_file_dependencies():
+            key_components[FILE_COMPONENT_PREFIX + file_path] = fingerprint_utils.get_file_fingerprint(file_path)
+        return key_components
+
+    def __describe_component(self, name: str) -> str:
+        """
+        Gets a readable description of a key component
+        :param name: the component name
+        :return: the description
+        """
+        for prefix, description in [(SETTINGS_COMPONENT_PREFIX, "settings"),
+                                    (INPUT_COMPONENT_PREFIX, "input"),
+                                    (FILE_COMPONENT_PREFIX, "file")]:
+            if name.startswith(prefix):
+                return "{} {}".format(description, name[len(prefix):])
+        return name
+
+    def __get_file_name(self, suffix: str) -> str:
+        """
+        Return the manifest file name of a step object for this key
+        :param suffix: the suffix of the step object (input or output)
+        :return: the file name
+        """
+        return self.step_dir + self.key + suffix
@@ -0,0 +1,115 @@
+"""
+Module which contains the StepGraph class
+It runs the steps of a pipeline as soon as the steps they depend on are done, some of them concurrently
+"""
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from src.exception.plan_interruption_exception import PlanInterruptionException
+from src.pipeline.step_node import StepNode
+
+
+class StepGraph:
+    """
+    The StepGraph entity
+    Steps are added in an order in which they can run one after the other, which is the order used
+    with a single worker. With more workers, independent steps run concurrently on a thread pool.
+    Either way, each step gets the same inputs, so the results are the same
+    """
+
+    nodes: List[StepNode]
+
+    def __init__(self):
+        """Class constructor"""
+        self.nodes = []
+
+    def add(self, step_class: type, *args: Any, after: Optional[List[StepNode]] = None, **kwargs: Any) -> StepNode:
+        """
+        Adds a step to the graph
+        :param step_class: the step class
+        :param args: the positional arguments of the step, either values or references to outputs of steps already added
+        :param after: the steps that must run before this one, even if their outputs are not used (such as steps writing the same files)
+        :param kwargs: the keyword arguments of the step, either values or references to outputs of steps already added
+        :return: the node of the step, whose output can be referenced by the steps added next
+        """
+        node = StepNode(step_class, args, kwargs, after if after is not None else [])
+        for dependency in node.dependencies:
+            if dependency not in self.nodes:
+                raise ValueError("Step {} depends on a step that was not added to the graph".format(step_class.__name__))
+        self.nodes.append(node)
+        return node
+
+    def run(self, workers: int = 1) -> None:
+        """
+        Runs all the steps of the graph
+        In plan mode, the steps that do not depend on a step that would re-run are still planned
+        :param workers: how many steps may run at the same time
+        """
+        if workers < 1:
+            raise ValueError("Parameter workers must be at least 1")
+        if workers == 1:
+            self.__schedule(self.__run_now, workers)
+            return
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="Step") as executor:
+            # Each step runs within a copy of the current context, so that it sees the pipeline execution context
+            self.__schedule(lambda node: executor.submit(contextvars.copy_context().run, node.run), workers)
+
+    def __schedule(self, submit: Callable[[StepNode], Future], workers: int) -> None:
+        """
+        Submits the steps whose dependencies are done, in the order they were added, until all are done
+        :param submit: the function that starts running a step
+        :param workers: how many steps may run at the same time
+        """
+        pending = list(self.nodes)
+        running: Dict[Future, StepNode] = {}
+        done: Set[StepNode] = set()
+        not_planned: Set[StepNode] = set()
+        plan_interruptions: List[PlanInterruptionException] = []
+        errors: List[Exception] = []
+
+        while pending or running:
+            for node in list(pending):
+                if errors or len(running) >= workers:
+                    break
+                if any(dependency in not_planned for dependency in node.dependencies):
+                    pending.remove(node)
+                    not_planned.add(node)
+                elif all(dependency in done for dependency in node.dependencies):
+                    pending.remove(node)
+                    running[submit(node)] = node
+            if errors:
+                pending.clear()
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                exception = future.exception()
+                if exception is None:
+                    done.add(node)
+                elif isinstance(exception, PlanInterruptionException):
+                    not_planned.add(node)
+                    plan_interruptions.append(exception)
+                else:
+                    errors.append(exception)
+
+        if errors:
+            raise errors[0]
+        if plan_interruptions:
+            raise PlanInterruptionException("\n".join(str(exception) for exception in plan_interruptions))
+
+    def __run_now(self, node: StepNode) -> Future:
+        """
+        Runs a step in the current thread
+        :param node: the node of the step
+        :return: the future of the step run, already done
+        """
+        future: Future = Future()
+        try:
+            node.run()
+            future.set_result(None)
+        except Exception as exception:
+            future.set_exception(exception)
+        return future
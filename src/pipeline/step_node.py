@@ -0,0 +1,71 @@
+"""Module which contains the StepNode class"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.pipeline.step import Step
+from src.pipeline.step_output_reference import StepOutputReference
+from src.utils import profiling_utils
+
+INPUTS_PROFILE_CATEGORY = "inputs"
+
+
+class StepNode:
+    """
+    The StepNode entity
+    It holds a step of a StepGraph, with the arguments it is built from. The step depends on the
+    steps whose outputs are referenced by its arguments, and on the steps it must run after
+    """
+
+    step_class: type
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    dependencies: List["StepNode"]
+    step: Optional[Step]
+
+    def __init__(self, step_class: type,
+                 args: Tuple[Any, ...],
+                 kwargs: Dict[str, Any],
+                 after: List["StepNode"]):
+        """
+        Class constructor
+        :param step_class: the step class
+        :param args: the positional arguments of the step, either values or references to step outputs
+        :param kwargs: the keyword arguments of the step, either values or references to step outputs
+        :param after: the nodes that must run before this one, even if their outputs are not used
+        """
+        self.step_class = step_class
+        self.args = args
+        self.kwargs = kwargs
+        self.dependencies = []
+        for value in list(args) + list(kwargs.values()):
+            if isinstance(value, StepOutputReference) and value.node not in self.dependencies:
+                self.dependencies.append(value.node)
+        for node in after:
+            if node not in self.dependencies:
+                self.dependencies.append(node)
+        self.step = None
+
+    def output(self, field_name: str) -> StepOutputReference:
+        """
+        Get a reference to a field of the step output, to be used as argument by other steps
+        :param field_name: the field name
+        :return: the reference
+        """
+        return StepOutputReference(self, field_name)
+
+    def run(self) -> None:
+        """Builds the step from its arguments, which runs it (or loads its cached output)"""
+        # Outputs of skipped steps are loaded on their first access, that is, here
+        with profiling_utils.profile("{} inputs".format(self.step_class.__name__), INPUTS_PROFILE_CATEGORY):
+            args = [self.__resolve(value) for value in self.args]
+            kwargs = {name: self.__resolve(value) for name, value in self.kwargs.items()}
+        self.step = self.step_class(*args, **kwargs)
+
+    def __resolve(self, value: Any) -> Any:
+        """
+        Resolves an argument of the step
+        :param value: the argument
+        :return: the referenced field, for references, or the argument itself
+        """
+        if isinstance(value, StepOutputReference):
+            return value.resolve()
+        return value
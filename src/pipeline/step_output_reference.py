@@ -0,0 +1,30 @@
+"""Module which contains the StepOutputReference class"""
+from typing import Any
+
+
+class StepOutputReference:
+    """
+    The StepOutputReference entity
+    It stands for a field of a step output, before the step has run
+    """
+
+    node: Any
+    field_name: str
+
+    def __init__(self, node: Any, field_name: str):
+        """
+        Class constructor
+        :param node: the step node whose output holds the field
+        :param field_name: the field name
+        """
+        self.node = node
+        self.field_name = field_name
+
+    def resolve(self) -> Any:
+        """
+        Get the referenced field, once its step has run
+        :return: the field value
+        """
+        if self.node.step is None:
+            raise Exception("Step {} must run before its output is used".format(self.node.step_class.__name__))
+        return getattr(self.node.step.step_output, self.field_name)
@@ -11,8 +11,8 @@ import config.dataset_settings as dscfg
 import config.general_settings as cfg
 
 import src.utils.pandas_utils as pdutils
-from src.enum.risk_rate_index_enum import RiskRateIndexEnum
 from src.pipeline.step import Step, StepInput, StepOutput
+from src.risk_rate.threshold_set import ThresholdSet
 from src.utils.dataset_columns_utils import get_column_name_prefix, get_column_name_suffix, get_column_names_suffix
 
 
@@ -38,9 +38,7 @@ class CalculatePredictedRiskRatesStep(Step):
         """Internal run for step"""
         original_dataset = self.step_input.original_dataset
         predicted_dataset = self.step_input.predicted_dataset
-        thresholds = self.step_input.thresholds
-
-        self.__set_thresholds(thresholds)
+        threshold_set = ThresholdSet(self.step_input.thresholds)
 
         dates = pdutils.select_columns(predicted_dataset, dscfg.DATE_COLUMN_NAME, reset_row_indexes=True)
         merged_dataframe = pdutils.join_inner_by_date([dates, original_dataset])
@@ -49,8 +47,8 @@ class CalculatePredictedRiskRatesStep(Step):
         except KeyError:
             hotspot_identified = None
 
-        probs_present, risk_rates_present = self.__get_risk_rates_present(predicted_dataset)
-        probs_forecasted_columns, risk_rates_forecasted_list = self.__get_risk_rates_future(predicted_dataset)
+        probs_present, risk_rates_present = self.__get_risk_rates_present(predicted_dataset, threshold_set)
+        probs_forecasted_columns, risk_rates_forecasted_list = self.__get_risk_rates_future(predicted_dataset, threshold_set)
         risk_rates_dataset = self.__create_risk_rate_dataset(
             dates, probs_present, risk_rates_present,
             probs_forecasted_columns, risk_rates_forecasted_list,
@@ -61,28 +59,23 @@ class CalculatePredictedRiskRatesStep(Step):
 
         self.step_output = CalculatePredictedRiskRatesStepOutput(risk_rates_dataset)
 
-    def __set_thresholds(self, thresholds: List[float]) -> None:
-        RiskRateIndexEnum.NULO.set_prob_threshold(thresholds[0])
-        RiskRateIndexEnum.PEQUENO.set_prob_threshold(thresholds[1])
-        RiskRateIndexEnum.MEDIO.set_prob_threshold(thresholds[2])
-        RiskRateIndexEnum.ALTO.set_prob_threshold(thresholds[3])
-        RiskRateIndexEnum.MUITO_ALTO.set_prob_threshold(thresholds[4])
-
-    def __get_risk_rates_present(self, predicted_dataset: pd.DataFrame) -> Tuple[Any, List[str]]:
+    def __get_risk_rates_present(self, predicted_dataset: pd.DataFrame, threshold_set: ThresholdSet) -> Tuple[Any, List[str]]:
         """
         Gets the risk rates for predicted dataset, present time
         :param predicted_dataset: the dataset with predicted probabilities
+        :param threshold_set: the thresholds of the risk rate indexes
         :return: the risk rates
         """
         column_name = get_column_name_prefix(dscfg.PRESENT_COLUMN_NAME, dscfg.PROBS_PREFIX)
         probs_present = predicted_dataset[column_name].tolist()
-        risk_rates_present = self.__generate_predicted_risk_rate(probs_present)
+        risk_rates_present = threshold_set.classify(probs_present)
         return probs_present, risk_rates_present
 
-    def __get_risk_rates_future(self, predicted_dataset: pd.DataFrame) -> Tuple[pd.DataFrame, Any]:
+    def __get_risk_rates_future(self, predicted_dataset: pd.DataFrame, threshold_set: ThresholdSet) -> Tuple[pd.DataFrame, Any]:
         """
         Gets the risk rates for predicted dataset, future time
         :param predicted_dataset: the dataset with predicted probabilities
+        :param threshold_set: the thresholds of the risk rate indexes
         :return: the risk rates
         """
         column_name = get_column_name_prefix(dscfg.FORECASTED_COLUMN_NAME, dscfg.PROBS_PREFIX)
@@ -90,24 +83,10 @@ class CalculatePredictedRiskRatesStep(Step):
         risk_rates_forecasted_list = []
         for i in range(0, probs_forecasted_columns.shape[1]):
             probs_forecasted = pdutils.dataframe_to_list(pdutils.select_columns(probs_forecasted_columns, i))
-            risk_rates_forecasted = self.__generate_predicted_risk_rate(probs_forecasted)
+            risk_rates_forecasted = threshold_set.classify(probs_forecasted)
             risk_rates_forecasted_list.append(risk_rates_forecasted)
         return probs_forecasted_columns, risk_rates_forecasted_list
 
-    def __generate_predicted_risk_rate(self, probs: List[float]) -> List[str]:
-        """
-        Gets the risk rates for predicted dataset
-        :param probs: the list of probabilities
-        :return: the risk rates
-        """
-        predicted_risk_rates = []
-        for prob in probs:
-            for risk_rate in RiskRateIndexEnum:
-                if prob <= risk_rate.prob_threshold:
-                    predicted_risk_rates.append(risk_rate.value)
-                    break
-        return predicted_risk_rates
-
     def __create_risk_rate_dataset(self,
                                    dates: pd.DataFrame,
                                    probs_present: List[float],
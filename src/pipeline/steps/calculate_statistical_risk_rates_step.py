@@ -2,7 +2,8 @@
 Module which contains the CalculateStatisticalRiskRatesStep, CalculateStatisticalRiskRatesStepInput and CalculateStatisticalRiskRatesStepOutput classes
 They contain the required methods to calculate the statistical/known risk rates such as FMA, Angstron and so on
 """
-from typing import List
+import logging
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -13,7 +14,9 @@ import src.utils.pandas_utils as pdutils
 from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
 from src.exception.not_implemented_exception import NotImplementedException
 from src.pipeline.step import Step, StepInput, StepOutput
-from src.risk_rate.algorithm.risk_rate_algorithm_factory import get
+from src.risk_rate import segment_operations
+from src.risk_rate.risk_rate_state import RiskRateState
+from src.risk_rate.risk_rate_states import RiskRateStates
 from src.utils.dataset_columns_utils import get_column_names_suffix
 
 
@@ -25,16 +28,19 @@ class CalculateStatisticalRiskRatesStep(Step):
 
     def __init__(self, input_dataset: pd.DataFrame,
                  X_test: pd.DataFrame,
-                 forecasted_X_tests: List[pd.DataFrame]):
+                 forecasted_X_tests: List[pd.DataFrame],
+                 risk_rate_states: Optional[RiskRateStates] = None):
         """
         Class constructor
         :param input_dataset: the initial and prepared dataset
         :param X_test: attributes for testing
         :param forecasted_X_tests: the list of forecasted datasets (one per day in the future)
+        :param risk_rate_states: the states of a previous run, if any, from which only the days after them are calculated
         """
         self.step_input = CalculateStatisticalRiskRatesStepInput(input_dataset,
                                                                  X_test,
-                                                                 forecasted_X_tests)
+                                                                 forecasted_X_tests,
+                                                                 risk_rate_states if risk_rate_states is not None else RiskRateStates())
         self.prepare()
 
     def run(self) -> None:
@@ -49,27 +55,74 @@ class CalculateStatisticalRiskRatesStep(Step):
         joined = pdutils.join_inner_by_date([input_dataset, dates_x_test])
         input_dataset = pdutils.select_columns(joined, column_names)
 
+        risk_rate_states = self.step_input.risk_rate_states
+        if risk_rate_states.states and not risk_rate_states.is_continued_by(input_dataset):
+            logging.info("The dataset does not continue from the risk rate states, so they are calculated from its first day")
+            risk_rate_states = RiskRateStates(risk_rate_states.model_fingerprint)
+
+        # The days up to the states were already calculated, the series continue from the states on the days after them
+        known_risk_rates_dataset = risk_rate_states.select_known_risk_rates(input_dataset)
+        input_dataset = risk_rate_states.select_new_rows(input_dataset)
+        forecasted_X_tests = [risk_rate_states.select_new_rows(forecasted_dataset) for forecasted_dataset in forecasted_X_tests]
+
+        new_risk_rates_dataset, new_states = self.__calculate_risk_rates(input_dataset, forecasted_X_tests, risk_rate_states.states)
+        risk_rate_states = risk_rate_states.update(new_states, new_risk_rates_dataset)
+
+        output_dataset = new_risk_rates_dataset
+        if not known_risk_rates_dataset.empty and not new_risk_rates_dataset.empty:
+            output_dataset = pdutils.join_dataframes_x_wise([known_risk_rates_dataset, new_risk_rates_dataset])
+        elif not known_risk_rates_dataset.empty:
+            output_dataset = known_risk_rates_dataset
+        output_dataset.to_csv(cfg.DATA_GENERATED_DIR + "statistical_risk_rates.csv")
+        self.step_output = CalculateStatisticalRiskRatesStepOutput(output_dataset, risk_rate_states)
+
+    def __calculate_risk_rates(self, input_dataset: pd.DataFrame,
+                               forecasted_X_tests: List[pd.DataFrame],
+                               states: Dict[str, RiskRateState]) -> Tuple[pd.DataFrame, Dict[str, RiskRateState]]:
+        """
+        Calculates the risk rates of the present and forecasted days, continuing from the states given
+        :param input_dataset: the rows of the days to be calculated
+        :param forecasted_X_tests: the forecasted datasets, with the same days
+        :param states: the states on the day before the first row, by column name and algorithm
+        :return: the risk rates, with the date column, and the states on the last day
+        """
         output_dataset = pdutils.select_columns(input_dataset, dscfg.DATE_COLUMN_NAME)
+        if input_dataset.empty:
+            # Every day was already calculated by a previous run
+            return output_dataset, states
 
         present_column_name = get_column_names_suffix(dscfg.PRESENT_COLUMN_NAME, "")[0]
         forecasted_column_names = get_column_names_suffix(dscfg.FORECASTED_COLUMN_NAME, "")
 
+        # A single engine per dataset, so that the columns and intermediates shared by the algorithms are computed once.
+        # Long histories are calculated by segments in a process pool
+        column_names = [present_column_name] + forecasted_column_names
+        engines = [segment_operations.create_engine(dataset, self.__get_engine_states(states, column_name),
+                                                    cfg.RISK_RATE_WORKERS, cfg.RISK_RATE_MIN_DAYS_PER_WORKER)
+                   for dataset, column_name in zip([input_dataset] + forecasted_X_tests, column_names)]
+
+        datasets = [output_dataset]
+        new_states = dict(states)
         for risk_rate_algorithm in RiskRateAlgorithmEnum:
             try:
-                algorithm = get(risk_rate_algorithm)
-                dataset = algorithm.calculate_for_dataset(input_dataset)
-                dataset = pdutils.add_prefix_to_column_names(dataset, present_column_name)
-                output_dataset = pdutils.join_dataframes_y_wise([output_dataset, dataset])
-                for i, forecasted_dataset in enumerate(forecasted_X_tests):
-                    forecasted_column_name = forecasted_column_names[i]
-                    dataset = algorithm.calculate_for_dataset(forecasted_dataset)
-                    dataset = pdutils.add_prefix_to_column_names(dataset, forecasted_column_name)
-                    output_dataset = pdutils.join_dataframes_y_wise([output_dataset, dataset])
+                for engine, column_name in zip(engines, column_names):
+                    dataset = engine.calculate_risk_rate_dataset(risk_rate_algorithm)
+                    datasets.append(pdutils.add_prefix_to_column_names(dataset, column_name))
+                    new_states[column_name + risk_rate_algorithm.value] = engine.get_state(risk_rate_algorithm)
             except NotImplementedException:
                 pass
+        return pdutils.join_dataframes_y_wise(datasets), new_states
 
-        output_dataset.to_csv(cfg.DATA_GENERATED_DIR + "statistical_risk_rates.csv")
-        self.step_output = CalculateStatisticalRiskRatesStepOutput(output_dataset)
+    def __get_engine_states(self, risk_rate_states: Dict[str, RiskRateState], column_name: str) -> Dict[RiskRateAlgorithmEnum, RiskRateState]:
+        """
+        Get the states of the algorithms of a dataset (present or one of the forecasted days)
+        :param risk_rate_states: the states of a previous run, by column name and algorithm
+        :param column_name: the column name of the dataset
+        :return: the states, by algorithm
+        """
+        return {risk_rate_algorithm: risk_rate_states[column_name + risk_rate_algorithm.value]
+                for risk_rate_algorithm in RiskRateAlgorithmEnum
+                if column_name + risk_rate_algorithm.value in risk_rate_states}
 
 
 class CalculateStatisticalRiskRatesStepInput(StepInput):
@@ -78,30 +131,37 @@ class CalculateStatisticalRiskRatesStepInput(StepInput):
     input_dataset: pd.DataFrame
     X_test: pd.DataFrame
     forecasted_X_tests: List[pd.DataFrame]
+    risk_rate_states: RiskRateStates
 
     def __init__(self,
                  input_dataset: pd.DataFrame,
                  X_test: pd.DataFrame,
-                 forecasted_X_tests: List[pd.DataFrame]):
+                 forecasted_X_tests: List[pd.DataFrame],
+                 risk_rate_states: RiskRateStates):
         """
         Class constructor
         :param input_dataset: the initial and prepared dataset
         :param X_test: attributes for testing
         :param forecasted_X_tests: the list of forecasted datasets (one per day in the future)
+        :param risk_rate_states: the states of a previous run
         """
         self.input_dataset = input_dataset
         self.X_test = X_test
         self.forecasted_X_tests = forecasted_X_tests
+        self.risk_rate_states = risk_rate_states
 
 
 class CalculateStatisticalRiskRatesStepOutput(StepOutput):
     """Output for CalculateStatisticalRiskRatesStep"""
 
     statistical_risk_rates_dataset: pd.DataFrame
+    risk_rate_states: RiskRateStates
 
-    def __init__(self, statistical_risk_rates_dataset: pd.DataFrame):
+    def __init__(self, statistical_risk_rates_dataset: pd.DataFrame, risk_rate_states: RiskRateStates):
         """
         Class constructor
         :param statistical_risk_rates_dataset: the dataset with statistical risk rates for dataset
+        :param risk_rate_states: the states on the last day, with the risk rates of every day calculated so far
         """
         self.statistical_risk_rates_dataset = statistical_risk_rates_dataset
+        self.risk_rate_states = risk_rate_states
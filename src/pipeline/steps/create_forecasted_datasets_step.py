@@ -21,17 +21,20 @@ class CreateForecastedDatasetsStep(Step):
     def __init__(self, scaler: Scaler,
                  forecaster: Forecaster,
                  scaled_X_train: pd.DataFrame,
-                 X_test: pd.DataFrame):
+                 X_test: pd.DataFrame,
+                 step_role: str = ""):
         """
         Class constructor
         :param scaler: the trained scaler
         :param forecaster: the trained forecaster
         :param scaled_X_train: scaled dataset with attributes for train
         :param X_test: attributes for test
+        :param step_role: the role of this step instance, when the step is used more than once in the pipeline
         """
         self.step_input = CreateForecastedDatasetsStepInput(
             scaler, forecaster, scaled_X_train, X_test
         )
+        self.step_role = step_role
         self.prepare()
 
     def run(self) -> None:
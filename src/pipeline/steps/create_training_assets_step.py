@@ -96,15 +96,16 @@ class CreateTrainingAssetsStepOutput(StepOutput):
         :param X_test: attributes for testing
         :param y_test: targets for testing
         """
-        self.X_train = X_train
-        self.y_train = y_train
-        self.X_validation = X_validation
-        self.y_validation = y_validation
+        # Train and validation assets are indexed from zero, as the train plus validation ones
+        self.X_train = X_train.reset_index(drop=True)
+        self.y_train = y_train.reset_index(drop=True)
+        self.X_validation = X_validation.reset_index(drop=True)
+        self.y_validation = y_validation.reset_index(drop=True)
         self.X_test = X_test
         self.y_test = y_test
         self.X_train_validation = pdutils.join_dataframes_x_wise(
-            [X_train, X_validation]
+            [self.X_train, self.X_validation]
         )
         self.y_train_validation = pdutils.join_dataframes_x_wise(
-            [y_train, y_validation]
+            [self.y_train, self.y_validation]
         )
@@ -5,10 +5,13 @@ They contain the required methods to run the prediction algorithm (ml)
 from pickle import dump
 from typing import List
 
+import config.forecast_settings as fccfg
 import config.general_settings as cfg
 
 from src.classification.algorithm.classifier import Classifier
 from src.forecasting.algorithm.forecaster import Forecaster
+from src.forecasting.numpy_model import NumpyModel
+from src.forecasting.tflite_model import TFLiteModel
 from src.pipeline.step import Step, StepInput, StepOutput
 from src.sampling.sampler import Sampler, SamplingMethodEnum
 from src.scaling.scaler import Scaler
@@ -19,6 +22,7 @@ class DeployModelStep(Step):
 
     step_name = "Deploy Model"
     step_description = "Deploy model assets"
+    step_cacheable = False
 
     def __init__(self,
                  scaler: Scaler,
@@ -43,6 +47,7 @@ class DeployModelStep(Step):
         definitions_dict = {
             cfg.SCALING_METHOD_KEY: self.step_input.scaler.method,
             cfg.FORECASTING_ALGORITHM_KEY: self.step_input.forecaster.algorithm,
+            cfg.FORECASTING_MODE_KEY: self.step_input.forecaster.mode,
             cfg.SAMPLING_METHOD_KEY: self.step_input.sampler.method,
             cfg.CLASSIFICATION_ALGORITHM_KEY: self.step_input.classifier.algorithm,
             cfg.THRESHOLDS_KEY: self.step_input.thresholds,
@@ -54,6 +59,11 @@ class DeployModelStep(Step):
         dump(definitions_dict, open(save_file_format.format(path, cfg.DEFINITIONS_DICT_FILE_NAME), 'wb'))
         dump(self.step_input.scaler.scaler, open(save_file_format.format(path, cfg.SCALER_FILE_NAME), 'wb'))
         self.step_input.forecaster.forecaster.save(save_file_format.format(path, cfg.FORECASTER_SUB_DIR))
+        NumpyModel.from_keras(self.step_input.forecaster.forecaster).save(save_file_format.format(path, cfg.FORECASTER_WEIGHTS_FILE_NAME))
+        if fccfg.TFLITE_QUANTIZATION is not None:
+            TFLiteModel.from_keras(self.step_input.forecaster.forecaster,
+                                   fccfg.TFLITE_QUANTIZATION,
+                                   fccfg.TFLITE_BATCH_SIZE).save(save_file_format.format(path, cfg.FORECASTER_TFLITE_FILE_NAME))
         if self.step_input.sampler.method != SamplingMethodEnum.NONE:
             dump(self.step_input.sampler.sampler, open(save_file_format.format(path, cfg.SAMPLER_FILE_NAME), 'wb'))
         dump(self.step_input.classifier.classifier, open(save_file_format.format(path, cfg.CLASSIFIER_FILE_NAME), 'wb'))
@@ -2,22 +2,16 @@
 Module which contains the LoadModelStep, LoadModelStepInput and LoadModelStepOutput classes
 They contain the required methods to run the prediction algorithm (ml)
 """
-from pickle import load
 from typing import List
 
-from tensorflow.keras.models import load_model
-
 import config.general_settings as cfg
 
-from src.classification.algorithm import classifier_factory
 from src.classification.algorithm.classifier import Classifier
-from src.forecasting.algorithm import forecaster_factory
 from src.forecasting.algorithm.forecaster import Forecaster
 from src.pipeline.step import Step, StepInput, StepOutput
-from src.sampling import sampler_factory
-from src.sampling.sampler import Sampler, SamplingMethodEnum
-from src.scaling import scaler_factory
+from src.sampling.sampler import Sampler
 from src.scaling.scaler import Scaler
+from src.serving.deployed_model import DeployedModel
 
 
 class LoadModelStep(Step):
@@ -33,30 +27,22 @@ class LoadModelStep(Step):
         self.step_input = LoadModelStepInput()
         self.prepare()
 
+    def get_file_dependencies(self) -> List[str]:
+        """
+        The files read by the step, whose content is part of the step cache key
+        :return: the file paths
+        """
+        return DeployedModel.get_file_paths(cfg.OUTPUT_DEPLOYED_MODEL_DIR)
+
     def run(self) -> None:
         """Internal run for step"""
+        deployed_model = DeployedModel.load(cfg.OUTPUT_DEPLOYED_MODEL_DIR)
 
-        load_file_format = "{}{}"
-        path = cfg.OUTPUT_DEPLOYED_MODEL_DIR
-
-        definitions_dict = load(open(load_file_format.format(path, cfg.DEFINITIONS_DICT_FILE_NAME), 'rb'))
-
-        scaler = scaler_factory.get(definitions_dict[cfg.SCALING_METHOD_KEY])
-        scaler.scaler = load(open(load_file_format.format(path, cfg.SCALER_FILE_NAME), 'rb'))
-
-        forecaster = forecaster_factory.get(definitions_dict[cfg.FORECASTING_ALGORITHM_KEY])
-        forecaster.forecaster = load_model(load_file_format.format(path, cfg.FORECASTER_SUB_DIR))
-
-        sampler = sampler_factory.get(definitions_dict[cfg.SAMPLING_METHOD_KEY])
-        if sampler.method != SamplingMethodEnum.NONE:
-            sampler.sampler = load(open(load_file_format.format(path, cfg.SAMPLER_FILE_NAME), 'rb'))
-
-        classifier = classifier_factory.get(definitions_dict[cfg.CLASSIFICATION_ALGORITHM_KEY])
-        classifier.classifier = load(open(load_file_format.format(path, cfg.CLASSIFIER_FILE_NAME), 'rb'))
-
-        thresholds = definitions_dict[cfg.THRESHOLDS_KEY]
-
-        self.step_output = LoadModelStepOutput(scaler, forecaster, sampler, classifier, thresholds)
+        self.step_output = LoadModelStepOutput(deployed_model.scaler,
+                                               deployed_model.forecaster,
+                                               deployed_model.sampler,
+                                               deployed_model.classifier,
+                                               deployed_model.thresholds)
 
 
 class LoadModelStepInput(StepInput):
@@ -0,0 +1,69 @@
+"""
+Module which contains the LoadRiskRateStatesStep, LoadRiskRateStatesStepInput and LoadRiskRateStatesStepOutput classes
+They contain the required methods to load the risk rate states saved by the last prediction
+"""
+import logging
+import os
+from pickle import load
+from typing import List
+
+import config.general_settings as cfg
+
+from src.pipeline.step import Step, StepInput, StepOutput
+from src.risk_rate.risk_rate_states import RiskRateStates
+from src.serving.deployed_model import DeployedModel
+
+
+class LoadRiskRateStatesStep(Step):
+    """The LoadRiskRateStatesStep entity"""
+
+    step_name = "Load Risk Rate States"
+    step_description = "Load the risk rate states saved next to the deployed model"
+
+    def __init__(self):
+        """
+        Class constructor
+        """
+        self.step_input = LoadRiskRateStatesStepInput()
+        self.prepare()
+
+    def get_file_dependencies(self) -> List[str]:
+        """
+        The files read by the step, whose content is part of the step cache key
+        :return: the file paths
+        """
+        return [cfg.OUTPUT_DEPLOYED_MODEL_DIR + cfg.RISK_RATE_STATES_FILE_NAME] + DeployedModel.get_file_paths(cfg.OUTPUT_DEPLOYED_MODEL_DIR)
+
+    def run(self) -> None:
+        """Internal run for step"""
+        file_name = cfg.OUTPUT_DEPLOYED_MODEL_DIR + cfg.RISK_RATE_STATES_FILE_NAME
+        model_fingerprint = DeployedModel.get_fingerprint(cfg.OUTPUT_DEPLOYED_MODEL_DIR)
+
+        # Without saved states (first prediction), or with states saved for another deployed model, whose
+        # forecasted days they continue, the risk rates are calculated from the first day
+        risk_rate_states = RiskRateStates(model_fingerprint)
+        if os.path.isfile(file_name):
+            saved_risk_rate_states = load(open(file_name, 'rb'))
+            if isinstance(saved_risk_rate_states, RiskRateStates) and saved_risk_rate_states.model_fingerprint == model_fingerprint:
+                risk_rate_states = saved_risk_rate_states
+            else:
+                logging.info("The risk rate states were saved for another deployed model, so they are calculated from the first day")
+
+        self.step_output = LoadRiskRateStatesStepOutput(risk_rate_states)
+
+
+class LoadRiskRateStatesStepInput(StepInput):
+    """Input for LoadRiskRateStatesStep"""
+
+
+class LoadRiskRateStatesStepOutput(StepOutput):
+    """Output for LoadRiskRateStatesStep"""
+
+    risk_rate_states: RiskRateStates
+
+    def __init__(self, risk_rate_states: RiskRateStates):
+        """
+        Class constructor
+        :param risk_rate_states: the risk rate states, for the deployed model
+        """
+        self.risk_rate_states = risk_rate_states
@@ -22,14 +22,17 @@ class PredictStep(Step):
 
     def __init__(self, classifier: Classifier,
                  scaled_X_validation: pd.DataFrame,
-                 forecasted_scaled_X_validations: List[pd.DataFrame]):
+                 forecasted_scaled_X_validations: List[pd.DataFrame],
+                 step_role: str = ""):
         """
         Class constructor
         :param classifier: the trained classifier
         :param scaled_X_validation: the scaled feature space for validation
         :param forecasted_scaled_X_validations: the list of scaled forecasted datasets (one per day in the future)
+        :param step_role: the role of this step instance, when the step is used more than once in the pipeline
         """
         self.step_input = PredictStepInput(classifier, scaled_X_validation, forecasted_scaled_X_validations)
+        self.step_role = step_role
         self.prepare()
 
     def run(self) -> None:
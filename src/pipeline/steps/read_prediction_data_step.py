@@ -3,11 +3,13 @@ Module which contains the ReadPredictionDataStep, ReadPredictionDataStepInput an
 It contains the required methods to perform data preprocessing for the historical data
 """
 
+from typing import List
+
 import pandas as pd
 
 import config.general_settings as cfg
 
-from src.data.datafile import Datafile
+from src.data.datafile import Datafile, get_full_file_path
 from src.enum.data_sources_enum import DataSourceEnum
 from src.pipeline.step import Step, StepInput, StepOutput
 
@@ -31,6 +33,13 @@ class ReadPredictionDataStep(Step):
 
         self.step_output = ReadPredictionDataStepOutput(dataset)
 
+    def get_file_dependencies(self) -> List[str]:
+        """
+        The files read by the step, whose content is part of the step cache key
+        :return: the file paths
+        """
+        return [get_full_file_path(DataSourceEnum.PREDICTION_DATA, cfg.PREDICTION_DATA_FILE_NAME)]
+
 
 class ReadPredictionDataStepInput(StepInput):
     """Input for ReadPredictionDataStep"""
@@ -2,6 +2,7 @@
 Module which contains the ReadPrepareTrainingDataStep, ReadPrepareTrainingDataStepInput and ReadPrepareTrainingDataStepOutput classes
 It contains the required methods to perform data preprocessing for the historical data
 """
+from typing import List
 
 import pandas as pd
 
@@ -9,7 +10,7 @@ import config.dataset_settings as dscfg
 import config.general_settings as cfg
 
 import src.utils.pandas_utils as pdutils
-from src.data.datafile import Datafile
+from src.data.datafile import Datafile, get_full_file_path
 from src.enum.data_sources_enum import DataSourceEnum
 from src.pipeline.step import Step, StepInput, StepOutput
 
@@ -35,6 +36,14 @@ class ReadPrepareTrainingDataStep(Step):
 
         self.step_output = ReadPrepareTrainingDataStepOutput(input_dataset)
 
+    def get_file_dependencies(self) -> List[str]:
+        """
+        The files read by the step, whose content is part of the step cache key
+        :return: the file paths
+        """
+        return [get_full_file_path(DataSourceEnum.HOTSPOT_DATA, cfg.HOTSPOT_FILE_NAME),
+                get_full_file_path(DataSourceEnum.CLIMATIC_DATA, cfg.CLIMATIC_DATA_FILE_NAME)]
+
     def __create_input_dataset(self) -> pd.DataFrame:
         """
         Calls different methods sequentially in order to generate the dataset
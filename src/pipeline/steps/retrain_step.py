@@ -2,6 +2,7 @@
 Module which contains the RetrainStep, RetrainStepInput and RetrainStepOutput classes
 They contain the required methods to retrain the models
 """
+import copy
 from typing import Tuple
 
 import pandas as pd
@@ -45,10 +46,11 @@ class RetrainStep(Step):
 
     def run(self) -> None:
         """Internal run for step"""
-        i_scaler = self.step_input.scaler
-        i_forecaster = self.step_input.forecaster
-        i_sampler = self.step_input.sampler
-        i_classifier = self.step_input.classifier
+        # The trained models are copied before retraining, since they are still used by other steps
+        i_scaler = copy.copy(self.step_input.scaler)
+        i_forecaster = copy.copy(self.step_input.forecaster)
+        i_sampler = copy.copy(self.step_input.sampler)
+        i_classifier = copy.copy(self.step_input.classifier)
         X_train_validation = self.step_input.X_train_validation
         y_train_validation = self.step_input.y_train_validation
 
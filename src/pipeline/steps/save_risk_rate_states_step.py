@@ -0,0 +1,49 @@
+"""
+Module which contains the SaveRiskRateStatesStep, SaveRiskRateStatesStepInput and SaveRiskRateStatesStepOutput classes
+They contain the required methods to save the risk rate states, so that the next prediction continues from them
+"""
+from pickle import dump
+
+import config.general_settings as cfg
+
+from src.pipeline.step import Step, StepInput, StepOutput
+from src.risk_rate.risk_rate_states import RiskRateStates
+
+
+class SaveRiskRateStatesStep(Step):
+    """The SaveRiskRateStatesStep entity"""
+
+    step_name = "Save Risk Rate States"
+    step_description = "Save the risk rate states next to the deployed model"
+    step_cacheable = False
+
+    def __init__(self, risk_rate_states: RiskRateStates):
+        """
+        Class constructor
+        :param risk_rate_states: the risk rate states, with the risk rates of every day calculated so far
+        """
+        self.step_input = SaveRiskRateStatesStepInput(risk_rate_states)
+        self.prepare()
+
+    def run(self) -> None:
+        """Internal run for step"""
+        dump(self.step_input.risk_rate_states, open(cfg.OUTPUT_DEPLOYED_MODEL_DIR + cfg.RISK_RATE_STATES_FILE_NAME, 'wb'))
+
+        self.step_output = SaveRiskRateStatesStepOutput()
+
+
+class SaveRiskRateStatesStepInput(StepInput):
+    """Input for SaveRiskRateStatesStep"""
+
+    risk_rate_states: RiskRateStates
+
+    def __init__(self, risk_rate_states: RiskRateStates):
+        """
+        Class constructor
+        :param risk_rate_states: the risk rate states, with the risk rates of every day calculated so far
+        """
+        self.risk_rate_states = risk_rate_states
+
+
+class SaveRiskRateStatesStepOutput(StepOutput):
+    """Output for SaveRiskRateStatesStep"""
@@ -17,6 +17,10 @@ from src.enum.sampling_methods_enum import SamplingMethodEnum
 from src.pipeline.step import Step, StepInput, StepOutput
 from src.sampling import sampler_factory
 from src.sampling.sampler import Sampler
+from src.utils import profiling_utils
+
+SAMPLING_PROFILE_CATEGORY = "sampling"
+COMBINATION_PROFILE_CATEGORY = "combination"
 
 
 class SelectSamplerClassifierStep(Step):
@@ -87,12 +91,14 @@ class SelectSamplerClassifierStep(Step):
         evaluation_metrics_run = []
 
         for sampling_method in sampling_methods:
-            sampler = sampler_factory.get(sampling_method)
-            sampled_scaled_X_train, sampled_y_train = sampler.fit_sample(scaled_X_train, y_train)
+            with profiling_utils.profile(sampling_method.value, SAMPLING_PROFILE_CATEGORY):
+                sampler = sampler_factory.get(sampling_method)
+                sampled_scaled_X_train, sampled_y_train = sampler.fit_sample(scaled_X_train, y_train)
             for classification_algorithm in classification_algorithms:
-                classifier = classifier_factory.get(classification_algorithm)
-                classifier.train(sampled_scaled_X_train, sampled_y_train)
-                evaluation_metric = classifier.evaluate(scaled_X_validation, y_validation)
+                with profiling_utils.profile("{} + {}".format(sampling_method.value, classification_algorithm.value), COMBINATION_PROFILE_CATEGORY):
+                    classifier = classifier_factory.get(classification_algorithm)
+                    classifier.train(sampled_scaled_X_train, sampled_y_train)
+                    evaluation_metric = classifier.evaluate(scaled_X_validation, y_validation)
                 sampling_methods_run.append(sampling_method)
                 classification_algorithms_run.append(classification_algorithm)
                 evaluation_metrics_run.append(evaluation_metric)
@@ -3,21 +3,27 @@ Module which contains the SelectScalerForecasterStep, SelectScalerForecasterStep
 They contain the required methods to scale the datasets (also known as normalization) and train the forecaster, in order to select
 the best combination
 """
+import os
+from tempfile import TemporaryDirectory
 from typing import List, Tuple
 
 import pandas as pd
 
-import config.dataset_settings as dscfg
+import config.forecast_settings as fccfg
 import config.general_settings as cfg
 
-import src.utils.pandas_utils as pdutils
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
 from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting import selection_operations
 from src.forecasting.algorithm import forecaster_factory
 from src.forecasting.algorithm.forecaster import Forecaster
+from src.forecasting.window_cache import WindowCache
 from src.pipeline.step import Step, StepInput, StepOutput
-from src.scaling import scaler_factory
 from src.scaling.scaler import Scaler
+from src.utils import profiling_utils
+
+SCALING_PROFILE_CATEGORY = "scaling"
+COMBINATION_PROFILE_CATEGORY = "combination"
 
 
 class SelectScalerForecasterStep(Step):
@@ -58,43 +64,52 @@ class SelectScalerForecasterStep(Step):
 
     def __select(self) -> Tuple[Scaler, Forecaster, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """Selects best combination"""
-        scaling_methods = self.step_input.scaling_methods
-        forecasting_algorithms = self.step_input.forecasting_algorithms
-
         X_train = self.step_input.X_train
         X_validation = self.step_input.X_validation
-
-        best_forecaster = None
-        best_scaler = None
-        best_scaler_forecaster_error_metric = None
-        best_scaled_X_train = None
-        best_scaled_X_validation = None
-
-        scaling_methods_run = []
-        forecasting_algorithms_run = []
-        error_metrics_run = []
-
-        for scaling_method in scaling_methods:
-            scaler = scaler_factory.get(scaling_method)
-            scaled_X_train = scaler.fit_scale(X_train)
-            scaled_X_validation = scaler.scale(X_validation)
-            for forecast_algorithm in forecasting_algorithms:
-                forecaster = forecaster_factory.get(forecast_algorithm)
-                forecaster.learn(pdutils.delete_columns(scaled_X_train, dscfg.COLUMNS_IGNORE_FOR_ML))
-                error_metric = forecaster.evaluate(pdutils.delete_columns(scaled_X_validation, dscfg.COLUMNS_IGNORE_FOR_ML))
-                scaling_methods_run.append(scaling_method)
-                forecasting_algorithms_run.append(forecast_algorithm)
-                error_metrics_run.append(error_metric)
-                if best_scaler_forecaster_error_metric is None or error_metric[0] < best_scaler_forecaster_error_metric[0]:
-                    best_scaler_forecaster_error_metric = error_metric
-                    best_scaler = scaler
-                    best_forecaster = forecaster
-                    best_scaled_X_train = scaled_X_train
-                    best_scaled_X_validation = scaled_X_validation
+        combinations = [(scaling_method, forecast_algorithm)
+                        for scaling_method in self.step_input.scaling_methods
+                        for forecast_algorithm in self.step_input.forecasting_algorithms]
+
+        # Each scaler is fitted once, and its forecasters share the scaled sequences stored in the window cache
+        window_cache = WindowCache(cfg.OUTPUT_WINDOW_CACHE_DIR)
+        scalings = {}
+        for scaling_method in self.step_input.scaling_methods:
+            with profiling_utils.profile(scaling_method.value, SCALING_PROFILE_CATEGORY):
+                scalings[scaling_method] = selection_operations.scale(scaling_method, X_train, X_validation, window_cache)
+        forecasting_algorithms = [forecast_algorithm for _, forecast_algorithm in combinations]
+        train_file_paths = [scalings[scaling_method][3] for scaling_method, _ in combinations]
+        validation_file_paths = [scalings[scaling_method][4] for scaling_method, _ in combinations]
+
+        with TemporaryDirectory() as weights_dir:
+            weights_file_paths = [os.path.join(weights_dir, "combination_{}".format(position)) for position in range(len(combinations))]
+            if fccfg.SELECTION_WORKERS > 1 and len(combinations) > 1:
+                with profiling_utils.profile("{} combinations".format(len(combinations)), COMBINATION_PROFILE_CATEGORY,
+                                             workers=fccfg.SELECTION_WORKERS):
+                    error_metrics_run = selection_operations.train_combinations(forecasting_algorithms, train_file_paths,
+                                                                                validation_file_paths, weights_file_paths,
+                                                                                fccfg.SELECTION_WORKERS)
+            else:
+                error_metrics_run = []
+                for position, combination in enumerate(combinations):
+                    with profiling_utils.profile("{} + {}".format(combination[0].value, combination[1].value), COMBINATION_PROFILE_CATEGORY):
+                        error_metrics_run.append(selection_operations.train_combination(position, forecasting_algorithms[position],
+                                                                                        train_file_paths[position],
+                                                                                        validation_file_paths[position],
+                                                                                        weights_file_paths[position]))
+
+            # Only the forecaster of the best combination is restored, with the saved weights
+            best_position = selection_operations.get_best_position(error_metrics_run)
+            best_scaling_method, best_forecast_algorithm = combinations[best_position]
+            best_scaler, best_scaled_X_train, best_scaled_X_validation, best_train_file_path, _ = scalings[best_scaling_method]
+            best_forecaster = forecaster_factory.get(best_forecast_algorithm)
+            best_forecaster.restore(WindowCache.load(best_train_file_path), weights_file_paths[best_position])
+
+        # Only the sequences of this selection are kept, so that those of earlier data do not pile up
+        window_cache.clean(train_file_paths + validation_file_paths)
 
         execution_summary = pd.DataFrame({
-            'scaling_method': scaling_methods_run,
-            'forecast_algorithm': forecasting_algorithms_run,
+            'scaling_method': [scaling_method for scaling_method, _ in combinations],
+            'forecast_algorithm': [forecast_algorithm for _, forecast_algorithm in combinations],
             'error_metric': error_metrics_run
         })
         execution_summary.to_csv(cfg.ASSETS_DIR + "select_scaler_forecaster_execution_summary.csv")
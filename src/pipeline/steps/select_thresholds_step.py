@@ -3,7 +3,9 @@ Module which contains the SelectThresholdsStep, SelectThresholdsStepInput and Se
 They contain the required methods to calculate the risk rates after prediction (classification algorithm)
 """
 
-from typing import Any, List, Tuple
+from typing import List
+
+import numpy as np
 
 import pandas as pd
 
@@ -13,9 +15,10 @@ import config.risk_rate_threshold_settings as rrtcfg
 
 import src.utils.pandas_utils as pdutils
 from src.enum.evaluation_measures_enum import EvaluationMeasureEnum
-from src.enum.risk_rate_index_enum import RiskRateIndexEnum
 from src.evaluation.measure.evaluator_factory import get
 from src.pipeline.step import Step, StepInput, StepOutput
+from src.risk_rate import threshold_search_operations
+from src.risk_rate.threshold_set import ThresholdSet
 from src.utils.dataset_columns_utils import get_column_name_prefix, get_column_name_suffix, get_column_names_suffix
 
 
@@ -44,94 +47,66 @@ class SelectThresholdsStep(Step):
         merged_dataframe = pdutils.join_inner_by_date([dates, original_dataset])
         hotspot_identified = pdutils.select_columns(merged_dataframe, dscfg.HOTSPOT_IDENTIFIED_COLUMN_NAME, reset_row_indexes=True)
 
+        candidate_thresholds = [rrtcfg.THRESHOLD_NULO, rrtcfg.THRESHOLD_PEQUENO, rrtcfg.THRESHOLD_MEDIO,
+                                rrtcfg.THRESHOLD_ALTO, rrtcfg.THRESHOLD_MUITO_ALTO]
+        probs_present = self.__get_probs_present(predicted_dataset)
+        probs_forecasted_columns = self.__get_probs_forecasted_columns(predicted_dataset)
+        probabilities = np.column_stack([np.asarray(probs_present, dtype=np.float64),
+                                         probs_forecasted_columns.to_numpy(dtype=np.float64)])
+
+        best_thresholds, best_score = threshold_search_operations.search_thresholds(
+            probabilities,
+            self.__get_hotspots_by_row(hotspot_identified, len(probs_present)),
+            candidate_thresholds
+        )
+
         best_risk_rates_dataset = None
         best_correlation_dataset = None
-        best_score = -1
-        best_thresholds = []
-
-        for thr_nulo in rrtcfg.THRESHOLD_NULO:
-            for thr_pequeno in rrtcfg.THRESHOLD_PEQUENO:
-                for thr_medio in rrtcfg.THRESHOLD_MEDIO:
-                    for thr_alto in rrtcfg.THRESHOLD_ALTO:
-                        for thr_muito_alto in rrtcfg.THRESHOLD_MUITO_ALTO:
-                            curr_thresholds = [thr_nulo, thr_pequeno, thr_medio, thr_alto, thr_muito_alto]
-                            if self.__are_valid_thresholds(curr_thresholds):
-                                RiskRateIndexEnum.NULO.set_prob_threshold(thr_nulo)
-                                RiskRateIndexEnum.PEQUENO.set_prob_threshold(thr_pequeno)
-                                RiskRateIndexEnum.MEDIO.set_prob_threshold(thr_medio)
-                                RiskRateIndexEnum.ALTO.set_prob_threshold(thr_alto)
-                                RiskRateIndexEnum.MUITO_ALTO.set_prob_threshold(thr_muito_alto)
-
-                                probs_present, risk_rates_present = self.__get_risk_rates_present(predicted_dataset)
-                                probs_forecasted_columns, risk_rates_forecasted_list = self.__get_risk_rates_future(predicted_dataset)
-                                risk_rates_dataset = self.__create_risk_rate_dataset(
-                                    dates, probs_present, risk_rates_present,
-                                    probs_forecasted_columns, risk_rates_forecasted_list,
-                                    hotspot_identified
-                                )
-                                correlation_dataset = self.__create_correlation_dataset(risk_rates_dataset)
-                                score = self.__get_score(correlation_dataset)
-                                if score > best_score:
-                                    best_score = score
-                                    best_risk_rates_dataset = risk_rates_dataset
-                                    best_correlation_dataset = correlation_dataset
-                                    best_thresholds = curr_thresholds
+        if best_thresholds:
+            threshold_set = ThresholdSet(best_thresholds)
+            risk_rates_present = threshold_set.classify(probs_present)
+            risk_rates_forecasted_list = [threshold_set.classify(probs_forecasted_columns.iloc[:, i])
+                                          for i in range(0, probs_forecasted_columns.shape[1])]
+            best_risk_rates_dataset = self.__create_risk_rate_dataset(
+                dates, probs_present, risk_rates_present,
+                probs_forecasted_columns, risk_rates_forecasted_list,
+                hotspot_identified
+            )
+            best_correlation_dataset = self.__create_correlation_dataset(best_risk_rates_dataset)
 
         self.__save_selected_thresholds_info(best_thresholds)
 
         self.step_output = SelectThresholdsStepOutput(best_risk_rates_dataset, best_correlation_dataset, best_score, best_thresholds)
 
-    def __are_valid_thresholds(self, thresholds: List[float]) -> bool:
+    def __get_probs_present(self, predicted_dataset: pd.DataFrame) -> List[float]:
         """
-        Returns if thresholds are valid or not
-        :param thresholds: the list with the thresholds
-        :return: whether thresholds are valid or not
-        """
-        for i in range(0, len(thresholds)):
-            for j in range(0, len(thresholds)):
-                if thresholds[i] >= thresholds[j] and i < j:
-                    return False
-        return True
-
-    def __get_risk_rates_present(self, predicted_dataset: pd.DataFrame) -> Tuple[Any, List[str]]:
-        """
-        Gets the risk rates for predicted dataset, present time
+        Gets the predicted probabilities, present time
         :param predicted_dataset: the dataset with predicted probabilities
-        :return: the risk rates
+        :return: the probabilities
         """
         column_name = get_column_name_prefix(dscfg.PRESENT_COLUMN_NAME, dscfg.PROBS_PREFIX)
-        probs_present = predicted_dataset[column_name].tolist()
-        risk_rates_present = self.__generate_predicted_risk_rate(probs_present)
-        return probs_present, risk_rates_present
+        return predicted_dataset[column_name].tolist()
 
-    def __get_risk_rates_future(self, predicted_dataset: pd.DataFrame) -> Tuple[pd.DataFrame, Any]:
+    def __get_probs_forecasted_columns(self, predicted_dataset: pd.DataFrame) -> pd.DataFrame:
         """
-        Gets the risk rates for predicted dataset, future time
+        Gets the predicted probabilities, future time
         :param predicted_dataset: the dataset with predicted probabilities
-        :return: the risk rates
+        :return: the probabilities, one column per day in the future
         """
         column_name = get_column_name_prefix(dscfg.FORECASTED_COLUMN_NAME, dscfg.PROBS_PREFIX)
-        probs_forecasted_columns = pdutils.select_columns_with_substring(predicted_dataset, column_name)
-        risk_rates_forecasted_list = []
-        for i in range(0, probs_forecasted_columns.shape[1]):
-            probs_forecasted = pdutils.dataframe_to_list(pdutils.select_columns(probs_forecasted_columns, i))
-            risk_rates_forecasted = self.__generate_predicted_risk_rate(probs_forecasted)
-            risk_rates_forecasted_list.append(risk_rates_forecasted)
-        return probs_forecasted_columns, risk_rates_forecasted_list
+        return pdutils.select_columns_with_substring(predicted_dataset, column_name)
 
-    def __generate_predicted_risk_rate(self, probs: List[float]) -> List[str]:
+    def __get_hotspots_by_row(self, hotspot_identified: pd.DataFrame, n_rows: int) -> np.ndarray:
         """
-        Gets the risk rates for predicted dataset
-        :param probs: the list of probabilities
-        :return: the risk rates
+        Gets whether a hotspot was identified for each row of the risk rates dataset, which is joined by row position
+        :param hotspot_identified: the dataframe with hotspot_identified (binary)
+        :param n_rows: the number of rows with predicted probabilities
+        :return: whether a hotspot was identified (1) or not, for each row
         """
-        predicted_risk_rates = []
-        for prob in probs:
-            for risk_rate in RiskRateIndexEnum:
-                if prob <= risk_rate.prob_threshold:
-                    predicted_risk_rates.append(risk_rate.value)
-                    break
-        return predicted_risk_rates
+        hotspots = np.zeros(n_rows)
+        values = hotspot_identified.iloc[:n_rows, 0].to_numpy() == 1
+        hotspots[:len(values)] = values
+        return hotspots
 
     def __create_risk_rate_dataset(self,
                                    dates: pd.DataFrame,
@@ -178,39 +153,6 @@ class SelectThresholdsStep(Step):
         result = evaluation_calculator.calculate(risk_rate_dataset)
         return pd.DataFrame(result)
 
-    def __get_score(self, correlation_dataset: pd.DataFrame) -> float:
-        """
-        Get score for a given combination
-        :param correlation_dataset: the dataset with the correlations
-        :return: the score
-        """
-        total_sum = 0
-
-        for column in list(correlation_dataset.columns):
-            is_present_result_column = dscfg.PRESENT_COLUMN_NAME in column
-            is_forecasted_result_column = dscfg.FORECASTED_COLUMN_NAME in column
-
-            curr_sum = 0
-
-            if (is_present_result_column or is_forecasted_result_column) and dscfg.COUNT_SUFFIX not in column:
-                nulo_corr = pdutils.select_value_row_column(correlation_dataset, 0, column)
-                pequeno_corr = pdutils.select_value_row_column(correlation_dataset, 1, column)
-                medio_corr = pdutils.select_value_row_column(correlation_dataset, 2, column)
-                alto_corr = pdutils.select_value_row_column(correlation_dataset, 3, column)
-                muito_alto_corr = pdutils.select_value_row_column(correlation_dataset, 4, column)
-
-                curr_sum += (1 - nulo_corr) * 5
-                curr_sum += (1 - pequeno_corr) * 4
-                curr_sum += (1 - medio_corr) * 3
-                curr_sum += alto_corr * 2
-                curr_sum += muito_alto_corr * 1
-
-                curr_sum = curr_sum / 15
-
-                total_sum += curr_sum
-
-        return total_sum
-
     def __save_selected_thresholds_info(self, selected_thresholds: List[float]) -> None:
         with open(cfg.ASSETS_DIR + "thresholds.txt", 'w') as f:
             f.write("Selected best thresholds: ")
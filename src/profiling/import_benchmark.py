@@ -0,0 +1,84 @@
+"""
+Module that benchmarks the import time of the entry points of the program.
+Each module of ENTRY_MODULES is imported in a fresh interpreter with "python -X importtime", and the time
+spent importing each top-level package and the heavy libraries imported are saved to
+/output/profiles/import_benchmark.csv, so that an import that slows down the start of every run is noticed
+"""
+import os
+import subprocess
+import sys
+from typing import List
+
+import pandas as pd
+
+import config.general_settings as cfg
+
+from src.utils.logging_utils import print_and_log
+
+BENCHMARK_FILE_NAME = "import_benchmark.csv"
+
+# The modules imported by each menu option, before it runs
+ENTRY_MODULES = {
+    "menu": "src.menu.menu",
+    "predict": "src.pipeline.pipelines.predict_pipeline",
+    "serve": "src.serving.prediction_server",
+    "fit": "src.pipeline.pipelines.fit_pipeline"
+}
+HEAVY_LIBRARIES = ["tensorflow", "matplotlib", "xgboost", "lightgbm", "catboost", "imblearn", "sklearn"]
+TOP_PACKAGES = 5
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def execute() -> None:
+    """Imports each entry module, and saves and prints the results"""
+    results = []
+    for entry, module in ENTRY_MODULES.items():
+        import_times = get_import_times(module)
+        package_times = import_times.groupby("package")["self_time"].sum().sort_values(ascending=False)
+        results.append({
+            "entry": entry,
+            "import_time": import_times["self_time"].sum(),
+            "heavy_libraries": " ".join(library for library in HEAVY_LIBRARIES if library in package_times.index),
+            "top_packages": " ".join("{}={:.2f}".format(package, time) for package, time in package_times.head(TOP_PACKAGES).items())
+        })
+
+    results = pd.DataFrame(results)
+    results.to_csv(cfg.OUTPUT_PROFILES_DIR + BENCHMARK_FILE_NAME, index=False)
+    print_and_log("Import benchmark (in seconds):\n{}".format(results.to_string(index=False)))
+
+
+def get_import_times(module: str) -> pd.DataFrame:
+    """
+    Imports a module in a fresh interpreter, and gets the import time of every module it imports
+    :param module: the module name
+    :return: the import times
+    """
+    environment = dict(os.environ, PYTHONPATH=cfg.PROJECT_DIR, TF_CPP_MIN_LOG_LEVEL="3")
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+                             cwd=cfg.PROJECT_DIR, env=environment, capture_output=True, text=True, check=True)
+    return parse_import_times(process.stderr.splitlines())
+
+
+def parse_import_times(lines: List[str]) -> pd.DataFrame:
+    """
+    Parses the report of "python -X importtime"
+    :param lines: the lines of the report, other lines are ignored
+    :return: the import times, with the module, its top-level package, its own import time and its cumulative
+    import time (with the modules it imports), in seconds
+    """
+    rows = []
+    for line in lines:
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        self_time, cumulative_time, module = [field.strip() for field in line[len(IMPORT_TIME_PREFIX):].split("|")]
+        if not self_time.isdigit():
+            # The header of the report
+            continue
+        rows.append({
+            "module": module,
+            "package": module.split(".")[0],
+            "self_time": int(self_time) / 1e6,
+            "cumulative_time": int(cumulative_time) / 1e6
+        })
+    return pd.DataFrame(rows, columns=["module", "package", "self_time", "cumulative_time"])
@@ -0,0 +1,114 @@
+"""
+Module that benchmarks the inference backends of the deployed forecaster.
+The Keras model (SavedModel), its NumPy model and its TFLite conversion with each quantization of
+BENCHMARK_INFERENCE_QUANTIZATIONS forecast the same random windows, and their load time, latency per batch,
+size and drift from the Keras model are saved to /output/profiles/inference_benchmark.csv,
+so that a backend can be chosen for each deployment
+"""
+import os
+import tempfile
+from timeit import default_timer as timer
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+import pandas as pd
+
+import config.forecast_settings as fccfg
+import config.general_settings as cfg
+
+from src.enum.inference_backends_enum import InferenceBackendEnum
+from src.forecasting.numpy_model import NumpyModel
+from src.forecasting.tflite_model import TFLiteModel
+from src.utils.logging_utils import print_and_log
+
+BENCHMARK_FILE_NAME = "inference_benchmark.csv"
+
+
+def execute() -> None:
+    """Runs the deployed forecaster with each inference backend, and saves and prints the results"""
+    from tensorflow.keras.models import load_model
+
+    saved_model_path = cfg.OUTPUT_DEPLOYED_MODEL_DIR + cfg.FORECASTER_SUB_DIR
+    start = timer()
+    keras_model = load_model(saved_model_path)
+    keras_load_time = timer() - start
+
+    rng = np.random.default_rng(cfg.SEED)
+    X = rng.random((fccfg.BENCHMARK_INFERENCE_WINDOWS,) + tuple(keras_model.input_shape[1:]), dtype=np.float32)
+    expected = keras_model.predict(X, batch_size=fccfg.TFLITE_BATCH_SIZE, verbose=0)
+
+    results = [__benchmark(InferenceBackendEnum.KERAS.value, keras_model, keras_load_time, __get_size(saved_model_path), X, expected)]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        weights_file_path = os.path.join(temp_dir, cfg.FORECASTER_WEIGHTS_FILE_NAME)
+        NumpyModel.from_keras(keras_model).save(weights_file_path)
+        results.append(__benchmark_file(InferenceBackendEnum.NUMPY.value, NumpyModel.load, weights_file_path, X, expected))
+        for quantization in fccfg.BENCHMARK_INFERENCE_QUANTIZATIONS:
+            tflite_file_path = os.path.join(temp_dir, "{}_{}".format(quantization, cfg.FORECASTER_TFLITE_FILE_NAME))
+            TFLiteModel.from_keras(keras_model, quantization, fccfg.TFLITE_BATCH_SIZE).save(tflite_file_path)
+            results.append(__benchmark_file("{} ({})".format(InferenceBackendEnum.TFLITE.value, quantization),
+                                            TFLiteModel.load, tflite_file_path, X, expected))
+
+    results = pd.DataFrame(results)
+    results.to_csv(cfg.OUTPUT_PROFILES_DIR + BENCHMARK_FILE_NAME, index=False)
+    print_and_log("Inference benchmark ({} windows, batches of {}):\n{}".format(fccfg.BENCHMARK_INFERENCE_WINDOWS,
+                                                                                fccfg.TFLITE_BATCH_SIZE,
+                                                                                results.to_string(index=False)))
+
+
+def __benchmark_file(backend: str, load: Callable[[str], Any], file_path: str, X: np.ndarray, expected: np.ndarray) -> Dict[str, Any]:
+    """
+    Loads a model from its file and runs it
+    :param backend: the name of the backend
+    :param load: the function that loads the model
+    :param file_path: the file path of the model
+    :param X: the windows
+    :param expected: the output of the Keras model
+    :return: the results of the backend
+    """
+    start = timer()
+    model = load(file_path)
+    model.predict(X[:1])
+    load_time = timer() - start
+    return __benchmark(backend, model, load_time, __get_size(file_path), X, expected)
+
+
+def __benchmark(backend: str, model: Any, load_time: float, size: int, X: np.ndarray, expected: np.ndarray) -> Dict[str, Any]:
+    """
+    Runs a model on the windows, one batch at a time
+    :param backend: the name of the backend
+    :param model: the model
+    :param load_time: the time to load the model (in seconds)
+    :param size: the size of the model files (in bytes)
+    :param X: the windows
+    :param expected: the output of the Keras model
+    :return: the backend, the load time, the mean latency per batch (in milliseconds), the size and
+    the maximum and mean absolute drift from the Keras model
+    """
+    batch_size = fccfg.TFLITE_BATCH_SIZE
+    batches = [X[start:start + batch_size] for start in range(0, X.shape[0], batch_size)]
+    start = timer()
+    for _ in range(fccfg.BENCHMARK_INFERENCE_REPEATS):
+        output = np.concatenate([np.asarray(model.predict(batch, verbose=0)) for batch in batches])
+    elapsed = timer() - start
+
+    drift = np.abs(output - expected)
+    return {
+        "backend": backend,
+        "load_time": load_time,
+        "batch_latency_ms": 1000 * elapsed / (fccfg.BENCHMARK_INFERENCE_REPEATS * len(batches)),
+        "size_kb": size / 1024,
+        "max_drift": drift.max(),
+        "mean_drift": drift.mean()
+    }
+
+
+def __get_size(path: str) -> int:
+    """
+    Get the size of a file, or of all the files of a directory
+    :param path: the path
+    :return: the size (in bytes)
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(directory, file_name)) for directory, _, file_names in os.walk(path) for file_name in file_names)
@@ -0,0 +1,76 @@
+"""Module which contains the ProfileSpan class"""
+from typing import Any, Dict, Optional
+
+
+class ProfileSpan:
+    """
+    The ProfileSpan entity
+    It measures a section of the pipeline execution, such as a step or one of the combinations it trains.
+    Times are in seconds and sizes in bytes
+    """
+
+    name: str
+    category: str
+    parent: Optional["ProfileSpan"]
+    thread_id: int
+    thread_name: str
+    args: Dict[str, Any]
+    start_time: float
+    wall_time: float
+    thread_cpu_time: float
+    process_cpu_time: float
+    peak_rss: int
+    tracemalloc_peak: int
+    bytes_serialized: int
+    bytes_deserialized: int
+
+    def __init__(self, name: str,
+                 category: str,
+                 parent: Optional["ProfileSpan"],
+                 thread_id: int,
+                 thread_name: str,
+                 args: Dict[str, Any]):
+        """
+        Class constructor
+        :param name: the span name
+        :param category: the span category (pipeline, step, combination...)
+        :param parent: the span within which this one was opened, if any
+        :param thread_id: the id of the thread that opened the span
+        :param thread_name: the name of the thread that opened the span
+        :param args: extra values describing the span
+        """
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.thread_id = thread_id
+        self.thread_name = thread_name
+        self.args = dict(args)
+        self.start_time = 0.0
+        self.wall_time = 0.0
+        self.thread_cpu_time = 0.0
+        self.process_cpu_time = 0.0
+        self.peak_rss = 0
+        self.tracemalloc_peak = 0
+        self.bytes_serialized = 0
+        self.bytes_deserialized = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the span measures, in a JSON compatible format
+        :return: the measures, by name
+        """
+        return {
+            "name": self.name,
+            "category": self.category,
+            "parent": self.parent.name if self.parent is not None else None,
+            "thread": self.thread_name,
+            "start_time": self.start_time,
+            "wall_time": self.wall_time,
+            "thread_cpu_time": self.thread_cpu_time,
+            "process_cpu_time": self.process_cpu_time,
+            "peak_rss": self.peak_rss,
+            "tracemalloc_peak": self.tracemalloc_peak,
+            "bytes_serialized": self.bytes_serialized,
+            "bytes_deserialized": self.bytes_deserialized,
+            "args": self.args
+        }
@@ -0,0 +1,165 @@
+"""
+Module which contains the Profiler class
+It measures the spans of a pipeline execution and saves them as a JSON report and a Chrome trace
+"""
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.profiling.profile_span import ProfileSpan
+
+MICROSECONDS_PER_SECOND = 1000000
+
+
+class Profiler:
+    """
+    The Profiler entity
+    Spans may be opened by several threads at the same time. Process wide measures (CPU time, peak RSS
+    and traced memory peak) then include everything that ran meanwhile, so they are upper bounds
+    """
+
+    spans: List[ProfileSpan]
+    trace_memory: bool
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        Class constructor
+        :param trace_memory: whether to trace Python memory allocations (tracemalloc), which slows down the execution
+        """
+        self.spans = []
+        self.trace_memory = trace_memory
+        self.__lock = threading.Lock()
+        self.__start_time = time.perf_counter()
+        self.__open_spans: Dict[ProfileSpan, Tuple[float, float, float]] = {}
+        self.__started_tracemalloc = False
+
+    def start(self) -> None:
+        """Starts profiling, including memory allocations if they are traced"""
+        self.__start_time = time.perf_counter()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stops profiling"""
+        if self.__started_tracemalloc:
+            tracemalloc.stop()
+            self.__started_tracemalloc = False
+
+    def open_span(self, name: str, category: str, parent: Optional[ProfileSpan] = None, args: Optional[Dict[str, Any]] = None) -> ProfileSpan:
+        """
+        Opens a span, which starts measuring
+        :param name: the span name
+        :param category: the span category (pipeline, step, combination...)
+        :param parent: the span within which this one is opened, if any
+        :param args: extra values describing the span
+        :return: the span
+        """
+        thread = threading.current_thread()
+        span = ProfileSpan(name, category, parent, thread.ident, thread.name, args if args is not None else {})
+        with self.__lock:
+            self.__update_tracemalloc_peaks(reset=True)
+            start_time = time.perf_counter()
+            span.start_time = start_time - self.__start_time
+            self.__open_spans[span] = (start_time, time.thread_time(), time.process_time())
+        return span
+
+    def close_span(self, span: ProfileSpan) -> None:
+        """
+        Closes a span, which stops measuring. It must be closed by the thread that opened it
+        :param span: the span
+        """
+        end_time = time.perf_counter()
+        thread_cpu_time = time.thread_time()
+        process_cpu_time = time.process_time()
+        with self.__lock:
+            self.__update_tracemalloc_peaks(reset=False)
+            start_time, start_thread_cpu_time, start_process_cpu_time = self.__open_spans.pop(span)
+            span.wall_time = end_time - start_time
+            span.thread_cpu_time = thread_cpu_time - start_thread_cpu_time
+            span.process_cpu_time = process_cpu_time - start_process_cpu_time
+            span.peak_rss = self.__get_peak_rss()
+            self.spans.append(span)
+
+    def record_bytes(self, span: ProfileSpan, bytes_serialized: int = 0, bytes_deserialized: int = 0) -> None:
+        """
+        Records bytes serialized or deserialized within a span, and the spans it is nested in
+        :param span: the innermost span
+        :param bytes_serialized: the bytes serialized
+        :param bytes_deserialized: the bytes deserialized
+        """
+        with self.__lock:
+            while span is not None:
+                span.bytes_serialized += bytes_serialized
+                span.bytes_deserialized += bytes_deserialized
+                span = span.parent
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Get the measures of all closed spans, in the order they were opened
+        :return: the report, in a JSON compatible format
+        """
+        return {"spans": [span.to_dict() for span in sorted(self.spans, key=lambda span: span.start_time)]}
+
+    def get_trace(self) -> Dict[str, Any]:
+        """
+        Get all closed spans as Chrome trace events, to be opened with chrome://tracing or Perfetto
+        :return: the trace, in a JSON compatible format
+        """
+        process_id = os.getpid()
+        events = []
+        for thread_id, thread_name in sorted({(span.thread_id, span.thread_name) for span in self.spans}):
+            events.append({"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id, "args": {"name": thread_name}})
+        for span in sorted(self.spans, key=lambda span: span.start_time):
+            args = span.to_dict()
+            del args["name"], args["category"], args["thread"], args["start_time"], args["wall_time"]
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_time * MICROSECONDS_PER_SECOND,
+                "dur": span.wall_time * MICROSECONDS_PER_SECOND,
+                "pid": process_id,
+                "tid": span.thread_id,
+                "args": args
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, report_file_name: str, trace_file_name: str) -> None:
+        """
+        Saves the JSON report and the Chrome trace
+        :param report_file_name: the report file name
+        :param trace_file_name: the trace file name
+        """
+        for file_name, content in [(report_file_name, self.get_report()), (trace_file_name, self.get_trace())]:
+            os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+            with open(file_name, 'w') as file:
+                json.dump(content, file, indent=4, default=str)
+
+    def __update_tracemalloc_peaks(self, reset: bool) -> None:
+        """
+        Updates the traced memory peak of the open spans. Since tracemalloc keeps a single peak,
+        it is folded into every open span before being reset for a new span
+        :param reset: whether to reset the tracemalloc peak
+        """
+        if not tracemalloc.is_tracing():
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        for span in self.__open_spans:
+            span.tracemalloc_peak = max(span.tracemalloc_peak, peak)
+        if reset:
+            tracemalloc.reset_peak()
+
+    def __get_peak_rss(self) -> int:
+        """
+        Get the peak resident set size of the process so far
+        :return: the peak RSS, in bytes
+        """
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak_rss if sys.platform == "darwin" else peak_rss * 1024
@@ -0,0 +1,72 @@
+"""
+Module that benchmarks the training settings of the forecasters.
+Each setting of BENCHMARK_SETTINGS trains the same forecaster on the same training assets, from the same seed,
+and the epoch time and the final validation MAE are saved to /output/profiles/training_benchmark.csv,
+so that a setting can be chosen for each deployment
+"""
+from timeit import default_timer as timer
+from typing import Any, Dict
+
+import pandas as pd
+
+import tensorflow as tf
+
+import config.dataset_settings as dscfg
+import config.forecast_settings as fccfg
+import config.general_settings as cfg
+
+import src.utils.pandas_utils as pdutils
+from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting.algorithm import forecaster_factory
+from src.forecasting.training_settings import TrainingSettings
+from src.pipeline.steps.create_training_assets_step import CreateTrainingAssetsStep
+from src.pipeline.steps.read_prepare_training_data_step import ReadPrepareTrainingDataStep
+from src.scaling import scaler_factory
+from src.utils.logging_utils import print_and_log
+
+BENCHMARK_FILE_NAME = "training_benchmark.csv"
+
+
+def execute() -> None:
+    """Trains the forecaster with each benchmark setting, and saves and prints the results"""
+    # The steps of the fit pipeline, which are loaded from their cache if the fit already ran
+    dataset = ReadPrepareTrainingDataStep().step_output.dataset
+    X_train = CreateTrainingAssetsStep(dataset).step_output.X_train
+
+    scaler = scaler_factory.get(ScalingMethodEnum(fccfg.BENCHMARK_SCALING_METHOD))
+    scaled_X_train = pdutils.delete_columns(scaler.fit_scale(X_train), dscfg.COLUMNS_IGNORE_FOR_ML)
+    forecasting_algorithm = ForecastingAlgorithmEnum(fccfg.ALGORITHM[0])
+
+    results = pd.DataFrame([__benchmark(forecasting_algorithm, scaled_X_train, overrides) for overrides in fccfg.BENCHMARK_SETTINGS])
+    results.to_csv(cfg.OUTPUT_PROFILES_DIR + BENCHMARK_FILE_NAME, index=False)
+    print_and_log("Training benchmark of {} ({} epochs at most):\n{}".format(forecasting_algorithm.value,
+                                                                             fccfg.BENCHMARK_EPOCHS,
+                                                                             results.to_string(index=False)))
+
+
+def __benchmark(forecasting_algorithm: ForecastingAlgorithmEnum, scaled_X_train: pd.DataFrame, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Trains a forecaster with a setting
+    :param forecasting_algorithm: the forecasting algorithm
+    :param scaled_X_train: the scaled attributes for training
+    :param overrides: the setting, as the training settings that differ from the forecast settings
+    :return: the setting, the epochs run, the mean epoch time (in seconds) and the final validation MAE
+    """
+    training_settings = TrainingSettings.from_config(**{"epochs": fccfg.BENCHMARK_EPOCHS, "verbose": 0, "plot_history": False,
+                                                        **overrides})
+    tf.keras.utils.set_random_seed(cfg.SEED)
+    forecaster = forecaster_factory.get(forecasting_algorithm)
+
+    start = timer()
+    history = forecaster.learn(scaled_X_train, training_settings)
+    elapsed = timer() - start
+
+    epochs = len(history.history["loss"])
+    return {
+        "settings": training_settings.describe(),
+        "learning_rate": training_settings.get_learning_rate(),
+        "epochs": epochs,
+        "epoch_time": elapsed / epochs,
+        "validation_mae": history.history["val_mae"][-1]
+    }
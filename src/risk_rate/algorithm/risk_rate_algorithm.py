@@ -1,21 +1,28 @@
 """
 Module which contains the RiskRateAlgorithm class
-It contains the required methods to calculate risk rate for a given algorithm
+It contains the required methods to calculate risk rate for a given algorithm, as a view over the RiskRateEngine
 """
 
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
 import config.dataset_settings as dscfg
 
+from src.risk_rate.risk_rate_engine import RiskRateEngine
+from src.risk_rate.risk_rate_state import RiskRateState
+
 
 class RiskRateAlgorithm:
-    """The RiskRateAlgorithm entity"""
+    """
+    The RiskRateAlgorithm entity
+    After each calculation, its state holds the index on the last day, so that update continues the series from it
+    """
 
     risk_rate_algorithm = None
     value_list: List[float]
     index_list = List[str]
+    state: Optional[RiskRateState] = None
 
     def calculate_for_dataset(self, dataset: pd.DataFrame) -> pd.DataFrame:
         """
@@ -27,9 +34,39 @@ class RiskRateAlgorithm:
             raise Exception("Class RiskRateAlgorithm must not be called directly")
         if dataset.empty:
             raise ValueError("Parameter dataset must not be empty")
-        self.value_list = []
-        self.index_list = []
-        return pd.DataFrame()
+        self.state = None
+        return self.__calculate(dataset)
+
+    def update(self, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculates the Risk Rate for the days after the state only, continuing the series from the state.
+        Without state, or if the days after the state do not start on the next day, it is the same as calculate_for_dataset
+        :param new_rows: the input dataset, whose rows up to the state date are skipped
+        :return: dataset with risk rates for the new days
+        """
+        if self.__class__ == RiskRateAlgorithm:
+            raise Exception("Class RiskRateAlgorithm must not be called directly")
+        if self.state is None or not self.state.is_continued_by(new_rows):
+            return self.calculate_for_dataset(new_rows)
+        new_rows = self.state.select_new_rows(new_rows)
+        if new_rows.empty:
+            self.value_list = []
+            self.index_list = []
+            return self.create_risk_rate_dataset()
+        return self.__calculate(new_rows)
+
+    def __calculate(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calculates the Risk Rate from the state, if any, and moves the state to the last day
+        :param dataset: the input dataset
+        :return: dataset with risk rates
+        """
+        states = {self.risk_rate_algorithm: self.state} if self.state is not None else None
+        engine = RiskRateEngine(dataset, states)
+        values, self.index_list = engine.calculate(self.risk_rate_algorithm)
+        self.value_list = values.tolist()
+        self.state = engine.get_state(self.risk_rate_algorithm)
+        return self.create_risk_rate_dataset()
 
     def create_risk_rate_dataset(self) -> pd.DataFrame:
         """
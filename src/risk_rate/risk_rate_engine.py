@@ -0,0 +1,184 @@
+"""
+Module which contains the RiskRateEngine class
+It calculates the risk rate values and indexes of every algorithm for a dataset in a single pass
+"""
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+import src.risk_rate.risk_rate_kernels as kernels
+import src.utils.pandas_utils as pdutils
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.exception.not_implemented_exception import NotImplementedException
+from src.risk_rate.risk_rate_state import RiskRateState
+from src.utils.dataset_columns_utils import get_column_name_suffix
+
+
+class RiskRateEngine:
+    """
+    The RiskRateEngine entity
+    The climatic columns (temperature, relative humidity, wind velocity and precipitation) are read once,
+    and the intermediates shared by the algorithms (humidity factor, saturation vapour pressure, saturation
+    deficit and dew point) are computed once, on their first use.
+    The recurrent algorithms start from the states given, if any, instead of 0.
+    Values already calculated elsewhere (e.g. by segment_operations) may be given, so that only their indexes are calculated
+    """
+
+    dataset: pd.DataFrame
+    states: Dict[RiskRateAlgorithmEnum, RiskRateState]
+
+    def __init__(self, dataset: pd.DataFrame,
+                 states: Optional[Dict[RiskRateAlgorithmEnum, RiskRateState]] = None,
+                 values: Optional[Dict[RiskRateAlgorithmEnum, np.ndarray]] = None):
+        """
+        Class constructor
+        :param dataset: the input dataset, with the climatic columns, whose first row is the day after the states
+        :param states: the states of the algorithms on the day before the first row, by algorithm
+        :param values: the values already calculated, by algorithm
+        """
+        if dataset.empty:
+            raise ValueError("Parameter dataset must not be empty")
+        self.dataset = dataset
+        self.states = states if states is not None else {}
+        self.__arrays: Dict[str, np.ndarray] = {}
+        for risk_rate_algorithm, algorithm_values in (values if values is not None else {}).items():
+            self.__arrays[risk_rate_algorithm.value] = algorithm_values
+
+    def calculate(self, risk_rate_algorithm: RiskRateAlgorithmEnum) -> Tuple[np.ndarray, List[str]]:
+        """
+        Calculates the risk rate values and indexes of an algorithm
+        :param risk_rate_algorithm: the risk rate algorithm
+        :return: the risk rate values and the risk rate indexes, one per row
+        """
+        name = risk_rate_algorithm.value
+        previous_index = self.__get_previous_index(risk_rate_algorithm)
+        if risk_rate_algorithm == RiskRateAlgorithmEnum.FMA:
+            values = self.__get(name, lambda: kernels.calculate_fma(self.__get_humidity_factor(), self.__get_precipitation(), previous_index))
+            return values, kernels.classify_fma(values)
+        if risk_rate_algorithm == RiskRateAlgorithmEnum.FMA_PLUS:
+            values = self.__get(name, lambda: kernels.calculate_fma_plus(self.__get_humidity_factor(), self.__get_precipitation(),
+                                                                         self.__get_column(dscfg.WIND_VELOCITY_COLUMN_NAME), previous_index))
+            return values, kernels.classify_fma_plus(values)
+        if risk_rate_algorithm == RiskRateAlgorithmEnum.TELICYN:
+            values = self.__get(name, lambda: kernels.calculate_telicyn(self.__get_temperature(), self.__get_dew_point(), self.__get_precipitation(), previous_index))
+            return values, kernels.classify_telicyn(values)
+        if risk_rate_algorithm == RiskRateAlgorithmEnum.ANGSTRON:
+            values = self.__get(name, lambda: kernels.calculate_angstron(self.__get_temperature(), self.__get_relative_humidity()))
+            return values, kernels.classify_angstron(values)
+        if risk_rate_algorithm == RiskRateAlgorithmEnum.NESTEROV:
+            values = self.__get(name, lambda: kernels.calculate_nesterov(self.__get_temperature(), self.__get_saturation_deficit(), self.__get_precipitation(),
+                                                                         previous_index))
+            return values, kernels.classify_nesterov(values)
+        raise NotImplementedException("No RiskRateAlgorithmEnum implemented for risk rate algorithm {}".format(risk_rate_algorithm.value))
+
+    def calculate_risk_rate_dataset(self, risk_rate_algorithms: Union[RiskRateAlgorithmEnum, List[RiskRateAlgorithmEnum]] = None) -> pd.DataFrame:
+        """
+        Calculates the risk rate dataset of one or more algorithms, with a value and an index column per algorithm
+        :param risk_rate_algorithms: the risk rate algorithms, all of them by default
+        :return: dataset with risk rates
+        """
+        if risk_rate_algorithms is None:
+            risk_rate_algorithms = list(RiskRateAlgorithmEnum)
+        if isinstance(risk_rate_algorithms, RiskRateAlgorithmEnum):
+            risk_rate_algorithms = [risk_rate_algorithms]
+        columns = {}
+        for risk_rate_algorithm in risk_rate_algorithms:
+            values, indexes = self.calculate(risk_rate_algorithm)
+            columns[get_column_name_suffix(risk_rate_algorithm.value, dscfg.RISK_RATE_VALUE_COLUMN_NAME_SUFFIX)] = values
+            columns[get_column_name_suffix(risk_rate_algorithm.value, dscfg.RISK_RATE_INDEX_COLUMN_NAME_SUFFIX)] = indexes
+        return pd.DataFrame(columns)
+
+    def get_state(self, risk_rate_algorithm: RiskRateAlgorithmEnum) -> RiskRateState:
+        """
+        Get the state of an algorithm on the last row of the dataset, from which it continues on the next days
+        :param risk_rate_algorithm: the risk rate algorithm
+        :return: the state
+        """
+        values, _ = self.calculate(risk_rate_algorithm)
+        date = None
+        if dscfg.DATE_COLUMN_NAME in self.dataset.columns:
+            date = self.dataset[dscfg.DATE_COLUMN_NAME].iloc[-1]
+        return RiskRateState(risk_rate_algorithm, date, values[-1].item())
+
+    def __get(self, name: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Get an array, which is computed on the first call only
+        :param name: the array name
+        :param compute: computes the array
+        :return: the array
+        """
+        if name not in self.__arrays:
+            self.__arrays[name] = compute()
+        return self.__arrays[name]
+
+    def __get_previous_index(self, risk_rate_algorithm: RiskRateAlgorithmEnum) -> float:
+        """
+        Get the index of an algorithm on the day before the first row
+        :param risk_rate_algorithm: the risk rate algorithm
+        :return: the index from its state, or 0 without state
+        """
+        if risk_rate_algorithm in self.states:
+            return self.states[risk_rate_algorithm].value
+        return 0
+
+    def __get_column(self, column_name: str) -> np.ndarray:
+        """
+        Get the values of a column of the dataset
+        :param column_name: the column name
+        :return: the column values
+        """
+        return self.__get(column_name, lambda: pdutils.select_column_values(self.dataset, column_name))
+
+    def __get_temperature(self) -> np.ndarray:
+        """
+        Get the temperatures
+        :return: the temperatures
+        """
+        return self.__get_column(dscfg.TEMPERATURE_COLUMN_NAME)
+
+    def __get_relative_humidity(self) -> np.ndarray:
+        """
+        Get the relative humidities
+        :return: the relative humidities
+        """
+        return self.__get_column(dscfg.RELATIVE_HUMIDITY_COLUMN_NAME)
+
+    def __get_precipitation(self) -> np.ndarray:
+        """
+        Get the precipitations
+        :return: the precipitations
+        """
+        return self.__get_column(dscfg.PRECIPITATION_COLUMN_NAME)
+
+    def __get_humidity_factor(self) -> np.ndarray:
+        """
+        Get the humidity factors, shared by FMA and FMA+
+        :return: the humidity factors
+        """
+        return self.__get("humidity_factor", lambda: kernels.get_humidity_factor(self.__get_relative_humidity()))
+
+    def __get_saturation_vapour_pressure(self) -> np.ndarray:
+        """
+        Get the saturation vapour pressures, shared by Nesterov and Telicyn
+        :return: the saturation vapour pressures
+        """
+        return self.__get("saturation_vapour_pressure", lambda: kernels.get_saturation_vapour_pressure(self.__get_temperature()))
+
+    def __get_saturation_deficit(self) -> np.ndarray:
+        """
+        Get the saturation deficits, used by Nesterov
+        :return: the saturation deficits
+        """
+        return self.__get("saturation_deficit", lambda: kernels.get_saturation_deficit(self.__get_saturation_vapour_pressure(),
+                                                                                        self.__get_relative_humidity()))
+
+    def __get_dew_point(self) -> np.ndarray:
+        """
+        Get the dew point temperatures, used by Telicyn
+        :return: the dew point temperatures
+        """
+        return self.__get("dew_point", lambda: kernels.get_dew_point(self.__get_saturation_vapour_pressure(), self.__get_relative_humidity()))
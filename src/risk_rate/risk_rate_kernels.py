@@ -0,0 +1,301 @@
+"""
+Module that has the array kernels of the risk rate algorithms
+Each kernel takes the climatic columns as float arrays and computes the daily index values in one pass.
+Element-wise arithmetic is done by NumPy, while the recurrences and the transcendental functions
+(pow, exp, log10) are computed on Python floats, in the same order as a day by day computation,
+so that the values are exactly the same.
+The kernels also take 2-D arrays (stations x days), whose recurrences advance day by day for every station at once
+"""
+import math
+from functools import partial
+from typing import Callable, List, Tuple, Union
+
+import numpy as np
+
+from src.enum.risk_rate_index_enum import RiskRateIndexEnum
+
+
+def calculate_angstron(temp: np.ndarray, rh: np.ndarray) -> np.ndarray:
+    """
+    Calculates the Angstron index of each day
+    :param temp: the temperatures
+    :param rh: the relative humidities
+    :return: the Angstron indexes
+    """
+    return (rh / 20) + ((temp - 27) / 10)
+
+
+def calculate_fma(humidity_factor: np.ndarray, precip: np.ndarray, previous_index: Union[float, np.ndarray] = 0) -> np.ndarray:
+    """
+    Calculates the FMA index of each day, accumulated since the last day with heavy precipitation
+    :param humidity_factor: the humidity factors (100 / relative humidity)
+    :param precip: the precipitations
+    :param previous_index: the FMA index of the day before the first one (one per station, for 2-D arrays)
+    :return: the FMA indexes
+    """
+    decay, resets = __get_fma_decay(precip)
+    return __accumulate(humidity_factor, decay, resets, previous_index)
+
+
+def calculate_fma_plus(humidity_factor: np.ndarray, precip: np.ndarray, wind_v: np.ndarray,
+                       previous_index: Union[float, np.ndarray] = 0) -> np.ndarray:
+    """
+    Calculates the FMA+ index of each day, which is the FMA index weighted by the wind velocity
+    :param humidity_factor: the humidity factors (100 / relative humidity)
+    :param precip: the precipitations
+    :param wind_v: the wind velocities
+    :param previous_index: the FMA+ index of the day before the first one (one per station, for 2-D arrays)
+    :return: the FMA+ indexes
+    """
+    decay, resets = __get_fma_decay(precip)
+    wind_factors = __map(math.exp, 0.04 * wind_v)
+    return __accumulate(humidity_factor, decay, resets, previous_index, multipliers=wind_factors)
+
+
+def calculate_nesterov(temp: np.ndarray, saturation_deficit: np.ndarray, precip: np.ndarray,
+                       previous_index: Union[float, np.ndarray] = 0) -> np.ndarray:
+    """
+    Calculates the Nesterov index of each day, accumulated since the last day with heavy precipitation
+    :param temp: the temperatures
+    :param saturation_deficit: the saturation deficits
+    :param precip: the precipitations
+    :param previous_index: the Nesterov index of the day before the first one (one per station, for 2-D arrays)
+    :return: the Nesterov indexes
+    """
+    decay = np.select([precip >= 5.10, precip >= 2.10], [0.50, 0.75], 1.0)
+    # Above 10.00 the index is reset, and from 8.10 the previous index is not kept
+    resets = precip > 10.00
+    restarts = ~resets & (precip >= 8.10)
+    return __accumulate(saturation_deficit * temp, decay, resets, previous_index, restarts=restarts)
+
+
+def calculate_telicyn(temp: np.ndarray, dew_point: np.ndarray, precip: np.ndarray,
+                      previous_index: Union[float, np.ndarray] = 0) -> np.ndarray:
+    """
+    Calculates the Telicyn index of each day, accumulated since the last day with precipitation
+    :param temp: the temperatures
+    :param dew_point: the dew point temperatures
+    :param precip: the precipitations
+    :param previous_index: the Telicyn index of the day before the first one (one per station, for 2-D arrays)
+    :return: the Telicyn indexes
+    """
+    diff = temp - dew_point
+    # The factor is 0 when the temperature is not above the dew point
+    logged = ~(diff <= 0)
+    factor = np.zeros(diff.shape, dtype=np.float64)
+    factor[logged] = __map(math.log10, diff[logged])
+    return __accumulate(factor, np.ones(factor.shape), ~(precip < 2.5), previous_index)
+
+
+def get_humidity_factor(rh: np.ndarray) -> np.ndarray:
+    """
+    Calculates the humidity factor of each day, used by FMA and FMA+
+    :param rh: the relative humidities
+    :return: the humidity factors
+    """
+    return 100.0 / rh
+
+
+def get_saturation_vapour_pressure(temp: np.ndarray) -> np.ndarray:
+    """
+    Calculates the saturation vapour pressure of each day
+    :param temp: the temperatures
+    :return: the saturation vapour pressures
+    """
+    return 6.1 * __map(partial(pow, 10), (7.5 * temp) / (237.3 + temp))
+
+
+def get_saturation_deficit(saturation_vapour_pressure: np.ndarray, rh: np.ndarray) -> np.ndarray:
+    """
+    Calculates the saturation deficit of each day
+    :param saturation_vapour_pressure: the saturation vapour pressures
+    :param rh: the relative humidities
+    :return: the saturation deficits
+    """
+    return saturation_vapour_pressure * (1 - (rh / 100))
+
+
+def get_dew_point(saturation_vapour_pressure: np.ndarray, rh: np.ndarray) -> np.ndarray:
+    """
+    Calculates the dew point temperature of each day
+    :param saturation_vapour_pressure: the saturation vapour pressures
+    :param rh: the relative humidities
+    :return: the dew point temperatures
+    """
+    e = (rh / 100) * saturation_vapour_pressure
+    log_dpt = __map(math.log10, e / 6.1)
+    return (237.3 * log_dpt) / (7.5 - log_dpt)
+
+
+def classify(conditions: List[np.ndarray], risk_rates: List[str], default_risk_rate: str) -> List[str]:
+    """
+    Assigns a risk rate to each index value, from the first condition it meets
+    :param conditions: the conditions, each one a boolean array over the index values
+    :param risk_rates: the risk rate of each condition
+    :param default_risk_rate: the risk rate of the values that meet no condition
+    :return: the risk rates (a list per station, for 2-D arrays)
+    """
+    positions = np.select(conditions, list(range(len(risk_rates))), len(risk_rates))
+    names = np.array(list(risk_rates) + [default_risk_rate], dtype=object)
+    return names[positions].tolist()
+
+
+def classify_fma(fma_indexes: np.ndarray) -> List[str]:
+    """
+    Convert FMA indexes to risk rates
+    :param fma_indexes: the FMA indexes
+    :return: the risk rates
+    """
+    return classify([fma_indexes > 20, fma_indexes >= 8.1, fma_indexes >= 3.1, fma_indexes >= 1.1],
+                    [RiskRateIndexEnum.MUITO_ALTO.value, RiskRateIndexEnum.ALTO.value,
+                     RiskRateIndexEnum.MEDIO.value, RiskRateIndexEnum.PEQUENO.value],
+                    RiskRateIndexEnum.NULO.value)
+
+
+def classify_fma_plus(fma_plus_indexes: np.ndarray) -> List[str]:
+    """
+    Convert FMA+ indexes to risk rates
+    :param fma_plus_indexes: the FMA+ indexes
+    :return: the risk rates
+    """
+    return classify([fma_plus_indexes > 24, fma_plus_indexes >= 14.1, fma_plus_indexes >= 8.1, fma_plus_indexes >= 3.1],
+                    [RiskRateIndexEnum.MUITO_ALTO.value, RiskRateIndexEnum.ALTO.value,
+                     RiskRateIndexEnum.MEDIO.value, RiskRateIndexEnum.PEQUENO.value],
+                    RiskRateIndexEnum.NULO.value)
+
+
+def classify_telicyn(telicyn_indexes: np.ndarray) -> List[str]:
+    """
+    Convert Telicyn indexes to risk rates
+    :param telicyn_indexes: the Telicyn indexes
+    :return: the risk rates
+    """
+    return classify([telicyn_indexes > 5, telicyn_indexes >= 3.6, telicyn_indexes >= 2.1],
+                    [RiskRateIndexEnum.ALTO.value, RiskRateIndexEnum.MEDIO.value, RiskRateIndexEnum.PEQUENO.value],
+                    RiskRateIndexEnum.NULO.value)
+
+
+def classify_angstron(angstron_indexes: np.ndarray) -> List[str]:
+    """
+    Convert Angstron indexes to risk rates
+    :param angstron_indexes: the Angstron indexes
+    :return: the risk rates
+    """
+    return classify([angstron_indexes > 4.5, angstron_indexes >= 4.3, angstron_indexes >= 4.0, angstron_indexes >= 3.5],
+                    [RiskRateIndexEnum.NULO.value, RiskRateIndexEnum.PEQUENO.value,
+                     RiskRateIndexEnum.MEDIO.value, RiskRateIndexEnum.ALTO.value],
+                    RiskRateIndexEnum.MUITO_ALTO.value)
+
+
+def classify_nesterov(nesterov_indexes: np.ndarray) -> List[str]:
+    """
+    Convert Nesterov indexes to risk rates
+    :param nesterov_indexes: the Nesterov indexes
+    :return: the risk rates
+    """
+    return classify([nesterov_indexes > 4000, nesterov_indexes >= 1001, nesterov_indexes >= 501, nesterov_indexes >= 301],
+                    [RiskRateIndexEnum.MUITO_ALTO.value, RiskRateIndexEnum.ALTO.value,
+                     RiskRateIndexEnum.MEDIO.value, RiskRateIndexEnum.PEQUENO.value],
+                    RiskRateIndexEnum.NULO.value)
+
+
+def __map(function: Callable[[float], float], values: np.ndarray) -> np.ndarray:
+    """
+    Applies a function of the math module to each value, as a Python float
+    :param function: the function
+    :param values: the values, of any shape
+    :return: the results, of the same shape
+    """
+    return np.array(list(map(function, values.ravel().tolist())), dtype=np.float64).reshape(values.shape)
+
+
+def __get_fma_decay(precip: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets how much of the previous FMA index is kept each day, and the days when it is reset
+    :param precip: the precipitations
+    :return: the decays and the resets
+    """
+    decay = np.select([precip >= 10.00, precip >= 5.00, precip >= 2.50], [0.20, 0.40, 0.70], 1.0)
+    return decay, precip > 12.90
+
+
+def __accumulate(factors: np.ndarray,
+                 decay: np.ndarray,
+                 resets: np.ndarray,
+                 previous_index: Union[float, np.ndarray],
+                 multipliers: np.ndarray = None,
+                 restarts: np.ndarray = None) -> np.ndarray:
+    """
+    Computes the recurrence index = (previous index * decay + factor) * multiplier, starting from the previous index.
+    On reset days the index is 0 (times the multiplier), and on restart days the previous index is not kept
+    :param factors: the factor added each day
+    :param decay: how much of the previous index is kept each day
+    :param resets: the days when the index is reset
+    :param previous_index: the index of the day before the first one
+    :param multipliers: the multiplier of each day, if any
+    :param restarts: the days when the previous index is not kept, if any
+    :return: the indexes
+    """
+    if decay.ndim == 2:
+        return __accumulate_stations(factors, decay, resets, previous_index, multipliers, restarts)
+    n_days = len(decay)
+    factors = factors.tolist()
+    decay = decay.tolist()
+    resets = resets.tolist()
+    multipliers = multipliers.tolist() if multipliers is not None else None
+    restarts = restarts.tolist() if restarts is not None else [False] * n_days
+
+    values = []
+    previous = previous_index
+    for i in range(n_days):
+        if resets[i]:
+            value = 0.00
+        elif restarts[i]:
+            value = factors[i]
+        elif decay[i] == 1.0:
+            value = previous + factors[i]
+        else:
+            value = previous * decay[i] + factors[i]
+        if multipliers is not None:
+            value = value * multipliers[i]
+        values.append(value)
+        previous = value
+    return np.array(values, dtype=np.float64)
+
+
+def __accumulate_stations(factors: np.ndarray,
+                          decay: np.ndarray,
+                          resets: np.ndarray,
+                          previous_index: Union[float, np.ndarray],
+                          multipliers: np.ndarray = None,
+                          restarts: np.ndarray = None) -> np.ndarray:
+    """
+    Computes the recurrence of __accumulate for stations x days arrays, one day at a time for every station.
+    Keeping the whole previous index (decay 1.0) is the same as adding to it, so the values are exactly the same
+    :param factors: the factor added each day, by station
+    :param decay: how much of the previous index is kept each day, by station
+    :param resets: the days when the index is reset, by station
+    :param previous_index: the index of the day before the first one, for every station or by station
+    :param multipliers: the multiplier of each day, by station, if any
+    :param restarts: the days when the previous index is not kept, by station, if any
+    :return: the indexes, by station
+    """
+    # Days x stations, so that each day is contiguous
+    factors = np.ascontiguousarray(factors.T, dtype=np.float64)
+    decay = np.ascontiguousarray(decay.T)
+    resets = np.ascontiguousarray(resets.T)
+    multipliers = np.ascontiguousarray(multipliers.T) if multipliers is not None else None
+    restarts = np.ascontiguousarray(restarts.T) if restarts is not None else None
+
+    values = np.empty(factors.shape, dtype=np.float64)
+    previous = np.broadcast_to(np.asarray(previous_index, dtype=np.float64), factors.shape[1:])
+    for i in range(len(factors)):
+        value = previous * decay[i] + factors[i]
+        if restarts is not None:
+            value = np.where(restarts[i], factors[i], value)
+        value = np.where(resets[i], 0.00, value)
+        if multipliers is not None:
+            value = value * multipliers[i]
+        values[i] = value
+        previous = value
+    return values.T.copy()
@@ -0,0 +1,55 @@
+"""Module which contains the RiskRateState class"""
+from typing import Optional
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+
+
+class RiskRateState:
+    """
+    The RiskRateState entity
+    It holds the index of a risk rate algorithm on the last day it was calculated for, so that the
+    recurrent algorithms (FMA, FMA+, Nesterov and Telicyn) continue their series from it on new days
+    """
+
+    risk_rate_algorithm: RiskRateAlgorithmEnum
+    date: Optional[pd.Timestamp]
+    value: float
+
+    def __init__(self, risk_rate_algorithm: RiskRateAlgorithmEnum,
+                 date: Optional[pd.Timestamp],
+                 value: float):
+        """
+        Class constructor
+        :param risk_rate_algorithm: the risk rate algorithm
+        :param date: the last day the index was calculated for, if the dataset had dates
+        :param value: the index on that day
+        """
+        self.risk_rate_algorithm = risk_rate_algorithm
+        self.date = date
+        self.value = value
+
+    def select_new_rows(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select the rows of the days after the state date. Without dates, every row is new
+        :param dataset: the input dataset
+        :return: the new rows
+        """
+        if self.date is None or dscfg.DATE_COLUMN_NAME not in dataset.columns:
+            return dataset.reset_index(drop=True)
+        return dataset.loc[dataset[dscfg.DATE_COLUMN_NAME] > self.date].reset_index(drop=True)
+
+    def is_continued_by(self, dataset: pd.DataFrame) -> bool:
+        """
+        Whether the days of a dataset after the state date start on the day after it, so that the series
+        continues from the state. Without dates, every row is new, so the series continues
+        :param dataset: the input dataset
+        :return: whether it continues from the state or not
+        """
+        if self.date is None or dscfg.DATE_COLUMN_NAME not in dataset.columns:
+            return True
+        new_dates = dataset.loc[dataset[dscfg.DATE_COLUMN_NAME] > self.date, dscfg.DATE_COLUMN_NAME]
+        return new_dates.empty or new_dates.iloc[0] == self.date + pd.Timedelta(days=1)
@@ -0,0 +1,92 @@
+"""Module which contains the RiskRateStates class"""
+from typing import Dict, Optional
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+import src.utils.pandas_utils as pdutils
+from src.risk_rate.risk_rate_state import RiskRateState
+
+
+class RiskRateStates:
+    """
+    The RiskRateStates entity
+    It holds what a prediction saves of its statistical risk rates: the states on the last day (one per dataset
+    column and algorithm), the risk rates of every day calculated so far and the fingerprint of the deployed model
+    they were calculated with, since the forecasted columns depend on it.
+    The next prediction takes the risk rates of the days already calculated from them, and continues the series
+    from the states on the new days
+    """
+
+    model_fingerprint: Optional[str]
+    states: Dict[str, RiskRateState]
+    risk_rates_dataset: pd.DataFrame
+
+    def __init__(self, model_fingerprint: Optional[str] = None,
+                 states: Optional[Dict[str, RiskRateState]] = None,
+                 risk_rates_dataset: Optional[pd.DataFrame] = None):
+        """
+        Class constructor
+        :param model_fingerprint: the fingerprint of the deployed model, if any
+        :param states: the states on the last day, by column name and algorithm. The states are saved together, so they share their date
+        :param risk_rates_dataset: the risk rates of every day calculated so far, with the date column
+        """
+        self.model_fingerprint = model_fingerprint
+        self.states = states if states is not None else {}
+        self.risk_rates_dataset = risk_rates_dataset if risk_rates_dataset is not None else pd.DataFrame()
+
+    def is_continued_by(self, dataset: pd.DataFrame) -> bool:
+        """
+        Whether the risk rates of a dataset can be calculated from the states: the risk rates of its days up to
+        the states date were already calculated, and its days after that date start on the next day
+        :param dataset: the input dataset
+        :return: whether it continues from the states or not
+        """
+        if not self.states:
+            return False
+        state = next(iter(self.states.values()))
+        if state.date is None or dscfg.DATE_COLUMN_NAME not in dataset.columns:
+            return False
+        dates = dataset[dscfg.DATE_COLUMN_NAME]
+        known_dates = dates.loc[dates <= state.date]
+        if not known_dates.isin(self.risk_rates_dataset[dscfg.DATE_COLUMN_NAME]).all():
+            return False
+        return state.is_continued_by(dataset)
+
+    def select_known_risk_rates(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select the risk rates already calculated for the days of a dataset up to the states date
+        :param dataset: the input dataset, which continues from the states
+        :return: the risk rates of those days, in the dataset order
+        """
+        if not self.states:
+            return pd.DataFrame()
+        dates = pdutils.select_columns(dataset, dscfg.DATE_COLUMN_NAME)
+        known_dates = dates.loc[dates[dscfg.DATE_COLUMN_NAME] <= next(iter(self.states.values())).date]
+        return pdutils.join_inner_by_date([known_dates, self.risk_rates_dataset])
+
+    def select_new_rows(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select the rows of a dataset for the days after the states
+        :param dataset: the input dataset
+        :return: the new rows, or every row without states
+        """
+        if not self.states:
+            return dataset.reset_index(drop=True)
+        return next(iter(self.states.values())).select_new_rows(dataset)
+
+    def update(self, states: Dict[str, RiskRateState], new_risk_rates_dataset: pd.DataFrame) -> "RiskRateStates":
+        """
+        Get the risk rate states after calculating new days
+        :param states: the states on the last new day, by column name and algorithm
+        :param new_risk_rates_dataset: the risk rates of the new days, with the date column
+        :return: the updated risk rate states, for the same deployed model
+        """
+        if new_risk_rates_dataset.empty:
+            return RiskRateStates(self.model_fingerprint, states, self.risk_rates_dataset)
+        if self.risk_rates_dataset.empty:
+            return RiskRateStates(self.model_fingerprint, states, new_risk_rates_dataset)
+        return RiskRateStates(self.model_fingerprint,
+                              states,
+                              pdutils.join_dataframes_x_wise([self.risk_rates_dataset, new_risk_rates_dataset]))
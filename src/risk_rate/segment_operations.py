@@ -0,0 +1,220 @@
+"""
+Module that has all operations required to calculate the risk rates of long histories in parallel.
+The recurrent algorithms (FMA, FMA+, Nesterov and Telicyn) do not depend on the days before a day with
+heavy precipitation, which resets all of them. The history is split into segments on those days, and
+on the first day of each series (e.g. each station), and the segments are calculated by a process pool.
+The climatic columns are shared with the processes through shared memory, and so are the values they calculate,
+which are stitched back in order. The values are exactly the same as calculating the whole history at once
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+import src.utils.pandas_utils as pdutils
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.exception.not_implemented_exception import NotImplementedException
+from src.risk_rate.risk_rate_engine import RiskRateEngine
+from src.risk_rate.risk_rate_state import RiskRateState
+
+CLIMATIC_COLUMN_NAMES = [dscfg.TEMPERATURE_COLUMN_NAME,
+                         dscfg.RELATIVE_HUMIDITY_COLUMN_NAME,
+                         dscfg.WIND_VELOCITY_COLUMN_NAME,
+                         dscfg.PRECIPITATION_COLUMN_NAME]
+
+
+def get_reset_days(precip: np.ndarray) -> np.ndarray:
+    """
+    Get the days on which every recurrent algorithm is reset, that is, whose index does not depend on the days before
+    :param precip: the precipitations
+    :return: whether each day resets every recurrent algorithm
+    """
+    fma_resets = precip > 12.90
+    nesterov_resets = precip >= 8.10
+    telicyn_resets = ~(precip < 2.5)
+    return fma_resets & nesterov_resets & telicyn_resets
+
+
+def get_segments(reset_days: np.ndarray, series_starts: Sequence[int], n_segments: int) -> List[Tuple[int, int]]:
+    """
+    Split the days into about n_segments segments of similar length, each one starting on a reset day,
+    on the first day of a series or on the first day
+    :param reset_days: whether each day resets every recurrent algorithm
+    :param series_starts: the first day of each series
+    :param n_segments: the number of segments wanted
+    :return: the first and last (excluded) day of each segment, in order
+    """
+    n_days = len(reset_days)
+    boundaries = np.union1d(np.flatnonzero(reset_days), np.asarray(series_starts, dtype=np.int64))
+    boundaries = boundaries[(boundaries > 0) & (boundaries < n_days)]
+
+    # Each segment ends on the first boundary at or after its ideal end
+    ideal_ends = [n_days * i // n_segments for i in range(1, n_segments)]
+    ends = np.unique(boundaries[np.minimum(np.searchsorted(boundaries, ideal_ends), len(boundaries) - 1)]) if len(boundaries) else []
+    starts = [0] + list(ends)
+    return [(int(start), int(end)) for start, end in zip(starts, list(ends) + [n_days])]
+
+
+def create_engine(dataset: pd.DataFrame,
+                  states: Optional[Dict[RiskRateAlgorithmEnum, RiskRateState]] = None,
+                  workers: int = 1,
+                  min_days_per_worker: int = 1,
+                  series_starts: Sequence[int] = ()) -> RiskRateEngine:
+    """
+    Create the RiskRateEngine of a dataset, whose values are calculated in parallel by segments if the dataset
+    is long enough. Otherwise, the engine calculates them itself
+    :param dataset: the input dataset, with the climatic columns
+    :param states: the states of the algorithms on the day before the first row, by algorithm
+    :param workers: the maximum number of processes
+    :param min_days_per_worker: the minimum number of days calculated by each process
+    :param series_starts: the first day (row position) of each series other than the first one, which start from 0
+    :return: the engine
+    """
+    n_segments = min(workers, len(dataset) // max(min_days_per_worker, 1))
+    if n_segments < 2 or dataset.empty:
+        return __create_series_engine(dataset, states, series_starts)
+
+    columns = np.stack([pdutils.select_column_values(dataset, column_name) for column_name in CLIMATIC_COLUMN_NAMES])
+    segments = get_segments(get_reset_days(columns[-1]), series_starts, n_segments)
+    if len(segments) < 2:
+        return __create_series_engine(dataset, states, series_starts)
+
+    input_memory = SharedMemory(create=True, size=columns.nbytes)
+    output_memory = SharedMemory(create=True, size=len(RiskRateAlgorithmEnum) * columns.nbytes // len(CLIMATIC_COLUMN_NAMES))
+    try:
+        values = __calculate_segments(input_memory, output_memory, columns, segments, states, series_starts)
+    finally:
+        input_memory.close()
+        input_memory.unlink()
+        output_memory.close()
+        output_memory.unlink()
+    return RiskRateEngine(dataset, states, values)
+
+
+def __calculate_segments(input_memory: SharedMemory,
+                         output_memory: SharedMemory,
+                         columns: np.ndarray,
+                         segments: List[Tuple[int, int]],
+                         states: Optional[Dict[RiskRateAlgorithmEnum, RiskRateState]],
+                         series_starts: Sequence[int]) -> Dict[RiskRateAlgorithmEnum, np.ndarray]:
+    """
+    Calculates the values of every algorithm by segments, in a process pool
+    :param input_memory: the shared memory for the climatic columns
+    :param output_memory: the shared memory for the values
+    :param columns: the climatic columns, one per row
+    :param segments: the first and last (excluded) day of each segment
+    :param states: the states of the algorithms on the day before the first row, by algorithm
+    :param series_starts: the first day (row position) of each series other than the first one
+    :return: the values, by algorithm
+    """
+    n_days = columns.shape[1]
+    np.ndarray(columns.shape, dtype=np.float64, buffer=input_memory.buf)[:] = columns
+    previous_indexes = {risk_rate_algorithm: state.value for risk_rate_algorithm, state in (states or {}).items()}
+
+    with ProcessPoolExecutor(max_workers=len(segments), mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(__calculate_segment,
+                                   input_memory.name,
+                                   output_memory.name,
+                                   n_days,
+                                   start,
+                                   end,
+                                   [series_start - start for series_start in series_starts if start < series_start < end],
+                                   previous_indexes if start == 0 else {})
+                   for start, end in segments]
+        implemented = [future.result() for future in futures][0]
+
+    risk_rate_algorithms = list(RiskRateAlgorithmEnum)
+    outputs = np.ndarray((len(risk_rate_algorithms), n_days), dtype=np.float64, buffer=output_memory.buf)
+    return {risk_rate_algorithm: outputs[i].copy() for i, risk_rate_algorithm in enumerate(risk_rate_algorithms) if risk_rate_algorithm in implemented}
+
+
+def __create_series_engine(dataset: pd.DataFrame,
+                           states: Optional[Dict[RiskRateAlgorithmEnum, RiskRateState]],
+                           series_starts: Sequence[int]) -> RiskRateEngine:
+    """
+    Create the RiskRateEngine of a dataset in this process, with every series starting from 0 (or from the states, for the first one)
+    :param dataset: the input dataset
+    :param states: the states of the algorithms on the day before the first row, by algorithm
+    :param series_starts: the first day (row position) of each series other than the first one
+    :return: the engine
+    """
+    series_starts = [series_start for series_start in series_starts if 0 < series_start < len(dataset)]
+    if not series_starts:
+        return RiskRateEngine(dataset, states)
+    values = {}
+    for start, end in zip([0] + series_starts, series_starts + [len(dataset)]):
+        engine = RiskRateEngine(dataset.iloc[start:end], states if start == 0 else None)
+        for risk_rate_algorithm in RiskRateAlgorithmEnum:
+            try:
+                values.setdefault(risk_rate_algorithm, []).append(engine.calculate(risk_rate_algorithm)[0])
+            except NotImplementedException:
+                pass
+    return RiskRateEngine(dataset, states, {risk_rate_algorithm: np.concatenate(parts) for risk_rate_algorithm, parts in values.items()})
+
+
+def __calculate_segment(input_memory_name: str,
+                        output_memory_name: str,
+                        n_days: int,
+                        start: int,
+                        end: int,
+                        series_starts: List[int],
+                        previous_indexes: Dict[RiskRateAlgorithmEnum, float]) -> List[RiskRateAlgorithmEnum]:
+    """
+    Calculates the values of every algorithm for a segment, in a worker process
+    :param input_memory_name: the name of the shared memory with the climatic columns
+    :param output_memory_name: the name of the shared memory where the values are written
+    :param n_days: the number of days of the whole history
+    :param start: the first day of the segment
+    :param end: the last day (excluded) of the segment
+    :param series_starts: the first day of each series within the segment, relative to its start
+    :param previous_indexes: the indexes on the day before the segment, by algorithm, for the first segment
+    :return: the algorithms calculated
+    """
+    input_memory = SharedMemory(name=input_memory_name)
+    output_memory = SharedMemory(name=output_memory_name)
+    try:
+        return __write_segment_values(input_memory, output_memory, n_days, start, end, series_starts, previous_indexes)
+    finally:
+        input_memory.close()
+        output_memory.close()
+
+
+def __write_segment_values(input_memory: SharedMemory,
+                           output_memory: SharedMemory,
+                           n_days: int,
+                           start: int,
+                           end: int,
+                           series_starts: List[int],
+                           previous_indexes: Dict[RiskRateAlgorithmEnum, float]) -> List[RiskRateAlgorithmEnum]:
+    """
+    Calculates the values of every algorithm for a segment, and writes them to the shared memory
+    :param input_memory: the shared memory with the climatic columns
+    :param output_memory: the shared memory where the values are written
+    :param n_days: the number of days of the whole history
+    :param start: the first day of the segment
+    :param end: the last day (excluded) of the segment
+    :param series_starts: the first day of each series within the segment, relative to its start
+    :param previous_indexes: the indexes on the day before the segment, by algorithm
+    :return: the algorithms calculated
+    """
+    columns = np.ndarray((len(CLIMATIC_COLUMN_NAMES), n_days), dtype=np.float64, buffer=input_memory.buf)
+    dataset = pd.DataFrame({column_name: columns[i, start:end] for i, column_name in enumerate(CLIMATIC_COLUMN_NAMES)})
+    states = {risk_rate_algorithm: RiskRateState(risk_rate_algorithm, None, value) for risk_rate_algorithm, value in previous_indexes.items()}
+    engine = __create_series_engine(dataset, states, series_starts)
+
+    risk_rate_algorithms = list(RiskRateAlgorithmEnum)
+    outputs = np.ndarray((len(risk_rate_algorithms), n_days), dtype=np.float64, buffer=output_memory.buf)
+    implemented = []
+    for i, risk_rate_algorithm in enumerate(risk_rate_algorithms):
+        try:
+            outputs[i, start:end] = engine.calculate(risk_rate_algorithm)[0]
+            implemented.append(risk_rate_algorithm)
+        except NotImplementedException:
+            pass
+    return implemented
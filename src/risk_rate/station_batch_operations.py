@@ -0,0 +1,117 @@
+"""
+Module that has all operations required to calculate the risk rates of many stations (e.g. INMET stations) at once.
+The climatic columns are given as stations x days arrays, and the recurrences advance day by day for every station
+at once, so the cost does not grow with the number of stations as a loop over stations does.
+The values are exactly the same as calculating each station by itself
+"""
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+import src.risk_rate.risk_rate_kernels as kernels
+import src.utils.pandas_utils as pdutils
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.exception.not_implemented_exception import NotImplementedException
+
+
+def stack_station_datasets(datasets: List[pd.DataFrame]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stack the climatic columns of the datasets of many stations, which must have the same days
+    :param datasets: the input dataset of each station, with the climatic columns
+    :return: the temperatures, relative humidities, wind velocities and precipitations, as stations x days arrays
+    """
+    if not datasets:
+        raise ValueError("Parameter datasets must not be empty")
+    if len(set(len(dataset) for dataset in datasets)) > 1:
+        raise ValueError("Parameter datasets must have the same number of days")
+    if all(dscfg.DATE_COLUMN_NAME in dataset.columns for dataset in datasets):
+        dates = datasets[0][dscfg.DATE_COLUMN_NAME].values
+        if any(not np.array_equal(dataset[dscfg.DATE_COLUMN_NAME].values, dates) for dataset in datasets[1:]):
+            raise ValueError("Parameter datasets must have the same days")
+    return tuple(np.stack([pdutils.select_column_values(dataset, column_name) for dataset in datasets])
+                 for column_name in [dscfg.TEMPERATURE_COLUMN_NAME,
+                                     dscfg.RELATIVE_HUMIDITY_COLUMN_NAME,
+                                     dscfg.WIND_VELOCITY_COLUMN_NAME,
+                                     dscfg.PRECIPITATION_COLUMN_NAME])
+
+
+def calculate_station_risk_rates(temp: np.ndarray,
+                                 rh: np.ndarray,
+                                 wind_v: np.ndarray,
+                                 precip: np.ndarray,
+                                 risk_rate_algorithms: Union[RiskRateAlgorithmEnum, List[RiskRateAlgorithmEnum]] = None,
+                                 previous_indexes: Optional[Dict[RiskRateAlgorithmEnum, np.ndarray]] = None
+                                 ) -> Dict[RiskRateAlgorithmEnum, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Calculates the risk rate values and indexes of one or more algorithms for many stations
+    :param temp: the temperatures, as a stations x days array
+    :param rh: the relative humidities, as a stations x days array
+    :param wind_v: the wind velocities, as a stations x days array
+    :param precip: the precipitations, as a stations x days array
+    :param risk_rate_algorithms: the risk rate algorithms, all of them by default
+    :param previous_indexes: the index of each station on the day before the first one, by algorithm (0 if not given)
+    :return: the risk rate values and the risk rate indexes, as stations x days arrays, by algorithm
+    """
+    temp, rh, wind_v, precip = [np.asarray(values, dtype=np.float64) for values in [temp, rh, wind_v, precip]]
+    if temp.ndim != 2 or any(values.shape != temp.shape for values in [rh, wind_v, precip]):
+        raise ValueError("Parameters temp, rh, wind_v and precip must be stations x days arrays of the same shape")
+    if risk_rate_algorithms is None:
+        risk_rate_algorithms = list(RiskRateAlgorithmEnum)
+    if isinstance(risk_rate_algorithms, RiskRateAlgorithmEnum):
+        risk_rate_algorithms = [risk_rate_algorithms]
+    previous_indexes = previous_indexes if previous_indexes is not None else {}
+
+    # The intermediates shared by the algorithms are computed once, on their first use
+    intermediates = {}
+    risk_rates = {}
+    for risk_rate_algorithm in risk_rate_algorithms:
+        previous_index = previous_indexes.get(risk_rate_algorithm, 0)
+        if risk_rate_algorithm == RiskRateAlgorithmEnum.FMA:
+            values = kernels.calculate_fma(__get_humidity_factor(intermediates, rh), precip, previous_index)
+            indexes = kernels.classify_fma(values)
+        elif risk_rate_algorithm == RiskRateAlgorithmEnum.FMA_PLUS:
+            values = kernels.calculate_fma_plus(__get_humidity_factor(intermediates, rh), precip, wind_v, previous_index)
+            indexes = kernels.classify_fma_plus(values)
+        elif risk_rate_algorithm == RiskRateAlgorithmEnum.TELICYN:
+            dew_point = kernels.get_dew_point(__get_saturation_vapour_pressure(intermediates, temp), rh)
+            values = kernels.calculate_telicyn(temp, dew_point, precip, previous_index)
+            indexes = kernels.classify_telicyn(values)
+        elif risk_rate_algorithm == RiskRateAlgorithmEnum.ANGSTRON:
+            values = kernels.calculate_angstron(temp, rh)
+            indexes = kernels.classify_angstron(values)
+        elif risk_rate_algorithm == RiskRateAlgorithmEnum.NESTEROV:
+            saturation_deficit = kernels.get_saturation_deficit(__get_saturation_vapour_pressure(intermediates, temp), rh)
+            values = kernels.calculate_nesterov(temp, saturation_deficit, precip, previous_index)
+            indexes = kernels.classify_nesterov(values)
+        else:
+            raise NotImplementedException("No RiskRateAlgorithmEnum implemented for risk rate algorithm {}".format(risk_rate_algorithm.value))
+        risk_rates[risk_rate_algorithm] = (values, np.array(indexes, dtype=object))
+    return risk_rates
+
+
+def __get_humidity_factor(intermediates: Dict[str, np.ndarray], rh: np.ndarray) -> np.ndarray:
+    """
+    Get the humidity factors, shared by FMA and FMA+
+    :param intermediates: the intermediates already computed
+    :param rh: the relative humidities
+    :return: the humidity factors
+    """
+    if "humidity_factor" not in intermediates:
+        intermediates["humidity_factor"] = kernels.get_humidity_factor(rh)
+    return intermediates["humidity_factor"]
+
+
+def __get_saturation_vapour_pressure(intermediates: Dict[str, np.ndarray], temp: np.ndarray) -> np.ndarray:
+    """
+    Get the saturation vapour pressures, shared by Nesterov and Telicyn
+    :param intermediates: the intermediates already computed
+    :param temp: the temperatures
+    :return: the saturation vapour pressures
+    """
+    if "saturation_vapour_pressure" not in intermediates:
+        intermediates["saturation_vapour_pressure"] = kernels.get_saturation_vapour_pressure(temp)
+    return intermediates["saturation_vapour_pressure"]
@@ -0,0 +1,102 @@
+"""
+Module that has all operations required to search the thresholds of the risk rate indexes
+(Nulo, Pequeno, Médio, Alto and Muito alto) for predicted probabilities.
+The probabilities are sorted once, so that every combination of thresholds is scored
+from cumulative counts, without building its risk rates
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+# Score weight of the correlation of each risk rate index, and whether it is inverted (1 - correlation),
+# since hotspots should not happen for low indexes
+SCORE_WEIGHTS = [5, 4, 3, 2, 1]
+SCORE_INVERTED = [True, True, True, False, False]
+SCORE_TOTAL_WEIGHT = 15
+
+NO_INDEX = -1
+
+
+def get_valid_thresholds(candidate_thresholds: List[List[float]]) -> np.ndarray:
+    """
+    Get every combination of candidate thresholds that is strictly increasing
+    :param candidate_thresholds: the candidate thresholds of each risk rate index
+    :return: the valid combinations (one per row), in the order of nested loops over the candidates
+    """
+    grids = np.meshgrid(*[np.asarray(candidates, dtype=np.float64) for candidates in candidate_thresholds], indexing="ij")
+    combinations = np.stack([grid.ravel() for grid in grids], axis=1)
+    return combinations[np.all(combinations[:, 1:] > combinations[:, :-1], axis=1)]
+
+
+def get_risk_rate_indexes(probabilities: np.ndarray, thresholds: List[float]) -> np.ndarray:
+    """
+    Get the risk rate index of each probability, that is, the first one whose threshold is not below it
+    :param probabilities: the probabilities
+    :param thresholds: the thresholds of the risk rate indexes, strictly increasing
+    :return: the position of the risk rate index of each probability, or NO_INDEX if above every threshold
+    """
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    indexes = np.searchsorted(np.asarray(thresholds, dtype=np.float64), probabilities, side="left")
+    return np.where(indexes < len(thresholds), indexes, NO_INDEX)
+
+
+def get_scores(probabilities: np.ndarray, hotspot_identified: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Get the score of each combination of thresholds. For each column of probabilities, the correlation
+    of a risk rate index is the rate of hotspots among the rows with that index (0 without rows), and
+    the column score is the weighted sum of the correlations. The score is the sum of the column scores
+    :param probabilities: the probabilities, one column per prediction (present and forecasted days)
+    :param hotspot_identified: whether a hotspot was identified (1) or not, for each row
+    :param thresholds: the combinations of thresholds, one per row
+    :return: the scores
+    """
+    probabilities = np.asarray(probabilities, dtype=np.float64).reshape(len(hotspot_identified), -1)
+    hotspots = np.asarray(hotspot_identified) == 1
+    scores = np.zeros(thresholds.shape[0])
+    for column in range(probabilities.shape[1]):
+        scores = scores + __get_column_scores(probabilities[:, column], hotspots, thresholds)
+    return scores
+
+
+def search_thresholds(probabilities: np.ndarray,
+                      hotspot_identified: np.ndarray,
+                      candidate_thresholds: List[List[float]]) -> Tuple[List[float], float]:
+    """
+    Search the combination of thresholds with the best score. Ties are won by the first combination,
+    in the order of nested loops over the candidates
+    :param probabilities: the probabilities, one column per prediction (present and forecasted days)
+    :param hotspot_identified: whether a hotspot was identified (1) or not, for each row
+    :param candidate_thresholds: the candidate thresholds of each risk rate index
+    :return: the best thresholds and their score, or no thresholds and a score of -1 if no combination is valid
+    """
+    thresholds = get_valid_thresholds(candidate_thresholds)
+    if thresholds.shape[0] == 0:
+        return [], -1
+    scores = get_scores(probabilities, hotspot_identified, thresholds)
+    best = int(np.argmax(scores))
+    return thresholds[best].tolist(), float(scores[best])
+
+
+def __get_column_scores(probabilities: np.ndarray, hotspots: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Get the score of each combination of thresholds for a single column of probabilities.
+    The operations follow the order of a scalar computation, so that the scores are exactly the same
+    :param probabilities: the probabilities
+    :param hotspots: whether a hotspot was identified, for each row
+    :param thresholds: the combinations of thresholds, one per row
+    :return: the scores
+    """
+    order = np.argsort(probabilities, kind="stable")
+    cumulative_hotspots = np.concatenate([[0], np.cumsum(hotspots[order])])
+
+    # Rows whose probability is not above each threshold, and the hotspots among them
+    counts_not_above = np.searchsorted(probabilities[order], thresholds, side="right")
+    counts = np.diff(counts_not_above, axis=1, prepend=0)
+    hotspot_counts = np.diff(cumulative_hotspots[counts_not_above], axis=1, prepend=0)
+    correlations = np.divide(hotspot_counts, counts, out=np.zeros(counts.shape), where=counts > 0)
+
+    scores = np.zeros(thresholds.shape[0])
+    for i, (weight, inverted) in enumerate(zip(SCORE_WEIGHTS, SCORE_INVERTED)):
+        correlation = 1 - correlations[:, i] if inverted else correlations[:, i]
+        scores = scores + correlation * weight
+    return scores / SCORE_TOTAL_WEIGHT
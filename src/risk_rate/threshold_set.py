@@ -0,0 +1,78 @@
+"""Module which contains the ThresholdSet class"""
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.enum.risk_rate_index_enum import RiskRateIndexEnum
+from src.risk_rate import threshold_search_operations
+
+
+class ThresholdSet:
+    """
+    The ThresholdSet entity
+    It holds the probability thresholds of the risk rate indexes (Nulo, Pequeno, Médio, Alto and Muito alto),
+    in that order, and classifies probabilities with them. It cannot be changed once created, so that the same
+    set can be shared by threads (e.g. parallel threshold evaluation or a prediction server with many models)
+    """
+
+    def __init__(self, thresholds: Sequence[float]):
+        """
+        Class constructor
+        :param thresholds: the threshold of each risk rate index, in increasing order
+        """
+        values = np.array(thresholds, dtype=np.float64)
+        if values.shape != (len(RiskRateIndexEnum),):
+            raise ValueError("Parameter thresholds must have one threshold per risk rate index")
+        if np.any(values[1:] < values[:-1]):
+            raise ValueError("Parameter thresholds must be in increasing order")
+        values.flags.writeable = False
+        self.__values = values
+
+    @classmethod
+    def get_default(cls) -> "ThresholdSet":
+        """
+        Get the default thresholds of the risk rate indexes
+        :return: the threshold set
+        """
+        return cls([risk_rate.prob_threshold for risk_rate in RiskRateIndexEnum])
+
+    @property
+    def thresholds(self) -> List[float]:
+        """
+        Getter for thresholds
+        :return: the threshold of each risk rate index
+        """
+        return self.__values.tolist()
+
+    def get_risk_rate_indexes(self, probabilities: Sequence[float]) -> np.ndarray:
+        """
+        Get the risk rate index of each probability, that is, the first one whose threshold is not below it
+        :param probabilities: the probabilities
+        :return: the position of the risk rate index of each probability, or NO_INDEX if above every threshold
+        """
+        return threshold_search_operations.get_risk_rate_indexes(probabilities, self.__values)
+
+    def classify(self, probabilities: Sequence[float]) -> List[Optional[str]]:
+        """
+        Convert probabilities to risk rates
+        :param probabilities: the probabilities
+        :return: the risk rates, or None for the probabilities above every threshold
+        """
+        # NO_INDEX (-1) selects the last name
+        names = np.array([risk_rate.value for risk_rate in RiskRateIndexEnum] + [None], dtype=object)
+        return names[self.get_risk_rate_indexes(probabilities)].tolist()
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Whether two threshold sets have the same thresholds
+        :param other: the other threshold set
+        :return: whether they are equal
+        """
+        return isinstance(other, ThresholdSet) and self.thresholds == other.thresholds
+
+    def __hash__(self) -> int:
+        """
+        Hash of the thresholds
+        :return: the hash
+        """
+        return hash(tuple(self.thresholds))
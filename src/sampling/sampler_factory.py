@@ -2,28 +2,28 @@
 
 from src.enum.sampling_methods_enum import SamplingMethodEnum
 from src.exception.not_implemented_exception import NotImplementedException
-from src.sampling.adasyn_sampler import ADASYNSampler
-from src.sampling.all_knn_sampler import AllKNNSampler
-from src.sampling.borderline_smote_sampler import BorderlineSMOTESampler
-from src.sampling.cluster_centroids_sampler import ClusterCentroidsSampler
-from src.sampling.edited_nearest_neighbours_sampler import \
-    EditedNearestNeighboursSampler
-from src.sampling.instance_hardness_threshold_sampler import \
-    InstanceHardnessThresholdSampler
-from src.sampling.near_miss_sampler import NearMissSampler
-from src.sampling.neighbourhood_cleaning_rule_sampler import \
-    NeighbourhoodCleaningRuleSampler
-from src.sampling.none_sampler import NoneSampler
-from src.sampling.one_sided_selection_sampler import OneSidedSelectionSampler
-from src.sampling.random_over_sampler import RandomOverSampler
-from src.sampling.random_under_sampler import RandomUnderSampler
-from src.sampling.repeated_edited_nearested_neighbours_sampler import \
-    RepeatedEditedNearestNeighboursSampler
 from src.sampling.sampler import Sampler
-from src.sampling.smote_sampler import SMOTESampler
-from src.sampling.smoteenn_sampler import SMOTEENNSampler
-from src.sampling.smotetomek_sampler import SMOTETomekSampler
-from src.sampling.svmsmote_sampler import SVMSMOTESampler
+
+# The modules of the samplers, imported when they are chosen. They are code dependencies of the factory nonetheless
+LAZY_MODULE_NAMES = [
+    "src.sampling.none_sampler",
+    "src.sampling.random_over_sampler",
+    "src.sampling.smote_sampler",
+    "src.sampling.adasyn_sampler",
+    "src.sampling.borderline_smote_sampler",
+    "src.sampling.svmsmote_sampler",
+    "src.sampling.random_under_sampler",
+    "src.sampling.cluster_centroids_sampler",
+    "src.sampling.near_miss_sampler",
+    "src.sampling.edited_nearest_neighbours_sampler",
+    "src.sampling.repeated_edited_nearested_neighbours_sampler",
+    "src.sampling.all_knn_sampler",
+    "src.sampling.one_sided_selection_sampler",
+    "src.sampling.neighbourhood_cleaning_rule_sampler",
+    "src.sampling.instance_hardness_threshold_sampler",
+    "src.sampling.smoteenn_sampler",
+    "src.sampling.smotetomek_sampler",
+]
 
 
 def get(sampling_method: SamplingMethodEnum) -> Sampler:
@@ -75,69 +75,87 @@ def get(sampling_method: SamplingMethodEnum) -> Sampler:
                                   .format(sampling_method.value))
 
 
-def __none() -> NoneSampler:
+# Each sampler is imported when it is chosen, so that imbalanced-learn is only imported by the samplers using it
+def __none() -> Sampler:
+    from src.sampling.none_sampler import NoneSampler
     return NoneSampler()
 
 
-def __roversampler() -> RandomOverSampler:
+def __roversampler() -> Sampler:
+    from src.sampling.random_over_sampler import RandomOverSampler
     return RandomOverSampler()
 
 
-def __smote() -> SMOTESampler:
+def __smote() -> Sampler:
+    from src.sampling.smote_sampler import SMOTESampler
     return SMOTESampler()
 
 
-def __adasyn() -> ADASYNSampler:
+def __adasyn() -> Sampler:
+    from src.sampling.adasyn_sampler import ADASYNSampler
     return ADASYNSampler()
 
 
-def __borderline_smote() -> BorderlineSMOTESampler:
+def __borderline_smote() -> Sampler:
+    from src.sampling.borderline_smote_sampler import BorderlineSMOTESampler
     return BorderlineSMOTESampler()
 
 
-def __svmsmote() -> SVMSMOTESampler:
+def __svmsmote() -> Sampler:
+    from src.sampling.svmsmote_sampler import SVMSMOTESampler
     return SVMSMOTESampler()
 
 
-def __rundersampler() -> RandomUnderSampler:
+def __rundersampler() -> Sampler:
+    from src.sampling.random_under_sampler import RandomUnderSampler
     return RandomUnderSampler()
 
 
-def __cluster_centroids() -> ClusterCentroidsSampler:
+def __cluster_centroids() -> Sampler:
+    from src.sampling.cluster_centroids_sampler import ClusterCentroidsSampler
     return ClusterCentroidsSampler()
 
 
-def __near_miss() -> NearMissSampler:
+def __near_miss() -> Sampler:
+    from src.sampling.near_miss_sampler import NearMissSampler
     return NearMissSampler()
 
 
-def __editednearestneighbours() -> EditedNearestNeighboursSampler:
+def __editednearestneighbours() -> Sampler:
+    from src.sampling.edited_nearest_neighbours_sampler import EditedNearestNeighboursSampler
     return EditedNearestNeighboursSampler()
 
 
-def __repeditednearestneighbours() -> RepeatedEditedNearestNeighboursSampler:
+def __repeditednearestneighbours() -> Sampler:
+    from src.sampling.repeated_edited_nearested_neighbours_sampler import RepeatedEditedNearestNeighboursSampler
     return RepeatedEditedNearestNeighboursSampler()
 
 
-def __allknn() -> AllKNNSampler:
+def __allknn() -> Sampler:
+    from src.sampling.all_knn_sampler import AllKNNSampler
     return AllKNNSampler()
 
 
-def __onesidedselection() -> OneSidedSelectionSampler:
+def __onesidedselection() -> Sampler:
+    from src.sampling.one_sided_selection_sampler import OneSidedSelectionSampler
     return OneSidedSelectionSampler()
 
 
-def __neighbourhoodcleaningrule() -> NeighbourhoodCleaningRuleSampler:
+def __neighbourhoodcleaningrule() -> Sampler:
+    from src.sampling.neighbourhood_cleaning_rule_sampler import NeighbourhoodCleaningRuleSampler
     return NeighbourhoodCleaningRuleSampler()
 
 
-def __instance_hardness_threshold() -> InstanceHardnessThresholdSampler:
+def __instance_hardness_threshold() -> Sampler:
+    from src.sampling.instance_hardness_threshold_sampler import InstanceHardnessThresholdSampler
     return InstanceHardnessThresholdSampler()
 
 
-def __smoteenn() -> SMOTEENNSampler:
+def __smoteenn() -> Sampler:
+    from src.sampling.smoteenn_sampler import SMOTEENNSampler
     return SMOTEENNSampler()
 
 
-def __smotetomek() -> SMOTETomekSampler:
+def __smotetomek() -> Sampler:
+    from src.sampling.smotetomek_sampler import SMOTETomekSampler
     return SMOTETomekSampler()
@@ -0,0 +1,126 @@
+"""Module which contains the DeployedModel class"""
+import os
+from pickle import load
+from typing import Any, List
+
+import config.forecast_settings as fccfg
+import config.general_settings as cfg
+
+from src.classification.algorithm import classifier_factory
+from src.classification.algorithm.classifier import Classifier
+from src.enum.inference_backends_enum import InferenceBackendEnum
+from src.forecasting.algorithm import forecaster_factory
+from src.forecasting.algorithm.forecaster import Forecaster
+from src.forecasting.numpy_model import NumpyModel
+from src.forecasting.tflite_model import TFLiteModel
+from src.sampling import sampler_factory
+from src.sampling.sampler import Sampler, SamplingMethodEnum
+from src.scaling import scaler_factory
+from src.scaling.scaler import Scaler
+from src.utils import fingerprint_utils
+
+
+class DeployedModel:
+    """
+    The DeployedModel entity
+    It holds the assets saved by DeployModelStep (scaler, forecaster, sampler, classifier and thresholds),
+    loaded from the deployed model directory
+    """
+
+    scaler: Scaler
+    forecaster: Forecaster
+    sampler: Sampler
+    classifier: Classifier
+    thresholds: List[float]
+
+    def __init__(self,
+                 scaler: Scaler,
+                 forecaster: Forecaster,
+                 sampler: Sampler,
+                 classifier: Classifier,
+                 thresholds: List[float]):
+        """
+        Class constructor
+        :param scaler: the fitted scaler
+        :param forecaster: the trained forecaster
+        :param sampler: the fitted sampler
+        :param classifier: the trained classifier
+        :param thresholds: the selected thresholds
+        """
+        self.scaler = scaler
+        self.forecaster = forecaster
+        self.sampler = sampler
+        self.classifier = classifier
+        self.thresholds = thresholds
+
+    @staticmethod
+    def get_file_paths(path: str) -> List[str]:
+        """
+        Get the files of a deployed model
+        :param path: the directory of the deployed model
+        :return: the file paths
+        """
+        # The model files only, since the risk rate states next to them change on every prediction
+        return [path + file_name for file_name in [cfg.DEFINITIONS_DICT_FILE_NAME, cfg.SCALER_FILE_NAME, cfg.FORECASTER_SUB_DIR,
+                                                   cfg.FORECASTER_WEIGHTS_FILE_NAME, cfg.FORECASTER_TFLITE_FILE_NAME,
+                                                   cfg.SAMPLER_FILE_NAME, cfg.CLASSIFIER_FILE_NAME]]
+
+    @staticmethod
+    def get_fingerprint(path: str) -> str:
+        """
+        Get the fingerprint of the files of a deployed model, which changes whenever another model is deployed
+        :param path: the directory of the deployed model
+        :return: the fingerprint
+        """
+        return fingerprint_utils.get_fingerprint_of_fingerprints({os.path.relpath(file_path, path): fingerprint_utils.get_file_fingerprint(file_path)
+                                                                  for file_path in DeployedModel.get_file_paths(path)})
+
+    @classmethod
+    def load(cls, path: str) -> "DeployedModel":
+        """
+        Loads a deployed model
+        :param path: the directory of the deployed model
+        :return: the deployed model
+        """
+        load_file_format = "{}{}"
+
+        definitions_dict = load(open(load_file_format.format(path, cfg.DEFINITIONS_DICT_FILE_NAME), 'rb'))
+
+        scaler = scaler_factory.get(definitions_dict[cfg.SCALING_METHOD_KEY])
+        scaler.scaler = load(open(load_file_format.format(path, cfg.SCALER_FILE_NAME), 'rb'))
+
+        # The mode the forecaster was trained with, since its model forecasts either one day or the whole horizon.
+        # Models deployed before it was saved fall back to FORECASTING_MODE
+        forecaster = forecaster_factory.get(definitions_dict[cfg.FORECASTING_ALGORITHM_KEY],
+                                            definitions_dict.get(cfg.FORECASTING_MODE_KEY))
+        forecaster.forecaster = cls.__load_forecaster_model(path)
+
+        sampler = sampler_factory.get(definitions_dict[cfg.SAMPLING_METHOD_KEY])
+        if sampler.method != SamplingMethodEnum.NONE:
+            sampler.sampler = load(open(load_file_format.format(path, cfg.SAMPLER_FILE_NAME), 'rb'))
+
+        classifier = classifier_factory.get(definitions_dict[cfg.CLASSIFICATION_ALGORITHM_KEY])
+        classifier.classifier = load(open(load_file_format.format(path, cfg.CLASSIFIER_FILE_NAME), 'rb'))
+
+        thresholds = definitions_dict[cfg.THRESHOLDS_KEY]
+
+        return cls(scaler, forecaster, sampler, classifier, thresholds)
+
+    @staticmethod
+    def __load_forecaster_model(path: str) -> Any:
+        """
+        Loads the model of the deployed forecaster for the INFERENCE_BACKEND: a NumpyModel from its weights,
+        a TFLiteModel from its conversion or the Keras model, which is also loaded if the backend files were not deployed
+        :param path: the directory of the deployed model
+        :return: the model
+        """
+        inference_backend = InferenceBackendEnum(fccfg.INFERENCE_BACKEND)
+        weights_file_path = path + cfg.FORECASTER_WEIGHTS_FILE_NAME
+        if inference_backend == InferenceBackendEnum.NUMPY and os.path.isfile(weights_file_path):
+            return NumpyModel.load(weights_file_path)
+        tflite_file_path = path + cfg.FORECASTER_TFLITE_FILE_NAME
+        if inference_backend == InferenceBackendEnum.TFLITE and os.path.isfile(tflite_file_path):
+            return TFLiteModel.load(tflite_file_path)
+
+        from tensorflow.keras.models import load_model
+        return load_model(path + cfg.FORECASTER_SUB_DIR)
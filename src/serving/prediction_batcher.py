@@ -0,0 +1,86 @@
+"""Module which contains the PredictionBatcher class"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple
+
+
+class PredictionBatcher:
+    """
+    The PredictionBatcher entity
+    It gathers the requests submitted by concurrent threads into batches, and runs each batch with a single call
+    of its predict function, on its own thread. A batch is run once it has max_batch_size requests, or batch_wait
+    seconds after its first request arrived
+    """
+
+    def __init__(self, predict: Callable[[List[Any]], List[Any]], max_batch_size: int, batch_wait: float):
+        """
+        Class constructor
+        :param predict: the function that answers a batch of requests, with one result per request, in order
+        :param max_batch_size: the maximum number of requests of a batch
+        :param batch_wait: how long (in seconds) a batch waits for more requests
+        """
+        if max_batch_size < 1:
+            raise ValueError("Parameter max_batch_size must be positive")
+        self.__predict = predict
+        self.__max_batch_size = max_batch_size
+        self.__batch_wait = batch_wait
+        self.__requests: "queue.Queue[Any]" = queue.Queue()
+        self.__thread = threading.Thread(target=self.__run, name="PredictionBatcher", daemon=True)
+        self.__thread.start()
+
+    def submit(self, request: Any) -> "Future[Any]":
+        """
+        Submits a request to the next batch
+        :param request: the request
+        :return: the future result of the request
+        """
+        future: "Future[Any]" = Future()
+        self.__requests.put((request, future))
+        return future
+
+    def stop(self) -> None:
+        """Stops the batcher, once the requests already submitted are answered"""
+        self.__requests.put(None)
+        self.__thread.join()
+
+    def __run(self) -> None:
+        """Gathers and runs the batches, until the batcher is stopped"""
+        stopped = False
+        while not stopped:
+            item = self.__requests.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.__batch_wait
+            while len(batch) < self.__max_batch_size:
+                try:
+                    item = self.__requests.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopped = True
+                    break
+                batch.append(item)
+            self.__run_batch(batch)
+
+    def __run_batch(self, batch: List[Tuple[Any, "Future[Any]"]]) -> None:
+        """
+        Runs a batch, and sets the result of each request.
+        If the batch fails, its requests are run one by one, so that a single bad request does not fail the others
+        :param batch: the requests and their futures
+        """
+        try:
+            results = self.__predict([request for request, _ in batch])
+        except Exception as exception:
+            if len(batch) == 1:
+                batch[0][1].set_exception(exception)
+                return
+            logging.warning("Batch of {} requests failed ({}), running them one by one".format(len(batch), exception))
+            for item in batch:
+                self.__run_batch([item])
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
@@ -0,0 +1,70 @@
+"""Module which contains the PredictionRequestHandler class"""
+import json
+import logging
+from http.server import BaseHTTPRequestHandler
+from typing import Any
+
+PREDICT_PATH = "/predict"
+HEALTH_PATH = "/health"
+
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    """
+    The PredictionRequestHandler entity
+    It answers the HTTP requests of the prediction service (the service attribute of its server):
+    POST /predict, with a JSON object whose rows are the recent climatic rows of a location, and GET /health
+    """
+
+    # Connections are kept alive and small responses are sent at once, so that a client pays no connection setup
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        """Answers GET requests"""
+        if self.path != HEALTH_PATH:
+            self.__send_json(404, {"error": "Path {} not found".format(self.path)})
+            return
+        self.__send_json(200, {"status": "ok"})
+
+    def do_POST(self) -> None:
+        """Answers POST requests"""
+        if self.path != PREDICT_PATH:
+            self.__send_json(404, {"error": "Path {} not found".format(self.path)})
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            rows = body["rows"]
+        except (ValueError, KeyError, TypeError):
+            self.__send_json(400, {"error": "Body must be a JSON object with the rows"})
+            return
+        try:
+            result = self.server.service.predict(rows)
+        except ValueError as exception:
+            self.__send_json(400, {"error": str(exception)})
+            return
+        except Exception as exception:
+            logging.exception("Prediction failed: {}".format(exception))
+            self.__send_json(500, {"error": "Prediction failed"})
+            return
+        self.__send_json(200, result)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """
+        Logs a request to the log file, instead of the standard error
+        :param format: the message format
+        :param args: the message arguments
+        """
+        logging.info("%s - %s", self.address_string(), format % args)
+
+    def __send_json(self, status: int, body: Any) -> None:
+        """
+        Sends a JSON response
+        :param status: the HTTP status
+        :param body: the response body
+        """
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
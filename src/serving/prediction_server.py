@@ -0,0 +1,41 @@
+"""
+Module that runs the prediction service over HTTP, with the deployed model loaded once and kept warm.
+POST /predict takes {"rows": [...]}, the recent climatic rows of a location (at least OBSERVATION_WINDOW rows,
+with the columns of the prediction data), and answers its present and forecasted probabilities and risk rates
+"""
+from http.server import ThreadingHTTPServer
+
+import config.general_settings as cfg
+import config.serving_settings as svcfg
+
+from src.serving.prediction_request_handler import PREDICT_PATH, PredictionRequestHandler
+from src.serving.prediction_service import PredictionService
+from src.utils.logging_utils import print_and_log
+
+
+def execute() -> None:
+    """Runs the prediction service, until it is interrupted"""
+    service = PredictionService(cfg.OUTPUT_DEPLOYED_MODEL_DIR)
+    server = create_server(service, svcfg.SERVE_HOST, svcfg.SERVE_PORT)
+    print_and_log("Serving predictions on http://{}:{}{}".format(svcfg.SERVE_HOST, server.server_address[1], PREDICT_PATH))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+def create_server(service: PredictionService, host: str, port: int) -> ThreadingHTTPServer:
+    """
+    Creates the HTTP server of a prediction service
+    :param service: the prediction service
+    :param host: the host
+    :param port: the port (0 picks a free one)
+    :return: the server, not started yet
+    """
+    server = ThreadingHTTPServer((host, port), PredictionRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
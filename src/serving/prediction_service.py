@@ -0,0 +1,99 @@
+"""Module which contains the PredictionService class"""
+import logging
+import threading
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+import config.serving_settings as svcfg
+
+from src.serving import serving_operations
+from src.serving.deployed_model import DeployedModel
+from src.serving.prediction_batcher import PredictionBatcher
+from src.utils import fingerprint_utils
+from src.utils.logging_utils import print_and_log
+
+
+class PredictionService:
+    """
+    The PredictionService entity
+    It loads the deployed model once, and answers the requests with it, in batches.
+    The deployed model files are checked every SERVE_RELOAD_INTERVAL seconds, and a new deployment is loaded
+    and swapped in without stopping the service. The requests already in a batch are answered by the old model
+    """
+
+    def __init__(self, path: str):
+        """
+        Class constructor
+        :param path: the directory of the deployed model
+        """
+        self.__path = path
+        self.__file_state = self.__get_file_state()
+        self.__pending_file_state = self.__file_state
+        self.__deployed_model = DeployedModel.load(path)
+        self.__batcher = PredictionBatcher(self.__predict_batch, svcfg.SERVE_MAX_BATCH_SIZE, svcfg.SERVE_BATCH_WAIT)
+        self.__stop_event = threading.Event()
+        self.__watcher = threading.Thread(target=self.__watch, name="DeployedModelWatcher", daemon=True)
+        self.__watcher.start()
+
+    @property
+    def deployed_model(self) -> DeployedModel:
+        """
+        Getter for deployed_model
+        :return: the deployed model answering the requests
+        """
+        return self.__deployed_model
+
+    def predict(self, rows: Any) -> Dict[str, Any]:
+        """
+        Predicts the present and forecasted probabilities and risk rates of a location
+        :param rows: the recent climatic rows of the location, in chronological order
+        :return: the result
+        """
+        return self.__batcher.submit(serving_operations.parse_rows(rows)).result()
+
+    def reload_if_changed(self) -> bool:
+        """
+        Loads the deployed model again if its files changed. A change is only loaded once the files are the same
+        in two checks in a row, so that a deployment still being written is not loaded
+        :return: whether the deployed model was loaded again
+        """
+        file_state = self.__get_file_state()
+        if file_state == self.__file_state or file_state != self.__pending_file_state:
+            self.__pending_file_state = file_state
+            return False
+        try:
+            deployed_model = DeployedModel.load(self.__path)
+        except Exception as exception:
+            logging.exception("The new deployed model could not be loaded: {}".format(exception))
+            return False
+        self.__deployed_model = deployed_model
+        self.__file_state = file_state
+        print_and_log("Deployed model loaded again from {}".format(self.__path))
+        return True
+
+    def stop(self) -> None:
+        """Stops the service, once the requests already submitted are answered"""
+        self.__stop_event.set()
+        self.__watcher.join()
+        self.__batcher.stop()
+
+    def __predict_batch(self, requests: List[pd.DataFrame]) -> List[Dict[str, Any]]:
+        """
+        Answers a batch of requests
+        :param requests: the rows of each request
+        :return: the result of each request
+        """
+        return serving_operations.predict(self.__deployed_model, requests)
+
+    def __watch(self) -> None:
+        """Checks the deployed model files, until the service is stopped"""
+        while not self.__stop_event.wait(svcfg.SERVE_RELOAD_INTERVAL):
+            self.reload_if_changed()
+
+    def __get_file_state(self) -> Tuple[str, ...]:
+        """
+        Get the state of the deployed model files
+        :return: the fingerprint of each file
+        """
+        return tuple(fingerprint_utils.get_file_fingerprint(file_path) for file_path in DeployedModel.get_file_paths(self.__path))
@@ -0,0 +1,103 @@
+"""
+Module that has all operations required to answer the requests of the prediction service.
+Each request holds the recent climatic rows of a location, in chronological order. Its present probability is
+predicted from its last row, and its forecasted probabilities from the days forecasted after its last row.
+The requests of a batch are forecasted and classified together: one forecaster call per day in the future
+(a single one in direct mode) and one classifier call, whatever the number of requests
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+import config.forecast_settings as fccfg
+
+import src.utils.pandas_utils as pdutils
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
+from src.forecasting.algorithm.forecaster import Forecaster
+from src.risk_rate.threshold_set import ThresholdSet
+from src.serving.deployed_model import DeployedModel
+
+
+def parse_rows(rows: Any) -> pd.DataFrame:
+    """
+    Parses the rows of a request
+    :param rows: the rows, as a list of objects with the climatic data columns
+    :return: the rows, with the climatic data columns only
+    """
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValueError("Parameter rows must be a list of objects")
+    if len(rows) < fccfg.OBSERVATION_WINDOW:
+        raise ValueError("Parameter rows must have at least {} rows".format(fccfg.OBSERVATION_WINDOW))
+    dataset = pd.DataFrame(rows)
+    missing_columns = [column for column in dscfg.CLIMATIC_DATA_SELECTED_COLUMNS if column not in dataset.columns]
+    if missing_columns:
+        raise ValueError("Parameter rows must have the columns {}".format(", ".join(missing_columns)))
+    dataset = pdutils.select_columns(dataset, dscfg.CLIMATIC_DATA_SELECTED_COLUMNS)
+    values = dataset[dscfg.COLUMNS_SCALING].apply(pd.to_numeric, errors="coerce")
+    if values.isna().any(axis=None):
+        raise ValueError("Parameter rows must have numeric values in the columns {}".format(", ".join(dscfg.COLUMNS_SCALING)))
+    dataset[dscfg.COLUMNS_SCALING] = values.astype(np.float64)
+    return dataset
+
+
+def predict(deployed_model: DeployedModel, requests: List[pd.DataFrame]) -> List[Dict[str, Any]]:
+    """
+    Predicts the present and forecasted probabilities and risk rates of a batch of requests
+    :param deployed_model: the deployed model
+    :param requests: the rows of each request, parsed by parse_rows
+    :return: the result of each request, in order
+    """
+    features = [pdutils.delete_columns(deployed_model.scaler.scale(rows), dscfg.COLUMNS_IGNORE_FOR_ML) for rows in requests]
+    columns = features[0].columns
+    values = [feature.to_numpy(dtype=np.float64) for feature in features]
+
+    windows = np.stack([value[-fccfg.OBSERVATION_WINDOW:] for value in values])
+    present = np.stack([value[-1] for value in values])
+    forecasted = forecast(deployed_model.forecaster, windows)
+
+    # The present and forecasted rows of every request, classified at once
+    X = np.concatenate([present[:, np.newaxis], forecasted.astype(np.float64)], axis=1)
+    probabilities = deployed_model.classifier.predict(pd.DataFrame(X.reshape((-1, X.shape[2])), columns=columns))[1].iloc[:, 1]
+    probabilities = probabilities.to_numpy(dtype=np.float64).reshape(X.shape[:2])
+    risk_rates = np.array(ThresholdSet(deployed_model.thresholds).classify(probabilities.ravel()), dtype=object).reshape(X.shape[:2])
+
+    return [__create_result(rows, request_probabilities, request_risk_rates)
+            for rows, request_probabilities, request_risk_rates in zip(requests, probabilities, risk_rates)]
+
+
+def forecast(forecaster: Forecaster, windows: np.ndarray) -> np.ndarray:
+    """
+    Forecasts the days after each observation window
+    :param forecaster: the trained forecaster
+    :param windows: the observation windows, with shape (n_windows, OBSERVATION_WINDOW, n_features)
+    :return: the forecasted values, with shape (n_windows, FORECAST_HORIZON, n_features)
+    """
+    if forecaster.mode == ForecastingModeEnum.DIRECT:
+        return forecaster.forecast_windows(windows)[:, :fccfg.FORECAST_HORIZON]
+
+    # Each forecasted day is appended to the windows, which then drop their first day
+    forecasted = []
+    for _ in range(0, fccfg.FORECAST_HORIZON):
+        forecasted_values = forecaster.forecast_windows(windows)
+        forecasted.append(forecasted_values)
+        windows = np.concatenate([windows[:, 1:], forecasted_values[:, np.newaxis].astype(windows.dtype)], axis=1)
+    return np.stack(forecasted, axis=1)
+
+
+def __create_result(rows: pd.DataFrame, probabilities: np.ndarray, risk_rates: np.ndarray) -> Dict[str, Any]:
+    """
+    Creates the result of a request
+    :param rows: the rows of the request
+    :param probabilities: the present probability followed by the forecasted ones
+    :param risk_rates: the present risk rate followed by the forecasted ones
+    :return: the result, with the date of the last row
+    """
+    return {
+        dscfg.DATE_COLUMN_NAME: str(rows[dscfg.DATE_COLUMN_NAME].iloc[-1]),
+        dscfg.PRESENT_COLUMN_NAME: {"probability": float(probabilities[0]), "risk_rate": risk_rates[0]},
+        dscfg.FORECASTED_COLUMN_NAME: [{"days_in_future": days_in_future, "probability": float(probability), "risk_rate": risk_rate}
+                                       for days_in_future, (probability, risk_rate) in enumerate(zip(probabilities[1:], risk_rates[1:]), start=1)]
+    }
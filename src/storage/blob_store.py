@@ -0,0 +1,228 @@
+"""
+Module which contains the BlobStore class
+It stores values by the fingerprint of their content, so that every unique value is written only once
+"""
+import os
+import pickle
+import shutil
+import threading
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+
+import pandas as pd
+
+from src.storage.storage_statistics import StorageStatistics
+from src.utils import fingerprint_utils, profiling_utils
+
+PARQUET_FORMAT = "parquet"
+NPY_FORMAT = "npy"
+KERAS_FORMAT = "keras"
+PICKLE_FORMAT = "pickle"
+
+FORMAT_SUFFIXES = {
+    PARQUET_FORMAT: ".parquet",
+    NPY_FORMAT: ".npy",
+    KERAS_FORMAT: "_model",
+    PICKLE_FORMAT: ".pkl"
+}
+
+
+class BlobStore:
+    """
+    The BlobStore entity
+    DataFrames are stored as Parquet files, arrays as .npy files (memory-mapped when loaded),
+    Keras models in their native format and everything else is pickled.
+    Blobs are named after the fingerprint of their content, and are never changed once written
+    """
+
+    root_dir: str
+    compression: Optional[str]
+    statistics: StorageStatistics
+
+    def __init__(self, root_dir: str, compression: Optional[str] = None, statistics: Optional[StorageStatistics] = None):
+        """
+        Class constructor
+        :param root_dir: the directory where blobs are stored
+        :param compression: the Parquet compression codec ("zstd", "lz4", "snappy"...), or None for no compression
+        :param statistics: the statistics to be updated, if they are shared with other stores
+        """
+        self.root_dir = root_dir
+        self.compression = compression
+        self.statistics = statistics if statistics is not None else StorageStatistics()
+
+    def put(self, value: Any) -> Dict[str, str]:
+        """
+        Stores a value, unless a value with the same content is already stored
+        :param value: the value
+        :return: the reference to the blob, to be kept in a manifest
+        """
+        if isinstance(value, pd.DataFrame) and self.__is_parquet_compatible(value):
+            blob_format = PARQUET_FORMAT
+        elif isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            blob_format = NPY_FORMAT
+        elif is_keras_model(value):
+            blob_format = KERAS_FORMAT
+        else:
+            blob_format = PICKLE_FORMAT
+
+        blob_id = fingerprint_utils.get_fingerprint(value)
+        fingerprint_utils.remember_fingerprint(value, blob_id)
+        return self.__put(value, {"format": blob_format, "blob": blob_id})
+
+    def __put(self, value: Any, reference: Dict[str, str]) -> Dict[str, str]:
+        """
+        Stores a value in the format of its reference, unless it is already stored
+        A DataFrame that pyarrow cannot convert is pickled instead
+        :param value: the value
+        :param reference: the reference to the blob
+        :return: the reference to the blob, whose format may have changed
+        """
+        path = self.__get_path(reference)
+        if os.path.exists(path):
+            self.statistics.record_deduplicated(self.__get_size(path))
+            return reference
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        blob_format = reference["format"]
+        temporary_path = "{}.tmp{}-{}{}".format(path, os.getpid(), threading.get_ident(), FORMAT_SUFFIXES[blob_format])
+        try:
+            self.__write(value, blob_format, temporary_path)
+        except (ValueError, TypeError, NotImplementedError):
+            # The Arrow errors derive from these
+            if blob_format != PARQUET_FORMAT:
+                raise
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return self.__put(value, {"format": PICKLE_FORMAT, "blob": reference["blob"]})
+        try:
+            os.replace(temporary_path, path)
+        except OSError:
+            # Written meanwhile by someone else, with the same content
+            shutil.rmtree(temporary_path, ignore_errors=True)
+        size = self.__get_size(path)
+        self.statistics.record_written(size)
+        profiling_utils.record_bytes_serialized(size)
+        return reference
+
+    def get(self, reference: Dict[str, str]) -> Any:
+        """
+        Loads a stored value. Its fingerprint is remembered, so that it is not computed again
+        while the value is not changed
+        :param reference: the reference to the blob, as returned when it was stored
+        :return: the value
+        """
+        path = self.__get_path(reference)
+        size = self.__get_size(path)
+        self.statistics.record_read(size)
+        profiling_utils.record_bytes_deserialized(size)
+        value = self.__read(reference["format"], path)
+        fingerprint_utils.remember_fingerprint(value, reference["blob"])
+        return value
+
+    def clean(self, referenced_blob_ids: Set[str]) -> None:
+        """
+        Removes the blobs that are not referenced anymore. No value must be stored meanwhile
+        :param referenced_blob_ids: the fingerprints of the blobs to be kept
+        """
+        if not os.path.isdir(self.root_dir):
+            return
+        for sub_dir_name in os.listdir(self.root_dir):
+            sub_dir = os.path.join(self.root_dir, sub_dir_name)
+            for blob_name in os.listdir(sub_dir):
+                blob_id = next((blob_name[:-len(suffix)] for suffix in FORMAT_SUFFIXES.values() if blob_name.endswith(suffix)), blob_name)
+                if blob_id in referenced_blob_ids:
+                    continue
+                path = os.path.join(sub_dir, blob_name)
+                self.statistics.record_removed(self.__get_size(path))
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+
+    def __read(self, blob_format: str, path: str) -> Any:
+        """
+        Reads a value in a given format
+        :param blob_format: the format
+        :param path: the path to be read
+        :return: the value
+        """
+        if blob_format == PARQUET_FORMAT:
+            return pd.read_parquet(path)
+        if blob_format == NPY_FORMAT:
+            # Copy-on-write memory map, so that the array is read lazily and can still be changed in memory
+            return np.load(path, mmap_mode='c', allow_pickle=False)
+        if blob_format == KERAS_FORMAT:
+            from tensorflow.keras.models import load_model
+            return load_model(path)
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+
+    def __write(self, value: Any, blob_format: str, path: str) -> None:
+        """
+        Writes a value in a given format
+        :param value: the value
+        :param blob_format: the format
+        :param path: the path to be written
+        """
+        if blob_format == PARQUET_FORMAT:
+            value.to_parquet(path, compression=self.compression)
+        elif blob_format == NPY_FORMAT:
+            np.save(path, value, allow_pickle=False)
+        elif blob_format == KERAS_FORMAT:
+            value.save(path)
+        else:
+            with open(path, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def __get_path(self, reference: Dict[str, str]) -> str:
+        """
+        Get the path of a blob, in a sub directory named after its first fingerprint characters
+        :param reference: the reference to the blob
+        :return: the path
+        """
+        blob_id = reference["blob"]
+        return os.path.join(self.root_dir, blob_id[:2], blob_id + FORMAT_SUFFIXES[reference["format"]])
+
+    def __get_size(self, path: str) -> int:
+        """
+        Get the size of a blob, in bytes
+        :param path: the blob path, either a file or a directory
+        :return: the size
+        """
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        return sum(os.path.getsize(os.path.join(dir_path, file_name))
+                   for dir_path, _, file_names in os.walk(path) for file_name in file_names)
+
+    def __is_parquet_compatible(self, dataframe: pd.DataFrame) -> bool:
+        """
+        Whether a DataFrame is restored exactly from Parquet. It requires unique string column names,
+        and the index frequency is lost. Object columns must hold strings only: other values either
+        cannot be converted or come back with another dtype (such as ints with None, which become floats)
+        :param dataframe: the DataFrame
+        :return: whether it is compatible or not
+        """
+        return (dataframe.columns.nlevels == 1
+                and dataframe.columns.is_unique
+                and all(isinstance(column, str) for column in dataframe.columns)
+                and getattr(dataframe.index, "freq", None) is None
+                and all(self.__holds_strings_only(column) for _, column in dataframe.items())
+                and self.__holds_strings_only(dataframe.index))
+
+    def __holds_strings_only(self, values: Any) -> bool:
+        """
+        Whether values of object dtype hold strings only (missing values aside). Values of any other dtype pass
+        :param values: the column or index
+        :return: whether they do or not
+        """
+        return values.dtype != object or pd.api.types.infer_dtype(values, skipna=True) in ["string", "empty"]
+
+
+def is_keras_model(value: Any) -> bool:
+    """
+    Whether a value is a Keras model, without importing tensorflow
+    :param value: the value
+    :return: whether it is a Keras model or not
+    """
+    return type(value).__module__.split(".")[0] in ["keras", "tensorflow"] and hasattr(value, "get_weights") and hasattr(value, "save")
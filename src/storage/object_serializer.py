@@ -0,0 +1,145 @@
+"""
+Module which contains the ObjectSerializer class
+It stores objects as a manifest that references the blobs holding their values
+"""
+import functools
+import importlib
+import json
+import os
+import threading
+from enum import Enum
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+import pandas as pd
+
+from src.storage.blob_store import BlobStore, is_keras_model
+
+SOURCE_PACKAGE = "src"
+
+OBJECT_FORMAT = "object"
+LIST_FORMAT = "list"
+TUPLE_FORMAT = "tuple"
+
+
+class ObjectSerializer:
+    """
+    The ObjectSerializer entity
+    Objects from this project are stored field by field, and lists holding DataFrames, arrays, models
+    or such objects item by item. Any other value is stored in the blob store, so that values shared
+    by many objects are written only once
+    """
+
+    blob_store: BlobStore
+
+    def __init__(self, blob_store: BlobStore):
+        """
+        Class constructor
+        :param blob_store: the blob store for the object values
+        """
+        self.blob_store = blob_store
+
+    def save(self, obj: Any, file_path: str) -> None:
+        """
+        Saves an object manifest into a file. The file is written atomically: it either describes the
+        whole object or does not exist
+        :param obj: the object
+        :param file_path: the manifest file path
+        """
+        manifest = self.__describe_value(obj)
+        temporary_file_path = "{}.tmp{}-{}".format(file_path, os.getpid(), threading.get_ident())
+        with open(temporary_file_path, 'w') as file:
+            json.dump(manifest, file, indent=4)
+        os.replace(temporary_file_path, file_path)
+
+    def load(self, file_path: str) -> Any:
+        """
+        Loads an object from its manifest file
+        :param file_path: the manifest file path
+        :return: the object
+        """
+        with open(file_path, 'r') as file:
+            manifest = json.load(file)
+        return self.__load_value(manifest)
+
+    def load_lazily(self, file_path: str) -> Tuple[type, Dict[str, Callable[[], Any]]]:
+        """
+        Loads the class of an object from its manifest file, and one loader per field,
+        so that each field is only read when it is needed
+        :param file_path: the manifest file path of an object from this project
+        :return: the object class and the field loaders, by field name
+        """
+        with open(file_path, 'r') as file:
+            manifest = json.load(file)
+        if manifest["format"] != OBJECT_FORMAT:
+            raise TypeError("Only objects from this project can be loaded lazily: {}".format(file_path))
+        return (self.__load_class(manifest),
+                {name: functools.partial(self.__load_value, entry) for name, entry in manifest["fields"].items()})
+
+    def contains(self, file_path: str) -> bool:
+        """
+        Whether an object manifest was saved into a file
+        :param file_path: the manifest file path
+        :return: whether it was saved or not
+        """
+        return os.path.isfile(file_path)
+
+    def __describe_value(self, value: Any) -> Dict[str, Any]:
+        """
+        Describes a value, storing its leaves in the blob store
+        :param value: the value
+        :return: the manifest entry that describes how to load it
+        """
+        if isinstance(value, (list, tuple)) and any(self.__is_structured(item) for item in value):
+            return {"format": LIST_FORMAT if isinstance(value, list) else TUPLE_FORMAT,
+                    "items": [self.__describe_value(item) for item in value]}
+        if self.__is_source_object(value):
+            return {"format": OBJECT_FORMAT,
+                    "module": type(value).__module__,
+                    "class": type(value).__qualname__,
+                    "fields": {name: self.__describe_value(field) for name, field in vars(value).items()}}
+        return self.blob_store.put(value)
+
+    def __load_value(self, entry: Dict[str, Any]) -> Any:
+        """
+        Loads a value described by a manifest entry
+        :param entry: the manifest entry
+        :return: the value
+        """
+        if entry["format"] in [LIST_FORMAT, TUPLE_FORMAT]:
+            items = [self.__load_value(item) for item in entry["items"]]
+            return items if entry["format"] == LIST_FORMAT else tuple(items)
+        if entry["format"] == OBJECT_FORMAT:
+            object_class = self.__load_class(entry)
+            obj = object_class.__new__(object_class)
+            for name, field_entry in entry["fields"].items():
+                setattr(obj, name, self.__load_value(field_entry))
+            return obj
+        return self.blob_store.get(entry)
+
+    def __load_class(self, entry: Dict[str, Any]) -> type:
+        """
+        Loads the class of an object described by a manifest entry
+        :param entry: the manifest entry
+        :return: the class
+        """
+        return functools.reduce(getattr, entry["class"].split("."), importlib.import_module(entry["module"]))
+
+    def __is_structured(self, value: Any) -> bool:
+        """
+        Whether a value is worth storing on its own, instead of inside the list that holds it
+        :param value: the value
+        :return: whether it is structured or not
+        """
+        return isinstance(value, (pd.DataFrame, np.ndarray)) or is_keras_model(value) or self.__is_source_object(value)
+
+    def __is_source_object(self, value: Any) -> bool:
+        """
+        Whether a value is an object from a class of this project (enums excluded)
+        :param value: the value
+        :return: whether it is or not
+        """
+        return (type(value).__module__.startswith(SOURCE_PACKAGE + ".")
+                and hasattr(value, "__dict__")
+                and not isinstance(value, (Enum, type)))
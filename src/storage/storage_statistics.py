@@ -0,0 +1,81 @@
+"""
+Module which contains the StorageStatistics class
+It accumulates how many bytes were written, deduplicated, read and removed by the blob store
+"""
+import threading
+
+
+class StorageStatistics:
+    """
+    The StorageStatistics entity
+    It can be shared by steps running concurrently, so it is only updated through its record methods
+    """
+
+    bytes_written: int
+    bytes_deduplicated: int
+    bytes_read: int
+    blobs_written: int
+    blobs_deduplicated: int
+    bytes_removed: int
+    blobs_removed: int
+
+    def __init__(self):
+        """Class constructor"""
+        self.bytes_written = 0
+        self.bytes_deduplicated = 0
+        self.bytes_read = 0
+        self.blobs_written = 0
+        self.blobs_deduplicated = 0
+        self.bytes_removed = 0
+        self.blobs_removed = 0
+        self.__lock = threading.Lock()
+
+    def record_written(self, size: int) -> None:
+        """
+        Records a blob that was written
+        :param size: the blob size, in bytes
+        """
+        with self.__lock:
+            self.blobs_written += 1
+            self.bytes_written += size
+
+    def record_deduplicated(self, size: int) -> None:
+        """
+        Records a blob that was not written, since it was already stored
+        :param size: the blob size, in bytes
+        """
+        with self.__lock:
+            self.blobs_deduplicated += 1
+            self.bytes_deduplicated += size
+
+    def record_read(self, size: int) -> None:
+        """
+        Records a blob that was read
+        :param size: the blob size, in bytes
+        """
+        with self.__lock:
+            self.bytes_read += size
+
+    def record_removed(self, size: int) -> None:
+        """
+        Records a blob that was removed, since no stored object references it anymore
+        :param size: the blob size, in bytes
+        """
+        with self.__lock:
+            self.blobs_removed += 1
+            self.bytes_removed += size
+
+    def get_summary(self) -> str:
+        """
+        Get a readable summary of the statistics
+        :return: the summary
+        """
+        return "{} blobs written ({} bytes), {} blobs deduplicated ({} bytes saved), {} bytes read, {} blobs removed ({} bytes freed)".format(
+            self.blobs_written,
+            self.bytes_written,
+            self.blobs_deduplicated,
+            self.bytes_deduplicated,
+            self.bytes_read,
+            self.blobs_removed,
+            self.bytes_removed
+        )
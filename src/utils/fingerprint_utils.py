@@ -0,0 +1,357 @@
+"""
+Module with utilities for fingerprinting objects, files and code
+A fingerprint is a hexadecimal digest that only changes when the content changes
+"""
+import ast
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import os
+import pickle
+import sys
+import weakref
+from enum import Enum
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+import pandas as pd
+
+SOURCE_PACKAGE = "src"
+CONFIG_PACKAGE = "config"
+# The module global listing the modules a module imports only when they are needed (such as the factories),
+# which are code dependencies as well
+LAZY_MODULE_NAMES_GLOBAL = "LAZY_MODULE_NAMES"
+# The settings module global listing the settings that only change how the code runs, not its results
+EXECUTION_SETTINGS_GLOBAL = "EXECUTION_SETTINGS"
+FILE_CHUNK_SIZE = 1024 * 1024
+
+# Fingerprints already known for leaf objects (DataFrames, arrays, models...), by object id
+__known_fingerprints: Dict[int, Tuple[Any, str]] = {}
+
+
+def get_fingerprint(obj: Any) -> str:
+    """
+    Get the fingerprint of a python object
+    DataFrames and arrays are hashed by content, without pickling them. Containers are hashed from
+    the fingerprints of the leaf objects they hold, so a known leaf fingerprint is never computed again
+    :param obj: the object
+    :return: the fingerprint
+    """
+    if __is_leaf(obj):
+        return __get_leaf_fingerprint(obj)
+    digest = hashlib.sha256()
+    __update_digest(digest, obj)
+    return digest.hexdigest()
+
+
+def remember_fingerprint(obj: Any, fingerprint: str) -> None:
+    """
+    Remembers the fingerprint of a leaf object (such as a DataFrame, an array or a model), for as long as it lives.
+    The object must not be changed afterwards, unless forget_fingerprints is called for it
+    :param obj: the object
+    :param fingerprint: its fingerprint, as returned by get_fingerprint
+    """
+    if not __is_leaf(obj):
+        return
+    try:
+        reference = weakref.ref(obj, __forget_dead_object)
+    except TypeError:
+        return
+    __known_fingerprints[id(obj)] = (reference, fingerprint)
+
+
+def forget_fingerprints(obj: Any) -> None:
+    """
+    Forgets the fingerprints remembered for an object and every leaf object it holds,
+    since they are about to be changed
+    :param obj: the object
+    """
+    if __is_leaf(obj):
+        __known_fingerprints.pop(id(obj), None)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            forget_fingerprints(item)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            forget_fingerprints(value)
+    elif __is_source_object(obj):
+        forget_fingerprints(vars(obj))
+
+
+def get_fingerprint_of_fingerprints(fingerprints: Dict[str, str]) -> str:
+    """
+    Get a single fingerprint from named fingerprints, regardless of their order
+    :param fingerprints: the fingerprints, by name
+    :return: the combined fingerprint
+    """
+    digest = hashlib.sha256()
+    for name in sorted(fingerprints):
+        digest.update("{}={};".format(name, fingerprints[name]).encode())
+    return digest.hexdigest()
+
+
+def get_file_fingerprint(path: str) -> str:
+    """
+    Get the fingerprint of a file or directory content
+    Missing paths have their own fingerprint, so that creating them invalidates it
+    :param path: the file or directory path
+    :return: the fingerprint
+    """
+    digest = hashlib.sha256()
+    if os.path.isdir(path):
+        for dir_path, dir_names, file_names in os.walk(path):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                file_path = os.path.join(dir_path, file_name)
+                digest.update(os.path.relpath(file_path, path).encode())
+                __update_digest_with_file(digest, file_path)
+    elif os.path.isfile(path):
+        __update_digest_with_file(digest, path)
+    else:
+        digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def get_settings_fingerprint(settings_module: ModuleType) -> str:
+    """
+    Get the fingerprint of a settings module, considering only its upper case variables
+    The settings listed in EXECUTION_SETTINGS (such as the workers) are left out
+    :param settings_module: the settings module (from config package)
+    :return: the fingerprint
+    """
+    execution_settings = set(vars(settings_module).get(EXECUTION_SETTINGS_GLOBAL, [])) | {EXECUTION_SETTINGS_GLOBAL}
+    settings = {name: value for name, value in vars(settings_module).items() if name.isupper() and name not in execution_settings}
+    return get_fingerprint(settings)
+
+
+def get_code_dependencies(module: ModuleType) -> Tuple[List[ModuleType], List[ModuleType]]:
+    """
+    Get the source and settings modules that a module depends on, directly or not
+    Only modules from the src and config packages are followed. The modules listed in LAZY_MODULE_NAMES
+    are followed from their source, without running them, so that their libraries are not imported
+    :param module: the module
+    :return: the source modules (including the module itself) and the settings modules, sorted by name
+    """
+    source_modules = {module.__name__: module}
+    settings_modules = {}
+    modules_to_visit = [module]
+    while modules_to_visit:
+        current_module = modules_to_visit.pop()
+        dependencies = [__get_defining_module(value) for value in list(vars(current_module).values())]
+        dependencies += [__get_lazy_module(name) for name in vars(current_module).get(LAZY_MODULE_NAMES_GLOBAL, [])]
+        for dependency in dependencies:
+            if dependency is None:
+                continue
+            if __belongs_to_package(dependency, CONFIG_PACKAGE):
+                settings_modules[dependency.__name__] = dependency
+            elif __belongs_to_package(dependency, SOURCE_PACKAGE) and dependency.__name__ not in source_modules:
+                source_modules[dependency.__name__] = dependency
+                modules_to_visit.append(dependency)
+    return ([source_modules[name] for name in sorted(source_modules)],
+            [settings_modules[name] for name in sorted(settings_modules)])
+
+
+def get_code_fingerprint(modules: List[ModuleType]) -> str:
+    """
+    Get the fingerprint of the source code of modules
+    :param modules: the modules
+    :return: the fingerprint
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(module.__name__.encode())
+        __update_digest_with_file(digest, module.__file__)
+    return digest.hexdigest()
+
+
+def __get_defining_module(value: Any) -> Any:
+    """
+    Get the module in which a module global was defined
+    :param value: the module global
+    :return: the module, or None if it is not a module, class nor function
+    """
+    if inspect.ismodule(value):
+        return value
+    if inspect.isclass(value) or inspect.isfunction(value):
+        return sys.modules.get(value.__module__)
+    return None
+
+
+def __get_lazy_module(name: str) -> ModuleType:
+    """
+    Get a module imported only when it is needed, without running it: its globals are the src and config
+    modules it imports, so that the same dependencies are followed whether it was already imported or not
+    :param name: the module name
+    :return: the module
+    """
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError("No module named {}".format(name))
+    module = importlib.util.module_from_spec(spec)
+    with open(module.__file__, 'rb') as file:
+        tree = ast.parse(file.read(), module.__file__)
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if __is_followed(alias.name):
+                    setattr(module, alias.asname or alias.name, importlib.import_module(alias.name))
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and __is_followed(node.module):
+            imported_module = importlib.import_module(node.module)
+            for alias in node.names:
+                # The imported name may be a module itself, as in "from src.sampling import sampler_factory"
+                value = getattr(imported_module, alias.name, None)
+                if value is None:
+                    value = importlib.import_module("{}.{}".format(node.module, alias.name))
+                setattr(module, alias.asname or alias.name, value)
+    return module
+
+
+def __is_followed(module_name: str) -> bool:
+    """
+    Check whether a module name belongs to the src or config packages
+    :param module_name: the module name
+    :return: whether it belongs or not
+    """
+    return module_name.split(".")[0] in (SOURCE_PACKAGE, CONFIG_PACKAGE)
+
+
+def __belongs_to_package(module: ModuleType, package: str) -> bool:
+    """
+    Check whether a module belongs to a package
+    :param module: the module
+    :param package: the package name
+    :return: whether it belongs or not
+    """
+    return module.__name__ == package or module.__name__.startswith(package + ".")
+
+
+def __update_digest_with_file(digest: Any, file_path: str) -> None:
+    """
+    Update a digest with a file content
+    :param digest: the digest
+    :param file_path: the file path
+    """
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(FILE_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+
+def __forget_dead_object(reference: Any) -> None:
+    """
+    Forgets the fingerprint of an object that no longer exists
+    :param reference: the weak reference to the object
+    """
+    for object_id, (known_reference, _) in list(__known_fingerprints.items()):
+        if known_reference is reference:
+            __known_fingerprints.pop(object_id, None)
+
+
+def __is_leaf(obj: Any) -> bool:
+    """
+    Whether an object is a leaf, that is, it is hashed as a whole and its fingerprint can be remembered
+    :param obj: the object
+    :return: whether it is a leaf or not
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str, bytes, Enum, list, tuple, dict)):
+        return False
+    return not __is_source_object(obj)
+
+
+def __is_source_object(obj: Any) -> bool:
+    """
+    Whether an object is from a class of this project, hashed field by field
+    :param obj: the object
+    :return: whether it is or not
+    """
+    return type(obj).__module__.startswith(SOURCE_PACKAGE + ".") and hasattr(obj, "__dict__") and not isinstance(obj, (Enum, type))
+
+
+def __get_leaf_fingerprint(obj: Any) -> str:
+    """
+    Get the fingerprint of a leaf object, unless it is already known
+    :param obj: the leaf object
+    :return: the fingerprint
+    """
+    known_fingerprint = __known_fingerprints.get(id(obj))
+    if known_fingerprint is not None and known_fingerprint[0]() is obj:
+        return known_fingerprint[1]
+    digest = hashlib.sha256()
+    __update_digest_with_leaf(digest, obj)
+    return digest.hexdigest()
+
+
+def __update_digest(digest: Any, obj: Any) -> None:
+    """
+    Update a digest with an object, recursively
+    :param digest: the digest
+    :param obj: the object
+    """
+    if __is_leaf(obj):
+        digest.update("leaf:{};".format(__get_leaf_fingerprint(obj)).encode())
+    elif obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+        digest.update("{}:{!r};".format(type(obj).__name__, obj).encode())
+    elif isinstance(obj, Enum):
+        digest.update("{}.{}:{!r};".format(type(obj).__module__, type(obj).__qualname__, obj.value).encode())
+    elif isinstance(obj, (list, tuple)):
+        digest.update("{}:{};".format(type(obj).__name__, len(obj)).encode())
+        for item in obj:
+            __update_digest(digest, item)
+    elif isinstance(obj, dict):
+        digest.update("dict:{};".format(len(obj)).encode())
+        for key in sorted(obj, key=repr):
+            __update_digest(digest, key)
+            __update_digest(digest, obj[key])
+    else:
+        digest.update("{}.{};".format(type(obj).__module__, type(obj).__qualname__).encode())
+        __update_digest(digest, vars(obj))
+
+
+def __update_digest_with_leaf(digest: Any, obj: Any) -> None:
+    """
+    Update a digest with the content of a leaf object
+    :param digest: the digest
+    :param obj: the leaf object
+    """
+    if isinstance(obj, pd.DataFrame):
+        digest.update("DataFrame:{!r}:{!r};".format(list(obj.columns), [str(dtype) for dtype in obj.dtypes]).encode())
+        __update_digest_with_pandas_object(digest, obj)
+    elif isinstance(obj, pd.Series):
+        digest.update("Series:{!r}:{};".format(obj.name, obj.dtype).encode())
+        __update_digest_with_pandas_object(digest, obj)
+    elif isinstance(obj, np.ndarray):
+        digest.update("ndarray:{}:{};".format(obj.shape, obj.dtype).encode())
+        if obj.dtype.hasobject:
+            digest.update(pickle.dumps(obj.tolist()))
+        else:
+            digest.update(np.ascontiguousarray(obj).tobytes())
+    elif hasattr(obj, "get_weights") and hasattr(obj, "to_json"):
+        # Keras models are hashed by architecture and weights, since their pickle is not stable
+        digest.update("model:{};".format(obj.to_json()).encode())
+        __update_digest(digest, obj.get_weights())
+    else:
+        digest.update("{}.{};".format(type(obj).__module__, type(obj).__qualname__).encode())
+        digest.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def __update_digest_with_pandas_object(digest: Any, obj: Any) -> None:
+    """
+    Update a digest with the content of a DataFrame or a Series
+    Object columns whose cells cannot be hashed by pandas (such as lists) are hashed from their pickled values
+    :param digest: the digest
+    :param obj: the DataFrame or Series
+    """
+    try:
+        digest.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+        return
+    except TypeError:
+        pass
+    digest.update(pd.util.hash_pandas_object(obj.index).values.tobytes())
+    columns = obj.items() if isinstance(obj, pd.DataFrame) else [(obj.name, obj)]
+    for _, column in columns:
+        try:
+            digest.update(pd.util.hash_pandas_object(column, index=False).values.tobytes())
+        except TypeError:
+            digest.update(pickle.dumps(column.tolist(), protocol=pickle.HIGHEST_PROTOCOL))
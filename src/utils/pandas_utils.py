@@ -1,6 +1,8 @@
 """Module with utilities for handling pandas dataframes"""
 from typing import Any, Hashable, List, Union
 
+import numpy as np
+
 import pandas as pd
 
 import config.dataset_settings as dscfg
@@ -96,16 +98,28 @@ def select_value_row_column(dataframe: pd.DataFrame,
     return dataframe.loc[dataframe.index[row], column]
 
 
+def select_column_values(dataframe: pd.DataFrame,
+                         column: Union[str, int]) -> np.ndarray:
+    """
+    Select the values of a column as a contiguous float array.
+    :param dataframe: the input dataframe
+    :param column: the column name or index
+    :return: the column values, in row order
+    """
+    if isinstance(column, int):
+        column = dataframe.columns[column]
+    return np.ascontiguousarray(dataframe[column].to_numpy(dtype=np.float64))
+
+
 def join_dataframes_x_wise(dataframes: List[pd.DataFrame],
                            drop_column_names: bool = False) -> pd.DataFrame:
     """
     Join two dataframes row-wise (x-axis).
     :param dataframes: the list of dataframes to be joined x-wise
     :param drop_column_names: whether to drop the column names of not
-    :return: the new dataframe
+    :return: the new dataframe, the given dataframes are not changed
     """
-    for dataframe in dataframes:
-        dataframe.reset_index(drop=True, inplace=True)
+    dataframes = [dataframe.reset_index(drop=True) for dataframe in dataframes]
 
     if drop_column_names:
         for dataframe in dataframes:
@@ -116,7 +130,7 @@ def join_dataframes_x_wise(dataframes: List[pd.DataFrame],
         if output_dataframe is None:
             output_dataframe = dataframe
         else:
-            output_dataframe = pd.concat([output_dataframe, dataframe.reset_index(drop=True)], ignore_index=True)
+            output_dataframe = pd.concat([output_dataframe, dataframe], ignore_index=True)
     return output_dataframe
 
 
@@ -126,11 +140,11 @@ def join_dataframes_y_wise(dataframes: List[pd.DataFrame],
     Join two dataframes column-wise (y-axis).
     :param dataframes: the list of dataframes to be joined y-wise
     :param drop_duplicates: whether to drop duplicated columns or not
-    :return: the new dataframe
+    :return: the new dataframe, the given dataframes are not changed
     """
+    dataframes = [dataframe.reset_index(drop=True) for dataframe in dataframes]
     column_names = []
     for dataframe in dataframes:
-        dataframe.reset_index(drop=True, inplace=True)
         column_names += list(dataframe.columns)
 
     output_dataframe = None
@@ -138,7 +152,7 @@ def join_dataframes_y_wise(dataframes: List[pd.DataFrame],
         if output_dataframe is None:
             output_dataframe = dataframe
         else:
-            output_dataframe = pd.concat([output_dataframe, dataframe.reset_index(drop=True)], ignore_index=True, axis=1)
+            output_dataframe = pd.concat([output_dataframe, dataframe], ignore_index=True, axis=1)
 
     output_dataframe.columns = column_names
     if drop_duplicates:
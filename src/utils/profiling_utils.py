@@ -0,0 +1,64 @@
+"""
+Module with utilities for profiling the pipeline execution
+Profiling is enabled by setting a profiler in the execution context. When it is not set, they do nothing
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from src.pipeline import execution_context
+from src.profiling.profile_span import ProfileSpan
+
+# The innermost span open in the current context, within which new spans are nested
+__current_span: ContextVar = ContextVar("current_profile_span", default=None)
+
+
+@contextmanager
+def profile(name: str, category: str, **args: Any) -> Iterator[Optional[ProfileSpan]]:
+    """
+    Measures a section of the pipeline execution, nested in the section being measured, if any
+    :param name: the section name
+    :param category: the section category (pipeline, step, combination...)
+    :param args: extra values describing the section
+    :return: the span being measured, whose args may still be updated, or None if profiling is disabled
+    """
+    profiler = execution_context.get_profiler()
+    if profiler is None:
+        yield None
+        return
+    span = profiler.open_span(name, category, __current_span.get(), args)
+    token = __current_span.set(span)
+    try:
+        yield span
+    finally:
+        __current_span.reset(token)
+        profiler.close_span(span)
+
+
+def record_bytes_serialized(size: int) -> None:
+    """
+    Records bytes serialized within the sections being measured
+    :param size: the bytes serialized
+    """
+    __record_bytes(size, 0)
+
+
+def record_bytes_deserialized(size: int) -> None:
+    """
+    Records bytes deserialized within the sections being measured
+    :param size: the bytes deserialized
+    """
+    __record_bytes(0, size)
+
+
+def __record_bytes(bytes_serialized: int, bytes_deserialized: int) -> None:
+    """
+    Records bytes serialized or deserialized within the innermost span and the spans it is nested in
+    :param bytes_serialized: the bytes serialized
+    :param bytes_deserialized: the bytes deserialized
+    """
+    profiler = execution_context.get_profiler()
+    span = __current_span.get()
+    if profiler is None or span is None:
+        return
+    profiler.record_bytes(span, bytes_serialized, bytes_deserialized)
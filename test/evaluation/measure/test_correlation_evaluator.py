@@ -0,0 +1,30 @@
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_index_enum import RiskRateIndexEnum
+from src.evaluation.measure.correlation_evaluator import CorrelationEvaluator
+
+NULO = RiskRateIndexEnum.NULO.value
+PEQUENO = RiskRateIndexEnum.PEQUENO.value
+ALTO = RiskRateIndexEnum.ALTO.value
+
+
+def test_calculate():
+    dataset = pd.DataFrame({"present_fma_index": [NULO, NULO, PEQUENO, ALTO, ALTO, ALTO],
+                            "present_telicyn_index": [ALTO, ALTO, ALTO, ALTO, NULO, "xxx"],
+                            "present_fma_value": [0.0, 1.0, 2.0, 30.0, 40.0, 50.0],
+                            dscfg.HOTSPOT_IDENTIFIED_COLUMN_NAME: [0, 1, 0, 1, 1, 0]})
+    actual_return = CorrelationEvaluator().calculate(dataset)
+
+    risk_rates = [risk_rate.value for risk_rate in RiskRateIndexEnum]
+    expected_fma = {NULO: (0.5, 2), PEQUENO: (0.0, 1), ALTO: (2 / 3, 3)}
+    expected_telicyn = {NULO: (1.0, 1), ALTO: (0.5, 4)}
+    assert list(actual_return.keys()) == [dscfg.EVALUATION_METRIC_COLUMN_NAME,
+                                          "present_fma", "present_fma_count",
+                                          "present_telicyn", "present_telicyn_count"]
+    assert actual_return[dscfg.EVALUATION_METRIC_COLUMN_NAME] == ["correlation_" + risk_rate for risk_rate in risk_rates]
+    assert actual_return["present_fma"] == [expected_fma.get(risk_rate, (0, 0))[0] for risk_rate in risk_rates]
+    assert actual_return["present_fma_count"] == [expected_fma.get(risk_rate, (0, 0))[1] for risk_rate in risk_rates]
+    assert actual_return["present_telicyn"] == [expected_telicyn.get(risk_rate, (0, 0))[0] for risk_rate in risk_rates]
+    assert actual_return["present_telicyn_count"] == [expected_telicyn.get(risk_rate, (0, 0))[1] for risk_rate in risk_rates]
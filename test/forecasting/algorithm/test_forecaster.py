@@ -4,6 +4,7 @@ import pytest
 
 import config.forecast_settings as fccfg
 
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
 from src.forecasting.algorithm.forecaster import Forecaster
 
 
@@ -72,3 +73,56 @@ def test_get_assets():
     assert actual_n_features == expected_n_features
 
     fccfg.OBSERVATION_WINDOW = actual_observation_window
+
+
+def test_constructor_call_directly_forecast_windows():
+    windows = np.zeros((1, fccfg.OBSERVATION_WINDOW, 1))
+    with pytest.raises(Exception) as e_info:
+        Forecaster().forecast_windows(windows)
+    assert str(
+        e_info.value) == "Class Forecaster must not be called directly"
+
+
+def test_get_assets_views():
+    dataset = np.random.default_rng(0).random((40, 3))
+
+    actual_X, actual_y, actual_n_features = Forecaster().get_assets(dataset)
+
+    expected_X = np.array([dataset[i:i + fccfg.OBSERVATION_WINDOW] for i in range(len(dataset) - fccfg.OBSERVATION_WINDOW)])
+    expected_y = dataset[fccfg.OBSERVATION_WINDOW:]
+    assert np.array_equal(actual_X, expected_X)
+    assert np.array_equal(actual_y, expected_y)
+    assert actual_n_features == 3
+    assert np.shares_memory(actual_X, dataset)
+    assert np.shares_memory(actual_y, dataset)
+    assert not actual_X.flags.writeable
+
+
+def test_get_assets_short_dataset():
+    dataset = np.zeros((fccfg.OBSERVATION_WINDOW, 2))
+
+    actual_X, actual_y, actual_n_features = Forecaster().get_assets(dataset)
+
+    assert actual_X.shape == (0, fccfg.OBSERVATION_WINDOW, 2)
+    assert actual_y.shape == (0, 2)
+    assert actual_n_features == 2
+
+
+def test_get_assets_direct():
+    dataset = np.random.default_rng(0).random((40, 3))
+
+    actual_X, actual_y, actual_n_features = Forecaster(ForecastingModeEnum.DIRECT).get_assets(dataset)
+
+    n_windows = len(dataset) - fccfg.OBSERVATION_WINDOW - fccfg.FORECAST_HORIZON + 1
+    expected_X = np.array([dataset[i:i + fccfg.OBSERVATION_WINDOW] for i in range(n_windows)])
+    expected_y = np.array([dataset[i + fccfg.OBSERVATION_WINDOW:i + fccfg.OBSERVATION_WINDOW + fccfg.FORECAST_HORIZON]
+                           for i in range(n_windows)])
+    assert np.array_equal(actual_X, expected_X)
+    assert np.array_equal(actual_y, expected_y)
+    assert actual_n_features == 3
+    assert np.shares_memory(actual_y, dataset)
+
+
+def test_constructor_mode():
+    assert Forecaster().mode == ForecastingModeEnum(fccfg.FORECASTING_MODE)
+    assert Forecaster(ForecastingModeEnum.DIRECT).mode == ForecastingModeEnum.DIRECT
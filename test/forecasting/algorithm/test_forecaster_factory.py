@@ -2,7 +2,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import config.forecast_settings as fccfg
+
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
 from src.exception.not_implemented_exception import NotImplementedException
 from src.forecasting.algorithm import forecaster_factory
 from src.forecasting.algorithm.cnn_forecaster import CNNForecaster
@@ -25,6 +28,11 @@ def test_get_cnn():
     assert isinstance(algorithm, CNNForecaster)
 
 
+def test_get_mode():
+    assert forecaster_factory.get(ForecastingAlgorithmEnum.LSTM).mode == ForecastingModeEnum(fccfg.FORECASTING_MODE)
+    assert forecaster_factory.get(ForecastingAlgorithmEnum.GRU, ForecastingModeEnum.DIRECT).mode == ForecastingModeEnum.DIRECT
+
+
 def test_get_invalid():
     with pytest.raises(TypeError) as e_info:
         forecaster_factory.get("xxx")
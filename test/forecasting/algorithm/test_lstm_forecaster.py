@@ -2,10 +2,11 @@ import numpy as np
 import pandas as pd
 
 from tensorflow.keras import Sequential
-from tensorflow.keras.layers import Dense, LSTM
+from tensorflow.keras.layers import Dense, LSTM, Reshape
 
 import config.forecast_settings as fccfg
 from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
 from src.forecasting.algorithm.lstm_forecaster import LSTMForecaster
 
 import pytest
@@ -55,6 +56,22 @@ def test_build_architecture():
     fccfg.OBSERVATION_WINDOW = actual_observation_window
 
 
+def test_build_architecture_direct():
+    dataset = pd.DataFrame({
+        'col1': np.arange(20, dtype=float),
+        'col2': np.arange(20, 40, dtype=float)
+    })
+
+    actual_X, actual_y, actual_architecture = LSTMForecaster(ForecastingModeEnum.DIRECT).build_architecture(dataset)
+
+    n_windows = dataset.shape[0] - fccfg.OBSERVATION_WINDOW - fccfg.FORECAST_HORIZON + 1
+    assert actual_X.shape == (n_windows, fccfg.OBSERVATION_WINDOW, 2)
+    assert actual_y.shape == (n_windows, fccfg.FORECAST_HORIZON, 2)
+    assert np.array_equal(actual_y[0], np.asarray(dataset)[fccfg.OBSERVATION_WINDOW:fccfg.OBSERVATION_WINDOW + fccfg.FORECAST_HORIZON])
+    assert actual_architecture.output_shape == (None, fccfg.FORECAST_HORIZON, 2)
+    assert isinstance(actual_architecture.layers[-1], Reshape)
+
+
 def test_evaluate_none_forecaster():
     valid_dataset = pd.DataFrame({'col': ['value']})
     with pytest.raises(Exception) as e_info:
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+import config.forecast_settings as fccfg
+
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
+from src.forecasting.algorithm.forecaster import Forecaster
+from src.forecasting.forecast_operations import create_forecasted_datasets
+
+
+class StubModel:
+    def predict(self, X, verbose=0):
+        X = np.asarray(X, dtype=np.float64)
+        weights = np.arange(1, X.shape[1] + 1, dtype=np.float64)
+        return (np.tensordot(weights, X, axes=([0], [1])) / weights.sum()).astype(np.float32)
+
+
+class DirectStubModel:
+    def predict(self, X, verbose=0):
+        forecasted = StubModel().predict(X)
+        return np.stack([forecasted + day for day in range(0, fccfg.FORECAST_HORIZON)], axis=1)
+
+
+class StubForecaster(Forecaster):
+    def __init__(self, mode=ForecastingModeEnum.RECURSIVE):
+        super().__init__(mode)
+        self.forecaster = DirectStubModel() if mode == ForecastingModeEnum.DIRECT else StubModel()
+
+
+def get_dataset(start, n_rows):
+    return pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=n_rows).shift(start),
+        'T': np.linspace(20, 35, n_rows) + start,
+        'UR': np.linspace(90, 40, n_rows),
+        'V': np.cos(np.arange(n_rows) + start),
+        'P': np.sin(np.arange(n_rows) + start)
+    })
+
+
+def forecast_row_by_row(forecaster, X_train, X_test):
+    dataset = pd.concat([X_train, X_test]).reset_index(drop=True).drop(columns=['Date'])
+    predict_start_index = X_train.shape[0]
+    forecasted_datasets = []
+    last_forecasted = pd.DataFrame()
+    for days_in_future in range(0, fccfg.FORECAST_HORIZON):
+        forecasted = pd.DataFrame()
+        for i in range(0, days_in_future):
+            forecasted = pd.concat([forecasted, last_forecasted.iloc[[i]]]).reset_index(drop=True)
+        for i in range(predict_start_index + days_in_future, predict_start_index + X_test.shape[0]):
+            x = dataset.iloc[range(i - fccfg.OBSERVATION_WINDOW, i - days_in_future)].reset_index(drop=True)
+            if not last_forecasted.empty:
+                index_start = i - predict_start_index - 1
+                x_last = last_forecasted.iloc[range(index_start, index_start + days_in_future)].reset_index(drop=True)
+                x.columns = x_last.columns
+                x = pd.concat([x, x_last]).reset_index(drop=True)
+            forecasted = pd.concat([forecasted, forecaster.forecast(x)])
+        forecasted = forecasted.reset_index(drop=True)
+        forecasted_datasets.append(forecasted)
+        last_forecasted = forecasted
+    return forecasted_datasets
+
+
+def test_create_forecasted_datasets_matches_row_by_row(monkeypatch):
+    monkeypatch.setattr(pd.DataFrame, 'to_csv', lambda *args, **kwargs: None)
+    X_train = get_dataset(0, 30)
+    X_test = get_dataset(30, 12)
+    forecaster = StubForecaster()
+
+    expected = forecast_row_by_row(forecaster, X_train.copy(), X_test.copy())
+    actual = create_forecasted_datasets(forecaster, X_train, X_test)
+
+    assert len(actual) == fccfg.FORECAST_HORIZON
+    for expected_dataset, actual_dataset in zip(expected, actual):
+        assert list(actual_dataset.columns) == list(X_test.columns)
+        assert actual_dataset['Date'].equals(X_test['Date'].reset_index(drop=True))
+        values = actual_dataset.drop(columns=['Date']).to_numpy()
+        assert values.dtype == expected_dataset.to_numpy().dtype
+        assert np.array_equal(values, expected_dataset.to_numpy())
+
+
+def test_create_forecasted_datasets_calls_model_once_per_day(monkeypatch):
+    monkeypatch.setattr(pd.DataFrame, 'to_csv', lambda *args, **kwargs: None)
+    forecaster = StubForecaster()
+    calls = []
+    predict = forecaster.forecaster.predict
+    forecaster.forecaster.predict = lambda X, verbose=0: calls.append(X.shape) or predict(X)
+
+    X_test = get_dataset(30, 12)
+    create_forecasted_datasets(forecaster, get_dataset(0, 30), X_test)
+
+    n_features = X_test.shape[1] - 1
+    assert calls == [(X_test.shape[0] - i, fccfg.OBSERVATION_WINDOW, n_features) for i in range(0, fccfg.FORECAST_HORIZON)]
+
+
+def test_create_forecasted_datasets_direct(monkeypatch):
+    monkeypatch.setattr(pd.DataFrame, 'to_csv', lambda *args, **kwargs: None)
+    X_train = get_dataset(0, 30)
+    X_test = get_dataset(30, 12)
+    forecaster = StubForecaster(ForecastingModeEnum.DIRECT)
+    calls = []
+    predict = forecaster.forecaster.predict
+    forecaster.forecaster.predict = lambda X, verbose=0: calls.append(X.shape) or predict(X)
+
+    actual = create_forecasted_datasets(forecaster, X_train, X_test)
+
+    values = pd.concat([X_train, X_test]).drop(columns=['Date']).to_numpy()
+    n_rows = X_test.shape[0]
+    assert calls == [(n_rows, fccfg.OBSERVATION_WINDOW, values.shape[1])]
+    assert len(actual) == fccfg.FORECAST_HORIZON
+    for days_in_future, actual_dataset in enumerate(actual):
+        assert list(actual_dataset.columns) == list(X_test.columns)
+        actual_values = actual_dataset.drop(columns=['Date']).to_numpy()
+        for row in range(0, n_rows):
+            # The window ends days_in_future days before the row, or the row is copied from the day before
+            window_row = max(row - days_in_future, 0)
+            day = days_in_future if row >= days_in_future else row
+            window_end = X_train.shape[0] + window_row
+            window = values[window_end - fccfg.OBSERVATION_WINDOW:window_end][np.newaxis]
+            assert np.array_equal(actual_values[row], DirectStubModel().predict(window)[0, day])
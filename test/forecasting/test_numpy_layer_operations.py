@@ -0,0 +1,63 @@
+import numpy as np
+
+import pytest
+
+import tensorflow as tf
+from tensorflow.keras import Sequential
+from tensorflow.keras.layers import Conv1D, Dense, Flatten, GRU, LSTM, MaxPooling1D, TimeDistributed
+
+from src.forecasting import numpy_layer_operations
+
+
+def apply_layers(model, X):
+    output = X
+    for layer in model.layers:
+        config = layer.get_config()
+        if isinstance(layer, TimeDistributed):
+            config["layer"] = {"class_name": type(layer.layer).__name__, "config": layer.layer.get_config()}
+        output = numpy_layer_operations.apply(type(layer).__name__, config, layer.get_weights(), output)
+    return output
+
+
+def assert_matches_keras(model, X):
+    rng = np.random.default_rng(0)
+    model.set_weights([rng.normal(0, 0.3, weights.shape).astype(np.float32) for weights in model.get_weights()])
+    assert np.allclose(apply_layers(model, X), model.predict(X, verbose=0), atol=1e-5)
+
+
+def test_lstm_sequences():
+    tf.keras.utils.set_random_seed(0)
+    X = np.random.default_rng(1).random((8, 6, 3)).astype(np.float32)
+    assert_matches_keras(Sequential([LSTM(7, return_sequences=True, input_shape=(6, 3))]), X)
+
+
+def test_gru_reset_before():
+    tf.keras.utils.set_random_seed(0)
+    X = np.random.default_rng(1).random((8, 6, 3)).astype(np.float32)
+    assert_matches_keras(Sequential([GRU(7, reset_after=False, input_shape=(6, 3)), Dense(2)]), X)
+
+
+def test_conv1d_max_pooling1d():
+    tf.keras.utils.set_random_seed(0)
+    X = np.random.default_rng(1).random((8, 7, 3)).astype(np.float32)
+    assert_matches_keras(Sequential([Conv1D(16, 2, activation='relu', input_shape=(7, 3)), MaxPooling1D(2), LSTM(5)]), X)
+
+
+def test_time_distributed():
+    tf.keras.utils.set_random_seed(0)
+    X = np.random.default_rng(1).random((8, 2, 6, 3)).astype(np.float32)
+    assert_matches_keras(Sequential([TimeDistributed(Conv1D(4, 1, activation='relu'), input_shape=(None, 6, 3)),
+                                     TimeDistributed(MaxPooling1D(2)),
+                                     TimeDistributed(Flatten()),
+                                     LSTM(5)]), X)
+
+
+def test_get_activation_not_supported():
+    with pytest.raises(ValueError) as e_info:
+        numpy_layer_operations.get_activation("softplus")
+    assert str(e_info.value) == "Activation softplus is not supported"
+
+
+def test_lstm_backwards_not_supported():
+    with pytest.raises(ValueError):
+        numpy_layer_operations.lstm({"name": "lstm", "go_backwards": True}, [], np.zeros((1, 1, 1), dtype=np.float32))
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+
+import numpy as np
+
+import pandas as pd
+
+import pytest
+
+import tensorflow as tf
+
+import config.general_settings as cfg
+
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
+from src.forecasting.algorithm.cnn_forecaster import CNNForecaster
+from src.forecasting.algorithm.gru_forecaster import GRUForecaster
+from src.forecasting.algorithm.lstm_forecaster import LSTMForecaster
+from src.forecasting.numpy_model import NumpyModel
+
+
+def get_trained_model(forecaster):
+    tf.keras.utils.set_random_seed(cfg.SEED)
+    X, _, model = forecaster.build_architecture(np.random.default_rng(0).random((40, 4)))
+    # Random weights, so that every bias takes part in the comparison
+    rng = np.random.default_rng(1)
+    model.set_weights([rng.normal(0, 0.3, weights.shape).astype(np.float32) for weights in model.get_weights()])
+    return X, model
+
+
+@pytest.mark.parametrize("forecaster", [LSTMForecaster(), GRUForecaster(), CNNForecaster(), LSTMForecaster(ForecastingModeEnum.DIRECT)])
+def test_predict(forecaster):
+    X, model = get_trained_model(forecaster)
+
+    expected_output = model.predict(X, verbose=0)
+    actual_output = NumpyModel.from_keras(model).predict(X)
+
+    assert actual_output.dtype == np.float32
+    assert actual_output.shape == expected_output.shape
+    assert np.allclose(actual_output, expected_output, atol=1e-5)
+
+
+def test_save_load(tmp_path):
+    X, model = get_trained_model(GRUForecaster())
+    numpy_model = NumpyModel.from_keras(model)
+    file_path = str(tmp_path / "weights.npz")
+
+    numpy_model.save(file_path)
+    actual_model = NumpyModel.load(file_path)
+
+    assert [layer["class_name"] for layer in actual_model.layers] == ["GRU", "GRU", "Dense"]
+    assert np.array_equal(actual_model.predict(X), numpy_model.predict(X))
+
+
+def test_forecast_without_tensorflow(tmp_path):
+    X, model = get_trained_model(LSTMForecaster())
+    file_path = str(tmp_path / "weights.npz")
+    NumpyModel.from_keras(model).save(file_path)
+    np.save(str(tmp_path / "windows.npy"), X[:3])
+
+    code = "\n".join([
+        "import sys",
+        "import numpy as np",
+        "from src.forecasting.algorithm import forecaster_factory",
+        "from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum",
+        "from src.forecasting.numpy_model import NumpyModel",
+        "forecaster = forecaster_factory.get(ForecastingAlgorithmEnum.LSTM)",
+        "forecaster.forecaster = NumpyModel.load('{}')".format(file_path),
+        "print(forecaster.forecast_windows(np.load('{}')).shape)".format(tmp_path / "windows.npy"),
+        "print('tensorflow' in sys.modules)"
+    ])
+    output = subprocess.run([sys.executable, "-c", code], cwd=cfg.PROJECT_DIR, capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ["(3,", "4)", "False"]
+
+
+def test_predict_unsupported_layer():
+    numpy_model = NumpyModel([{"class_name": "Dropout", "config": {}, "weights": []}])
+    with pytest.raises(ValueError) as e_info:
+        numpy_model.predict(pd.DataFrame({'col': [1.0]}))
+    assert str(e_info.value) == "Layer Dropout is not supported"
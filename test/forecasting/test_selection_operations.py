@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from unittest import mock
+
+import pandas as pd
+
+import config.general_settings as cfg
+
+from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting import selection_operations
+
+
+def test_get_best_position():
+    error_metrics = [[0.3, 0.1], [0.2, 0.5], [0.2, 0.4], [0.25, 0.0]]
+    assert selection_operations.get_best_position(error_metrics) == 1
+
+
+@mock.patch('src.forecasting.selection_operations.scaler_factory')
+def test_scale(mock_scaler_factory):
+    dataset = pd.DataFrame({'Date': ['2020-01-01', '2020-01-02'], 'col': [1.0, 2.0]})
+    scaler = mock_scaler_factory.get.return_value
+    scaler.fit_scale.return_value = dataset
+    scaler.scale.return_value = dataset
+    window_cache = mock.Mock()
+    window_cache.put.side_effect = ["train", "validation"]
+
+    actual_return = selection_operations.scale(ScalingMethodEnum.MIN_MAX_SCALER, dataset, dataset, window_cache)
+
+    assert actual_return == (scaler, dataset, dataset, "train", "validation")
+    mock_scaler_factory.get.assert_called_once_with(ScalingMethodEnum.MIN_MAX_SCALER)
+    scaler.fit_scale.assert_called_once_with(dataset)
+
+
+@mock.patch('tensorflow.keras.utils.set_random_seed')
+@mock.patch('src.forecasting.selection_operations.forecaster_factory')
+@mock.patch('src.forecasting.selection_operations.WindowCache')
+def test_train_combination(mock_window_cache, mock_forecaster_factory, mock_set_random_seed):
+    mock_window_cache.load.side_effect = lambda file_path: file_path + " sequence"
+    forecaster = mock_forecaster_factory.get.return_value
+    forecaster.evaluate.return_value = [0.1]
+
+    actual_return = selection_operations.train_combination(2, ForecastingAlgorithmEnum.LSTM, "train", "validation", "weights")
+
+    assert actual_return == [0.1]
+    mock_set_random_seed.assert_called_once_with(selection_operations.fccfg.SELECTION_SEED + 2)
+    mock_forecaster_factory.get.assert_called_once_with(ForecastingAlgorithmEnum.LSTM)
+    forecaster.learn.assert_called_once_with("train sequence")
+    forecaster.evaluate.assert_called_once_with("validation sequence")
+    forecaster.save_weights.assert_called_once_with("weights")
+
+
+def test_import_fit_pipeline_without_tensorflow():
+    # TensorFlow is only imported when a combination is trained, so planning or a fully cached fit does not pay for it
+    code = "\n".join([
+        "import sys",
+        "import src.pipeline.pipelines.fit_pipeline",
+        "print('tensorflow' in sys.modules)"
+    ])
+    output = subprocess.run([sys.executable, "-c", code], cwd=cfg.PROJECT_DIR, capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ["False"]
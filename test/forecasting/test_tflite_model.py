@@ -0,0 +1,51 @@
+import numpy as np
+
+import pytest
+
+import tensorflow as tf
+
+import config.general_settings as cfg
+
+from src.forecasting.algorithm.gru_forecaster import GRUForecaster
+from src.forecasting.algorithm.lstm_forecaster import LSTMForecaster
+from src.forecasting.tflite_model import TFLiteModel
+
+
+def get_trained_model(forecaster):
+    tf.keras.utils.set_random_seed(cfg.SEED)
+    X, _, model = forecaster.build_architecture(np.random.default_rng(0).random((40, 4)))
+    rng = np.random.default_rng(1)
+    model.set_weights([rng.normal(0, 0.3, weights.shape).astype(np.float32) for weights in model.get_weights()])
+    return X, model
+
+
+def test_predict_float32():
+    X, model = get_trained_model(LSTMForecaster())
+    # Fewer windows than a multiple of the batch, so that the last batch is padded
+    X = X[:11]
+
+    expected_output = model.predict(X, verbose=0)
+    actual_output = TFLiteModel.from_keras(model, "float32", 4).predict(X)
+
+    assert actual_output.shape == expected_output.shape
+    assert np.allclose(actual_output, expected_output, atol=1e-5)
+
+
+def test_predict_dynamic_range_save_load(tmp_path):
+    X, model = get_trained_model(GRUForecaster())
+    tflite_model = TFLiteModel.from_keras(model, "dynamic_range", 8)
+    file_path = str(tmp_path / "forecaster.tflite")
+
+    tflite_model.save(file_path)
+    actual_model = TFLiteModel.load(file_path)
+
+    assert actual_model.model_content == tflite_model.model_content
+    # The int8 weights drift from the float32 ones
+    assert np.allclose(actual_model.predict(X), model.predict(X, verbose=0), atol=5e-2)
+
+
+@pytest.mark.parametrize("quantization, batch_size", [("int4", 8), ("float32", 0)])
+def test_from_keras_invalid(quantization, batch_size):
+    _, model = get_trained_model(LSTMForecaster())
+    with pytest.raises(ValueError):
+        TFLiteModel.from_keras(model, quantization, batch_size)
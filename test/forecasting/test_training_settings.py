@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+import config.forecast_settings as fccfg
+
+from src.forecasting.training_settings import TrainingSettings
+
+
+def test_from_config():
+    training_settings = TrainingSettings.from_config()
+    assert training_settings.batch_size == fccfg.BATCH_SIZE
+    assert training_settings.dataset_pipeline == fccfg.DATASET_PIPELINE
+    assert training_settings.epochs == fccfg.NB_EPOCHS
+    assert training_settings.plot_history == fccfg.PLOT_HISTORY
+
+
+def test_from_config_overrides():
+    training_settings = TrainingSettings.from_config(batch_size=64, dataset_pipeline=True, verbose=0)
+    assert training_settings.batch_size == 64
+    assert training_settings.dataset_pipeline
+    assert training_settings.verbose == 0
+    assert training_settings.cache == fccfg.DATASET_CACHE
+
+
+def test_get_learning_rate():
+    assert TrainingSettings.from_config(batch_size=16, learning_rate_scaling=None).get_learning_rate() == fccfg.LEARNING_RATE
+    assert TrainingSettings.from_config(batch_size=16, learning_rate_scaling="linear").get_learning_rate() == fccfg.LEARNING_RATE * 16
+    assert TrainingSettings.from_config(batch_size=16, learning_rate_scaling="sqrt").get_learning_rate() == fccfg.LEARNING_RATE * math.sqrt(16)
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError) as e_info:
+        TrainingSettings.from_config(batch_size=0)
+    assert str(e_info.value) == "Parameter batch_size must be positive"
+
+
+def test_invalid_learning_rate_scaling():
+    with pytest.raises(ValueError) as e_info:
+        TrainingSettings.from_config(learning_rate_scaling="xxx")
+    assert str(e_info.value) == "Parameter learning_rate_scaling must be None, linear or sqrt"
@@ -0,0 +1,59 @@
+import os
+
+import numpy as np
+
+import pandas as pd
+
+from src.forecasting.window_cache import WindowCache
+
+
+def get_scaled_dataset(values):
+    return pd.DataFrame({'Date': pd.date_range('2020-01-01', periods=len(values)),
+                         'col1': values,
+                         'col2': [value * 2 for value in values]})
+
+
+def test_put(tmp_path):
+    window_cache = WindowCache(str(tmp_path) + "/")
+
+    actual_file_path = window_cache.put(get_scaled_dataset([0.1, 0.2, 0.3]))
+
+    assert os.path.isfile(actual_file_path)
+    assert os.path.dirname(actual_file_path) == str(tmp_path)
+    assert np.array_equal(WindowCache.load(actual_file_path), np.array([[0.1, 0.2], [0.2, 0.4], [0.3, 0.6]]))
+
+
+def test_put_same_content(tmp_path):
+    window_cache = WindowCache(str(tmp_path) + "/")
+
+    first_file_path = window_cache.put(get_scaled_dataset([0.1, 0.2, 0.3]))
+    second_file_path = window_cache.put(get_scaled_dataset([0.1, 0.2, 0.3]).iloc[::-1].iloc[::-1])
+    other_file_path = window_cache.put(get_scaled_dataset([0.1, 0.2, 0.4]))
+
+    assert first_file_path == second_file_path
+    assert first_file_path != other_file_path
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_load(tmp_path):
+    file_path = WindowCache(str(tmp_path) + "/").put(get_scaled_dataset([0.1, 0.2, 0.3]))
+
+    actual_sequence = WindowCache.load(file_path)
+
+    assert isinstance(actual_sequence, np.memmap)
+    assert not actual_sequence.flags.writeable
+
+
+def test_clean(tmp_path):
+    window_cache = WindowCache(str(tmp_path) + "/")
+    old_file_path = window_cache.put(get_scaled_dataset([0.1, 0.2, 0.3]))
+    file_paths = [window_cache.put(get_scaled_dataset([0.1, 0.2, 0.4])), window_cache.put(get_scaled_dataset([0.5, 0.6]))]
+
+    window_cache.clean(file_paths)
+
+    assert not os.path.exists(old_file_path)
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(file_path) for file_path in file_paths)
+
+
+def test_clean_missing_dir(tmp_path):
+    WindowCache(str(tmp_path / "window_cache") + "/").clean([])
@@ -21,3 +21,39 @@ def test_menu_not_implemented():
     with pytest.raises(Exception) as e_info:
         menu.execute(["dummy"])
     assert str(e_info.value) == "Menu option dummy not implemented"
+
+
+@mock.patch('src.pipeline.pipeline_executor.execute_fit_pipeline')
+def test_menu_execute_fit_plan(mock_execute_fit_pipeline):
+    menu.execute(["fit", "--plan"])
+    mock_execute_fit_pipeline.assert_called_once_with(plan=True)
+
+
+@mock.patch('src.pipeline.pipeline_executor.execute_predict_pipeline')
+def test_menu_execute_predict_plan(mock_execute_predict_pipeline):
+    menu.execute(["predict", "--plan"])
+    mock_execute_predict_pipeline.assert_called_once_with(plan=True)
+
+
+@mock.patch('src.profiling.training_benchmark.execute')
+def test_menu_execute_benchmark_training(mock_execute_benchmark):
+    menu.execute(["benchmark-training"])
+    mock_execute_benchmark.assert_called_once()
+
+
+@mock.patch('src.profiling.inference_benchmark.execute')
+def test_menu_execute_benchmark_inference(mock_execute_benchmark):
+    menu.execute(["benchmark-inference"])
+    mock_execute_benchmark.assert_called_once()
+
+
+@mock.patch('src.serving.prediction_server.execute')
+def test_menu_execute_serve(mock_execute_serve):
+    menu.execute(["serve"])
+    mock_execute_serve.assert_called_once()
+
+
+@mock.patch('src.profiling.import_benchmark.execute')
+def test_menu_execute_benchmark_imports(mock_execute_benchmark):
+    menu.execute(["benchmark-imports"])
+    mock_execute_benchmark.assert_called_once()
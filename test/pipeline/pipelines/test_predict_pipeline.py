@@ -0,0 +1,151 @@
+import os
+from pickle import load
+from unittest import mock
+
+import numpy as np
+
+import pandas as pd
+
+import pytest
+
+from sklearn.naive_bayes import GaussianNB
+
+import tensorflow as tf
+
+import config.dataset_settings as dscfg
+import config.general_settings as cfg
+
+from src.classification.algorithm import classifier_factory
+from src.enum.classification_algorithms_enum import ClassificationAlgorithmEnum
+from src.enum.data_sources_enum import DataSourceEnum
+from src.enum.sampling_methods_enum import SamplingMethodEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting.algorithm.lstm_forecaster import LSTMForecaster
+from src.forecasting.numpy_model import NumpyModel
+from src.pipeline import pipeline_executor
+from src.risk_rate.threshold_set import ThresholdSet
+from src.sampling import sampler_factory
+from src.scaling import scaler_factory
+from src.serving.deployed_model import DeployedModel
+
+N_DAYS = 40
+
+
+def get_prediction_data(n_days):
+    # The same days for any n_days, as if new days were appended to the data file
+    rng = np.random.default_rng(0)
+    n_all_days = N_DAYS + 10
+    return pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-01", periods=n_all_days),
+                         dscfg.TEMPERATURE_COLUMN_NAME: rng.uniform(15, 40, n_all_days),
+                         dscfg.RELATIVE_HUMIDITY_COLUMN_NAME: rng.uniform(20, 100, n_all_days),
+                         dscfg.WIND_VELOCITY_COLUMN_NAME: rng.uniform(0, 10, n_all_days),
+                         dscfg.PRECIPITATION_COLUMN_NAME: rng.choice([0.0, 0.0, 0.0, 2.5, 8.1, 13.0], n_all_days)}).head(n_days)
+
+
+def get_deployed_model():
+    tf.keras.utils.set_random_seed(cfg.SEED)
+    forecaster = LSTMForecaster()
+    _, _, model = forecaster.build_architecture(np.random.default_rng(0).random((N_DAYS, 4)))
+    forecaster.forecaster = NumpyModel.from_keras(model)
+
+    rng = np.random.default_rng(1)
+    classifier = classifier_factory.get(ClassificationAlgorithmEnum.NB)
+    classifier.classifier = GaussianNB().fit(rng.random((20, 4)), rng.integers(0, 2, 20))
+
+    return DeployedModel(scaler_factory.get(ScalingMethodEnum.NONE),
+                         forecaster,
+                         sampler_factory.get(SamplingMethodEnum.NONE),
+                         classifier,
+                         ThresholdSet.get_default().thresholds)
+
+
+@pytest.fixture
+def deployed_model_dir(tmp_path, monkeypatch):
+    for setting, dir_name in [('OUTPUT_EXECUTION_OBJECTS_DIR', "execution_objects"),
+                              ('OUTPUT_DEPLOYED_MODEL_DIR', "deployed_model"),
+                              ('DATA_DIR', "datasets"),
+                              ('DATA_GENERATED_DIR', "generated"),
+                              ('ASSETS_DIR', "assets")]:
+        os.makedirs(tmp_path / dir_name, exist_ok=True)
+        monkeypatch.setattr(cfg, setting, str(tmp_path / dir_name) + "/")
+    os.makedirs(tmp_path / "datasets" / DataSourceEnum.PREDICTION_DATA.value)
+    # The model is built in memory, but its files are what the risk rate states are saved for
+    (tmp_path / "deployed_model" / cfg.CLASSIFIER_FILE_NAME).write_bytes(b"classifier")
+    with mock.patch.object(DeployedModel, 'load', return_value=get_deployed_model()):
+        yield tmp_path / "deployed_model"
+
+
+def predict(prediction_data):
+    prediction_data.to_excel(cfg.DATA_DIR + DataSourceEnum.PREDICTION_DATA.value + "/" + cfg.PREDICTION_DATA_FILE_NAME, index=False)
+    pipeline_executor.execute_predict_pipeline()
+    return pd.read_csv(cfg.DATA_GENERATED_DIR + "predict_output_dataset.csv", index_col=0, parse_dates=[dscfg.DATE_COLUMN_NAME])
+
+
+def read_statistical_risk_rates():
+    return pd.read_csv(cfg.DATA_GENERATED_DIR + "statistical_risk_rates.csv", index_col=0, parse_dates=[dscfg.DATE_COLUMN_NAME])
+
+
+def test_predict_twice(deployed_model_dir):
+    first_output = predict(get_prediction_data(N_DAYS))
+    second_output = predict(get_prediction_data(N_DAYS))
+
+    assert len(first_output) == N_DAYS
+    assert len(second_output) == N_DAYS
+    pd.testing.assert_frame_equal(second_output, first_output)
+
+
+def test_predict_new_days(deployed_model_dir):
+    predict(get_prediction_data(N_DAYS))
+    first_risk_rates = read_statistical_risk_rates()
+    output = predict(get_prediction_data(N_DAYS + 5))
+    risk_rates = read_statistical_risk_rates()
+
+    # Continuing from the states gives the same present risk rates as calculating every day again
+    os.remove(deployed_model_dir / cfg.RISK_RATE_STATES_FILE_NAME)
+    predict(get_prediction_data(N_DAYS + 5))
+    expected_risk_rates = read_statistical_risk_rates()
+
+    assert len(output) == N_DAYS + 5
+    # The days already calculated keep their risk rates
+    pd.testing.assert_frame_equal(risk_rates.head(N_DAYS), first_risk_rates)
+    present_column_names = [column_name for column_name in risk_rates.columns if column_name.startswith(dscfg.PRESENT_COLUMN_NAME)]
+    pd.testing.assert_frame_equal(risk_rates[present_column_names], expected_risk_rates[present_column_names])
+
+
+def test_predict_not_continued(deployed_model_dir):
+    predict(get_prediction_data(N_DAYS))
+    # A gap after the day of the states
+    prediction_data = get_prediction_data(N_DAYS + 5).drop(index=N_DAYS)
+    output = predict(prediction_data)
+
+    os.remove(deployed_model_dir / cfg.RISK_RATE_STATES_FILE_NAME)
+    expected_output = predict(prediction_data)
+
+    assert len(output) == N_DAYS + 4
+    pd.testing.assert_frame_equal(output, expected_output)
+
+
+def test_predict_another_deployed_model(deployed_model_dir):
+    predict(get_prediction_data(N_DAYS))
+    states_file_name = deployed_model_dir / cfg.RISK_RATE_STATES_FILE_NAME
+    first_states = load(open(states_file_name, 'rb'))
+
+    (deployed_model_dir / cfg.CLASSIFIER_FILE_NAME).write_bytes(b"another classifier")
+    output = predict(get_prediction_data(N_DAYS))
+    second_states = load(open(states_file_name, 'rb'))
+
+    assert len(output) == N_DAYS
+    assert second_states.model_fingerprint == DeployedModel.get_fingerprint(str(deployed_model_dir) + "/")
+    assert second_states.model_fingerprint != first_states.model_fingerprint
+    assert len(second_states.risk_rates_dataset) == N_DAYS
+
+
+def test_predict_keeps_latest_execution_objects(deployed_model_dir):
+    predict(get_prediction_data(N_DAYS))
+    predict(get_prediction_data(N_DAYS + 5))
+
+    # Each step keeps the input and output manifests of its latest key only
+    step_dirs = [dir_path for dir_path, _, file_names in os.walk(cfg.OUTPUT_EXECUTION_OBJECTS_DIR) if "latest.json" in file_names]
+    assert len(step_dirs) > 0
+    for step_dir in step_dirs:
+        assert len(os.listdir(step_dir)) == 3, step_dir
@@ -0,0 +1,132 @@
+import os
+from unittest import mock
+
+import numpy as np
+
+import pandas as pd
+
+import pytest
+
+import config.general_settings as cfg
+
+from src.pipeline import execution_context
+from src.pipeline.pipelines.fit_pipeline import RETRAIN_VS_TEST_ROLE, TRAIN_VS_VALIDATION_ROLE
+from src.pipeline.step import Step, StepInput, StepOutput
+from src.storage.blob_store import BlobStore
+from src.utils import fingerprint_utils
+
+
+class ForecastStep(Step):
+    """Stands for a step used more than once in a pipeline, such as CreateForecastedDatasetsStep"""
+
+    step_name = "Forecast"
+    step_description = "Forecast the values"
+
+    def __init__(self, values, step_role=""):
+        self.step_input = StepInput()
+        self.step_input.values = values
+        self.step_role = step_role
+        self.prepare()
+
+    def run(self):
+        self.step_output = StepOutput()
+        self.step_output.forecasted_values = [value + 1 for value in self.step_input.values]
+
+
+class ReadStep(Step):
+    """Outputs a dataset and a larger array, which its consumer does not need"""
+
+    step_name = "Read"
+    step_description = "Read the data"
+
+    def __init__(self):
+        self.step_input = StepInput()
+        self.prepare()
+
+    def run(self):
+        self.step_output = StepOutput()
+        self.step_output.dataset = pd.DataFrame({'T': [20.5, 21.0, 22.5]})
+        self.step_output.windows = np.arange(10000, dtype=np.float64).reshape(100, 100)
+
+
+class MeanStep(Step):
+    """Consumes a single field of ReadStep"""
+
+    step_name = "Mean"
+    step_description = "Average the dataset"
+
+    def __init__(self, dataset):
+        self.step_input = StepInput()
+        self.step_input.dataset = dataset
+        self.prepare()
+
+    def run(self):
+        self.step_output = StepOutput()
+        self.step_output.mean = self.step_input.dataset.mean()
+
+
+@pytest.fixture(autouse=True)
+def execution_objects_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg, 'OUTPUT_EXECUTION_OBJECTS_DIR', str(tmp_path / "execution_objects") + "/")
+    execution_context.set_pipeline_name("fit")
+    yield
+    execution_context.set_pipeline_name(execution_context.DEFAULT_PIPELINE_NAME)
+
+
+def test_get_step_identity():
+    validation_step = ForecastStep([1], TRAIN_VS_VALIDATION_ROLE)
+    test_step = ForecastStep([1], RETRAIN_VS_TEST_ROLE)
+
+    assert validation_step.get_step_identity() == "fit/forecast_step/" + TRAIN_VS_VALIDATION_ROLE
+    assert test_step.get_step_identity() == "fit/forecast_step/" + RETRAIN_VS_TEST_ROLE
+    assert ForecastStep([1]).get_step_identity() == "fit/forecast_step"
+
+
+def test_instances_are_cached_apart():
+    validation_step = ForecastStep([1, 2], TRAIN_VS_VALIDATION_ROLE)
+    test_step = ForecastStep([3, 4], RETRAIN_VS_TEST_ROLE)
+
+    assert validation_step.step_output.updated
+    assert test_step.step_output.updated
+    assert validation_step.step_cache.step_dir != test_step.step_cache.step_dir
+    assert os.path.isdir(validation_step.step_cache.step_dir)
+    assert os.path.isdir(test_step.step_cache.step_dir)
+
+    # Running the second instance did not overwrite the entry of the first one, nor the other way around
+    cached_validation_step = ForecastStep([1, 2], TRAIN_VS_VALIDATION_ROLE)
+    cached_test_step = ForecastStep([3, 4], RETRAIN_VS_TEST_ROLE)
+
+    assert not cached_validation_step.step_output.updated
+    assert cached_validation_step.step_output.forecasted_values == [2, 3]
+    assert not cached_test_step.step_output.updated
+    assert cached_test_step.step_output.forecasted_values == [4, 5]
+
+
+def test_instances_with_same_input_are_cached_apart():
+    ForecastStep([1, 2], TRAIN_VS_VALIDATION_ROLE)
+
+    assert ForecastStep([1, 2], RETRAIN_VS_TEST_ROLE).step_output.updated
+    assert not ForecastStep([1, 2], TRAIN_VS_VALIDATION_ROLE).step_output.updated
+
+
+def test_skipped_step_output_is_loaded_by_field():
+    MeanStep(ReadStep().step_output.dataset)
+
+    loaded_blobs = []
+    original_get = BlobStore.get
+
+    def get(blob_store, reference):
+        loaded_blobs.append(reference["blob"])
+        return original_get(blob_store, reference)
+
+    with mock.patch.object(BlobStore, 'get', get):
+        read_step = ReadStep()
+        assert not read_step.step_output.updated
+        assert loaded_blobs == []
+
+        mean_step = MeanStep(read_step.step_output.dataset)
+
+    assert not mean_step.step_output.updated
+    # Only the dataset was read: neither the windows nor the output of the skipped consumer
+    assert loaded_blobs == [fingerprint_utils.get_fingerprint(pd.DataFrame({'T': [20.5, 21.0, 22.5]}))]
+    assert "windows" not in vars(read_step.step_output)
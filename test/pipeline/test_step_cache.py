@@ -0,0 +1,230 @@
+import os
+import shutil
+from unittest import mock
+
+import pandas as pd
+
+import pytest
+
+import config.forecast_settings as fccfg
+import config.general_settings as cfg
+
+from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.exception.plan_interruption_exception import PlanInterruptionException
+from src.forecasting.algorithm import forecaster_factory
+from src.pipeline import execution_context
+from src.pipeline.step import Step, StepInput, StepOutput
+from src.pipeline.step_cache import BLOBS_SUB_DIR, StepCache
+from src.pipeline.steps import select_sampler_classifier_step
+from src.pipeline.steps.select_scaler_forecaster_step import SelectScalerForecasterStep
+from src.scaling import scaler_factory
+from src.utils import fingerprint_utils, logging_utils
+
+
+class SumStep(Step):
+    """Sums its values, times the forecast horizon"""
+
+    step_name = "Sum"
+    step_description = "Sum the values"
+
+    def __init__(self, values, file_paths=()):
+        self.step_input = StepInput()
+        self.step_input.values = values
+        self.file_paths = list(file_paths)
+        self.prepare()
+
+    def get_file_dependencies(self):
+        return self.file_paths
+
+    def run(self):
+        self.step_output = StepOutput()
+        self.step_output.total = sum(self.step_input.values) * fccfg.FORECAST_HORIZON
+
+
+@pytest.fixture(autouse=True)
+def execution_objects_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg, 'OUTPUT_EXECUTION_OBJECTS_DIR', str(tmp_path / "execution_objects") + "/")
+
+
+def plan(*args):
+    execution_context.set_plan_mode(True)
+    try:
+        with mock.patch('src.pipeline.step.print_and_log') as mock_print_and_log:
+            try:
+                SumStep(*args)
+            except PlanInterruptionException:
+                pass
+    finally:
+        execution_context.set_plan_mode(False)
+    return " ".join(call.args[0] for call in mock_print_and_log.call_args_list)
+
+
+def test_miss_then_hit():
+    step = SumStep([1, 2])
+    assert step.step_output.updated
+    assert step.step_output.total == 3 * fccfg.FORECAST_HORIZON
+
+    with mock.patch.object(SumStep, 'run') as mock_run:
+        cached_step = SumStep([1, 2])
+
+    mock_run.assert_not_called()
+    assert not cached_step.step_output.updated
+    assert cached_step.step_output.total == 3 * fccfg.FORECAST_HORIZON
+
+
+def test_input_change():
+    SumStep([1, 2])
+
+    assert "input values changed" in plan([1, 3])
+    assert SumStep([1, 3]).step_output.updated
+    # Both keys stay stored
+    assert not SumStep([1, 2]).step_output.updated
+
+
+def test_settings_change(monkeypatch):
+    SumStep([1, 2])
+    monkeypatch.setattr(fccfg, 'FORECAST_HORIZON', fccfg.FORECAST_HORIZON + 1)
+
+    assert "settings config.forecast_settings changed" in plan([1, 2])
+    step = SumStep([1, 2])
+    assert step.step_output.updated
+    assert step.step_output.total == 3 * fccfg.FORECAST_HORIZON
+
+
+def test_execution_settings_change(monkeypatch):
+    SumStep([1, 2])
+    # Every step depends on general_settings, through the step cache
+    monkeypatch.setattr(cfg, 'PROFILE_PIPELINE', not cfg.PROFILE_PIPELINE)
+    monkeypatch.setattr(cfg, 'PIPELINE_WORKERS', cfg.PIPELINE_WORKERS + 1)
+
+    assert not SumStep([1, 2]).step_output.updated
+
+
+def test_code_change(tmp_path, monkeypatch):
+    # logging_utils is a dependency of the step module, through src.pipeline.step
+    module_copy = tmp_path / "logging_utils.py"
+    shutil.copyfile(logging_utils.__file__, module_copy)
+    monkeypatch.setattr(logging_utils, '__file__', str(module_copy))
+    SumStep([1, 2])
+    assert not SumStep([1, 2]).step_output.updated
+
+    module_copy.write_text(module_copy.read_text() + "\n# changed\n")
+
+    assert "code changed" in plan([1, 2])
+    assert SumStep([1, 2]).step_output.updated
+
+
+def test_file_change(tmp_path):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("1,2")
+    SumStep([1, 2], [str(file_path)])
+    assert not SumStep([1, 2], [str(file_path)]).step_output.updated
+
+    file_path.write_text("1,3")
+
+    assert "file {} changed".format(file_path) in plan([1, 2], [str(file_path)])
+    assert SumStep([1, 2], [str(file_path)]).step_output.updated
+
+
+def test_plan_mode_miss_does_not_run():
+    with mock.patch.object(SumStep, 'run') as mock_run:
+        message = plan([1, 2])
+
+    mock_run.assert_not_called()
+    assert "would re-run: no cached result" in message
+
+
+def test_plan_mode_hit():
+    SumStep([1, 2])
+
+    execution_context.set_plan_mode(True)
+    try:
+        step = SumStep([1, 2])
+    finally:
+        execution_context.set_plan_mode(False)
+
+    assert not step.step_output.updated
+    assert step.step_output.total == 3 * fccfg.FORECAST_HORIZON
+
+
+def test_lazy_modules_are_code_dependencies():
+    source_modules, _ = fingerprint_utils.get_code_dependencies(select_sampler_classifier_step)
+    source_module_names = [module.__name__ for module in source_modules]
+
+    # The classifiers and samplers are imported only when chosen, but changing them must invalidate the step
+    for module_name in ['src.classification.algorithm.rforest_classifier',
+                        'src.classification.algorithm.lightgbm_classifier',
+                        'src.sampling.smote_sampler',
+                        'src.sampling.smotetomek_sampler']:
+        assert module_name in source_module_names
+
+
+def test_select_scaler_forecaster_output_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg, 'ASSETS_DIR', str(tmp_path) + "/")
+    X = pd.DataFrame({'T': [20.5, 21.0, 22.5], 'P': [0.0, 1.5, 0.0]})
+    # The error metrics of Forecaster.evaluate are lists, next to enum columns
+    execution_summary = pd.DataFrame({'scaling_method': [ScalingMethodEnum.NONE, ScalingMethodEnum.NONE],
+                                      'forecast_algorithm': [ForecastingAlgorithmEnum.LSTM, ForecastingAlgorithmEnum.GRU],
+                                      'error_metric': [[0.5, 0.4, 0.3], [0.6, 0.5, 0.4]]})
+    selection = (scaler_factory.get(ScalingMethodEnum.NONE), forecaster_factory.get(ForecastingAlgorithmEnum.LSTM), X, X, execution_summary)
+    step_args = ([ScalingMethodEnum.NONE], [ForecastingAlgorithmEnum.LSTM, ForecastingAlgorithmEnum.GRU], X, X)
+
+    with mock.patch.object(SelectScalerForecasterStep, '_SelectScalerForecasterStep__select', return_value=selection):
+        step = SelectScalerForecasterStep(*step_args)
+        cached_step = SelectScalerForecasterStep(*step_args)
+
+    assert step.step_output.updated
+    assert not cached_step.step_output.updated
+    pd.testing.assert_frame_equal(cached_step.step_output.execution_summary, execution_summary)
+
+
+def count_files(dir_path):
+    return sum(len(file_names) for _, _, file_names in os.walk(dir_path))
+
+
+def test_clean_keeps_latest_key():
+    step = SumStep([1, 2])
+    SumStep([1, 3])
+    blobs_dir = cfg.OUTPUT_EXECUTION_OBJECTS_DIR + BLOBS_SUB_DIR
+
+    StepCache.clean(cfg.OUTPUT_EXECUTION_OBJECTS_DIR)
+
+    # The input and output manifests of the latest key, next to latest.json
+    assert count_files(step.step_cache.step_dir) == 3
+    assert not SumStep([1, 3]).step_output.updated
+    assert SumStep([1, 2]).step_output.updated
+    # The blobs of the removed key were written again, and nothing else is left
+    StepCache.clean(cfg.OUTPUT_EXECUTION_OBJECTS_DIR)
+    assert count_files(blobs_dir) == 2
+
+
+def test_clean_keeps_key_of_cache_hit():
+    SumStep([1, 2])
+    SumStep([1, 3])
+    # Used again, so it is the latest key
+    assert not SumStep([1, 2]).step_output.updated
+
+    StepCache.clean(cfg.OUTPUT_EXECUTION_OBJECTS_DIR)
+
+    assert not SumStep([1, 2]).step_output.updated
+    assert SumStep([1, 3]).step_output.updated
+
+
+def test_clean_keeps_blobs_of_other_steps():
+    SumStep([1, 2])
+    # Another pipeline, with its own step identity and the same blob store
+    execution_context.set_pipeline_name("predict")
+    try:
+        SumStep([1, 2, 3])
+    finally:
+        execution_context.set_pipeline_name(execution_context.DEFAULT_PIPELINE_NAME)
+
+    StepCache.clean(cfg.OUTPUT_EXECUTION_OBJECTS_DIR)
+
+    assert not SumStep([1, 2]).step_output.updated
+    execution_context.set_pipeline_name("predict")
+    try:
+        assert not SumStep([1, 2, 3]).step_output.updated
+    finally:
+        execution_context.set_pipeline_name(execution_context.DEFAULT_PIPELINE_NAME)
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+
+from src.exception.plan_interruption_exception import PlanInterruptionException
+from src.pipeline.step import StepOutput
+from src.pipeline.step_graph import StepGraph
+
+
+class Recorder:
+    """Records the events of the steps, which may run in different threads"""
+
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def record(self, event):
+        with self.lock:
+            self.events.append(event)
+
+
+class RecordedStep:
+    """Stands for a step: it runs when built, and outputs its name and inputs"""
+
+    def __init__(self, recorder, name, *inputs, delay=0.0, exception=None, barrier=None):
+        recorder.record("start " + name)
+        time.sleep(delay)
+        if barrier is not None:
+            barrier.wait()
+        if exception is not None:
+            raise exception
+        self.step_output = StepOutput()
+        self.step_output.name = name
+        self.step_output.inputs = list(inputs)
+        recorder.record("end " + name)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_run_dependency_order(workers):
+    recorder = Recorder()
+    graph = StepGraph()
+    read_node = graph.add(RecordedStep, recorder, "read", delay=0.05)
+    forecast_node = graph.add(RecordedStep, recorder, "forecast", read_node.output("name"))
+    predict_node = graph.add(RecordedStep, recorder, "predict", read_node.output("name"), forecast_node.output("name"))
+
+    graph.run(workers)
+
+    events = recorder.events
+    assert events.index("start forecast") > events.index("end read")
+    assert events.index("start predict") > events.index("end forecast")
+    assert predict_node.step.step_output.inputs == ["read", "forecast"]
+
+
+def test_run_independent_steps_concurrently():
+    recorder = Recorder()
+    # Both steps must be running at the same time to get through the barrier
+    barrier = threading.Barrier(2, timeout=10)
+    graph = StepGraph()
+    graph.add(RecordedStep, recorder, "validation", barrier=barrier)
+    graph.add(RecordedStep, recorder, "test", barrier=barrier)
+
+    graph.run(2)
+
+    assert sorted(recorder.events) == ["end test", "end validation", "start test", "start validation"]
+
+
+def test_run_after_order():
+    recorder = Recorder()
+    graph = StepGraph()
+    validation_node = graph.add(RecordedStep, recorder, "validation", delay=0.05)
+    # Independent of the first step, but writes the same files
+    graph.add(RecordedStep, recorder, "test", after=[validation_node])
+
+    graph.run(4)
+
+    assert recorder.events == ["start validation", "end validation", "start test", "end test"]
+
+
+def test_run_worker_exception():
+    recorder = Recorder()
+    graph = StepGraph()
+    failing_node = graph.add(RecordedStep, recorder, "read", exception=ValueError("unreadable"))
+    graph.add(RecordedStep, recorder, "forecast", failing_node.output("name"))
+
+    with pytest.raises(ValueError, match="unreadable"):
+        graph.run(4)
+
+    assert "start forecast" not in recorder.events
+
+
+def test_run_plan_interruption():
+    recorder = Recorder()
+    graph = StepGraph()
+    interrupted_node = graph.add(RecordedStep, recorder, "read", exception=PlanInterruptionException("read would re-run"))
+    graph.add(RecordedStep, recorder, "forecast", interrupted_node.output("name"))
+    graph.add(RecordedStep, recorder, "load")
+
+    with pytest.raises(PlanInterruptionException, match="read would re-run"):
+        graph.run(4)
+
+    # The steps that do not depend on the interrupted one are still planned
+    assert "start forecast" not in recorder.events
+    assert "end load" in recorder.events
+
+
+def test_add_dependency_not_added():
+    recorder = Recorder()
+    other_graph = StepGraph()
+    other_node = other_graph.add(RecordedStep, recorder, "read")
+
+    with pytest.raises(ValueError):
+        StepGraph().add(RecordedStep, recorder, "forecast", other_node.output("name"))
+
+
+def test_run_workers_invalid():
+    with pytest.raises(ValueError):
+        StepGraph().run(0)
+
+
+def test_step_output_reference_resolve():
+    recorder = Recorder()
+    graph = StepGraph()
+    read_node = graph.add(RecordedStep, recorder, "read")
+    reference = read_node.output("name")
+
+    with pytest.raises(Exception, match="must run before its output is used"):
+        reference.resolve()
+
+    graph.run()
+
+    assert reference.node is read_node
+    assert reference.resolve() == "read"
+
+
+def test_step_output_reference_resolve_lazy_field():
+    recorder = Recorder()
+    graph = StepGraph()
+    read_node = graph.add(RecordedStep, recorder, "read")
+    graph.run()
+    read_node.step.step_output = StepOutput()
+    read_node.step.step_output.set_lazy_fields({"name": lambda: "loaded"})
+
+    assert read_node.output("name").resolve() == "loaded"
+    with pytest.raises(AttributeError):
+        read_node.output("missing").resolve()
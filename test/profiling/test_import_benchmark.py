@@ -0,0 +1,28 @@
+import pytest
+
+from src.profiling import import_benchmark
+
+
+def test_parse_import_times():
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   numpy.core",
+        "import time:      1500 |       1620 | numpy",
+        "some other output",
+        "import time:        80 |       1700 | src.menu.menu"
+    ]
+
+    import_times = import_benchmark.parse_import_times(lines)
+
+    assert import_times["module"].tolist() == ["numpy.core", "numpy", "src.menu.menu"]
+    assert import_times["package"].tolist() == ["numpy", "numpy", "src"]
+    assert import_times["self_time"].tolist() == pytest.approx([0.00012, 0.0015, 0.00008])
+    assert import_times["cumulative_time"].tolist() == pytest.approx([0.00012, 0.00162, 0.0017])
+
+
+def test_get_import_times_predict():
+    import_times = import_benchmark.get_import_times(import_benchmark.ENTRY_MODULES["predict"])
+
+    assert "src.pipeline.pipelines.predict_pipeline" in import_times["module"].tolist()
+    # The predictions only import the libraries of the deployed algorithms, when they are loaded
+    assert set(import_times["package"]).isdisjoint(["tensorflow", "matplotlib", "xgboost", "lightgbm", "catboost", "imblearn"])
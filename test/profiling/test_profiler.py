@@ -0,0 +1,82 @@
+import json
+import threading
+
+from src.profiling.profiler import Profiler
+
+
+def test_close_span_measures_span():
+    profiler = Profiler(trace_memory=False)
+    profiler.start()
+    span = profiler.open_span("step", "step", args={"cache_hit": False})
+    sum(range(100000))
+    profiler.close_span(span)
+    profiler.stop()
+
+    assert profiler.spans == [span]
+    assert span.wall_time > 0
+    assert span.thread_cpu_time >= 0
+    assert span.peak_rss > 0
+    assert span.thread_name == threading.current_thread().name
+    assert span.args == {"cache_hit": False}
+
+
+def test_tracemalloc_peak_of_nested_spans():
+    profiler = Profiler()
+    profiler.start()
+    outer_span = profiler.open_span("outer", "step")
+    inner_span = profiler.open_span("inner", "combination", outer_span)
+    data = bytearray(10 * 1024 * 1024)
+    del data
+    profiler.close_span(inner_span)
+    sibling_span = profiler.open_span("sibling", "combination", outer_span)
+    profiler.close_span(sibling_span)
+    profiler.close_span(outer_span)
+    profiler.stop()
+
+    assert inner_span.tracemalloc_peak >= 10 * 1024 * 1024
+    assert outer_span.tracemalloc_peak >= 10 * 1024 * 1024
+    assert sibling_span.tracemalloc_peak < 10 * 1024 * 1024
+
+
+def test_record_bytes_adds_to_parent_spans():
+    profiler = Profiler(trace_memory=False)
+    outer_span = profiler.open_span("outer", "pipeline")
+    inner_span = profiler.open_span("inner", "step", outer_span)
+    profiler.record_bytes(inner_span, bytes_serialized=10)
+    profiler.record_bytes(inner_span, bytes_deserialized=4)
+    profiler.record_bytes(outer_span, bytes_serialized=1)
+
+    assert (inner_span.bytes_serialized, inner_span.bytes_deserialized) == (10, 4)
+    assert (outer_span.bytes_serialized, outer_span.bytes_deserialized) == (11, 4)
+
+
+def test_get_report_and_trace():
+    profiler = Profiler(trace_memory=False)
+    outer_span = profiler.open_span("fit", "pipeline")
+    inner_span = profiler.open_span("fit/retrain_step", "step", outer_span, {"cache_hit": True})
+    profiler.close_span(inner_span)
+    profiler.close_span(outer_span)
+
+    report = profiler.get_report()
+    assert [span["name"] for span in report["spans"]] == ["fit", "fit/retrain_step"]
+    assert report["spans"][1]["parent"] == "fit"
+    assert report["spans"][1]["args"] == {"cache_hit": True}
+
+    trace = profiler.get_trace()
+    complete_events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in complete_events] == ["fit", "fit/retrain_step"]
+    assert complete_events[1]["cat"] == "step"
+    assert complete_events[1]["ts"] >= complete_events[0]["ts"]
+    assert complete_events[1]["dur"] <= complete_events[0]["dur"]
+    assert any(event["ph"] == "M" for event in trace["traceEvents"])
+
+
+def test_save(tmp_path):
+    profiler = Profiler(trace_memory=False)
+    profiler.close_span(profiler.open_span("predict", "pipeline"))
+    profiler.save(str(tmp_path / "profile.json"), str(tmp_path / "trace.json"))
+
+    with open(tmp_path / "profile.json") as file:
+        assert json.load(file)["spans"][0]["name"] == "predict"
+    with open(tmp_path / "trace.json") as file:
+        assert "traceEvents" in json.load(file)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.risk_rate.algorithm import risk_rate_algorithm_factory
+
+
+def get_dataset(n_days=90):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-01", periods=n_days),
+                         dscfg.TEMPERATURE_COLUMN_NAME: rng.uniform(-5, 45, n_days),
+                         dscfg.RELATIVE_HUMIDITY_COLUMN_NAME: rng.uniform(5, 100, n_days),
+                         dscfg.WIND_VELOCITY_COLUMN_NAME: rng.uniform(0, 15, n_days),
+                         dscfg.PRECIPITATION_COLUMN_NAME: rng.choice([0.0, 0.0, 2.1, 2.5, 5.1, 8.1, 11.0, 13.0], n_days)})
+
+
+def test_update_continues_series():
+    dataset = get_dataset()
+    for risk_rate_algorithm in RiskRateAlgorithmEnum:
+        expected_data = risk_rate_algorithm_factory.get(risk_rate_algorithm).calculate_for_dataset(dataset)
+
+        algorithm = risk_rate_algorithm_factory.get(risk_rate_algorithm)
+        algorithm.calculate_for_dataset(dataset.iloc[:30])
+        # Overlapping rows were already calculated, so only the days after the state are
+        output_data = algorithm.update(dataset.iloc[20:])
+
+        assert output_data.equals(expected_data.iloc[30:].reset_index(drop=True))
+        assert algorithm.state.date == dataset[dscfg.DATE_COLUMN_NAME].iloc[-1]
+        assert algorithm.state.value == expected_data.iloc[-1, 0]
+
+
+def test_update_gap():
+    dataset = get_dataset()
+    algorithm = risk_rate_algorithm_factory.get(RiskRateAlgorithmEnum.FMA)
+    algorithm.calculate_for_dataset(dataset.iloc[:30])
+    # The day after the state is missing, so the series is calculated again from the first row given
+    new_rows = dataset.iloc[31:]
+    expected_data = risk_rate_algorithm_factory.get(RiskRateAlgorithmEnum.FMA).calculate_for_dataset(new_rows)
+
+    assert algorithm.update(new_rows).equals(expected_data)
+
+
+def test_update_without_state():
+    dataset = get_dataset()
+    algorithm = risk_rate_algorithm_factory.get(RiskRateAlgorithmEnum.FMA)
+    assert algorithm.update(dataset).equals(algorithm.calculate_for_dataset(dataset))
+
+
+def test_update_without_new_rows():
+    dataset = get_dataset()
+    algorithm = risk_rate_algorithm_factory.get(RiskRateAlgorithmEnum.NESTEROV)
+    algorithm.calculate_for_dataset(dataset)
+    state = algorithm.state
+    assert algorithm.update(dataset).empty
+    assert algorithm.state is state
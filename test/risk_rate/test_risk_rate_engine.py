@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.risk_rate.algorithm import risk_rate_algorithm_factory
+from src.risk_rate.risk_rate_engine import RiskRateEngine
+
+
+def get_dataset(seed=0, n_days=100):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({dscfg.TEMPERATURE_COLUMN_NAME: rng.uniform(-5, 45, n_days),
+                         dscfg.RELATIVE_HUMIDITY_COLUMN_NAME: rng.uniform(5, 100, n_days),
+                         dscfg.WIND_VELOCITY_COLUMN_NAME: rng.uniform(0, 15, n_days),
+                         dscfg.PRECIPITATION_COLUMN_NAME: rng.choice([0.0, 0.0, 2.1, 2.5, 5.1, 8.1, 11.0, 13.0], n_days)})
+
+
+def test_calculate_risk_rate_dataset_all_algorithms():
+    dataset = get_dataset()
+    output_data = RiskRateEngine(dataset).calculate_risk_rate_dataset()
+    expected_columns = []
+    for risk_rate_algorithm in RiskRateAlgorithmEnum:
+        expected_columns += [risk_rate_algorithm.value + dscfg.COMMON_SEPARATOR + dscfg.RISK_RATE_VALUE_COLUMN_NAME_SUFFIX,
+                             risk_rate_algorithm.value + dscfg.COMMON_SEPARATOR + dscfg.RISK_RATE_INDEX_COLUMN_NAME_SUFFIX]
+    assert list(output_data.columns) == expected_columns
+    assert len(output_data) == len(dataset)
+
+
+def test_calculate_risk_rate_dataset_matches_algorithms():
+    dataset = get_dataset(1)
+    engine = RiskRateEngine(dataset)
+    for risk_rate_algorithm in RiskRateAlgorithmEnum:
+        expected_data = risk_rate_algorithm_factory.get(risk_rate_algorithm).calculate_for_dataset(dataset)
+        assert engine.calculate_risk_rate_dataset(risk_rate_algorithm).equals(expected_data)
+
+
+def test_calculate_does_not_need_unused_columns():
+    dataset = get_dataset().drop(columns=[dscfg.WIND_VELOCITY_COLUMN_NAME, dscfg.PRECIPITATION_COLUMN_NAME])
+    values, indexes = RiskRateEngine(dataset).calculate(RiskRateAlgorithmEnum.ANGSTRON)
+    assert len(values) == len(indexes) == len(dataset)
+
+
+def test_empty_dataset():
+    with pytest.raises(ValueError):
+        RiskRateEngine(pd.DataFrame())
+
+
+def test_calculate_from_states():
+    dataset = get_dataset(2)
+    dataset[dscfg.DATE_COLUMN_NAME] = pd.date_range("2020-01-01", periods=len(dataset))
+    expected_data = RiskRateEngine(dataset).calculate_risk_rate_dataset()
+
+    first_engine = RiskRateEngine(dataset.iloc[:60])
+    states = {risk_rate_algorithm: first_engine.get_state(risk_rate_algorithm) for risk_rate_algorithm in RiskRateAlgorithmEnum}
+    output_data = RiskRateEngine(dataset.iloc[60:].reset_index(drop=True), states).calculate_risk_rate_dataset()
+
+    assert output_data.equals(expected_data.iloc[60:].reset_index(drop=True))
+    assert states[RiskRateAlgorithmEnum.FMA].date == dataset[dscfg.DATE_COLUMN_NAME].iloc[59]
@@ -0,0 +1,130 @@
+from math import exp, log10
+
+import numpy as np
+
+from src.risk_rate import risk_rate_kernels
+
+PRECIPITATIONS = [0.0, 0.0, 1.0, 2.1, 2.5, 5.0, 5.1, 8.1, 10.0, 11.0, 12.9, 13.0, 30.0, 0.0, 0.0]
+
+
+def get_inputs(seed):
+    rng = np.random.default_rng(seed)
+    n_days = 200
+    temp = rng.uniform(-5, 45, n_days)
+    rh = rng.uniform(5, 100, n_days)
+    wind_v = rng.uniform(0, 15, n_days)
+    precip = rng.choice(PRECIPITATIONS, n_days)
+    return temp, rh, wind_v, precip
+
+
+def get_reference_fma(rh, precip, wind_v=None):
+    # Day by day computation, as scalars
+    values = []
+    previous = 0
+    for i in range(len(rh)):
+        factor = 100.0 / rh[i]
+        if precip[i] > 12.90:
+            value = 0.00
+        elif precip[i] >= 10.00:
+            value = previous * 0.20 + factor
+        elif precip[i] >= 5.00:
+            value = previous * 0.40 + factor
+        elif precip[i] >= 2.50:
+            value = previous * 0.70 + factor
+        else:
+            value = previous + factor
+        if wind_v is not None:
+            value = value * exp(0.04 * wind_v[i])
+        values.append(value)
+        previous = value
+    return values
+
+
+def get_reference_nesterov(temp, rh, precip):
+    values = []
+    previous = 0
+    for i in range(len(temp)):
+        es = 6.1 * pow(10, ((7.5 * temp[i]) / (237.3 + temp[i])))
+        factor = es * (1 - (rh[i] / 100)) * temp[i]
+        if precip[i] > 10.00:
+            value = 0
+        elif precip[i] >= 8.10:
+            value = factor
+        elif precip[i] >= 5.10:
+            value = previous * 0.50 + factor
+        elif precip[i] >= 2.10:
+            value = previous * 0.75 + factor
+        else:
+            value = previous + factor
+        values.append(value)
+        previous = value
+    return values
+
+
+def get_reference_telicyn(temp, rh, precip):
+    values = []
+    previous = 0
+    for i in range(len(temp)):
+        es = 6.1 * pow(10, ((7.5 * temp[i]) / (237.3 + temp[i])))
+        log_dpt = log10(((rh[i] / 100) * es) / 6.1)
+        diff = temp[i] - (237.3 * log_dpt) / (7.5 - log_dpt)
+        factor = 0 if diff <= 0 else log10(diff)
+        value = previous + factor if precip[i] < 2.5 else 0
+        values.append(value)
+        previous = value
+    return values
+
+
+def assert_bit_equal(actual, expected):
+    assert np.array_equal(actual.view(np.int64), np.array(expected, dtype=np.float64).view(np.int64))
+
+
+def test_calculate_angstron():
+    temp, rh, _, _ = get_inputs(0)
+    expected = [(rh[i] / 20) + ((temp[i] - 27) / 10) for i in range(len(temp))]
+    assert_bit_equal(risk_rate_kernels.calculate_angstron(temp, rh), expected)
+
+
+def test_calculate_fma():
+    for seed in range(3):
+        _, rh, _, precip = get_inputs(seed)
+        humidity_factor = risk_rate_kernels.get_humidity_factor(rh)
+        assert_bit_equal(risk_rate_kernels.calculate_fma(humidity_factor, precip), get_reference_fma(rh.tolist(), precip.tolist()))
+
+
+def test_calculate_fma_plus():
+    for seed in range(3):
+        _, rh, wind_v, precip = get_inputs(seed)
+        expected = get_reference_fma(rh.tolist(), precip.tolist(), wind_v.tolist())
+        humidity_factor = risk_rate_kernels.get_humidity_factor(rh)
+        assert_bit_equal(risk_rate_kernels.calculate_fma_plus(humidity_factor, precip, wind_v), expected)
+
+
+def test_calculate_nesterov():
+    for seed in range(3):
+        temp, rh, _, precip = get_inputs(seed)
+        expected = get_reference_nesterov(temp.tolist(), rh.tolist(), precip.tolist())
+        es = risk_rate_kernels.get_saturation_vapour_pressure(temp)
+        saturation_deficit = risk_rate_kernels.get_saturation_deficit(es, rh)
+        assert_bit_equal(risk_rate_kernels.calculate_nesterov(temp, saturation_deficit, precip), expected)
+
+
+def test_calculate_telicyn():
+    for seed in range(3):
+        temp, rh, _, precip = get_inputs(seed)
+        expected = get_reference_telicyn(temp.tolist(), rh.tolist(), precip.tolist())
+        dew_point = risk_rate_kernels.get_dew_point(risk_rate_kernels.get_saturation_vapour_pressure(temp), rh)
+        assert_bit_equal(risk_rate_kernels.calculate_telicyn(temp, dew_point, precip), expected)
+
+
+def test_calculate_fma_reset():
+    rh = np.array([50.0, 50.0, 50.0, 50.0])
+    precip = np.array([0.0, 0.0, 13.0, 0.0])
+    assert risk_rate_kernels.calculate_fma(risk_rate_kernels.get_humidity_factor(rh), precip).tolist() == [2.0, 4.0, 0.0, 2.0]
+
+
+def test_classify():
+    values = np.array([0.5, 1.1, 3.0, 8.1, 25.0, np.nan])
+    actual_return = risk_rate_kernels.classify([values > 20, values >= 8.1, values >= 1.1],
+                                               ["high", "medium", "low"], "none")
+    assert actual_return == ["none", "low", "low", "medium", "high", "none"]
@@ -0,0 +1,45 @@
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.risk_rate.risk_rate_state import RiskRateState
+
+DATA = pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-01", periods=4),
+                     'col': [1, 2, 3, 4]})
+
+
+def test_select_new_rows():
+    state = RiskRateState(RiskRateAlgorithmEnum.FMA, pd.Timestamp("2020-01-02"), 1.5)
+    expected_data = pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-03", periods=2),
+                                  'col': [3, 4]})
+    assert state.select_new_rows(DATA).equals(expected_data)
+
+
+def test_select_new_rows_without_date():
+    state = RiskRateState(RiskRateAlgorithmEnum.FMA, None, 1.5)
+    assert state.select_new_rows(DATA).equals(DATA)
+
+
+def test_select_new_rows_without_date_column():
+    state = RiskRateState(RiskRateAlgorithmEnum.FMA, pd.Timestamp("2020-01-02"), 1.5)
+    input_data = DATA.drop(columns=[dscfg.DATE_COLUMN_NAME])
+    assert state.select_new_rows(input_data).equals(input_data)
+
+
+def test_is_continued_by():
+    state = RiskRateState(RiskRateAlgorithmEnum.FMA, pd.Timestamp("2020-01-02"), 1.5)
+    assert state.is_continued_by(DATA)
+    assert state.is_continued_by(DATA.iloc[2:])
+    assert state.is_continued_by(DATA.iloc[:2])
+
+
+def test_is_continued_by_gap():
+    state = RiskRateState(RiskRateAlgorithmEnum.FMA, pd.Timestamp("2020-01-02"), 1.5)
+    assert not state.is_continued_by(DATA.iloc[3:])
+    assert not state.is_continued_by(DATA.drop(index=2))
+
+
+def test_is_continued_by_without_date():
+    state = RiskRateState(RiskRateAlgorithmEnum.FMA, None, 1.5)
+    assert state.is_continued_by(DATA.iloc[3:])
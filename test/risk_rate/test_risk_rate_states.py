@@ -0,0 +1,70 @@
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.risk_rate.risk_rate_state import RiskRateState
+from src.risk_rate.risk_rate_states import RiskRateStates
+
+DATA = pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-01", periods=5),
+                     'col': [1, 2, 3, 4, 5]})
+RISK_RATES = pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-01", periods=3),
+                           'present_fma_value': [0.5, 1.0, 1.5]})
+
+
+def get_risk_rate_states():
+    states = {'present_fma': RiskRateState(RiskRateAlgorithmEnum.FMA, pd.Timestamp("2020-01-03"), 1.5)}
+    return RiskRateStates("model", states, RISK_RATES)
+
+
+def test_is_continued_by():
+    risk_rate_states = get_risk_rate_states()
+    assert risk_rate_states.is_continued_by(DATA)
+    assert risk_rate_states.is_continued_by(DATA.iloc[1:])
+    assert risk_rate_states.is_continued_by(DATA.iloc[3:])
+    assert risk_rate_states.is_continued_by(DATA.iloc[:3])
+
+
+def test_is_continued_by_gap():
+    risk_rate_states = get_risk_rate_states()
+    assert not risk_rate_states.is_continued_by(DATA.iloc[4:])
+    assert not risk_rate_states.is_continued_by(DATA.drop(index=3))
+
+
+def test_is_continued_by_days_not_calculated():
+    risk_rate_states = get_risk_rate_states()
+    earlier_data = pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2019-12-31", periods=6),
+                                 'col': [0, 1, 2, 3, 4, 5]})
+    assert not risk_rate_states.is_continued_by(earlier_data)
+
+
+def test_is_continued_by_without_states():
+    assert not RiskRateStates("model").is_continued_by(DATA)
+    assert not get_risk_rate_states().is_continued_by(DATA.drop(columns=[dscfg.DATE_COLUMN_NAME]))
+
+
+def test_select_known_risk_rates():
+    known_risk_rates = get_risk_rate_states().select_known_risk_rates(DATA.iloc[1:])
+    expected_risk_rates = RISK_RATES.iloc[1:].reset_index(drop=True)
+    assert known_risk_rates.equals(expected_risk_rates)
+    assert RiskRateStates("model").select_known_risk_rates(DATA).empty
+
+
+def test_select_new_rows():
+    expected_data = DATA.iloc[3:].reset_index(drop=True)
+    assert get_risk_rate_states().select_new_rows(DATA).equals(expected_data)
+    assert RiskRateStates("model").select_new_rows(DATA).equals(DATA)
+
+
+def test_update():
+    risk_rate_states = get_risk_rate_states()
+    new_states = {'present_fma': RiskRateState(RiskRateAlgorithmEnum.FMA, pd.Timestamp("2020-01-04"), 2.0)}
+    new_risk_rates = pd.DataFrame({dscfg.DATE_COLUMN_NAME: [pd.Timestamp("2020-01-04")],
+                                   'present_fma_value': [2.0]})
+
+    updated_risk_rate_states = risk_rate_states.update(new_states, new_risk_rates)
+
+    assert updated_risk_rate_states.model_fingerprint == "model"
+    assert updated_risk_rate_states.states is new_states
+    assert updated_risk_rate_states.risk_rates_dataset[dscfg.DATE_COLUMN_NAME].tolist() == list(pd.date_range("2020-01-01", periods=4))
+    assert risk_rate_states.update(new_states, new_risk_rates.iloc[:0]).risk_rates_dataset.equals(RISK_RATES)
@@ -0,0 +1,58 @@
+import numpy as np
+
+import pandas as pd
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.risk_rate import segment_operations
+from src.risk_rate.risk_rate_engine import RiskRateEngine
+from src.risk_rate.risk_rate_state import RiskRateState
+
+
+def get_dataset(n_days, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({dscfg.TEMPERATURE_COLUMN_NAME: rng.uniform(-5, 45, n_days),
+                         dscfg.RELATIVE_HUMIDITY_COLUMN_NAME: rng.uniform(5, 100, n_days),
+                         dscfg.WIND_VELOCITY_COLUMN_NAME: rng.uniform(0, 15, n_days),
+                         dscfg.PRECIPITATION_COLUMN_NAME: rng.choice([0.0, 0.0, 2.5, 8.1, 12.9, 13.0, 30.0], n_days)})
+
+
+def assert_same_values(actual_engine, expected_engine):
+    for risk_rate_algorithm in RiskRateAlgorithmEnum:
+        actual_values, actual_indexes = actual_engine.calculate(risk_rate_algorithm)
+        expected_values, expected_indexes = expected_engine.calculate(risk_rate_algorithm)
+        assert np.array_equal(actual_values.view(np.int64), expected_values.view(np.int64))
+        assert actual_indexes == expected_indexes
+
+
+def test_get_reset_days():
+    precip = np.array([0.0, 2.5, 8.1, 10.0, 12.9, 13.0, 30.0, np.nan])
+    assert segment_operations.get_reset_days(precip).tolist() == [False, False, False, False, False, True, True, False]
+
+
+def test_get_segments():
+    reset_days = np.zeros(10, dtype=bool)
+    reset_days[[3, 8]] = True
+    assert segment_operations.get_segments(reset_days, [], 2) == [(0, 8), (8, 10)]
+    assert segment_operations.get_segments(reset_days, [5], 3) == [(0, 3), (3, 8), (8, 10)]
+    assert segment_operations.get_segments(np.zeros(10, dtype=bool), [], 4) == [(0, 10)]
+
+
+def test_create_engine():
+    dataset = get_dataset(300)
+    states = {risk_rate_algorithm: RiskRateState(risk_rate_algorithm, None, 5.0) for risk_rate_algorithm in RiskRateAlgorithmEnum}
+    actual_return = segment_operations.create_engine(dataset, states, workers=3, min_days_per_worker=50)
+    assert_same_values(actual_return, RiskRateEngine(dataset, states))
+
+
+def test_create_engine_series_starts():
+    datasets = [get_dataset(120, seed) for seed in range(3)]
+    dataset = pd.concat(datasets, ignore_index=True)
+    series_starts = [120, 240]
+    for workers in [1, 3]:
+        actual_return = segment_operations.create_engine(dataset, workers=workers, min_days_per_worker=50, series_starts=series_starts)
+        for risk_rate_algorithm in RiskRateAlgorithmEnum:
+            actual_values, _ = actual_return.calculate(risk_rate_algorithm)
+            expected_values = np.concatenate([RiskRateEngine(series).calculate(risk_rate_algorithm)[0] for series in datasets])
+            assert np.array_equal(actual_values.view(np.int64), expected_values.view(np.int64))
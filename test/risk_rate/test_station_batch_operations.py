@@ -0,0 +1,55 @@
+import numpy as np
+
+import pandas as pd
+
+import pytest
+
+import config.dataset_settings as dscfg
+
+from src.enum.risk_rate_algorithms_enum import RiskRateAlgorithmEnum
+from src.risk_rate import station_batch_operations
+from src.risk_rate.risk_rate_engine import RiskRateEngine
+from src.risk_rate.risk_rate_state import RiskRateState
+
+
+def get_dataset(n_days, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({dscfg.DATE_COLUMN_NAME: pd.date_range("2020-01-01", periods=n_days),
+                         dscfg.TEMPERATURE_COLUMN_NAME: rng.uniform(-5, 45, n_days),
+                         dscfg.RELATIVE_HUMIDITY_COLUMN_NAME: rng.uniform(5, 100, n_days),
+                         dscfg.WIND_VELOCITY_COLUMN_NAME: rng.uniform(0, 15, n_days),
+                         dscfg.PRECIPITATION_COLUMN_NAME: rng.choice([0.0, 0.0, 2.5, 5.0, 8.1, 10.0, 13.0], n_days)})
+
+
+def test_stack_station_datasets():
+    datasets = [get_dataset(10, seed) for seed in range(3)]
+    temp, rh, wind_v, precip = station_batch_operations.stack_station_datasets(datasets)
+    assert temp.shape == (3, 10)
+    assert np.array_equal(precip[1], datasets[1][dscfg.PRECIPITATION_COLUMN_NAME].values)
+
+
+def test_stack_station_datasets_different_days():
+    with pytest.raises(ValueError) as e_info:
+        station_batch_operations.stack_station_datasets([get_dataset(10, 0), get_dataset(11, 1)])
+    assert str(e_info.value) == "Parameter datasets must have the same number of days"
+
+
+def test_calculate_station_risk_rates():
+    datasets = [get_dataset(100, seed) for seed in range(4)]
+    previous_indexes = {risk_rate_algorithm: np.array([0.0, 1.5, 30.0, 2000.0]) for risk_rate_algorithm in RiskRateAlgorithmEnum}
+    actual_return = station_batch_operations.calculate_station_risk_rates(*station_batch_operations.stack_station_datasets(datasets),
+                                                                          previous_indexes=previous_indexes)
+    for station, dataset in enumerate(datasets):
+        states = {risk_rate_algorithm: RiskRateState(risk_rate_algorithm, None, previous_indexes[risk_rate_algorithm][station].item())
+                  for risk_rate_algorithm in RiskRateAlgorithmEnum}
+        engine = RiskRateEngine(dataset, states)
+        for risk_rate_algorithm in RiskRateAlgorithmEnum:
+            values, indexes = actual_return[risk_rate_algorithm]
+            expected_values, expected_indexes = engine.calculate(risk_rate_algorithm)
+            assert np.array_equal(values[station].view(np.int64), expected_values.view(np.int64))
+            assert indexes[station].tolist() == expected_indexes
+
+
+def test_calculate_station_risk_rates_invalid_shape():
+    with pytest.raises(ValueError):
+        station_batch_operations.calculate_station_risk_rates(np.zeros(3), np.zeros(3), np.zeros(3), np.zeros(3))
@@ -0,0 +1,106 @@
+import numpy as np
+
+from src.risk_rate import threshold_search_operations
+
+CANDIDATE_THRESHOLDS = [[0.05, 0.10, 0.15, 0.20, 0.25, 0.30],
+                        [0.10, 0.15, 0.20, 0.25, 0.30, 0.35],
+                        [0.15, 0.20, 0.25, 0.30, 0.35, 0.40, 0.45],
+                        [0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50, 0.75],
+                        [1.00]]
+
+
+def get_reference_score(probabilities, hotspot_identified, thresholds):
+    # One risk rate index per probability and a weighted sum of correlations, computed as scalars
+    total_sum = 0
+    for column in range(probabilities.shape[1]):
+        indexes = []
+        for prob in probabilities[:, column].tolist():
+            for i, threshold in enumerate(thresholds):
+                if prob <= threshold:
+                    indexes.append(i)
+                    break
+        correlations = []
+        for i in range(len(thresholds)):
+            rows = [row for row, index in enumerate(indexes) if index == i]
+            if not rows:
+                correlations.append(0)
+            else:
+                correlations.append(len([row for row in rows if hotspot_identified[row] == 1]) / len(rows))
+        curr_sum = 0
+        curr_sum += (1 - correlations[0]) * 5
+        curr_sum += (1 - correlations[1]) * 4
+        curr_sum += (1 - correlations[2]) * 3
+        curr_sum += correlations[3] * 2
+        curr_sum += correlations[4] * 1
+        total_sum += curr_sum / 15
+    return total_sum
+
+
+def get_reference_search(probabilities, hotspot_identified, candidate_thresholds):
+    best_score = -1
+    best_thresholds = []
+    for thr_nulo in candidate_thresholds[0]:
+        for thr_pequeno in candidate_thresholds[1]:
+            for thr_medio in candidate_thresholds[2]:
+                for thr_alto in candidate_thresholds[3]:
+                    for thr_muito_alto in candidate_thresholds[4]:
+                        thresholds = [thr_nulo, thr_pequeno, thr_medio, thr_alto, thr_muito_alto]
+                        if any(thresholds[i] >= thresholds[i + 1] for i in range(len(thresholds) - 1)):
+                            continue
+                        score = get_reference_score(probabilities, hotspot_identified, thresholds)
+                        if score > best_score:
+                            best_score = score
+                            best_thresholds = thresholds
+    return best_thresholds, best_score
+
+
+def get_probabilities(seed):
+    random = np.random.default_rng(seed)
+    # Probabilities on the thresholds grid too, to check that a probability equal to a threshold belongs to its index
+    probabilities = np.concatenate([random.random((40, 3)), random.integers(0, 20, (20, 3)) * 0.05])
+    hotspot_identified = (random.random(60) < probabilities[:, 0]).astype(int)
+    return probabilities, hotspot_identified
+
+
+def test_get_valid_thresholds():
+    thresholds = threshold_search_operations.get_valid_thresholds([[0.1, 0.3], [0.2, 0.3], [1.0]])
+
+    assert thresholds.tolist() == [[0.1, 0.2, 1.0], [0.1, 0.3, 1.0]]
+
+
+def test_get_risk_rate_indexes():
+    indexes = threshold_search_operations.get_risk_rate_indexes([0.0, 0.05, 0.06, 0.5, 1.0, 1.5], [0.05, 0.25, 0.5, 0.75, 1.0])
+
+    assert indexes.tolist() == [0, 0, 1, 2, 4, threshold_search_operations.NO_INDEX]
+
+
+def test_get_scores_same_as_scalar_computation():
+    probabilities, hotspot_identified = get_probabilities(0)
+    thresholds = threshold_search_operations.get_valid_thresholds(CANDIDATE_THRESHOLDS)
+
+    scores = threshold_search_operations.get_scores(probabilities, hotspot_identified, thresholds)
+
+    assert scores.tolist() == [get_reference_score(probabilities, hotspot_identified, combination) for combination in thresholds.tolist()]
+
+
+def test_search_thresholds_same_as_nested_loops():
+    for seed in range(3):
+        probabilities, hotspot_identified = get_probabilities(seed)
+
+        assert (threshold_search_operations.search_thresholds(probabilities, hotspot_identified, CANDIDATE_THRESHOLDS)
+                == get_reference_search(probabilities, hotspot_identified, CANDIDATE_THRESHOLDS))
+
+
+def test_search_thresholds_tie_won_by_first_combination():
+    probabilities = np.array([[0.9], [0.95]])
+    hotspot_identified = np.array([1, 1])
+
+    thresholds, _ = threshold_search_operations.search_thresholds(probabilities, hotspot_identified, CANDIDATE_THRESHOLDS)
+
+    assert thresholds == [0.05, 0.10, 0.15, 0.20, 1.00]
+
+
+def test_search_thresholds_no_valid_combination():
+    thresholds, score = threshold_search_operations.search_thresholds(np.array([[0.5]]), np.array([1]), [[0.5], [0.4], [1.0]])
+
+    assert (thresholds, score) == ([], -1)
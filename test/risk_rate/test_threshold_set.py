@@ -0,0 +1,45 @@
+import numpy as np
+
+import pytest
+
+from src.enum.risk_rate_index_enum import RiskRateIndexEnum
+from src.risk_rate.threshold_set import ThresholdSet
+
+THRESHOLDS = [0.1, 0.2, 0.4, 0.7, 0.9]
+
+
+def test_constructor():
+    threshold_set = ThresholdSet(THRESHOLDS)
+    assert threshold_set.thresholds == THRESHOLDS
+
+
+def test_constructor_invalid_length():
+    with pytest.raises(ValueError) as e_info:
+        ThresholdSet([0.1, 0.2])
+    assert str(e_info.value) == "Parameter thresholds must have one threshold per risk rate index"
+
+
+def test_constructor_not_increasing():
+    with pytest.raises(ValueError) as e_info:
+        ThresholdSet([0.1, 0.5, 0.4, 0.7, 0.9])
+    assert str(e_info.value) == "Parameter thresholds must be in increasing order"
+
+
+def test_get_default():
+    assert ThresholdSet.get_default().thresholds == [risk_rate.prob_threshold for risk_rate in RiskRateIndexEnum]
+
+
+def test_classify():
+    threshold_set = ThresholdSet(THRESHOLDS)
+    actual_return = threshold_set.classify([0.0, 0.1, 0.15, 0.4, 0.5, 0.9, 0.95, np.nan])
+    assert actual_return == [RiskRateIndexEnum.NULO.value, RiskRateIndexEnum.NULO.value, RiskRateIndexEnum.PEQUENO.value,
+                             RiskRateIndexEnum.MEDIO.value, RiskRateIndexEnum.ALTO.value, RiskRateIndexEnum.MUITO_ALTO.value,
+                             None, None]
+
+
+def test_immutable():
+    threshold_set = ThresholdSet(THRESHOLDS)
+    threshold_set.thresholds[0] = 0.5
+    assert threshold_set.thresholds == THRESHOLDS
+    assert ThresholdSet(THRESHOLDS) == threshold_set
+    assert hash(ThresholdSet(THRESHOLDS)) == hash(threshold_set)
@@ -0,0 +1,76 @@
+from pickle import dump, load
+from unittest import mock
+
+import numpy as np
+
+import pytest
+
+from sklearn.naive_bayes import GaussianNB
+
+import tensorflow as tf
+
+import config.forecast_settings as fccfg
+import config.general_settings as cfg
+
+from src.classification.algorithm import classifier_factory
+from src.enum.classification_algorithms_enum import ClassificationAlgorithmEnum
+from src.enum.forecasting_algorithms_enum import ForecastingAlgorithmEnum
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
+from src.enum.sampling_methods_enum import SamplingMethodEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting.algorithm import forecaster_factory
+from src.pipeline.steps.deploy_model_step import DeployModelStep
+from src.risk_rate.threshold_set import ThresholdSet
+from src.sampling import sampler_factory
+from src.scaling import scaler_factory
+from src.serving.deployed_model import DeployedModel
+
+
+@pytest.fixture
+def deployed_model_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg, 'OUTPUT_EXECUTION_OBJECTS_DIR', str(tmp_path / "execution_objects") + "/")
+    monkeypatch.setattr(cfg, 'OUTPUT_DEPLOYED_MODEL_DIR', str(tmp_path) + "/")
+    monkeypatch.setattr(fccfg, 'INFERENCE_BACKEND', "numpy")
+    return str(tmp_path) + "/"
+
+
+def deploy_model(mode):
+    forecaster = forecaster_factory.get(ForecastingAlgorithmEnum.LSTM, mode)
+    _, _, forecaster.forecaster = forecaster.build_architecture(np.random.default_rng(0).random((40, 4)))
+
+    rng = np.random.default_rng(1)
+    classifier = classifier_factory.get(ClassificationAlgorithmEnum.NB)
+    classifier.classifier = GaussianNB().fit(rng.random((20, 4)), rng.integers(0, 2, 20))
+
+    # The numpy backend loads the weights file, not the Keras model
+    with mock.patch.object(tf.keras.Model, 'save'):
+        DeployModelStep(scaler_factory.get(ScalingMethodEnum.NONE),
+                        forecaster,
+                        sampler_factory.get(SamplingMethodEnum.NONE),
+                        classifier,
+                        ThresholdSet.get_default().thresholds)
+
+
+def test_load_forecasting_mode(deployed_model_dir, monkeypatch):
+    deploy_model(ForecastingModeEnum.DIRECT)
+    # The mode of the deployed model is kept even if the settings change afterwards
+    monkeypatch.setattr(fccfg, 'FORECASTING_MODE', ForecastingModeEnum.RECURSIVE.value)
+
+    deployed_model = DeployedModel.load(deployed_model_dir)
+
+    definitions_dict = load(open(deployed_model_dir + cfg.DEFINITIONS_DICT_FILE_NAME, 'rb'))
+    assert definitions_dict[cfg.FORECASTING_MODE_KEY] == ForecastingModeEnum.DIRECT
+    assert deployed_model.forecaster.mode == ForecastingModeEnum.DIRECT
+    # The loaded model forecasts the whole horizon, as in direct mode
+    assert deployed_model.forecaster.forecast_windows(np.zeros((1, fccfg.OBSERVATION_WINDOW, 4))).shape == (1, fccfg.FORECAST_HORIZON, 4)
+
+
+def test_load_without_forecasting_mode(deployed_model_dir, monkeypatch):
+    deploy_model(ForecastingModeEnum.RECURSIVE)
+    definitions_file_path = deployed_model_dir + cfg.DEFINITIONS_DICT_FILE_NAME
+    definitions_dict = load(open(definitions_file_path, 'rb'))
+    del definitions_dict[cfg.FORECASTING_MODE_KEY]
+    dump(definitions_dict, open(definitions_file_path, 'wb'))
+    monkeypatch.setattr(fccfg, 'FORECASTING_MODE', ForecastingModeEnum.DIRECT.value)
+
+    assert DeployedModel.load(deployed_model_dir).forecaster.mode == ForecastingModeEnum.DIRECT
@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from src.serving.prediction_batcher import PredictionBatcher
+
+
+def test_submit_batches_concurrent_requests():
+    batches = []
+    release = threading.Event()
+
+    def predict(requests):
+        release.wait(5)
+        batches.append(list(requests))
+        return [request * 2 for request in requests]
+
+    batcher = PredictionBatcher(predict, 8, 0.05)
+    # The first batch holds the batcher, while the other requests wait for the next one
+    futures = [batcher.submit(0)]
+    futures += [batcher.submit(request) for request in range(1, 6)]
+    release.set()
+
+    assert [future.result(5) for future in futures] == [0, 2, 4, 6, 8, 10]
+    assert sorted(request for batch in batches for request in batch) == list(range(0, 6))
+    assert len(batches) < 6
+    batcher.stop()
+
+
+def test_submit_max_batch_size():
+    batches = []
+
+    def predict(requests):
+        batches.append(list(requests))
+        return requests
+
+    batcher = PredictionBatcher(predict, 2, 1.0)
+    futures = [batcher.submit(request) for request in range(0, 5)]
+
+    assert [future.result(5) for future in futures] == list(range(0, 5))
+    assert all(len(batch) <= 2 for batch in batches)
+    batcher.stop()
+
+
+def test_submit_failed_request():
+    def predict(requests):
+        if "bad" in requests:
+            raise ValueError("bad request")
+        return requests
+
+    batcher = PredictionBatcher(predict, 8, 0.05)
+    futures = [batcher.submit(request) for request in ["a", "bad", "b"]]
+
+    assert futures[0].result(5) == "a"
+    assert futures[2].result(5) == "b"
+    with pytest.raises(ValueError) as e_info:
+        futures[1].result(5)
+    assert str(e_info.value) == "bad request"
+    batcher.stop()
+
+
+def test_constructor_invalid_max_batch_size():
+    with pytest.raises(ValueError) as e_info:
+        PredictionBatcher(lambda requests: requests, 0, 0.05)
+    assert str(e_info.value) == "Parameter max_batch_size must be positive"
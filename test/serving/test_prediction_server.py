@@ -0,0 +1,69 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from unittest import mock
+
+import pytest
+
+from src.serving import prediction_server
+
+
+def request(server, method, path, body=None):
+    url = "http://127.0.0.1:{}{}".format(server.server_address[1], path)
+    data = None if body is None else body.encode()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data, method=method), timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+@pytest.fixture
+def server():
+    service = mock.Mock()
+    server = prediction_server.create_server(service, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_predict(server):
+    server.service.predict.return_value = {"present": {"probability": 0.5, "risk_rate": "Médio"}}
+
+    status, body = request(server, "POST", "/predict", json.dumps({"rows": [{"T": 30}]}))
+
+    assert status == 200
+    assert body == {"present": {"probability": 0.5, "risk_rate": "Médio"}}
+    server.service.predict.assert_called_once_with([{"T": 30}])
+
+
+@pytest.mark.parametrize("body", ["not json", json.dumps([1, 2]), json.dumps({"data": []})])
+def test_predict_invalid_body(server, body):
+    status, response = request(server, "POST", "/predict", body)
+    assert status == 400
+    assert response == {"error": "Body must be a JSON object with the rows"}
+
+
+def test_predict_invalid_rows(server):
+    server.service.predict.side_effect = ValueError("Parameter rows must be a list of objects")
+    status, body = request(server, "POST", "/predict", json.dumps({"rows": 1}))
+    assert status == 400
+    assert body == {"error": "Parameter rows must be a list of objects"}
+
+
+def test_predict_error(server):
+    server.service.predict.side_effect = RuntimeError("model failure")
+    status, body = request(server, "POST", "/predict", json.dumps({"rows": []}))
+    assert status == 500
+    assert body == {"error": "Prediction failed"}
+
+
+def test_health(server):
+    assert request(server, "GET", "/health") == (200, {"status": "ok"})
+
+
+def test_not_found(server):
+    assert request(server, "GET", "/predict")[0] == 404
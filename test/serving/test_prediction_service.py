@@ -0,0 +1,60 @@
+from unittest import mock
+
+import numpy as np
+
+import pandas as pd
+
+import config.forecast_settings as fccfg
+
+from src.serving.prediction_service import PredictionService
+
+
+def get_rows(n_rows):
+    return [{'Date': str(date.date()), 'T': 20 + i, 'UR': 90 - i, 'V': np.cos(i), 'P': 0.0}
+            for i, date in enumerate(pd.date_range('2020-01-01', periods=n_rows))]
+
+
+@mock.patch('src.serving.serving_operations.predict')
+@mock.patch('src.serving.deployed_model.DeployedModel.load')
+def test_predict(mock_load, mock_predict, tmp_path):
+    mock_predict.side_effect = lambda deployed_model, requests: [{'n_rows': rows.shape[0]} for rows in requests]
+    service = PredictionService(str(tmp_path) + "/")
+
+    result = service.predict(get_rows(fccfg.OBSERVATION_WINDOW + 2))
+
+    assert result == {'n_rows': fccfg.OBSERVATION_WINDOW + 2}
+    mock_load.assert_called_once_with(str(tmp_path) + "/")
+    assert mock_predict.call_args[0][0] is mock_load.return_value
+    service.stop()
+
+
+@mock.patch('src.serving.deployed_model.DeployedModel.load')
+def test_reload_if_changed(mock_load, tmp_path):
+    first_model, second_model = mock.Mock(), mock.Mock()
+    mock_load.side_effect = [first_model, second_model]
+    (tmp_path / "classifier.pkl").write_bytes(b"first")
+    service = PredictionService(str(tmp_path) + "/")
+
+    assert not service.reload_if_changed()
+    (tmp_path / "classifier.pkl").write_bytes(b"second")
+    # The change is loaded once the files are the same in two checks in a row
+    assert not service.reload_if_changed()
+    assert service.deployed_model is first_model
+    assert service.reload_if_changed()
+    assert service.deployed_model is second_model
+    assert not service.reload_if_changed()
+    service.stop()
+
+
+@mock.patch('src.serving.deployed_model.DeployedModel.load')
+def test_reload_if_changed_load_error(mock_load, tmp_path):
+    first_model = mock.Mock()
+    mock_load.side_effect = [first_model, EOFError("truncated")]
+    service = PredictionService(str(tmp_path) + "/")
+
+    (tmp_path / "scaler.pkl").write_bytes(b"partial")
+    service.reload_if_changed()
+
+    assert not service.reload_if_changed()
+    assert service.deployed_model is first_model
+    service.stop()
@@ -0,0 +1,137 @@
+from unittest import mock
+
+import numpy as np
+
+import pandas as pd
+
+import pytest
+
+import config.forecast_settings as fccfg
+
+from src.classification.algorithm.classifier import Classifier
+from src.enum.forecasting_modes_enum import ForecastingModeEnum
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting.algorithm.forecaster import Forecaster
+from src.risk_rate.threshold_set import ThresholdSet
+from src.scaling import scaler_factory
+from src.serving import serving_operations
+from src.serving.deployed_model import DeployedModel
+
+THRESHOLDS = [0.1, 0.2, 0.4, 0.7, 1.0]
+
+
+class StubModel:
+    def predict(self, X, verbose=0):
+        return np.asarray(X, dtype=np.float32).mean(axis=1)
+
+
+class DirectStubModel:
+    def predict(self, X, verbose=0):
+        forecasted = StubModel().predict(X)
+        return np.stack([forecasted + day for day in range(0, fccfg.FORECAST_HORIZON)], axis=1)
+
+
+class StubForecaster(Forecaster):
+    def __init__(self, mode=ForecastingModeEnum.RECURSIVE):
+        super().__init__(mode)
+        self.forecaster = DirectStubModel() if mode == ForecastingModeEnum.DIRECT else StubModel()
+
+
+class StubEstimator:
+    def predict(self, X):
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(int)
+
+    def predict_proba(self, X):
+        probabilities = 1 / (1 + np.exp(-np.asarray(X).sum(axis=1)))
+        return np.stack([1 - probabilities, probabilities], axis=1)
+
+
+class StubClassifier(Classifier):
+    def __init__(self):
+        self.classifier = StubEstimator()
+
+
+def get_rows(start, n_rows):
+    return [{'Date': str(date.date()), 'T': 20 + start + i, 'UR': 90 - 2 * i, 'V': np.cos(i + start), 'P': 0.5 * (i % 3)}
+            for i, date in enumerate(pd.date_range('2020-01-01', periods=n_rows).shift(start))]
+
+
+def get_deployed_model(mode=ForecastingModeEnum.RECURSIVE):
+    scaler = scaler_factory.get(ScalingMethodEnum.MIN_MAX_SCALER)
+    scaler.fit_scale(serving_operations.parse_rows(get_rows(0, 60)))
+    return DeployedModel(scaler, StubForecaster(mode), None, StubClassifier(), THRESHOLDS)
+
+
+def test_parse_rows():
+    rows = [{**row, 'Extra': 1} for row in get_rows(0, fccfg.OBSERVATION_WINDOW)]
+    rows[0]['T'] = "21.5"
+
+    dataset = serving_operations.parse_rows(rows)
+
+    assert list(dataset.columns) == ['Date', 'T', 'UR', 'V', 'P']
+    assert dataset['T'].iloc[0] == 21.5
+    assert dataset.shape[0] == fccfg.OBSERVATION_WINDOW
+
+
+@pytest.mark.parametrize("rows, message", [
+    ({'rows': []}, "Parameter rows must be a list of objects"),
+    (get_rows(0, fccfg.OBSERVATION_WINDOW - 1), "Parameter rows must have at least {} rows".format(fccfg.OBSERVATION_WINDOW)),
+    ([{key: value for key, value in row.items() if key != 'UR'} for row in get_rows(0, fccfg.OBSERVATION_WINDOW)],
+     "Parameter rows must have the columns UR"),
+    ([{**row, 'P': 'rain'} for row in get_rows(0, fccfg.OBSERVATION_WINDOW)],
+     "Parameter rows must have numeric values in the columns T, UR, V, P")
+])
+def test_parse_rows_invalid(rows, message):
+    with pytest.raises(ValueError) as e_info:
+        serving_operations.parse_rows(rows)
+    assert str(e_info.value) == message
+
+
+def test_forecast_recursive():
+    windows = np.random.default_rng(0).random((3, fccfg.OBSERVATION_WINDOW, 4))
+
+    forecasted = serving_operations.forecast(StubForecaster(), windows)
+
+    expected = []
+    for _ in range(0, fccfg.FORECAST_HORIZON):
+        expected.append(windows.mean(axis=1))
+        windows = np.concatenate([windows[:, 1:], expected[-1][:, np.newaxis]], axis=1)
+    assert forecasted.shape == (3, fccfg.FORECAST_HORIZON, 4)
+    assert np.allclose(forecasted, np.stack(expected, axis=1), atol=1e-5)
+
+
+def test_forecast_direct():
+    windows = np.random.default_rng(0).random((3, fccfg.OBSERVATION_WINDOW, 4))
+    forecaster = StubForecaster(ForecastingModeEnum.DIRECT)
+
+    with mock.patch.object(forecaster, 'forecast_windows', wraps=forecaster.forecast_windows) as mock_forecast_windows:
+        forecasted = serving_operations.forecast(forecaster, windows)
+
+    mock_forecast_windows.assert_called_once()
+    assert forecasted.shape == (3, fccfg.FORECAST_HORIZON, 4)
+
+
+def test_predict():
+    deployed_model = get_deployed_model()
+    rows = serving_operations.parse_rows(get_rows(5, fccfg.OBSERVATION_WINDOW + 3))
+
+    result = serving_operations.predict(deployed_model, [rows])[0]
+
+    present = deployed_model.scaler.scale(rows).drop(columns=['Date']).to_numpy()[-1]
+    expected_probability = 1 / (1 + np.exp(-present.sum()))
+    assert result['Date'] == rows['Date'].iloc[-1]
+    assert result['present']['probability'] == pytest.approx(expected_probability)
+    assert result['present']['risk_rate'] == ThresholdSet(THRESHOLDS).classify([expected_probability])[0]
+    assert [day['days_in_future'] for day in result['forecasted']] == list(range(1, fccfg.FORECAST_HORIZON + 1))
+
+
+@pytest.mark.parametrize("mode", [ForecastingModeEnum.RECURSIVE, ForecastingModeEnum.DIRECT])
+def test_predict_batch(mode):
+    deployed_model = get_deployed_model(mode)
+    requests = [serving_operations.parse_rows(get_rows(start, fccfg.OBSERVATION_WINDOW + start)) for start in range(0, 4)]
+
+    with mock.patch.object(deployed_model.classifier, 'predict', wraps=deployed_model.classifier.predict) as mock_predict:
+        results = serving_operations.predict(deployed_model, requests)
+
+    mock_predict.assert_called_once()
+    assert results == [serving_operations.predict(deployed_model, [rows])[0] for rows in requests]
@@ -0,0 +1,148 @@
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from src.storage.blob_store import BlobStore
+from src.storage.storage_statistics import StorageStatistics
+from src.utils import fingerprint_utils
+
+
+def get_dataset():
+    return pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=4),
+        'T': np.array([20.5, 21.0, 22.5, 19.0], dtype=np.float32),
+        'P': [0.0, 1.5, 0.0, 3.0],
+        'hotspot': [True, False, False, True]
+    })
+
+
+def test_put_get_dataframe(tmp_path):
+    blob_store = BlobStore(str(tmp_path), "zstd")
+    reference = blob_store.put(get_dataset())
+
+    assert reference["format"] == "parquet"
+    loaded = blob_store.get(reference)
+    assert loaded.dtypes.equals(get_dataset().dtypes)
+    assert_frame_equal(loaded, get_dataset(), check_exact=True)
+
+
+def test_put_get_dataframe_not_parquet_compatible(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    dataset = pd.DataFrame({0: [1.0, 2.0], 1: [3.0, 4.0]})
+    reference = blob_store.put(dataset)
+
+    assert reference["format"] == "pickle"
+    assert_frame_equal(blob_store.get(reference), dataset, check_exact=True)
+
+
+@pytest.mark.parametrize("column", [["x", 1, 2.5], pd.Series([1, None, 3], dtype=object), [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]])
+def test_put_get_dataframe_object_column_not_parquet_compatible(tmp_path, column):
+    blob_store = BlobStore(str(tmp_path))
+    dataset = pd.DataFrame({'T': [20.5, 21.0, 22.5], 'values': column})
+    reference = blob_store.put(dataset)
+    loaded = blob_store.get(reference)
+
+    assert reference["format"] == "pickle"
+    assert loaded.dtypes.equals(dataset.dtypes)
+    assert_frame_equal(loaded, dataset, check_exact=True)
+
+
+def test_put_get_dataframe_string_column(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    dataset = pd.DataFrame({'T': [20.5, 21.0, 22.5], 'station': ["A", None, "C"]})
+    reference = blob_store.put(dataset)
+    loaded = blob_store.get(reference)
+
+    assert reference["format"] == "parquet"
+    assert loaded.dtypes.equals(dataset.dtypes)
+    assert_frame_equal(loaded, dataset, check_exact=True)
+
+
+def test_put_dataframe_parquet_error(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    dataset = get_dataset()
+
+    with mock.patch.object(pd.DataFrame, 'to_parquet', side_effect=TypeError("not convertible")):
+        reference = blob_store.put(dataset)
+
+    assert reference["format"] == "pickle"
+    assert os.listdir(tmp_path / reference["blob"][:2]) == [reference["blob"] + ".pkl"]
+    assert_frame_equal(blob_store.get(reference), dataset, check_exact=True)
+
+
+def test_put_get_array_is_memory_mapped(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    loaded = blob_store.get(blob_store.put(array))
+
+    assert isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, array)
+    loaded[0, 0] = -1
+    assert loaded[0, 0] == -1
+    assert np.array_equal(blob_store.get(blob_store.put(array)), array)
+
+
+def test_put_get_other_values(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+
+    assert blob_store.get(blob_store.put([0.1, 0.2])) == [0.1, 0.2]
+    assert blob_store.get(blob_store.put(None)) is None
+
+
+def test_put_same_content_is_written_once(tmp_path):
+    statistics = StorageStatistics()
+    blob_store = BlobStore(str(tmp_path), statistics=statistics)
+    reference = blob_store.put(get_dataset())
+    other_reference = blob_store.put(get_dataset())
+
+    assert reference == other_reference
+    assert statistics.blobs_written == 1
+    assert statistics.blobs_deduplicated == 1
+    assert statistics.bytes_deduplicated == statistics.bytes_written > 0
+    assert sum(len(file_names) for _, _, file_names in os.walk(str(tmp_path))) == 1
+
+
+def test_put_different_content(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    other_dataset = get_dataset()
+    other_dataset.iloc[0, 2] = 9.0
+
+    assert blob_store.put(get_dataset()) != blob_store.put(other_dataset)
+    assert blob_store.statistics.blobs_written == 2
+
+
+def test_clean(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    reference = blob_store.put(get_dataset())
+    blob_store.put(np.arange(12, dtype=np.float64))
+    old_value_reference = blob_store.put([0.1, 0.2])
+
+    blob_store.clean({reference["blob"]})
+
+    assert blob_store.statistics.blobs_removed == 2
+    assert blob_store.statistics.bytes_removed > 0
+    assert_frame_equal(blob_store.get(reference), get_dataset(), check_exact=True)
+    assert sum(len(file_names) for _, _, file_names in os.walk(str(tmp_path))) == 1
+    # Removed blobs are written again when stored
+    assert np.array_equal(blob_store.get(blob_store.put(np.arange(12, dtype=np.float64))), np.arange(12, dtype=np.float64))
+    assert blob_store.put([0.1, 0.2]) == old_value_reference
+
+
+def test_get_updates_bytes_read(tmp_path):
+    blob_store = BlobStore(str(tmp_path))
+    blob_store.get(blob_store.put(get_dataset()))
+
+    assert blob_store.statistics.bytes_read == blob_store.statistics.bytes_written
+
+
+def test_get_remembers_fingerprint(tmp_path, monkeypatch):
+    blob_store = BlobStore(str(tmp_path))
+    reference = blob_store.put(get_dataset())
+    loaded = blob_store.get(reference)
+    monkeypatch.setattr(pd.util, 'hash_pandas_object', None)
+
+    assert fingerprint_utils.get_fingerprint(loaded) == reference["blob"]
@@ -0,0 +1,121 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.pipeline.step import StepOutput
+from src.scaling import scaler_factory
+from src.storage.blob_store import BlobStore
+from src.storage.object_serializer import ObjectSerializer
+
+
+def get_dataset():
+    return pd.DataFrame({
+        'Date': pd.date_range('2020-01-01', periods=4),
+        'T': np.array([20.5, 21.0, 22.5, 19.0], dtype=np.float32),
+        'P': [0.0, 1.5, 0.0, 3.0]
+    })
+
+
+def get_step_output():
+    scaler = scaler_factory.get(ScalingMethodEnum.STANDARD_SCALER)
+    scaler.fit_scale(get_dataset(), ['T', 'P'])
+    step_output = StepOutput()
+    step_output.scaler = scaler
+    step_output.dataset = get_dataset()
+    step_output.datasets = [get_dataset(), get_dataset().head(2)]
+    step_output.thresholds = [0.1, 0.2]
+    step_output.method = ScalingMethodEnum.NONE
+    return step_output
+
+
+def test_save_load_source_object(tmp_path):
+    serializer = ObjectSerializer(BlobStore(str(tmp_path / "blobs")))
+    step_output = get_step_output()
+    file_path = str(tmp_path / "object.json")
+    serializer.save(step_output, file_path)
+    loaded = serializer.load(file_path)
+
+    assert serializer.contains(file_path)
+    assert isinstance(loaded, StepOutput)
+    assert type(loaded.scaler) == type(step_output.scaler)
+    assert_frame_equal(loaded.scaler.scale(get_dataset(), ['T', 'P']), step_output.scaler.scale(get_dataset(), ['T', 'P']), check_exact=True)
+    assert_frame_equal(loaded.dataset, get_dataset(), check_exact=True)
+    assert isinstance(loaded.datasets, list)
+    assert_frame_equal(loaded.datasets[1], get_dataset().head(2), check_exact=True)
+    assert loaded.thresholds == [0.1, 0.2]
+    assert loaded.method is ScalingMethodEnum.NONE
+
+
+def test_save_shares_values_between_objects(tmp_path):
+    blob_store = BlobStore(str(tmp_path / "blobs"))
+    serializer = ObjectSerializer(blob_store)
+    serializer.save(get_step_output(), str(tmp_path / "object.json"))
+    blobs_written = blob_store.statistics.blobs_written
+    serializer.save(get_step_output(), str(tmp_path / "other_object.json"))
+
+    assert blob_store.statistics.blobs_written == blobs_written
+    assert blob_store.statistics.blobs_deduplicated > 0
+
+
+def test_save_tuple(tmp_path):
+    serializer = ObjectSerializer(BlobStore(str(tmp_path / "blobs")))
+    file_path = str(tmp_path / "object.json")
+    serializer.save((get_dataset(), 1), file_path)
+    loaded = serializer.load(file_path)
+
+    assert isinstance(loaded, tuple)
+    assert_frame_equal(loaded[0], get_dataset(), check_exact=True)
+    assert loaded[1] == 1
+
+
+def test_contains_missing(tmp_path):
+    serializer = ObjectSerializer(BlobStore(str(tmp_path / "blobs")))
+
+    assert not serializer.contains(str(tmp_path / "missing.json"))
+    assert not os.path.exists(str(tmp_path / "blobs"))
+
+
+def test_load_lazily(tmp_path):
+    blob_store = BlobStore(str(tmp_path / "blobs"))
+    serializer = ObjectSerializer(blob_store)
+    file_path = str(tmp_path / "object.json")
+    serializer.save(get_step_output(), file_path)
+    output_class, field_loaders = serializer.load_lazily(file_path)
+
+    assert output_class == StepOutput
+    assert sorted(field_loaders) == ['dataset', 'datasets', 'method', 'scaler', 'thresholds']
+    assert blob_store.statistics.bytes_read == 0
+
+    step_output = output_class.__new__(output_class)
+    step_output.set_lazy_fields(field_loaders)
+    assert step_output.thresholds == [0.1, 0.2]
+    bytes_read = blob_store.statistics.bytes_read
+    assert step_output.thresholds == [0.1, 0.2]
+    assert blob_store.statistics.bytes_read == bytes_read
+    assert_frame_equal(step_output.dataset, get_dataset(), check_exact=True)
+    assert blob_store.statistics.bytes_read > bytes_read
+
+
+def test_load_lazily_missing_field(tmp_path):
+    serializer = ObjectSerializer(BlobStore(str(tmp_path / "blobs")))
+    file_path = str(tmp_path / "object.json")
+    serializer.save(get_step_output(), file_path)
+    output_class, field_loaders = serializer.load_lazily(file_path)
+    step_output = output_class.__new__(output_class)
+    step_output.set_lazy_fields(field_loaders)
+
+    with pytest.raises(AttributeError):
+        step_output.missing
+
+
+def test_load_lazily_not_an_object(tmp_path):
+    serializer = ObjectSerializer(BlobStore(str(tmp_path / "blobs")))
+    file_path = str(tmp_path / "object.json")
+    serializer.save([1, 2], file_path)
+
+    with pytest.raises(TypeError):
+        serializer.load_lazily(file_path)
@@ -0,0 +1,211 @@
+import ast
+import inspect
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+import config.classification_settings as clfcfg
+import config.forecast_settings as fccfg
+import config.general_settings as cfg
+
+from src.classification.algorithm import classifier_factory
+
+from src.enum.scaling_methods_enum import ScalingMethodEnum
+from src.forecasting.algorithm import forecaster_factory
+from src.sampling import sampler_factory
+from src.scaling import scaler_factory
+from src.utils import fingerprint_utils
+
+
+def test_get_fingerprint_dataframe_same_content():
+    dataframe = pd.DataFrame({'col1': [1, 2, 3], 'col2': [0.1, 0.2, 0.3]})
+
+    assert fingerprint_utils.get_fingerprint(dataframe) == fingerprint_utils.get_fingerprint(dataframe.copy())
+
+
+def test_get_fingerprint_dataframe_different_content():
+    dataframe = pd.DataFrame({'col1': [1, 2, 3], 'col2': [0.1, 0.2, 0.3]})
+    other_dataframe = dataframe.copy()
+    other_dataframe.iloc[1, 1] = 0.25
+
+    assert fingerprint_utils.get_fingerprint(dataframe) != fingerprint_utils.get_fingerprint(other_dataframe)
+
+
+def test_get_fingerprint_dataframe_different_columns_and_dtypes():
+    dataframe = pd.DataFrame({'col1': [1, 2, 3]})
+
+    assert fingerprint_utils.get_fingerprint(dataframe) != fingerprint_utils.get_fingerprint(dataframe.rename(columns={'col1': 'col2'}))
+    assert fingerprint_utils.get_fingerprint(dataframe) != fingerprint_utils.get_fingerprint(dataframe.astype(float))
+
+
+def test_get_fingerprint_dataframe_list_column():
+    # As the execution summary of SelectScalerForecasterStep, whose error metrics are lists
+    dataframe = pd.DataFrame({'forecast_algorithm': ["LSTM", "GRU"], 'error_metric': [[0.5, 0.4, 0.3], [0.6, 0.5, 0.4]]})
+    other_dataframe = pd.DataFrame({'forecast_algorithm': ["LSTM", "GRU"], 'error_metric': [[0.5, 0.4, 0.3], [0.6, 0.5, 0.7]]})
+
+    assert fingerprint_utils.get_fingerprint(dataframe) == fingerprint_utils.get_fingerprint(dataframe.copy())
+    assert fingerprint_utils.get_fingerprint(dataframe) != fingerprint_utils.get_fingerprint(other_dataframe)
+    assert fingerprint_utils.get_fingerprint(dataframe['error_metric']) != fingerprint_utils.get_fingerprint(other_dataframe['error_metric'])
+    assert fingerprint_utils.get_fingerprint(dataframe) != fingerprint_utils.get_fingerprint(dataframe.set_index(pd.Index([1, 2])))
+
+
+def test_get_fingerprint_array():
+    array = np.arange(6, dtype=np.float32)
+
+    assert fingerprint_utils.get_fingerprint(array) == fingerprint_utils.get_fingerprint(array.copy())
+    assert fingerprint_utils.get_fingerprint(array) != fingerprint_utils.get_fingerprint(array.reshape(2, 3))
+    assert fingerprint_utils.get_fingerprint(array) != fingerprint_utils.get_fingerprint(array.astype(np.float64))
+
+
+def test_get_fingerprint_collections_and_enums():
+    obj = {'b': [1, 2.0, "3"], 'a': (ScalingMethodEnum.NONE, None)}
+
+    assert fingerprint_utils.get_fingerprint(obj) == fingerprint_utils.get_fingerprint(dict(reversed(list(obj.items()))))
+    assert fingerprint_utils.get_fingerprint([1, 2]) != fingerprint_utils.get_fingerprint((1, 2))
+    assert fingerprint_utils.get_fingerprint(1) != fingerprint_utils.get_fingerprint(1.0)
+
+
+def test_get_fingerprint_source_objects():
+    scaler = scaler_factory.get(ScalingMethodEnum.NONE)
+    other_scaler = scaler_factory.get(ScalingMethodEnum.NONE)
+
+    assert fingerprint_utils.get_fingerprint(scaler) == fingerprint_utils.get_fingerprint(other_scaler)
+    other_scaler.method = ScalingMethodEnum.MIN_MAX_SCALER
+    assert fingerprint_utils.get_fingerprint(scaler) != fingerprint_utils.get_fingerprint(other_scaler)
+
+
+def test_get_fingerprint_of_fingerprints_order():
+    fingerprints = {'a': '1', 'b': '2'}
+
+    assert fingerprint_utils.get_fingerprint_of_fingerprints(fingerprints) == fingerprint_utils.get_fingerprint_of_fingerprints({'b': '2', 'a': '1'})
+    assert fingerprint_utils.get_fingerprint_of_fingerprints(fingerprints) != fingerprint_utils.get_fingerprint_of_fingerprints({'a': '2', 'b': '1'})
+
+
+def test_get_file_fingerprint(tmp_path):
+    file_path = tmp_path / "file.txt"
+    missing_fingerprint = fingerprint_utils.get_file_fingerprint(str(file_path))
+    file_path.write_text("content")
+    fingerprint = fingerprint_utils.get_file_fingerprint(str(file_path))
+
+    assert fingerprint != missing_fingerprint
+    assert fingerprint_utils.get_file_fingerprint(str(tmp_path)) != fingerprint_utils.get_file_fingerprint(str(tmp_path / "other"))
+    file_path.write_text("other content")
+    assert fingerprint_utils.get_file_fingerprint(str(file_path)) != fingerprint
+
+
+def test_get_settings_fingerprint():
+    fingerprint = fingerprint_utils.get_settings_fingerprint(fccfg)
+    actual_forecast_horizon = fccfg.FORECAST_HORIZON
+    fccfg.FORECAST_HORIZON = actual_forecast_horizon + 1
+
+    assert fingerprint_utils.get_settings_fingerprint(fccfg) != fingerprint
+
+    fccfg.FORECAST_HORIZON = actual_forecast_horizon
+    assert fingerprint_utils.get_settings_fingerprint(fccfg) == fingerprint
+
+
+@pytest.mark.parametrize("name, value", [("PIPELINE_WORKERS", 1), ("RISK_RATE_WORKERS", 1), ("PROFILE_PIPELINE", True)])
+def test_get_settings_fingerprint_execution_settings(monkeypatch, name, value):
+    fingerprint = fingerprint_utils.get_settings_fingerprint(cfg)
+    monkeypatch.setattr(cfg, name, value)
+
+    assert fingerprint_utils.get_settings_fingerprint(cfg) == fingerprint
+
+
+@pytest.mark.parametrize("name, value", [("SELECTION_WORKERS", 1), ("SELECTION_INTRA_OP_THREADS", 2), ("SELECTION_INTER_OP_THREADS", 2)])
+def test_get_settings_fingerprint_selection_workers(monkeypatch, name, value):
+    fingerprint = fingerprint_utils.get_settings_fingerprint(fccfg)
+    monkeypatch.setattr(fccfg, name, value)
+
+    assert fingerprint_utils.get_settings_fingerprint(fccfg) == fingerprint
+    monkeypatch.setattr(fccfg, 'SELECTION_SEED', fccfg.SELECTION_SEED + 1)
+    assert fingerprint_utils.get_settings_fingerprint(fccfg) != fingerprint
+
+
+def test_get_code_dependencies():
+    source_modules, settings_modules = fingerprint_utils.get_code_dependencies(forecaster_factory)
+    source_module_names = [module.__name__ for module in source_modules]
+
+    assert forecaster_factory.__name__ in source_module_names
+    assert 'src.forecasting.algorithm.lstm_forecaster' in source_module_names
+    assert fccfg in settings_modules
+    assert clfcfg not in settings_modules
+
+
+def test_get_code_dependencies_lazy_modules():
+    source_modules, settings_modules = fingerprint_utils.get_code_dependencies(classifier_factory)
+    source_module_names = [module.__name__ for module in source_modules]
+
+    assert 'src.classification.algorithm.xgboost_classifier' in source_module_names
+    assert 'src.classification.algorithm.catboost_classifier' in source_module_names
+    # Followed from the imports of the lazy modules
+    assert clfcfg in settings_modules
+    assert cfg in settings_modules
+
+
+def test_get_code_dependencies_lazy_modules_not_imported():
+    code = ("import sys\n"
+            "from src.pipeline.steps import select_sampler_classifier_step\n"
+            "from src.utils import fingerprint_utils\n"
+            "fingerprint_utils.get_code_dependencies(select_sampler_classifier_step)\n"
+            "print([name for name in ('xgboost', 'lightgbm', 'catboost', 'imblearn') if name in sys.modules])")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "[]"
+
+
+@pytest.mark.parametrize("factory", [classifier_factory, sampler_factory])
+def test_lazy_module_names(factory):
+    # Every module imported inside the factory functions must be listed
+    imported_module_names = [node.module for node in ast.walk(ast.parse(inspect.getsource(factory)))
+                             if isinstance(node, ast.ImportFrom) and node.col_offset > 0]
+
+    assert sorted(imported_module_names) == sorted(factory.LAZY_MODULE_NAMES)
+
+
+def test_get_code_fingerprint():
+    source_modules, _ = fingerprint_utils.get_code_dependencies(forecaster_factory)
+
+    assert fingerprint_utils.get_code_fingerprint(source_modules) == fingerprint_utils.get_code_fingerprint(source_modules)
+    assert fingerprint_utils.get_code_fingerprint(source_modules) != fingerprint_utils.get_code_fingerprint(source_modules[:1])
+
+
+def test_get_fingerprint_nested_leaf_uses_leaf_fingerprint():
+    dataframe = pd.DataFrame({'col1': [1, 2, 3]})
+    other_dataframe = dataframe.copy()
+    fingerprint_utils.remember_fingerprint(other_dataframe, fingerprint_utils.get_fingerprint(dataframe))
+
+    assert fingerprint_utils.get_fingerprint([dataframe, 1]) == fingerprint_utils.get_fingerprint([other_dataframe, 1])
+
+
+def test_remember_fingerprint():
+    dataframe = pd.DataFrame({'col1': [1, 2, 3]})
+    fingerprint_utils.remember_fingerprint(dataframe, "known")
+
+    assert fingerprint_utils.get_fingerprint(dataframe) == "known"
+    assert fingerprint_utils.get_fingerprint({'a': [dataframe]}) == fingerprint_utils.get_fingerprint({'a': [dataframe]})
+    assert fingerprint_utils.get_fingerprint(dataframe.copy()) != "known"
+
+
+def test_remember_fingerprint_not_leaf():
+    values = [1, 2]
+    fingerprint_utils.remember_fingerprint(values, "known")
+
+    assert fingerprint_utils.get_fingerprint(values) != "known"
+
+
+def test_forget_fingerprints():
+    dataframe = pd.DataFrame({'col1': [1, 2, 3]})
+    array = np.arange(3)
+    scaler = scaler_factory.get(ScalingMethodEnum.NONE)
+    scaler.data = dataframe
+    fingerprint_utils.remember_fingerprint(dataframe, "known dataframe")
+    fingerprint_utils.remember_fingerprint(array, "known array")
+    fingerprint_utils.forget_fingerprints({'scaler': scaler, 'arrays': (array,)})
+
+    assert fingerprint_utils.get_fingerprint(dataframe) != "known dataframe"
+    assert fingerprint_utils.get_fingerprint(array) != "known array"
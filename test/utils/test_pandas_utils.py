@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -171,6 +172,15 @@ def test_select_value_row_column_int():
     assert expected_return == actual_return
 
 
+def test_select_column_values():
+    input_data = pd.DataFrame({'col': [1, 2, 3], 'col2': [0.5, 1.5, 2.5]})
+    actual_return = pdutils.select_column_values(input_data, 'col')
+    assert actual_return.dtype == np.float64
+    assert actual_return.flags['C_CONTIGUOUS']
+    assert actual_return.tolist() == [1.0, 2.0, 3.0]
+    assert pdutils.select_column_values(input_data, 1).tolist() == [0.5, 1.5, 2.5]
+
+
 def test_join_dataframes_x_wise():
     data_1 = DATA.copy()
     data_2 = pd.DataFrame({'col': ['a', 'd'], 'col2': ['b', 'e'],
@@ -203,6 +213,17 @@ def test_join_dataframes_x_wise_drop_column_names_true():
     assert output_data.equals(expected_data)
 
 
+def test_join_dataframes_x_wise_does_not_change_input():
+    data_1 = DATA.copy()
+    data_1.index = [5, 6, 7]
+    data_2 = DATA.copy()
+
+    pdutils.join_dataframes_x_wise([data_1, data_2], drop_column_names=True)
+
+    assert list(data_1.index) == [5, 6, 7]
+    assert list(data_2.columns) == list(DATA.columns)
+
+
 def test_join_dataframes_y_wise():
     data_1 = DATA.copy()
     data_2 = pd.DataFrame({'col3': ['value3', 'value4', 'value2'],
@@ -235,6 +256,17 @@ def test_join_dataframes_y_wise_drop_duplicates_true():
     assert output_data.equals(expected_data)
 
 
+def test_join_dataframes_y_wise_does_not_change_input():
+    data_1 = DATA.copy()
+    data_1.index = [5, 6, 7]
+    data_2 = pd.DataFrame({'col4': ['a', 'b', 'c']})
+
+    output_data = pdutils.join_dataframes_y_wise([data_1, data_2])
+
+    assert list(data_1.index) == [5, 6, 7]
+    assert list(output_data.index) == [0, 1, 2]
+
+
 def test_remove_duplicated_columns():
     dataset = pd.DataFrame({'col1': ['e', 'f', 'g'],
                             'col4': ['a', 'b', 'c'],
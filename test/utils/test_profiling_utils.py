@@ -0,0 +1,62 @@
+import contextvars
+import threading
+
+from src.pipeline import execution_context
+from src.profiling.profiler import Profiler
+from src.utils import profiling_utils
+
+
+def run_in_context(function):
+    return contextvars.copy_context().run(function)
+
+
+def test_profile_disabled():
+    def profile_disabled():
+        with profiling_utils.profile("step", "step") as span:
+            profiling_utils.record_bytes_serialized(10)
+        return span
+
+    assert run_in_context(profile_disabled) is None
+
+
+def test_profile_nested_spans():
+    profiler = Profiler(trace_memory=False)
+
+    def profile_nested():
+        execution_context.set_profiler(profiler)
+        with profiling_utils.profile("fit", "pipeline"):
+            with profiling_utils.profile("fit/predict_step", "step", step_name="Predict") as span:
+                span.args["cache_hit"] = True
+                profiling_utils.record_bytes_deserialized(8)
+            profiling_utils.record_bytes_serialized(2)
+
+    run_in_context(profile_nested)
+
+    spans = {span.name: span for span in profiler.spans}
+    assert spans["fit/predict_step"].parent is spans["fit"]
+    assert spans["fit/predict_step"].args == {"step_name": "Predict", "cache_hit": True}
+    assert (spans["fit/predict_step"].bytes_serialized, spans["fit/predict_step"].bytes_deserialized) == (0, 8)
+    assert (spans["fit"].bytes_serialized, spans["fit"].bytes_deserialized) == (2, 8)
+
+
+def test_profile_spans_of_other_threads():
+    profiler = Profiler(trace_memory=False)
+
+    def profile_threads():
+        execution_context.set_profiler(profiler)
+        with profiling_utils.profile("fit", "pipeline"):
+            context = contextvars.copy_context()
+            thread = threading.Thread(target=context.run, args=(profile_step,), name="Step_0")
+            thread.start()
+            thread.join()
+
+    run_in_context(profile_threads)
+
+    spans = {span.name: span for span in profiler.spans}
+    assert spans["fit/retrain_step"].parent is spans["fit"]
+    assert spans["fit/retrain_step"].thread_name == "Step_0"
+
+
+def profile_step():
+    with profiling_utils.profile("fit/retrain_step", "step"):
+        pass